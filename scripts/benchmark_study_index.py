@@ -0,0 +1,425 @@
+"""Benchmark the study index at scale against a synthetic SQLCipher database.
+
+Builds a throwaway encrypted index of ``--rows`` synthetic instance rows (100k
+to 5M is the intended range) in a temporary directory. Studies follow
+per-modality shapes: several large CT and PET series, many mid-sized MR
+series, one- or two-image radiographs, short ultrasound and NM series, and
+patients with more than one study. Rows carry the file stats and per-instance
+fields a folder crawl stores, so the database has its real on-disk size.
+
+Timed operations (``operation`` column):
+
+- ``upsert``: ``upsert_rows`` throughput while the index is built, in batches
+  of the persistent writer's size (``insert``), then re-upserting existing
+  rows (``update``).
+- ``search`` / ``search_grouped``: latency of common filter mixes and FTS
+  queries (``variant`` is the query label). Grouped search also runs as
+  ``search_grouped_reopen``, reopening the connection before every query (one
+  ``PRAGMA key`` KDF per query), how the store behaved before pooling.
+- ``iter_all_entries``, ``csv_export`` and ``csv_import`` (the Export / Import
+  actions; import goes into an empty second index).
+- ``integrity_scan``: the synthetic files do not exist, so every study is
+  reported and every file falls back to a stat. This is the scan's worst case.
+- ``relocate_study_paths`` for ``--relocations`` studies spread across the
+  index.
+
+Rows are appended to ``dev-docs/perf-baselines/study_index.csv`` so index
+schema changes can be judged on numbers across commits.
+
+Usage:
+    python scripts/benchmark_study_index.py
+    python scripts/benchmark_study_index.py --rows 1000000 --queries 10
+    python scripts/benchmark_study_index.py --rows 5000000 --skip csv_import
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+try:
+    from scripts.privacy_console import print_redacted
+except ModuleNotFoundError:
+    from privacy_console import print_redacted
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+BASELINES_DIR = ROOT / "dev-docs" / "perf-baselines"
+CSV_FILE = BASELINES_DIR / "study_index.csv"
+CSV_FIELDS = [
+    "timestamp",
+    "git_sha",
+    "rows",
+    "studies",
+    "db_mb",
+    "operation",
+    "variant",
+    "repeats",
+    "median_ms",
+    "p95_ms",
+    "max_ms",
+    "rows_per_s",
+]
+OPERATIONS = (
+    "upsert",
+    "search",
+    "search_grouped",
+    "search_grouped_reopen",
+    "iter_all_entries",
+    "csv_export",
+    "csv_import",
+    "integrity_scan",
+    "relocate_study_paths",
+)
+PASSPHRASE = "benchmark-passphrase"
+# Rows re-upserted to time the update path (capped so large runs stay short).
+_UPDATE_ROWS = 50_000
+
+# Modality -> (weight, series per study, instances per series, descriptions).
+_STUDY_SHAPES: tuple[tuple[str, int, tuple[int, int], tuple[int, int], tuple[str, ...]], ...] = (
+    ("CT", 25, (2, 5), (30, 250), ("CHEST", "ABDOMEN PELVIS", "HEAD", "SPINE")),
+    ("MR", 20, (4, 12), (15, 120), ("BRAIN", "KNEE", "SPINE", "CARDIAC")),
+    ("CR", 30, (1, 2), (1, 2), ("CHEST", "KNEE", "HAND")),
+    ("US", 10, (1, 2), (5, 60), ("ABDOMEN", "THYROID")),
+    ("PT", 5, (2, 4), (100, 300), ("WHOLE BODY",)),
+    ("NM", 5, (1, 3), (1, 64), ("BONE", "CARDIAC")),
+    ("MG", 5, (1, 1), (4, 4), ("SCREENING",)),
+)
+_SURNAMES = ("Smith", "Garcia", "Nguyen", "Okafor", "Larsen", "Tanaka", "Silva", "Kowalski")
+_SOP_CLASS = "1.2.840.10008.5.1.4.1.1.2"
+_TRANSFER_SYNTAX = "1.2.840.10008.1.2.1"
+
+
+def iter_rows(total_rows: int, root: str = "/bench", seed: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield ``total_rows`` synthetic instance rows, study after study (deterministic)."""
+    rng = random.Random(seed)
+    weights = [shape[1] for shape in _STUDY_SHAPES]
+    produced = 0
+    study = 0
+    while produced < total_rows:
+        modality, _w, series_range, instance_range, descriptions = rng.choices(
+            _STUDY_SHAPES, weights
+        )[0]
+        patient = study // 3 + rng.randrange(2)  # most patients have a few studies
+        study_uid = f"1.2.826.0.1.3680043.10.9.{study}"
+        study_root = os.path.join(root, f"p{patient:07d}", f"s{study}")
+        patient_name = f"{_SURNAMES[patient % len(_SURNAMES)]}^Pat{patient:07d}"
+        study_date = f"{2000 + rng.randrange(25)}{1 + rng.randrange(12):02d}{1 + rng.randrange(28):02d}"
+        description = f"{modality} {rng.choice(descriptions)}"
+        for se in range(rng.randint(*series_range)):
+            series_uid = f"{study_uid}.{se}"
+            instances = rng.randint(*instance_range)
+            for i in range(instances):
+                if produced >= total_rows:
+                    return
+                sop_uid = f"{series_uid}.{i}"
+                header = {
+                    "00080016": {"vr": "UI", "Value": [_SOP_CLASS]},
+                    "00080018": {"vr": "UI", "Value": [sop_uid]},
+                    "00200011": {"vr": "IS", "Value": [se + 1]},
+                    "00200013": {"vr": "IS", "Value": [i + 1]},
+                    "00200032": {"vr": "DS", "Value": [-250.0, -250.0, float(i)]},
+                    "00200037": {"vr": "DS", "Value": [1, 0, 0, 0, 1, 0]},
+                    "00280010": {"vr": "US", "Value": [512]},
+                    "00280011": {"vr": "US", "Value": [512]},
+                    "00280030": {"vr": "DS", "Value": [0.7, 0.7]},
+                }
+                yield {
+                    "file_path": os.path.join(study_root, f"se{se}", f"im{i}.dcm"),
+                    "study_root_path": study_root,
+                    "study_uid": study_uid,
+                    "series_uid": series_uid,
+                    "sop_instance_uid": sop_uid,
+                    "patient_name": patient_name,
+                    "patient_id": f"PID{patient:07d}",
+                    "accession_number": f"ACC{study:08d}",
+                    "study_date": study_date,
+                    "study_description": description,
+                    "series_description": f"Series {se + 1}",
+                    "modality": modality,
+                    "file_size": 526_000,
+                    "file_mtime_ns": 1_700_000_000_000_000_000 + produced,
+                    "instance_number": i + 1,
+                    "number_of_frames": None,
+                    "transfer_syntax_uid": _TRANSFER_SYNTAX,
+                    "pixel_data_offset": 1_700,
+                    "instance_header": json.dumps(header, separators=(",", ":")),
+                }
+                produced += 1
+        study += 1
+
+
+# Label -> search / search_grouped_studies kwargs (first page of the dialog's default sort).
+QUERIES: dict[str, dict[str, Any]] = {
+    "browse": {},
+    "patient_name": {"patient_name_contains": "Tanaka"},
+    "patient_id": {"patient_id_contains": "PID00001"},
+    "modality_date": {"modality": "MR", "study_date_from": "20100101"},
+    "description_dates": {
+        "study_description_contains": "chest",
+        "study_date_from": "20150101",
+        "study_date_to": "20191231",
+    },
+    "fts": {"global_fts_query": "knee"},
+    "fts_prefix": {"global_fts_query": "tana*"},
+}
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _summary(
+    operation: str, variant: str, values_ms: list[float], rows_done: int | None = None
+) -> dict[str, object]:
+    """One result row: latency statistics and, for bulk operations, rows per second."""
+    total_s = sum(values_ms) / 1000.0
+    return {
+        "operation": operation,
+        "variant": variant,
+        "repeats": len(values_ms),
+        "median_ms": round(statistics.median(values_ms), 3),
+        "p95_ms": round(_percentile(values_ms, 0.95), 3),
+        "max_ms": round(max(values_ms), 3),
+        "rows_per_s": round(rows_done / total_s, 1) if rows_done and total_s > 0 else "",
+    }
+
+
+def _timed(fn, *args: Any, **kwargs: Any) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000.0
+
+
+def time_queries(store, queries: int, *, grouped: bool, reopen: bool) -> dict[str, list[float]]:
+    """Run every query ``queries`` times; return per-query latencies in ms."""
+    from core.study_index.sqlcipher_store import close_pooled_connections
+
+    search = store.search_grouped_studies if grouped else store.search
+    timings: dict[str, list[float]] = {label: [] for label in QUERIES}
+    for _ in range(queries):
+        for label, kwargs in QUERIES.items():
+            if reopen:
+                close_pooled_connections()
+            timings[label].append(_timed(search, limit=100 if grouped else 500, **kwargs)[1])
+    return timings
+
+
+def _service_for(db_path: str):
+    """Study index service on ``db_path`` without the OS keyring."""
+    from core.study_index.index_service import LocalStudyIndexService
+    from utils.config_manager import ConfigManager
+
+    class _BenchService(LocalStudyIndexService):
+        @staticmethod
+        def is_backend_available() -> bool:
+            return True
+
+        def _passphrase(self) -> str:
+            return PASSPHRASE
+
+    # A throwaway config next to the database, so the user's settings are untouched.
+    scratch = Path(db_path).with_suffix(".config")
+    config = ConfigManager(config_dir=scratch, private_storage_dir=scratch / "private")
+    config.set_study_index_db_path(db_path)
+    return _BenchService(config)
+
+
+def _build_index(store, total_rows: int, root: str, seed: int) -> list[dict[str, object]]:
+    from core.study_index.index_write_thread import INDEX_WRITE_BATCH_ROWS
+
+    rows = iter_rows(total_rows, root, seed)
+    batch_ms: list[float] = []
+    while batch := list(islice(rows, INDEX_WRITE_BATCH_ROWS)):
+        batch_ms.append(_timed(store.upsert_rows, batch)[1])
+    results = [_summary("upsert", "insert", batch_ms, total_rows)]
+    update_rows = list(iter_rows(min(total_rows, _UPDATE_ROWS), root, seed))
+    batch_ms = [
+        _timed(store.upsert_rows, update_rows[i : i + INDEX_WRITE_BATCH_ROWS])[1]
+        for i in range(0, len(update_rows), INDEX_WRITE_BATCH_ROWS)
+    ]
+    results.append(_summary("upsert", "update", batch_ms, len(update_rows)))
+    store.checkpoint()
+    return results
+
+
+def _relocate(store, tmp: str, relocations: int) -> dict[str, object] | None:
+    """Move ``relocations`` studies, evenly spread, to new roots holding one real file."""
+    groups = sorted(store.iter_study_groups(), key=lambda g: g["study_uid"])
+    if not groups or relocations <= 0:
+        return None
+    step = max(1, len(groups) // relocations)
+    elapsed: list[float] = []
+    moved = 0
+    for k, group in enumerate(groups[::step][:relocations]):
+        old_root = group["study_root_path"]
+        new_root = os.path.join(tmp, "moved", f"study{k}")
+        first = store.get_study_instances(group["study_uid"], old_root)[0]["file_path"]
+        target = Path(new_root) / os.path.relpath(first, old_root)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.touch()  # relocation only commits when a moved file exists
+        updated, ms = _timed(store.relocate_study_paths, group["study_uid"], old_root, new_root)
+        if updated:
+            elapsed.append(ms)
+            moved += updated
+    return _summary("relocate_study_paths", "study", elapsed, moved) if elapsed else None
+
+
+def run_benchmark(
+    total_rows: int,
+    queries: int,
+    *,
+    relocations: int = 5,
+    skip: frozenset[str] = frozenset(),
+    seed: int = 0,
+    progress=print,
+) -> list[dict[str, object]]:
+    """Build a temporary index of ``total_rows`` rows and time every operation not in ``skip``."""
+    from core.study_index.portability import read_entries_csv, write_entries_csv
+    from core.study_index.sqlcipher_store import (
+        StudyIndexStore,
+        close_pooled_connections,
+    )
+
+    results: list[dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="study_index_bench_") as tmp:
+        db_path = os.path.join(tmp, "bench.sqlite")
+        import_db_path = os.path.join(tmp, "import.sqlite")
+        csv_path = os.path.join(tmp, "export.csv")
+        store = StudyIndexStore(db_path, PASSPHRASE)
+        store.init_schema()
+        try:
+            progress(f"Indexing {total_rows} synthetic instance rows...")
+            build = _build_index(store, total_rows, os.path.join(tmp, "data"), seed)
+            if "upsert" not in skip:
+                results.extend(build)
+            indexed_rows = store.row_count()
+            run = {
+                "rows": indexed_rows,
+                "studies": store.study_count(),
+                "db_mb": round(os.path.getsize(db_path) / (1024 * 1024), 1),
+            }
+
+            store.search_grouped_studies(limit=1)  # warm the page cache
+            for operation, grouped, reopen in (
+                ("search", False, False),
+                ("search_grouped", True, False),
+                ("search_grouped_reopen", True, True),
+            ):
+                if operation in skip:
+                    continue
+                progress(f"Timing {operation}...")
+                timings = time_queries(store, queries, grouped=grouped, reopen=reopen)
+                results.extend(_summary(operation, label, v) for label, v in timings.items())
+
+            if "iter_all_entries" not in skip:
+                progress("Timing iter_all_entries...")
+                entries, ms = _timed(store.iter_all_entries)
+                results.append(_summary("iter_all_entries", "all", [ms], len(entries)))
+                del entries
+            service = _service_for(db_path)
+            if "csv_export" not in skip or "csv_import" not in skip:
+                progress("Timing CSV export...")
+                written, ms = _timed(
+                    lambda: write_entries_csv(csv_path, service.export_entries())
+                )
+                if "csv_export" not in skip:
+                    results.append(_summary("csv_export", "all", [ms], written))
+            if "csv_import" not in skip:
+                progress("Timing CSV import into an empty index...")
+                importer = _service_for(import_db_path)
+                (imported, _skipped), ms = _timed(
+                    lambda: importer.import_entries(read_entries_csv(csv_path))
+                )
+                results.append(_summary("csv_import", "empty_index", [ms], imported))
+            if "integrity_scan" not in skip:
+                progress("Timing integrity_scan...")
+                _records, ms = _timed(service.integrity_scan)
+                results.append(_summary("integrity_scan", "all_missing", [ms], indexed_rows))
+            if "relocate_study_paths" not in skip:
+                progress("Timing relocate_study_paths...")
+                relocated = _relocate(store, tmp, relocations)
+                if relocated is not None:
+                    results.append(relocated)
+        finally:
+            close_pooled_connections(db_path)
+            close_pooled_connections(import_db_path)
+    return [{**run, **row} for row in results]
+
+
+def write_rows(rows: list[dict[str, object]], csv_file: Path) -> None:
+    """Append benchmark rows (with timestamp and git SHA) to ``csv_file``."""
+    try:
+        sha = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=str(ROOT), text=True
+        ).strip()
+    except Exception:
+        sha = "unknown"
+    timestamp = datetime.now().isoformat(timespec="seconds")
+    csv_file.parent.mkdir(parents=True, exist_ok=True)
+    write_header = not csv_file.exists()
+    with open(csv_file, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        if write_header:
+            writer.writeheader()
+        for row in rows:
+            writer.writerow({"timestamp": timestamp, "git_sha": sha, **row})
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="synthetic instance rows to index")
+    parser.add_argument("--queries", type=int, default=20, help="repetitions of each query")
+    parser.add_argument("--relocations", type=int, default=5, help="studies to relocate")
+    parser.add_argument(
+        "--skip", nargs="*", default=[], choices=OPERATIONS, help="operations not to time"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic studies")
+    parser.add_argument("--csv", type=Path, default=CSV_FILE, help="CSV file to append to")
+    args = parser.parse_args(argv)
+
+    try:
+        import sqlcipher3.dbapi2  # noqa: F401  # pyright: ignore[reportUnusedImport]
+    except ImportError:
+        print("sqlcipher3 is not installed; nothing to benchmark.")
+        return 1
+
+    rows = run_benchmark(
+        max(1, args.rows),
+        max(1, args.queries),
+        relocations=args.relocations,
+        skip=frozenset(args.skip),
+        seed=args.seed,
+        progress=lambda message: print(message, flush=True),
+    )
+    if rows:
+        print(f"{rows[0]['rows']} rows, {rows[0]['studies']} studies, {rows[0]['db_mb']} MB")
+    for row in rows:
+        rate = f"  {row['rows_per_s']:.0f} rows/s" if row["rows_per_s"] != "" else ""
+        print(
+            f"  {row['operation']:<22} {row['variant']:<18} "
+            f"median={row['median_ms']:.2f}ms  p95={row['p95_ms']:.2f}ms  "
+            f"max={row['max_ms']:.2f}ms{rate}"
+        )
+    write_rows(rows, args.csv)
+    print_redacted(f"Results appended to {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
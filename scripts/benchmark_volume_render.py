@@ -0,0 +1,282 @@
+"""Benchmark headless 3D volume rendering with frame-time metrics.
+
+Renders synthetic CT-like volumes through ``VolumeRenderer`` in an offscreen
+VTK render window (CPU ray casting by default, so no GPU is needed) and
+sweeps every Detail level (``QUALITY_MODES``), blend mode and gradient-opacity
+setting. For each volume size it records the time to first frame (prepare +
+attach + first render) and peak memory; for each configuration it records
+the first frame after the change (which includes the transfer-function
+rebuild) and per-frame render times during a scripted camera orbit run at
+interactive quality, as the viewer does while the user drags.
+
+Rows are appended to ``dev-docs/perf-baselines/volume_render.csv`` so runs
+can be compared across commits.
+
+Usage:
+    python scripts/benchmark_volume_render.py
+    python scripts/benchmark_volume_render.py --sizes 64x128x128 --frames 6
+    python scripts/benchmark_volume_render.py --render-method Auto   # allow GPU
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+try:
+    from scripts.privacy_console import print_redacted
+except ModuleNotFoundError:
+    from privacy_console import print_redacted
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+BASELINES_DIR = ROOT / "dev-docs" / "perf-baselines"
+CSV_FILE = BASELINES_DIR / "volume_render.csv"
+DEFAULT_SIZES = ((64, 128, 128), (128, 256, 256), (256, 512, 512))
+CSV_FIELDS = [
+    "timestamp",
+    "git_sha",
+    "size",
+    "megabytes",
+    "render_method",
+    "window_px",
+    "quality",
+    "blend_mode",
+    "gradient_opacity",
+    "time_to_first_frame_ms",
+    "config_first_frame_ms",
+    "orbit_median_ms",
+    "orbit_p95_ms",
+    "orbit_max_ms",
+    "peak_traced_mb",
+    "max_rss_mb",
+]
+
+
+def make_ct_volume(shape: tuple[int, int, int], seed: int = 3) -> np.ndarray:
+    """Return a CT-like float32 HU volume: air, soft tissue, bone ring, spine, vessel."""
+    depth, rows, cols = shape
+    rng = np.random.default_rng(seed)
+    yy, xx = np.ogrid[-1.0:1.0:rows * 1j, -1.0:1.0:cols * 1j]
+    body = (xx / 0.85) ** 2 + (yy / 0.65) ** 2
+    ribs = (xx / 0.72) ** 2 + (yy / 0.52) ** 2
+    spine = xx**2 + (yy - 0.4) ** 2
+    volume = np.empty(shape, dtype=np.float32)
+    for z in range(depth):
+        t = z / max(depth - 1, 1)
+        hu = np.where(body < 1.0, 40.0, -1000.0)
+        hu = np.where((ribs > 0.85) & (ribs < 1.0), 900.0, hu)
+        hu = np.where(spine < 0.012, 700.0, hu)
+        vessel_x = 0.15 + 0.1 * np.sin(2.0 * np.pi * t)
+        hu = np.where((xx - vessel_x) ** 2 + (yy - 0.1) ** 2 < 0.003, 300.0, hu)
+        volume[z] = hu + rng.normal(0.0, 12.0, (rows, cols))
+    return volume
+
+
+def parse_sizes(text: str) -> list[tuple[int, int, int]]:
+    """Parse ``"DxHxW,DxHxW"`` into (depth, height, width) tuples."""
+    sizes = []
+    for item in text.split(","):
+        parts = [int(p) for p in item.lower().strip().split("x")]
+        if len(parts) != 3 or min(parts) <= 0:
+            raise argparse.ArgumentTypeError(f"bad size {item!r}; expected DxHxW")
+        sizes.append((parts[0], parts[1], parts[2]))
+    return sizes
+
+
+def _max_rss_mb() -> float | None:
+    if sys.platform == "win32":
+        return None
+    import resource
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _render_ms(window) -> float:
+    start = time.perf_counter()
+    window.Render()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def benchmark_size(
+    shape: tuple[int, int, int],
+    *,
+    frames: int,
+    window_px: int,
+    render_method: str,
+    qualities: list[str],
+    blend_modes: list[str],
+    gradient_settings: list[bool],
+) -> list[dict[str, object]]:
+    """Render one synthetic volume through every configuration."""
+    import SimpleITK as sitk
+
+    from core.volume_renderer import (
+        VolumeRenderer,
+        get_default_preset_for_modality,
+        vtk_mod,
+    )
+
+    volume = make_ct_volume(shape)
+    image = sitk.GetImageFromArray(volume)
+    image.SetSpacing((0.7, 0.7, 1.0))
+    del volume
+
+    tracemalloc.start()
+    renderer = VolumeRenderer()
+    window = vtk_mod.vtkRenderWindow()
+    window.SetOffScreenRendering(1)
+    window.SetSize(window_px, window_px)
+    window.AddRenderer(renderer.get_renderer())
+    try:
+        start = time.perf_counter()
+        renderer.set_render_method(render_method)
+        renderer.set_preset(get_default_preset_for_modality("CT"))
+        renderer.attach_volume(VolumeRenderer.prepare_volume_data(image))
+        window.Render()
+        first_frame_ms = (time.perf_counter() - start) * 1000.0
+
+        rows: list[dict[str, object]] = []
+        camera = renderer.get_renderer().GetActiveCamera()
+        for quality in qualities:
+            for blend_mode in blend_modes:
+                for gradient in gradient_settings:
+                    renderer.set_quality_mode(quality)
+                    renderer.set_blend_mode(blend_mode)
+                    renderer.set_gradient_opacity_enabled(gradient)
+                    config_ms = _render_ms(window)
+                    renderer.set_interactive_quality(True)
+                    orbit = []
+                    for _ in range(frames):
+                        camera.Azimuth(360.0 / frames)
+                        orbit.append(_render_ms(window))
+                    renderer.set_interactive_quality(False)
+                    rows.append({
+                        "quality": quality,
+                        "blend_mode": blend_mode,
+                        "gradient_opacity": int(gradient),
+                        "config_first_frame_ms": round(config_ms, 2),
+                        "orbit_median_ms": round(statistics.median(orbit), 2),
+                        "orbit_p95_ms": round(_percentile(orbit, 0.95), 2),
+                        "orbit_max_ms": round(max(orbit), 2),
+                    })
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        renderer.cleanup()
+        window.Finalize()
+
+    max_rss = _max_rss_mb()
+    for row in rows:
+        row.update({
+            "size": "x".join(str(n) for n in shape),
+            "megabytes": round(int(np.prod(shape)) * 4 / (1024 * 1024), 1),
+            "render_method": render_method,
+            "window_px": window_px,
+            "time_to_first_frame_ms": round(first_frame_ms, 2),
+            "peak_traced_mb": round(peak / (1024 * 1024), 1),
+            "max_rss_mb": "" if max_rss is None else round(max_rss, 1),
+        })
+    return rows
+
+
+def write_rows(rows: list[dict[str, object]], csv_file: Path) -> None:
+    """Append benchmark rows (with timestamp and git SHA) to ``csv_file``."""
+    try:
+        sha = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=str(ROOT), text=True
+        ).strip()
+    except Exception:
+        sha = "unknown"
+    timestamp = datetime.now().isoformat(timespec="seconds")
+    csv_file.parent.mkdir(parents=True, exist_ok=True)
+    write_header = not csv_file.exists()
+    with open(csv_file, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        if write_header:
+            writer.writeheader()
+        for row in rows:
+            writer.writerow({"timestamp": timestamp, "git_sha": sha, **row})
+
+
+def main(argv: list[str] | None = None) -> int:
+    from core.volume_renderer import BLEND_MODES, QUALITY_MODES, vtk_available
+
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=list(DEFAULT_SIZES),
+        help="comma-separated DxHxW volume sizes (default: %(default)s)",
+    )
+    parser.add_argument("--frames", type=int, default=12, help="orbit frames per configuration")
+    parser.add_argument("--window", type=int, default=384, help="render window size in pixels")
+    parser.add_argument(
+        "--render-method",
+        choices=["CPU", "Auto", "GPU"],
+        default="CPU",
+        help="VolumeRenderer render method (default: CPU ray casting)",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="only the Normal detail, Composite blend and gradient opacity off",
+    )
+    parser.add_argument("--csv", type=Path, default=CSV_FILE, help="CSV file to append to")
+    args = parser.parse_args(argv)
+
+    if not vtk_available:
+        print("VTK is not installed; nothing to benchmark.")
+        return 1
+    qualities = ["Normal"] if args.quick else [name for name, _ in QUALITY_MODES]
+    blend_modes = ["Composite"] if args.quick else [name for name, _ in BLEND_MODES]
+    gradient_settings = [False] if args.quick else [False, True]
+
+    all_rows: list[dict[str, object]] = []
+    for shape in args.sizes:
+        print(f"Volume {'x'.join(str(n) for n in shape)} ({args.render_method})...", flush=True)
+        rows = benchmark_size(
+            shape,
+            frames=max(1, args.frames),
+            window_px=args.window,
+            render_method=args.render_method,
+            qualities=qualities,
+            blend_modes=blend_modes,
+            gradient_settings=gradient_settings,
+        )
+        print(
+            f"  first frame {rows[0]['time_to_first_frame_ms']:.0f}ms  "
+            f"peak traced {rows[0]['peak_traced_mb']}MB  max RSS {rows[0]['max_rss_mb']}MB"
+        )
+        for row in rows:
+            print(
+                f"  {row['quality']:<6} {row['blend_mode']:<22} go={row['gradient_opacity']}  "
+                f"first={row['config_first_frame_ms']:.1f}ms  "
+                f"orbit median={row['orbit_median_ms']:.1f}ms  p95={row['orbit_p95_ms']:.1f}ms"
+            )
+        all_rows.extend(rows)
+
+    write_rows(all_rows, args.csv)
+    print_redacted(f"Results appended to {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
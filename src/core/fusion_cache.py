@@ -0,0 +1,435 @@
+"""
+Fusion Cache
+
+Persistent disk-based LRU cache for fusion-resampled overlay volumes, so a
+PET/CT or SPECT/CT pair opened again in a later session skips
+``ImageResampler.resample_to_reference``. Modelled on ``core.mpr_cache``.
+
+Each cached entry stores:
+  - The overlay resampled onto the base grid as one contiguous float32
+    ``(n_slices, rows, cols)`` ``.npy`` file, opened with
+    ``np.load(mmap_mode="r")`` so slices page in lazily on a hit.
+  - A JSON metadata sidecar with the cache key, access time, non-reversible
+    series keys (for invalidation) and the output grid geometry (size,
+    origin, spacing, direction), which the resampler checks against the
+    current base series before using a hit.
+
+Keys combine the overlay and base series keys, their instance counts and the
+interpolator; a changed instance count is a lightweight proxy for a changed
+series, as in the MPR cache.
+
+The LRU eviction policy is applied on writes when the total cache size
+exceeds the configured maximum (default: 500 MB).
+
+Inputs:
+    cache_dir   — Path (or str) of the directory used for storage.
+    max_size_mb — Maximum total disk usage in MB; 0 = unlimited.
+
+Outputs:
+    ``(volume, metadata)`` on a cache hit (read-only float32 memory map).
+    None on a cache miss.
+
+Requirements:
+    numpy (already a project dependency)
+    Standard library: json, hashlib, pathlib, os, time, threading
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from utils.privacy.safe_storage import (
+    assert_safe_internal_path,
+    atomic_write_private_text,
+    ensure_private_directory,
+)
+
+_logger = logging.getLogger(__name__)
+_SOURCE_ROOT = Path(__file__).resolve().parent.parent.parent
+
+_FUSION_CACHE_FORMAT_VERSION = "1"
+
+
+def _is_windows() -> bool:
+    return os.name == "nt"
+
+
+def _series_hash(series_key: str) -> str:
+    return hashlib.sha256(series_key.strip().encode("utf-8")).hexdigest()
+
+
+def make_fusion_cache_key(
+    overlay_series_key: str,
+    base_series_key: str,
+    overlay_instance_count: int,
+    base_instance_count: int,
+    interpolator: str,
+) -> str:
+    """
+    Build a stable SHA-256 hex digest cache key for one resampled overlay.
+
+    Args:
+        overlay_series_key:     Series key of the overlay (functional) series.
+        base_series_key:        Series key of the base (anatomical) series.
+        overlay_instance_count: Number of overlay datasets.
+        base_instance_count:    Number of base datasets.
+        interpolator:           Interpolation method string.
+
+    Returns:
+        64-character hex digest string.
+    """
+    parts = [
+        _FUSION_CACHE_FORMAT_VERSION,
+        overlay_series_key.strip(),
+        base_series_key.strip(),
+        str(int(overlay_instance_count)),
+        str(int(base_instance_count)),
+        interpolator.lower().strip(),
+    ]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class _CacheEntry:
+    """Lightweight descriptor for a single cache entry (metadata only)."""
+
+    __slots__ = ("key", "last_access", "path_data", "path_meta", "size_bytes")
+
+    def __init__(
+        self,
+        key: str,
+        path_data: Path,
+        path_meta: Path,
+        size_bytes: int,
+        last_access: float,
+    ) -> None:
+        self.key = key
+        self.path_data = path_data
+        self.path_meta = path_meta
+        self.size_bytes = size_bytes
+        self.last_access = last_access
+
+
+class FusionCache:
+    """
+    Persistent disk-based LRU cache for resampled fusion overlay volumes.
+
+    Thread-safe (uses an internal lock for all mutating operations); entries
+    are saved from the resampler's background fill thread.
+    """
+
+    _NPY_SUFFIX = ".npy"
+    _META_SUFFIX = "_meta.json"
+
+    def __init__(self, cache_dir: Path, max_size_mb: int = 500) -> None:
+        """
+        Args:
+            cache_dir:    Directory where cache files are stored.
+                          Created if it does not exist.
+            max_size_mb:  Maximum total cache size in MB (0 = unlimited).
+        """
+        self._cache_dir = Path(cache_dir)
+        assert_safe_internal_path(self._cache_dir, source_root=_SOURCE_ROOT)
+        ensure_private_directory(self._cache_dir)
+        self._max_size_bytes = int(max_size_mb) * 1024 * 1024
+        self._lock = threading.Lock()
+        self._index: dict[str, _CacheEntry] = {}
+        self._scan_disk()
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    def has(self, key: str) -> bool:
+        """Return True if a valid cache entry exists for *key*."""
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return False
+            return entry.path_data.exists() and entry.path_meta.exists()
+
+    def load(self, key: str) -> tuple[np.ndarray, dict[str, Any]] | None:
+        """
+        Load the cached volume for *key*.
+
+        Returns:
+            ``(volume, metadata_dict)`` on a hit, where ``volume`` is a
+            read-only float32 ``(n_slices, rows, cols)`` memory map and
+            ``metadata_dict`` holds the grid geometry. ``None`` on a miss or
+            I/O error.
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if not entry.path_data.exists() or not entry.path_meta.exists():
+                self._index.pop(key, None)
+                return None
+
+        try:
+            with open(entry.path_meta, encoding="utf-8") as f:
+                meta: dict[str, Any] = json.load(f)
+            volume = np.load(str(entry.path_data), mmap_mode="r", allow_pickle=False)
+            if volume.dtype != np.float32 or volume.ndim != 3:
+                raise ValueError("cached volume is not a float32 3-D array")
+            if list(volume.shape) != [int(v) for v in reversed(meta["size"])]:
+                raise ValueError("cached volume shape does not match metadata")
+        except Exception as exc:
+            _logger.warning(
+                "Fusion cache load failed",
+                extra={"operation": "fusion_cache.load", "error_class": type(exc).__name__},
+            )
+            return None
+
+        with self._lock:
+            if key in self._index:
+                self._index[key].last_access = time.time()
+                self._update_meta_access(entry.path_meta)
+
+        return volume, meta
+
+    def save(
+        self,
+        key: str,
+        volume: np.ndarray,
+        geometry: dict[str, Any],
+        series_keys: tuple[str, str],
+    ) -> bool:
+        """
+        Persist a resampled overlay volume.
+
+        Args:
+            key:         Key from ``make_fusion_cache_key``.
+            volume:      ``(n_slices, rows, cols)`` resampled overlay.
+            geometry:    Output grid: ``size`` (x, y, z), ``origin``,
+                         ``spacing`` and ``direction`` lists.
+            series_keys: ``(overlay_series_key, base_series_key)``; stored
+                         hashed, for ``invalidate``.
+
+        Returns:
+            True on success, False on failure.
+        """
+        size = [int(v) for v in geometry["size"]]
+        meta = {
+            "key": key,
+            "cache_format_version": _FUSION_CACHE_FORMAT_VERSION,
+            "created": time.time(),
+            "last_access": time.time(),
+            "series_keys": [_series_hash(series_key) for series_key in series_keys],
+            "size": size,
+            "origin": [float(v) for v in geometry["origin"]],
+            "spacing": [float(v) for v in geometry["spacing"]],
+            "direction": [float(v) for v in geometry["direction"]],
+        }
+        path_data = self._cache_dir / (key + self._NPY_SUFFIX)
+        path_meta = self._cache_dir / (key + self._META_SUFFIX)
+
+        tmp_data: Path | None = None
+        try:
+            array = np.ascontiguousarray(volume, dtype=np.float32)
+            if list(array.shape) != size[::-1]:
+                raise ValueError("volume shape does not match grid size")
+            descriptor, tmp_name = tempfile.mkstemp(
+                prefix=".fusion-cache-", suffix=".tmp", dir=self._cache_dir
+            )
+            tmp_data = Path(tmp_name)
+            if not _is_windows():
+                tmp_data.chmod(0o600)
+            with os.fdopen(descriptor, "wb") as stream:
+                np.lib.format.write_array(stream, array, allow_pickle=False)
+                stream.flush()
+                os.fsync(stream.fileno())
+            os.replace(tmp_data, path_data)
+            tmp_data = None
+            if not _is_windows():
+                path_data.chmod(0o600)
+            atomic_write_private_text(
+                path_meta,
+                json.dumps(meta, indent=2),
+                source_root=_SOURCE_ROOT,
+            )
+        except Exception as exc:
+            if tmp_data is not None:
+                tmp_data.unlink(missing_ok=True)
+            _logger.warning(
+                "Fusion cache save failed",
+                extra={"operation": "fusion_cache.save", "error_class": type(exc).__name__},
+            )
+            return False
+
+        size_bytes = self._file_size(path_data) + self._file_size(path_meta)
+        with self._lock:
+            self._index[key] = _CacheEntry(
+                key=key,
+                path_data=path_data,
+                path_meta=path_meta,
+                size_bytes=size_bytes,
+                last_access=time.time(),
+            )
+            if self._max_size_bytes > 0:
+                self._evict_lru()
+        return True
+
+    def invalidate(self, series_key: str | None = None) -> int:
+        """
+        Remove entries involving a series (as overlay or base), or all entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            if series_key is None:
+                keys_to_remove = list(self._index.keys())
+            else:
+                keys_to_remove = [
+                    k for k, e in self._index.items()
+                    if self._meta_has_series(e.path_meta, series_key)
+                ]
+            for k in keys_to_remove:
+                self._remove_entry(k)
+            return len(keys_to_remove)
+
+    def total_size_bytes(self) -> int:
+        """Return total disk usage of all cache entries (bytes)."""
+        with self._lock:
+            return sum(e.size_bytes for e in self._index.values())
+
+    def entry_count(self) -> int:
+        """Return number of cached entries."""
+        with self._lock:
+            return len(self._index)
+
+    def set_max_size_mb(self, max_size_mb: int) -> None:
+        """Apply a new bounded size limit and evict oldest entries if required."""
+        with self._lock:
+            self._max_size_bytes = int(max_size_mb) * 1024 * 1024
+            if self._max_size_bytes > 0:
+                self._evict_lru()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _scan_disk(self) -> None:
+        """Rebuild the index from disk, deleting entries of an older format."""
+        for meta_path in self._cache_dir.glob(f"*{self._META_SUFFIX}"):
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    meta = json.load(f)
+                key = meta.get("key", "")
+                if not key:
+                    continue
+                path_data = self._cache_dir / (key + self._NPY_SUFFIX)
+                if str(meta.get("cache_format_version", "")) != _FUSION_CACHE_FORMAT_VERSION:
+                    self._delete_files(path_data, meta_path)
+                    continue
+                if not path_data.exists():
+                    continue
+                self._index[key] = _CacheEntry(
+                    key=key,
+                    path_data=path_data,
+                    path_meta=meta_path,
+                    size_bytes=self._file_size(path_data) + self._file_size(meta_path),
+                    last_access=float(meta.get("last_access", 0.0)),
+                )
+            except Exception:
+                # Ignore corrupted metadata files.
+                pass
+
+    def _evict_lru(self) -> None:
+        """Remove oldest-accessed entries until total size ≤ max_size_bytes."""
+        total = sum(e.size_bytes for e in self._index.values())
+        if total <= self._max_size_bytes:
+            return
+        for entry in sorted(self._index.values(), key=lambda e: e.last_access):
+            if total <= self._max_size_bytes:
+                break
+            total -= entry.size_bytes
+            self._remove_entry(entry.key)
+
+    def _remove_entry(self, key: str) -> None:
+        """Remove entry files and index record (must hold _lock)."""
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return
+        self._delete_files(entry.path_data, entry.path_meta)
+
+    @staticmethod
+    def _delete_files(*paths: Path) -> None:
+        """Best-effort unlink (a still-mapped file may be locked on Windows)."""
+        for p in paths:
+            try:
+                if p.exists():
+                    p.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        """Return file size in bytes, 0 if missing."""
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _update_meta_access(path_meta: Path) -> None:
+        """Silently update last_access in a metadata JSON file."""
+        try:
+            with open(path_meta, encoding="utf-8") as f:
+                meta = json.load(f)
+            meta["last_access"] = time.time()
+            atomic_write_private_text(
+                path_meta,
+                json.dumps(meta, indent=2),
+                source_root=_SOURCE_ROOT,
+            )
+        except Exception:
+            pass
+
+    @staticmethod
+    def _meta_has_series(path_meta: Path, series_key: str) -> bool:
+        """Return True if metadata contains the matching non-reversible series key."""
+        try:
+            with open(path_meta, encoding="utf-8") as f:
+                meta = json.load(f)
+            return _series_hash(series_key) in meta.get("series_keys", [])
+        except Exception:
+            return False
+
+
+def open_fusion_cache(config_manager: Any) -> FusionCache | None:
+    """
+    Fusion cache for the configured location, or None unless opted in.
+
+    When the cache is disabled, files left in its location are cleared, as
+    for the MPR cache.
+    """
+    try:
+        if not config_manager.get_fusion_cache_enabled():
+            result = config_manager.clear_fusion_cache_storage()
+            if not result.success:
+                _logger.warning(
+                    "Disabled fusion cache storage could not be fully cleared",
+                    extra={"operation": "fusion_cache.clear", "failed": result.failed},
+                )
+            return None
+        return FusionCache(
+            cache_dir=config_manager.get_fusion_cache_path(),
+            max_size_mb=config_manager.get_fusion_cache_max_mb(),
+        )
+    except Exception as exc:
+        _logger.warning(
+            "Fusion cache initialization failed",
+            extra={"operation": "fusion_cache.init", "error_class": type(exc).__name__},
+        )
+        return None
@@ -0,0 +1,251 @@
+"""
+Fusion LUT Compositor
+
+Fixed-point fusion blending for the common display case: an integer-valued
+base slice (the already windowed 8-bit display image, or raw 8/16-bit
+stored values) under a float overlay with a fixed overlay window/level.
+
+``FusionProcessor.create_fusion_image`` normalises both inputs into new
+float arrays, evaluates the matplotlib colormap per pixel, and blends in
+float RGB — several full-size float buffers per fused slice.
+``FusionLutCompositor`` produces the same picture with:
+
+    - a per-colormap RGB LUT (the colormap's own ``N`` entries, 256 for all
+      built-in maps) indexed by the windowed overlay, using the same
+      ``floor(normalized * N)`` bucket rule as ``Colormap.__call__``;
+    - a grey LUT over the base dtype's whole stored range, pre-multiplied
+      into blend-table row offsets, so the base normalisation is one
+      ``np.take``;
+    - an ``alpha * 256`` fixed-point blend table per (colormap, alpha) over
+      every (grey level, colour bucket) pair, so threshold masking and
+      blending become one gather into a reusable ``(rows, cols, 3)`` uint8
+      output buffer.
+
+Results match the float path within two grey levels. The returned array is
+the compositor's buffer and is overwritten by the next ``composite`` call;
+convert or copy it before compositing again.
+
+Inputs:
+    2D uint8/int8/uint16/int16 base array, 2D overlay array already aligned
+    to the base, alpha, colormap name, threshold, overlay (window, level).
+
+Outputs:
+    (rows, cols, 3) uint8 RGB array.
+
+Requirements:
+    numpy, matplotlib (colormap tables, loaded on first use)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+_LUT_BASE_DTYPES = (np.uint8, np.int8, np.uint16, np.int16)
+
+# colormap name -> (N, 3) uint8 RGB table
+_COLORMAP_LUTS: dict[str, np.ndarray] = {}
+
+
+def colormap_lut(colormap_name: str) -> np.ndarray:
+    """
+    Return the ``(N, 3)`` uint8 RGB table of a matplotlib colormap.
+
+    Entry ``i`` is the colour ``Colormap.__call__`` returns for any value in
+    bucket ``i``, scaled to 0-255 the way the float fusion path scales it.
+    Unknown names fall back to ``'hot'`` like ``FusionProcessor.get_colormap``
+    (resolved here directly: ``fusion_processor`` imports this module).
+    """
+    lut = _COLORMAP_LUTS.get(colormap_name)
+    if lut is None:
+        import matplotlib  # deferred import (P1.7)
+
+        try:
+            cmap = matplotlib.colormaps.get_cmap(colormap_name)
+        except (ValueError, KeyError):
+            print(f"Warning: Colormap '{colormap_name}' not found, using 'hot'")
+            cmap = matplotlib.colormaps.get_cmap('hot')
+        rgb = cmap(np.arange(cmap.N)).astype(np.float32)[:, :3]
+        lut = np.clip(rgb * 255.0, 0, 255).astype(np.uint8)
+        lut.setflags(write=False)
+        _COLORMAP_LUTS[colormap_name] = lut
+    return lut
+
+
+def _grey_lut(
+    dtype: np.dtype,
+    base_min: float,
+    base_max: float,
+) -> np.ndarray:
+    """
+    Grey level for every stored value of ``dtype``, in unsigned-view order.
+
+    Signed bases are indexed through their unsigned view, so the table is
+    laid out as ``np.arange(n, dtype=unsigned).view(dtype)``.
+    """
+    unsigned = np.dtype(f"u{dtype.itemsize}")
+    values = np.arange(2 ** (8 * dtype.itemsize), dtype=unsigned).view(dtype)
+    values = values.astype(np.float32)
+    if base_max > base_min:
+        normalized = (values - np.float32(base_min)) / np.float32(base_max - base_min)
+        normalized = np.clip(normalized, 0.0, 1.0)
+    else:
+        normalized = np.zeros_like(values)
+    return (normalized * 255.0).astype(np.uint8)
+
+
+class FusionLutCompositor:
+    """
+    Reusable LUT-based fusion blender (one per fused view).
+
+    Per (colormap, alpha) it keeps a blend table holding the fused RGB of
+    every (grey level, colour bucket) pair, plus one extra column per grey
+    level for pixels below the threshold. A fused slice is then two small
+    index computations and one gather into the output buffer. Buffers are
+    reallocated only when the slice shape changes; the grey LUT only when
+    the base normalisation range, dtype or blend-table stride changes.
+    """
+
+    def __init__(self) -> None:
+        self._shape: tuple[int, int] | None = None
+        self._output: np.ndarray | None = None
+        self._scaled: np.ndarray | None = None
+        self._index: np.ndarray | None = None
+        self._mask: np.ndarray | None = None
+        self._code: np.ndarray | None = None
+        self._grey_key: tuple[str, float, float, int] | None = None
+        self._grey_lut: np.ndarray | None = None
+        self._blend_key: tuple[str, int] | None = None
+        self._blend_lut: np.ndarray | None = None
+
+    @staticmethod
+    def supports(
+        base_array: np.ndarray,
+        overlay_array: np.ndarray,
+        overlay_wl: tuple[float, float] | None,
+    ) -> bool:
+        """Return True when ``composite`` can blend these inputs."""
+        if overlay_wl is None or not overlay_wl[0] > 0:
+            return False
+        if base_array.ndim != 2 or overlay_array.ndim != 2:
+            return False
+        if base_array.shape != overlay_array.shape:
+            return False
+        return base_array.dtype.type in _LUT_BASE_DTYPES
+
+    def _ensure_buffers(self, shape: tuple[int, int]) -> None:
+        if self._shape == shape:
+            return
+        self._shape = shape
+        self._output = np.empty((*shape, 3), dtype=np.uint8)
+        self._scaled = np.empty(shape, dtype=np.float32)
+        self._index = np.empty(shape, dtype=np.uint16)
+        self._mask = np.empty(shape, dtype=bool)
+        self._code = np.empty(shape, dtype=np.intp)
+
+    def _base_rows(
+        self,
+        base_array: np.ndarray,
+        base_wl: tuple[float, float] | None,
+        stride: int,
+        out: np.ndarray,
+    ) -> None:
+        """Write ``grey level * stride`` (the blend-table row offset) per pixel into *out*."""
+        if base_wl is not None:
+            window, level = base_wl
+            base_min, base_max = level - window / 2.0, level + window / 2.0
+        else:
+            base_min, base_max = float(base_array.min()), float(base_array.max())
+        key = (base_array.dtype.str, base_min, base_max, stride)
+        if key != self._grey_key or self._grey_lut is None:
+            grey = _grey_lut(base_array.dtype, base_min, base_max)
+            self._grey_lut = grey.astype(np.intp) * np.intp(stride)
+            self._grey_key = key
+        unsigned = base_array.view(f"u{base_array.dtype.itemsize}")
+        np.take(self._grey_lut, unsigned, out=out, mode="clip")
+
+    def _blend_table(self, colormap: str, weight: int) -> np.ndarray:
+        """
+        ``(256 * (N + 1), 3)`` uint8 table; row ``grey * (N + 1) + bucket``.
+
+        ``fused = (grey * (256 - a) + colour * a + 128) >> 8`` with
+        ``a = alpha * 256``; bucket ``N`` is the unblended grey level.
+        """
+        key = (colormap, weight)
+        if key != self._blend_key or self._blend_lut is None:
+            lut = colormap_lut(colormap)
+            colours = np.concatenate([lut, np.zeros((1, 3), dtype=np.uint8)])
+            grey = np.arange(256, dtype=np.uint16)[:, np.newaxis, np.newaxis]
+            table = colours[np.newaxis].astype(np.uint16) * np.uint16(weight)
+            table = (table + grey * np.uint16(256 - weight) + np.uint16(128)) >> 8
+            table[:, -1, :] = grey[:, 0, :]
+            self._blend_lut = np.ascontiguousarray(
+                table.astype(np.uint8).reshape(-1, 3)
+            )
+            self._blend_key = key
+        return self._blend_lut
+
+    def composite(
+        self,
+        base_array: np.ndarray,
+        overlay_array: np.ndarray,
+        alpha: float,
+        colormap: str,
+        threshold: float,
+        overlay_wl: tuple[float, float],
+        base_wl: tuple[float, float] | None = None,
+    ) -> np.ndarray:
+        """
+        Blend an aligned overlay onto an integer base slice.
+
+        Args:
+            base_array: 2D integer base slice (see ``supports``)
+            overlay_array: 2D overlay slice with the base's shape
+            alpha: Overlay opacity (0-1)
+            colormap: Matplotlib colormap name
+            threshold: Overlay visibility threshold (0-1, normalised space)
+            overlay_wl: (window, level) for the overlay
+            base_wl: Optional (window, level) for the base; auto min/max if None
+
+        Returns:
+            The compositor's (rows, cols, 3) uint8 output buffer
+        """
+        shape = (int(base_array.shape[0]), int(base_array.shape[1]))
+        self._ensure_buffers(shape)
+        assert self._output is not None and self._scaled is not None
+        assert self._index is not None and self._mask is not None
+        assert self._code is not None
+
+        weight = int(round(min(max(alpha, 0.0), 1.0) * 256))
+        table = self._blend_table(colormap, weight)
+        n_colours = table.shape[0] // 256 - 1
+        window, level = overlay_wl
+        code = self._code
+        self._base_rows(base_array, base_wl, n_colours + 1, code)
+
+        # scaled = normalized * N; bucket = floor(scaled) clipped to [0, N-1]
+        scaled = self._scaled
+        np.subtract(overlay_array, level - window / 2.0, out=scaled, casting="unsafe")
+        np.multiply(scaled, n_colours / window, out=scaled)
+
+        # The float path tests the clipped value against the threshold; for a
+        # limit in (0, N] the unclipped comparison is equivalent. NaN never
+        # passes, as in the float path.
+        if threshold > 1.0:
+            limit = np.inf
+        elif threshold > 0.0:
+            limit = threshold * n_colours
+        else:
+            limit = -np.inf
+        np.greater_equal(scaled, limit, out=self._mask)
+        np.logical_not(self._mask, out=self._mask)  # now: pixels left unblended
+
+        # fmax / fmin clip like np.clip but also map NaN to 0, so the cast is
+        # defined everywhere; masked pixels are overwritten below anyway.
+        np.fmax(scaled, 0.0, out=scaled)
+        np.fmin(scaled, n_colours - 1, out=scaled)
+        np.copyto(self._index, scaled, casting="unsafe")
+        np.copyto(self._index, n_colours, where=self._mask)
+
+        np.add(code, self._index, out=code)
+        np.take(table, code, axis=0, out=self._output, mode="clip")
+        return self._output
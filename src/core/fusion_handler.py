@@ -68,8 +68,14 @@ class FusionHandler:
     - Interpolate overlay slices when needed
     """
 
-    def __init__(self):
-        """Initialize fusion handler with default state."""
+    def __init__(self, disk_cache: Any | None = None):
+        """
+        Initialize fusion handler with default state.
+
+        Args:
+            disk_cache: Optional shared ``core.fusion_cache.FusionCache`` for
+                resampled overlay volumes (None when the cache is disabled).
+        """
         self.base_series_uid: str | None = None
         self.overlay_series_uid: str | None = None
         self.fusion_enabled: bool = False
@@ -85,8 +91,9 @@ class FusionHandler:
         self.resampling_mode: str = 'high_accuracy'  # 'fast', 'high_accuracy'
         self.interpolation_method: str = 'linear'  # 'linear', 'nearest', 'cubic', 'b-spline'
 
-        # Phase 2: Image resampler for 3D volume resampling
-        self.image_resampler = ImageResampler()
+        # Phase 2: Image resampler for 3D volume resampling (first view resamples
+        # only the displayed slice; the volume is filled in the background)
+        self.image_resampler = ImageResampler(background_fill=True, disk_cache=disk_cache)
 
         # Cache for slice locations
         self._slice_location_cache: dict[str, list[tuple[int, float]]] = {}
@@ -737,14 +744,24 @@ class FusionHandler:
             return None
         return self._alignment_cache.get((base_series_uid, overlay_series_uid))
 
-    def clear_alignment_cache(self, series_uid: str | None = None) -> None:
+    def clear_alignment_cache(
+        self,
+        series_uid: str | None = None,
+        persistent: bool = False,
+    ) -> None:
         """
         Clear alignment cache.
         
         Args:
             series_uid: If provided, clear only entries involving this series UID.
                        If None, clear entire cache.
+            persistent: Also remove the matching resampled volumes from the
+                       persistent fusion cache. Leave False when only the
+                       selection changes, so the volumes survive for reuse.
         """
+        if persistent and self.image_resampler is not None:
+            self.image_resampler.invalidate_disk_cache(series_uid)
+
         if series_uid is None:
             self._alignment_cache.clear()
             return
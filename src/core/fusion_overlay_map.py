@@ -0,0 +1,178 @@
+"""
+Fusion Overlay Alignment Map
+
+Precomputed 2D resize + translation of fusion overlay slices.
+
+In 2D (fast) fusion mode every displayed slice used to go through a PIL
+round trip (float32 array -> ``Image`` -> BILINEAR resize -> array) followed
+by ``FusionProcessor._apply_translation_offset``, which allocates another
+canvas. Spacing ratio and offset are fixed for a base/overlay series pair,
+so ``OverlayAlignmentMap`` turns them into per-axis tap tables once and then
+aligns each slice with two separable gathers into reusable buffers.
+
+The tap tables reproduce PIL's BILINEAR resampling coefficients exactly
+(triangle filter, widened by the reduction factor when downscaling,
+renormalised at the image edges), and the rounded integer translation plus
+the base-sized canvas are folded into the same tables, so results match the
+PIL path to float32 rounding.
+
+Inputs:
+    2D float32 overlay slice, target resize (width, height) or None, base
+    (rows, cols) canvas shape, optional (x, y) pixel translation.
+
+Outputs:
+    2D float32 aligned overlay (the map's reusable buffer).
+
+Requirements:
+    numpy
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class _AxisTaps(NamedTuple):
+    """Per-axis gather: ``out[o] = sum_k weights[k, o] * in[indices[k, o]]``."""
+
+    indices: np.ndarray  # (k, n_out) intp
+    weights: np.ndarray  # (k, n_out) float32
+    identity: bool
+
+
+def _axis_taps(in_size: int, out_size: int, offset: int, canvas_size: int) -> _AxisTaps:
+    """
+    Tap table mapping ``in_size`` samples onto a ``canvas_size`` axis.
+
+    The input is resized to ``out_size`` with PIL's BILINEAR coefficients and
+    placed at ``offset`` on a zero canvas; canvas samples outside the resized
+    extent get zero weight.
+    """
+    if in_size == out_size == canvas_size and offset == 0:
+        index = np.arange(canvas_size, dtype=np.intp)[np.newaxis]
+        return _AxisTaps(index, np.ones((1, canvas_size), dtype=np.float32), True)
+
+    scale = in_size / out_size
+    filterscale = max(scale, 1.0)
+    support = filterscale  # bilinear filter support is 1.0
+    centers = (np.arange(out_size, dtype=np.float64) + 0.5) * scale
+    # int() truncation toward zero, then clamped, as in PIL's precompute_coeffs
+    xmin = np.maximum(np.trunc(centers - support + 0.5), 0).astype(np.intp)
+    xmax = np.minimum(np.trunc(centers + support + 0.5), in_size).astype(np.intp)
+    n_taps = max(int(np.max(xmax - xmin)), 1)
+
+    taps = xmin[:, np.newaxis] + np.arange(n_taps, dtype=np.intp)[np.newaxis]
+    weights = 1.0 - np.abs((taps - centers[:, np.newaxis] + 0.5) / filterscale)
+    weights = np.clip(weights, 0.0, None)
+    weights[taps >= xmax[:, np.newaxis]] = 0.0
+    totals = weights.sum(axis=1, keepdims=True)
+    np.divide(weights, totals, out=weights, where=totals != 0)
+    np.minimum(taps, in_size - 1, out=taps)
+
+    position = np.arange(canvas_size, dtype=np.intp) - offset
+    valid = (position >= 0) & (position < out_size)
+    indices = np.zeros((canvas_size, n_taps), dtype=np.intp)
+    canvas_weights = np.zeros((canvas_size, n_taps), dtype=np.float32)
+    indices[valid] = taps[position[valid]]
+    canvas_weights[valid] = weights[position[valid]]
+    return _AxisTaps(
+        np.ascontiguousarray(indices.T),
+        np.ascontiguousarray(canvas_weights.T),
+        False,
+    )
+
+
+class OverlayAlignmentMap:
+    """
+    Cached overlay resize + translation for one base/overlay series pair.
+
+    The tap tables are rebuilt only when the alignment key (overlay shape,
+    resize target, canvas shape, rounded offset) changes; otherwise each
+    ``align`` call reuses both the tables and the output buffers. The
+    returned array is overwritten by the next ``align`` call.
+    """
+
+    def __init__(self) -> None:
+        self._key: tuple[int, int, int, int, int, int, int, int] | None = None
+        self._rows: _AxisTaps | None = None
+        self._cols: _AxisTaps | None = None
+        self._row_pass: np.ndarray | None = None
+        self._row_gather: np.ndarray | None = None
+        self._output: np.ndarray | None = None
+        self._col_gather: np.ndarray | None = None
+
+    def align(
+        self,
+        overlay_array: np.ndarray,
+        resize_to: tuple[int, int] | None,
+        canvas_shape: tuple[int, int] | None,
+        translation_offset: tuple[float, float] | None,
+    ) -> np.ndarray:
+        """
+        Resize and translate one overlay slice.
+
+        Args:
+            overlay_array: 2D float32 overlay slice
+            resize_to: Optional (width, height) to resize the overlay to
+            canvas_shape: Base (rows, cols); used when ``translation_offset``
+                is given, as in ``FusionProcessor._apply_translation_offset``
+            translation_offset: Optional (x_offset, y_offset) in pixels
+
+        Returns:
+            Aligned float32 overlay (reusable buffer, or the input unchanged
+            when no resize or translation applies)
+        """
+        in_rows, in_cols = (int(n) for n in overlay_array.shape[:2])
+        if resize_to is not None:
+            out_cols, out_rows = int(resize_to[0]), int(resize_to[1])
+        else:
+            out_rows, out_cols = in_rows, in_cols
+        if translation_offset is not None and canvas_shape is not None:
+            canvas_rows, canvas_cols = (int(n) for n in canvas_shape[:2])
+            offset_x = int(round(translation_offset[0]))
+            offset_y = int(round(translation_offset[1]))
+        else:
+            canvas_rows, canvas_cols = out_rows, out_cols
+            offset_x = offset_y = 0
+
+        key: tuple[int, int, int, int, int, int, int, int] = (in_rows, in_cols, out_rows, out_cols, canvas_rows, canvas_cols, offset_x, offset_y)
+        if key != self._key:
+            self._rows = _axis_taps(in_rows, out_rows, offset_y, canvas_rows)
+            self._cols = _axis_taps(in_cols, out_cols, offset_x, canvas_cols)
+            self._row_pass = np.empty((canvas_rows, in_cols), dtype=np.float32)
+            self._row_gather = np.empty((canvas_rows, in_cols), dtype=np.float32)
+            self._output = np.empty((canvas_rows, canvas_cols), dtype=np.float32)
+            self._col_gather = np.empty((canvas_rows, canvas_cols), dtype=np.float32)
+            self._key = key
+        assert self._rows is not None and self._cols is not None
+        if self._rows.identity and self._cols.identity:
+            return overlay_array
+
+        rows = overlay_array
+        if not self._rows.identity:
+            rows = self._gather(overlay_array, self._rows, 0, self._row_pass, self._row_gather)
+        if self._cols.identity:
+            assert self._output is not None
+            np.copyto(self._output, rows)
+            return self._output
+        return self._gather(rows, self._cols, 1, self._output, self._col_gather)
+
+    @staticmethod
+    def _gather(
+        source: np.ndarray,
+        taps: _AxisTaps,
+        axis: int,
+        out: np.ndarray | None,
+        scratch: np.ndarray | None,
+    ) -> np.ndarray:
+        assert out is not None and scratch is not None
+        for k in range(taps.indices.shape[0]):
+            weight = taps.weights[k][:, np.newaxis] if axis == 0 else taps.weights[k]
+            target = out if k == 0 else scratch
+            np.take(source, taps.indices[k], axis=axis, out=target, mode="clip")
+            np.multiply(target, weight, out=target)
+            if k:
+                np.add(out, scratch, out=out)
+        return out
@@ -23,6 +23,8 @@ from typing import Any, ClassVar
 import numpy as np
 from PIL import Image
 
+from core.fusion_compositor import FusionLutCompositor
+from core.fusion_overlay_map import OverlayAlignmentMap
 from utils.debug_flags import DEBUG_OFFSET
 
 _COLORMAP_CACHE: dict[str, Any] = {}
@@ -96,6 +98,20 @@ class FusionProcessor:
         mask = (array >= threshold).astype(np.float32)
         return mask
 
+    @staticmethod
+    def get_colormap(colormap_name: str = 'hot') -> Any:
+        """Return the cached matplotlib colormap, falling back to 'hot'."""
+        cmap = _COLORMAP_CACHE.get(colormap_name)
+        if cmap is None:
+            import matplotlib  # deferred import (P1.7)
+            try:
+                cmap = matplotlib.colormaps.get_cmap(colormap_name)
+            except (ValueError, KeyError):
+                print(f"Warning: Colormap '{colormap_name}' not found, using 'hot'")
+                cmap = matplotlib.colormaps.get_cmap('hot')
+            _COLORMAP_CACHE[colormap_name] = cmap
+        return cmap
+
     @staticmethod
     def apply_colormap(
         array: np.ndarray,
@@ -110,15 +126,7 @@ class FusionProcessor:
         Returns:
             RGB array (0-1 range, float32, shape [..., 3])
         """
-        cmap = _COLORMAP_CACHE.get(colormap_name)
-        if cmap is None:
-            import matplotlib  # deferred import (P1.7)
-            try:
-                cmap = matplotlib.colormaps.get_cmap(colormap_name)
-            except (ValueError, KeyError):
-                print(f"Warning: Colormap '{colormap_name}' not found, using 'hot'")
-                cmap = matplotlib.colormaps.get_cmap('hot')
-            _COLORMAP_CACHE[colormap_name] = cmap
+        cmap = FusionProcessor.get_colormap(colormap_name)
 
         # cmap() returns float64 RGBA; cast to float32 RGB immediately (P1.3)
         colored = cmap(array).astype(np.float32)[..., :3]
@@ -136,7 +144,9 @@ class FusionProcessor:
         base_pixel_spacing: tuple[float, float] | None = None,
         overlay_pixel_spacing: tuple[float, float] | None = None,
         translation_offset: tuple[float, float] | None = None,
-        skip_2d_resize: bool = False
+        skip_2d_resize: bool = False,
+        compositor: FusionLutCompositor | None = None,
+        overlay_map: OverlayAlignmentMap | None = None
     ) -> np.ndarray:
         """
         Create fused image by blending base and overlay with colormap.
@@ -153,13 +163,16 @@ class FusionProcessor:
             overlay_pixel_spacing: Optional (row_spacing, col_spacing) in mm for overlay image
             translation_offset: Optional (x_offset, y_offset) in pixels for overlay positioning
             skip_2d_resize: If True, skip 2D resize (overlay already resampled via 3D, e.g., SimpleITK)
+            compositor: Optional FusionLutCompositor; used for integer bases with
+                an overlay W/L, in which case its reusable buffer is returned
+            overlay_map: Optional OverlayAlignmentMap; resizes and translates the
+                overlay with cached per-pair taps instead of PIL and a new canvas
             
         Returns:
             Fused RGB array (0-255, uint8)
         """
-        # Ensure float32 — skip copy if already correct dtype (P1.3)
-        if base_array.dtype != np.float32:
-            base_array = base_array.astype(np.float32)
+        # The overlay is aligned in float32; the base is cast only on the
+        # float blend path below (the LUT compositor reads integer bases).
         if overlay_array.dtype != np.float32:
             overlay_array = overlay_array.astype(np.float32)
 
@@ -171,6 +184,7 @@ class FusionProcessor:
             print(f"  skip_2d_resize: {skip_2d_resize}")
 
         # Phase 2: Skip 2D resize if 3D resampling was already applied
+        resize_to: tuple[int, int] | None = None  # (width, height)
         if not skip_2d_resize:
             # Apply pixel spacing-based scaling if both spacings are provided
             if base_pixel_spacing is not None and overlay_pixel_spacing is not None:
@@ -185,56 +199,57 @@ class FusionProcessor:
                 new_height = int(overlay_array.shape[0] * scale_y)
 
                 # Resize overlay to match physical dimensions
-                from PIL import Image as PILImage
-                overlay_pil = PILImage.fromarray(overlay_array)
-                overlay_pil = overlay_pil.resize(
-                    (new_width, new_height),
-                    PILImage.Resampling.BILINEAR
-                )
-                overlay_array = np.array(overlay_pil, dtype=np.float32)
+                resize_to = (new_width, new_height)
 
                 if DEBUG_OFFSET:
                     print(f"  [SCALING] scale_x: {scale_x:.4f}, scale_y: {scale_y:.4f}")
                     print(f"  [SCALING] new dimensions: {new_width} x {new_height}")
-                    print(f"  [SCALING] overlay_array after resize shape: {overlay_array.shape}")
-                    print(f"  [SCALING] overlay_array after resize range: [{np.min(overlay_array):.2f}, {np.max(overlay_array):.2f}]")
             elif base_array.shape != overlay_array.shape:
                 # Fallback: simple resize to match base dimensions if no spacing info
-                from PIL import Image as PILImage
-                overlay_pil = PILImage.fromarray(overlay_array)
-                overlay_pil = overlay_pil.resize(
-                    (base_array.shape[1], base_array.shape[0]),
-                    PILImage.Resampling.BILINEAR
-                )
-                overlay_array = np.array(overlay_pil, dtype=np.float32)
+                resize_to = (base_array.shape[1], base_array.shape[0])
         else:
             # Phase 2: 3D resampling was used, overlay should already match base dimensions
             # Just verify shapes match
             if overlay_array.shape[:2] != base_array.shape[:2]:
                 print(f"Warning: 3D resampled overlay shape {overlay_array.shape[:2]} doesn't match base {base_array.shape[:2]}")
                 # Fallback: resize to match
-                from PIL import Image as PILImage
-                overlay_pil = PILImage.fromarray(overlay_array)
-                overlay_pil = overlay_pil.resize(
-                    (base_array.shape[1], base_array.shape[0]),
-                    PILImage.Resampling.BILINEAR
-                )
-                overlay_array = np.array(overlay_pil, dtype=np.float32)
+                resize_to = (base_array.shape[1], base_array.shape[0])
 
         # Apply translation offset if provided (ONLY for 2D mode)
         # 3D resampling handles spatial alignment automatically through the resampling grid
         # For 3D mode, translation_offset should be None
-        if translation_offset is not None:
+        if overlay_map is not None:
+            # Cached per-pair tap tables: resize and translation in one gather
+            overlay_array = overlay_map.align(
+                overlay_array, resize_to, base_array.shape[:2], translation_offset
+            )
+        else:
+            if resize_to is not None:
+                overlay_array = FusionProcessor._resize_overlay(overlay_array, resize_to)
+            if translation_offset is not None:
+                overlay_array = FusionProcessor._apply_translation_offset(
+                    overlay_array, translation_offset[0], translation_offset[1], base_array.shape
+                )
+
+        if DEBUG_OFFSET and resize_to is not None:
+            print(f"  [SCALING] overlay_array after resize shape: {overlay_array.shape}")
+            print(f"  [SCALING] overlay_array after resize range: [{np.min(overlay_array):.2f}, {np.max(overlay_array):.2f}]")
+        if DEBUG_OFFSET and translation_offset is not None:
             offset_x, offset_y = translation_offset
-            overlay_array = FusionProcessor._apply_translation_offset(
-                overlay_array, offset_x, offset_y, base_array.shape
+            print(f"  [TRANSLATION] offset applied (2D mode): ({offset_x:.2f}, {offset_y:.2f})")
+            print(f"  [TRANSLATION] overlay_array after translation shape: {overlay_array.shape}")
+            print(f"  [TRANSLATION] overlay_array after translation range: [{np.min(overlay_array):.2f}, {np.max(overlay_array):.2f}]")
+            print(f"  [TRANSLATION] non-zero pixels: {np.count_nonzero(overlay_array)}")
+
+        if compositor is not None and compositor.supports(base_array, overlay_array, overlay_wl):
+            assert overlay_wl is not None
+            return compositor.composite(
+                base_array, overlay_array, alpha, colormap, threshold, overlay_wl, base_wl
             )
 
-            if DEBUG_OFFSET:
-                print(f"  [TRANSLATION] offset applied (2D mode): ({offset_x:.2f}, {offset_y:.2f})")
-                print(f"  [TRANSLATION] overlay_array after translation shape: {overlay_array.shape}")
-                print(f"  [TRANSLATION] overlay_array after translation range: [{np.min(overlay_array):.2f}, {np.max(overlay_array):.2f}]")
-                print(f"  [TRANSLATION] non-zero pixels: {np.count_nonzero(overlay_array)}")
+        # Ensure float32 — skip copy if already correct dtype (P1.3)
+        if base_array.dtype != np.float32:
+            base_array = base_array.astype(np.float32)
 
         # Normalize base image
         if base_wl is not None:
@@ -298,6 +313,21 @@ class FusionProcessor:
 
         return fused
 
+    @staticmethod
+    def _resize_overlay(
+        overlay_array: np.ndarray,
+        size: tuple[int, int]
+    ) -> np.ndarray:
+        """
+        Resize a float32 overlay to (width, height) with PIL BILINEAR.
+
+        ``OverlayAlignmentMap`` reproduces this resampling without the PIL
+        round trip; this is the path used when no map is supplied.
+        """
+        overlay_pil = Image.fromarray(overlay_array)
+        overlay_pil = overlay_pil.resize(size, Image.Resampling.BILINEAR)
+        return np.array(overlay_pil, dtype=np.float32)
+
     @staticmethod
     def _apply_translation_offset(
         overlay_array: np.ndarray,
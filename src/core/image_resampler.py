@@ -38,6 +38,7 @@ except ImportError:
     pass
 
 from core.dicom_processor import DICOMProcessor
+from core.fusion_cache import make_fusion_cache_key
 from utils.dicom_utils import (
     get_image_orientation,
     get_image_position,
@@ -57,6 +58,84 @@ class _ResamplingContext:
     reference_series_uid: str | None
     interpolator: str
     cache_key: tuple[str, str, str] | None
+    disk_key: str | None = None
+
+
+_IDENTITY_DIRECTION = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+
+
+def _vec3(values: Any) -> tuple[float, float, float]:
+    """First three entries of *values* as an (x, y, z) float tuple."""
+    return (float(values[0]), float(values[1]), float(values[2]))
+
+
+@dataclass(frozen=True)
+class _ReferenceGrid:
+    """Output grid of a reference series in SimpleITK (x, y, z) order."""
+
+    size: tuple[int, int, int]
+    origin: tuple[float, float, float]
+    spacing: tuple[float, float, float]
+    direction: tuple[float, ...]
+
+    def slice_grid(self, slice_idx: int) -> "_ReferenceGrid":
+        """One-slice grid at index *slice_idx* along the slice axis."""
+        step = self.spacing[2] * slice_idx
+        origin = _vec3(
+            [self.origin[axis] + step * self.direction[3 * axis + 2] for axis in range(3)]
+        )
+        return _ReferenceGrid(
+            size=(self.size[0], self.size[1], 1),
+            origin=origin,
+            spacing=self.spacing,
+            direction=self.direction,
+        )
+
+    @classmethod
+    def of_image(cls, image: Any) -> "_ReferenceGrid":
+        """Grid of a SimpleITK image."""
+        width, height, depth = (int(v) for v in image.GetSize())
+        return cls(
+            size=(width, height, depth),
+            origin=_vec3(image.GetOrigin()),
+            spacing=_vec3(image.GetSpacing()),
+            direction=tuple(float(v) for v in image.GetDirection()),
+        )
+
+    def as_dict(self) -> dict[str, list[Any]]:
+        """JSON-ready geometry for the fusion disk cache."""
+        return {
+            "size": list(self.size),
+            "origin": list(self.origin),
+            "spacing": list(self.spacing),
+            "direction": list(self.direction),
+        }
+
+    def matches(self, geometry: dict[str, Any], tolerance: float = 1e-4) -> bool:
+        """True if cached *geometry* describes this grid."""
+        try:
+            if [int(v) for v in geometry["size"]] != list(self.size):
+                return False
+            cached = [*geometry["origin"], *geometry["spacing"], *geometry["direction"]]
+            current = [*self.origin, *self.spacing, *self.direction]
+            return len(cached) == len(current) and all(
+                abs(float(a) - float(b)) <= tolerance for a, b in zip(cached, current, strict=True)
+            )
+        except (KeyError, TypeError, ValueError):
+            return False
+
+
+@dataclass
+class _PendingFill:
+    """Converted overlay and reference grid of a volume still being resampled."""
+
+    overlay_sitk: Any
+    grid: _ReferenceGrid
+    interpolator: str
+    disk_key: str | None = None
+    series_keys: tuple[str, str] = ("", "")
+    thread: threading.Thread | None = None
+    failed: bool = False
 
 
 class ImageResampler:
@@ -80,8 +159,20 @@ class ImageResampler:
         'b-spline': sitk.sitkBSpline if sitk_available else None,
     }
 
-    def __init__(self):
-        """Initialize image resampler with cache."""
+    def __init__(self, background_fill: bool = False, disk_cache: Any | None = None):
+        """
+        Initialize image resampler with cache.
+
+        Args:
+            background_fill: When True, a cached request whose volume is not
+                resampled yet resamples only the requested reference slice and
+                resamples the full volume in a background thread; later
+                requests are served from the volume cache once it lands.
+                When False, the first request resamples the whole volume.
+            disk_cache: Optional ``core.fusion_cache.FusionCache``; volumes
+                resampled for cached requests are saved to it and read back
+                (memory-mapped) before resampling.
+        """
         if not sitk_available:
             print("Warning: SimpleITK not available. 3D resampling will not work.")
 
@@ -98,6 +189,32 @@ class ImageResampler:
         # key = reference_series_uid, value = sorted+filtered dataset list
         self._sorted_ref_cache: dict[str, list[Dataset]] = {}
 
+        # Volumes being resampled in the background (background_fill mode):
+        # key = same as _cache, value = converted overlay + reference grid
+        self._background_fill = background_fill
+        self._pending_fills: dict[tuple[str, str, str], _PendingFill] = {}
+        # Fill threads still running (including the disk save after publishing)
+        self._fill_threads: set[threading.Thread] = set()
+
+        # Persistent fusion cache (opt-in; None when disabled)
+        self._disk_cache = disk_cache
+
+    def set_disk_cache(self, disk_cache: Any | None) -> None:
+        """Attach or detach the persistent fusion cache (None disables it)."""
+        self._disk_cache = disk_cache
+
+    def invalidate_disk_cache(self, series_uid: str | None = None) -> int:
+        """
+        Remove persisted volumes involving *series_uid*, or all of them.
+
+        Returns:
+            Number of disk entries removed.
+        """
+        disk_cache = self._disk_cache
+        if disk_cache is None:
+            return 0
+        return disk_cache.invalidate(series_uid)
+
     def dicom_series_to_sitk(
         self,
         datasets: list[Dataset],
@@ -208,82 +325,128 @@ class ImageResampler:
             # Create SimpleITK image
             sitk_image = sitk.GetImageFromArray(volume)
 
-            # Extract spatial information from first dataset
-            ds = sorted_datasets[0]
-
-            # Origin (ImagePositionPatient) - SimpleITK uses (x, y, z)
-            ipp_arr = get_image_position(ds)
-            if ipp_arr is not None:
-                sitk_image.SetOrigin(ipp_arr.tolist())
-
-            # Pixel spacing
-            pixel_spacing = [1.0, 1.0]
-            ps_tuple = get_pixel_spacing(ds)
-            if ps_tuple is not None:
-                pixel_spacing = [ps_tuple[0], ps_tuple[1]]  # [row, col]
-
-            # Slice spacing (from consecutive slices or SliceThickness)
-            slice_spacing = 1.0
-            if len(sorted_datasets) > 1:
-                # Calculate from ImagePositionPatient differences
-                pos1 = get_image_position(sorted_datasets[0])
-                pos2 = get_image_position(sorted_datasets[1])
-                if pos1 is not None and pos2 is not None:
-                    # Calculate 3D distance
-                    distance_3d = np.linalg.norm(pos2 - pos1)
-
-                    # Get slice thickness for comparison
-                    get_slice_thickness(sorted_datasets[0])
-
-                    # Calculate slice spacing as component along slice normal
-                    orientation = get_image_orientation(sorted_datasets[0])
-                    if orientation is not None:
-                        row_cosines, col_cosines = orientation
-                        slice_normal = np.cross(row_cosines, col_cosines)
-                        slice_normal = slice_normal / np.linalg.norm(slice_normal)
-
-                        pos_diff = pos2 - pos1
-                        slice_spacing = abs(np.dot(pos_diff, slice_normal))
-                    else:
-                        slice_spacing = distance_3d
+            origin, spacing, direction = self._series_geometry(sorted_datasets)
+            if origin is not None:
+                sitk_image.SetOrigin(origin)
+            sitk_image.SetSpacing(spacing)
+            if direction is not None:
+                sitk_image.SetDirection(direction)
+
+            return sitk_image
+
+        except Exception as e:
+            print_redacted(f"Error converting DICOM series to SimpleITK: {e}")
+            _logger.debug("%s", sanitized_format_exc())
+            return None
+
+    def _series_geometry(
+        self,
+        sorted_datasets: list[Dataset],
+    ) -> tuple[list[float] | None, list[float], list[float] | None]:
+        """
+        Spatial metadata of a sorted, duplicate-filtered series from its headers.
+
+        Args:
+            sorted_datasets: Datasets sorted by location without duplicates
+
+        Returns:
+            Tuple of (origin, spacing, direction) in SimpleITK (x, y, z) order;
+            origin and direction are None when the tags are missing
+        """
+        # Extract spatial information from first dataset
+        ds = sorted_datasets[0]
+
+        # Origin (ImagePositionPatient) - SimpleITK uses (x, y, z)
+        origin = None
+        ipp_arr = get_image_position(ds)
+        if ipp_arr is not None:
+            origin = ipp_arr.tolist()
+
+        # Pixel spacing
+        pixel_spacing = [1.0, 1.0]
+        ps_tuple = get_pixel_spacing(ds)
+        if ps_tuple is not None:
+            pixel_spacing = [ps_tuple[0], ps_tuple[1]]  # [row, col]
+
+        # Slice spacing (from consecutive slices or SliceThickness)
+        slice_spacing = 1.0
+        if len(sorted_datasets) > 1:
+            # Calculate from ImagePositionPatient differences
+            pos1 = get_image_position(sorted_datasets[0])
+            pos2 = get_image_position(sorted_datasets[1])
+            if pos1 is not None and pos2 is not None:
+                # Calculate 3D distance
+                distance_3d = np.linalg.norm(pos2 - pos1)
+
+                # Calculate slice spacing as component along slice normal
+                orientation = get_image_orientation(sorted_datasets[0])
+                if orientation is not None:
+                    row_cosines, col_cosines = orientation
+                    slice_normal = np.cross(row_cosines, col_cosines)
+                    slice_normal = slice_normal / np.linalg.norm(slice_normal)
+
+                    pos_diff = pos2 - pos1
+                    slice_spacing = abs(np.dot(pos_diff, slice_normal))
                 else:
-                    st = get_slice_thickness(ds)
-                    if st is not None:
-                        slice_spacing = st
+                    slice_spacing = distance_3d
             else:
                 st = get_slice_thickness(ds)
                 if st is not None:
                     slice_spacing = st
-
-            # SimpleITK uses (x, y, z) order for spacing
-            # Pixel spacing is [row, col] in DICOM, which maps to [y, x] in SimpleITK
-            sitk_image.SetSpacing([pixel_spacing[1], pixel_spacing[0], slice_spacing])
-
-            # Direction cosines (ImageOrientationPatient)
-            orientation = get_image_orientation(ds)
-            if orientation is not None:
-                row_cosines, col_cosines = orientation
-                slice_cosines = np.cross(row_cosines, col_cosines)
-
-                # SimpleITK 3x3 direction matrix: each COLUMN is the
-                # physical direction of one image axis, flattened in
-                # row-major order.  Same convention as mpr_volume.py.
-                #   Column 0 (x-axis / cols) -> row_cosines
-                #   Column 1 (y-axis / rows) -> col_cosines
-                #   Column 2 (z-axis / slices) -> slice_cosines
-                direction = [
+        else:
+            st = get_slice_thickness(ds)
+            if st is not None:
+                slice_spacing = st
+
+        # SimpleITK uses (x, y, z) order for spacing
+        # Pixel spacing is [row, col] in DICOM, which maps to [y, x] in SimpleITK
+        spacing = [float(pixel_spacing[1]), float(pixel_spacing[0]), float(slice_spacing)]
+
+        # Direction cosines (ImageOrientationPatient)
+        direction = None
+        orientation = get_image_orientation(ds)
+        if orientation is not None:
+            row_cosines, col_cosines = orientation
+            slice_cosines = np.cross(row_cosines, col_cosines)
+
+            # SimpleITK 3x3 direction matrix: each COLUMN is the
+            # physical direction of one image axis, flattened in
+            # row-major order.  Same convention as mpr_volume.py.
+            #   Column 0 (x-axis / cols) -> row_cosines
+            #   Column 1 (y-axis / rows) -> col_cosines
+            #   Column 2 (z-axis / slices) -> slice_cosines
+            direction = [
+                float(v) for v in (
                     row_cosines[0], col_cosines[0], slice_cosines[0],
                     row_cosines[1], col_cosines[1], slice_cosines[1],
                     row_cosines[2], col_cosines[2], slice_cosines[2],
-                ]
-                sitk_image.SetDirection(direction)
+                )
+            ]
 
-            return sitk_image
+        return origin, spacing, direction
+
+    def _reference_grid(self, sorted_datasets: list[Dataset]) -> _ReferenceGrid | None:
+        """
+        Output grid of a sorted reference series, built from headers only.
 
+        Matches the grid of ``dicom_series_to_sitk(reference)`` without
+        decoding the reference pixel data.
+        """
+        if not sorted_datasets:
+            return None
+        try:
+            rows = int(sorted_datasets[0].Rows)
+            cols = int(sorted_datasets[0].Columns)
+            origin, spacing, direction = self._series_geometry(sorted_datasets)
         except Exception as e:
-            print_redacted(f"Error converting DICOM series to SimpleITK: {e}")
-            _logger.debug("%s", sanitized_format_exc())
+            print_redacted(f"Error reading reference grid: {e}")
             return None
+        return _ReferenceGrid(
+            size=(cols, rows, len(sorted_datasets)),
+            origin=_vec3(origin) if origin is not None else (0.0, 0.0, 0.0),
+            spacing=_vec3(spacing),
+            direction=tuple(direction) if direction is not None else _IDENTITY_DIRECTION,
+        )
 
     def _get_location(self, ds: Dataset) -> float | None:
         """
@@ -441,6 +604,42 @@ class ImageResampler:
             _logger.debug("%s", sanitized_format_exc())
             return None
 
+    def _resample_onto_grid(
+        self,
+        moving: Any,
+        grid: _ReferenceGrid,
+        interpolator: str = 'linear'
+    ) -> Any | None:
+        """
+        Resample *moving* onto *grid* (same transform and fill as resample_to_reference).
+
+        Unlike resample_to_reference no reference image is needed, so a
+        single-slice grid costs one output slice.
+        """
+        if not sitk_available or moving is None:
+            return None
+
+        try:
+            interp_method = self.INTERPOLATION_METHODS.get(interpolator.lower(), sitk.sitkLinear)
+            if interp_method is None:
+                interp_method = sitk.sitkLinear
+
+            resample = sitk.ResampleImageFilter()
+            resample.SetSize([int(v) for v in grid.size])
+            resample.SetOutputOrigin(list(grid.origin))
+            resample.SetOutputSpacing(list(grid.spacing))
+            resample.SetOutputDirection(list(grid.direction))
+            resample.SetTransform(sitk.Transform(3, sitk.sitkIdentity))
+            resample.SetInterpolator(interp_method)
+            resample.SetDefaultPixelValue(0.0)
+            resample.SetOutputPixelType(moving.GetPixelID())
+            return resample.Execute(moving)
+
+        except Exception as e:
+            print_redacted(f"Error resampling image: {e}")
+            _logger.debug("%s", sanitized_format_exc())
+            return None
+
     def get_resampled_slice(
         self,
         overlay_datasets: list[Dataset],
@@ -455,8 +654,10 @@ class ImageResampler:
         Get resampled slice from overlay volume.
         
         Caches full volume resampling for performance. Extracts the requested slice
-        from the cached resampled volume.
-        
+        from the cached resampled volume. With background_fill, a cached request
+        whose volume is not ready yet resamples only the requested slice while
+        the volume is built in a background thread.
+
         Args:
             overlay_datasets: List of overlay series datasets
             reference_datasets: List of reference (base) series datasets
@@ -495,7 +696,33 @@ class ImageResampler:
                 reference_series_uid,
                 normalized_interpolator,
             ),
+            disk_key=self._get_disk_cache_key(
+                use_cache,
+                overlay_series_uid,
+                reference_series_uid,
+                len(overlay_datasets),
+                len(reference_datasets),
+                normalized_interpolator,
+            ),
         )
+        if (
+            context.disk_key is not None
+            and context.cache_key is not None
+            and self._get_cached_volume(context.cache_key) is None
+        ):
+            self._load_volume_from_disk(context, sorted_reference_datasets)
+        if (
+            self._background_fill
+            and context.cache_key is not None
+            and self._get_cached_volume(context.cache_key) is None
+        ):
+            return self._get_on_demand_slice(
+                overlay_datasets,
+                sorted_reference_datasets,
+                sorted_slice_idx,
+                context,
+            )
+
         resampled_volume = self._get_resampled_volume(
             overlay_datasets,
             reference_datasets,
@@ -565,6 +792,61 @@ class ImageResampler:
             return (overlay_series_uid, reference_series_uid, interpolator.lower())
         return None
 
+    def _get_disk_cache_key(
+        self,
+        use_cache: bool,
+        overlay_series_uid: str | None,
+        reference_series_uid: str | None,
+        overlay_count: int,
+        reference_count: int,
+        interpolator: str,
+    ) -> str | None:
+        """Return the persistent cache key when a disk cache is attached and caching is enabled."""
+        if self._disk_cache is None or not (use_cache and overlay_series_uid and reference_series_uid):
+            return None
+        return make_fusion_cache_key(
+            overlay_series_uid,
+            reference_series_uid,
+            overlay_count,
+            reference_count,
+            interpolator,
+        )
+
+    def _load_volume_from_disk(
+        self,
+        context: _ResamplingContext,
+        sorted_reference_datasets: list[Dataset],
+    ) -> bool:
+        """Publish a persisted volume into the memory caches if its grid still matches."""
+        disk_cache = self._disk_cache
+        if disk_cache is None or context.disk_key is None or context.cache_key is None:
+            return False
+        loaded = disk_cache.load(context.disk_key)
+        if loaded is None:
+            return False
+        volume_array, meta = loaded
+        grid = self._reference_grid(sorted_reference_datasets)
+        if grid is None or not grid.matches(meta):
+            return False
+        with self._cache_lock:
+            self._pending_fills.pop(context.cache_key, None)
+            self._store_volume_locked(context.cache_key, volume_array)
+            self._numpy_cache[context.cache_key] = volume_array
+        return True
+
+    def _save_volume_to_disk(
+        self,
+        disk_key: str | None,
+        volume_array: np.ndarray,
+        grid: _ReferenceGrid,
+        series_keys: tuple[str, str],
+    ) -> None:
+        """Persist a resampled volume when a disk cache is attached."""
+        disk_cache = self._disk_cache
+        if disk_cache is None or disk_key is None:
+            return
+        disk_cache.save(disk_key, volume_array, grid.as_dict(), series_keys)
+
     def _get_resampled_volume(
         self,
         overlay_datasets: list[Dataset],
@@ -596,8 +878,135 @@ class ImageResampler:
             return None
 
         self._cache_resampled_volume(context.cache_key, resampled_volume)
+        if context.disk_key is not None:
+            volume_array = self._get_numpy_volume(resampled_volume, context.cache_key)
+            if volume_array is not None:
+                self._save_volume_to_disk(
+                    context.disk_key,
+                    volume_array,
+                    _ReferenceGrid.of_image(resampled_volume),
+                    (context.overlay_series_uid or "", context.reference_series_uid or ""),
+                )
         return resampled_volume
 
+    def _get_on_demand_slice(
+        self,
+        overlay_datasets: list[Dataset],
+        sorted_reference_datasets: list[Dataset],
+        sorted_slice_idx: int,
+        context: _ResamplingContext,
+    ) -> np.ndarray | None:
+        """Resample one reference slice while the full volume is filled in the background."""
+        fill = self._get_pending_fill(overlay_datasets, sorted_reference_datasets, context)
+        if fill is None or sorted_slice_idx >= fill.grid.size[2]:
+            return None
+
+        resampled_slice = self._resample_onto_grid(
+            fill.overlay_sitk,
+            fill.grid.slice_grid(sorted_slice_idx),
+            fill.interpolator,
+        )
+        slice_array = self.sitk_to_numpy(resampled_slice)
+        if slice_array is None:
+            return None
+        return slice_array[0].astype(np.float32, copy=False)
+
+    def _get_pending_fill(
+        self,
+        overlay_datasets: list[Dataset],
+        sorted_reference_datasets: list[Dataset],
+        context: _ResamplingContext,
+    ) -> _PendingFill | None:
+        """
+        Read or start the background fill for a cache key.
+
+        The overlay series is converted to SimpleITK here, on the caller's
+        thread, because the first on-demand slice is resampled from it; only
+        the whole-volume resample runs in the background thread.
+        """
+        cache_key = context.cache_key
+        if cache_key is None:
+            return None
+        with self._cache_lock:
+            fill = self._pending_fills.get(cache_key)
+        if fill is not None:
+            return fill
+
+        overlay_sitk = self.dicom_series_to_sitk(
+            overlay_datasets,
+            context.overlay_series_uid,
+        )
+        grid = self._reference_grid(sorted_reference_datasets)
+        if overlay_sitk is None or grid is None:
+            return None
+
+        fill = _PendingFill(
+            overlay_sitk,
+            grid,
+            context.interpolator,
+            disk_key=context.disk_key,
+            series_keys=(context.overlay_series_uid or "", context.reference_series_uid or ""),
+        )
+        fill.thread = threading.Thread(
+            target=self._run_background_fill,
+            args=(cache_key, fill),
+            name="fusion-resample-fill",
+            daemon=True,
+        )
+        with self._cache_lock:
+            self._pending_fills[cache_key] = fill
+            self._fill_threads.add(fill.thread)
+        fill.thread.start()
+        return fill
+
+    def _run_background_fill(
+        self,
+        cache_key: tuple[str, str, str],
+        fill: _PendingFill,
+    ) -> None:
+        """Resample the full volume and publish it unless the fill was cleared."""
+        try:
+            self._fill_volume(cache_key, fill)
+        finally:
+            with self._cache_lock:
+                self._fill_threads.discard(threading.current_thread())
+
+    def _fill_volume(
+        self,
+        cache_key: tuple[str, str, str],
+        fill: _PendingFill,
+    ) -> None:
+        """Body of _run_background_fill."""
+        resampled_volume = self._resample_onto_grid(fill.overlay_sitk, fill.grid, fill.interpolator)
+        volume_array = self.sitk_to_numpy(resampled_volume)
+        with self._cache_lock:
+            if self._pending_fills.get(cache_key) is not fill:
+                return
+            if resampled_volume is None or volume_array is None:
+                # Keep serving single slices; do not restart the fill per scroll.
+                fill.failed = True
+                return
+            del self._pending_fills[cache_key]
+            self._store_volume_locked(cache_key, resampled_volume)
+            self._numpy_cache[cache_key] = volume_array
+        self._save_volume_to_disk(fill.disk_key, volume_array, fill.grid, fill.series_keys)
+
+    def wait_for_background_fill(self, timeout: float | None = None) -> bool:
+        """
+        Wait for running background fills.
+
+        Args:
+            timeout: Seconds to wait per fill, or None to wait until done
+
+        Returns:
+            True if no fill is still running
+        """
+        with self._cache_lock:
+            threads = list(self._fill_threads)
+        for thread in threads:
+            thread.join(timeout)
+        return not any(thread.is_alive() for thread in threads)
+
     def _get_cached_volume(self, cache_key: tuple[str, str, str] | None) -> Any | None:
         """Read a volume cache entry and refresh its LRU position."""
         if cache_key is None:
@@ -617,10 +1026,19 @@ class ImageResampler:
         if cache_key is None:
             return
         with self._cache_lock:
-            self._cache[cache_key] = resampled_volume
-            while len(self._cache) > self._MAX_CACHE_ENTRIES:
-                evicted_key, _ = self._cache.popitem(last=False)
-                self._numpy_cache.pop(evicted_key, None)
+            self._store_volume_locked(cache_key, resampled_volume)
+
+    def _store_volume_locked(
+        self,
+        cache_key: tuple[str, str, str],
+        resampled_volume: Any,
+    ) -> None:
+        """Insert a volume and apply LRU eviction; caller holds _cache_lock."""
+        self._cache[cache_key] = resampled_volume
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self._MAX_CACHE_ENTRIES:
+            evicted_key, _ = self._cache.popitem(last=False)
+            self._numpy_cache.pop(evicted_key, None)
 
     def _get_numpy_volume(
         self,
@@ -628,6 +1046,9 @@ class ImageResampler:
         cache_key: tuple[str, str, str] | None,
     ) -> np.ndarray | None:
         """Read or construct the cached NumPy representation of a volume."""
+        if isinstance(resampled_volume, np.ndarray):
+            # Memory-mapped volume published from the disk cache.
+            return resampled_volume
         volume_array = None
         if cache_key is not None:
             with self._cache_lock:
@@ -783,6 +1204,7 @@ class ImageResampler:
                 self._cache.clear()
                 self._numpy_cache.clear()
                 self._sorted_ref_cache.clear()
+                self._pending_fills.clear()
             else:
                 # Remove entries where either key component matches
                 keys_to_remove = [
@@ -794,3 +1216,6 @@ class ImageResampler:
                     self._numpy_cache.pop(key, None)
                 # Clear sorted ref cache for this series
                 self._sorted_ref_cache.pop(series_uid, None)
+                # Drop background fills so stale volumes are never published
+                for key in [key for key in self._pending_fills if series_uid in key]:
+                    del self._pending_fills[key]
@@ -19,8 +19,12 @@ Inputs:
     interpolation (str)           — "linear" (default), "nearest", "cubic".
 
 Outputs:
-    MprResult   — list of 2-D float32 NumPy arrays, output SliceStack,
-                  and rescale parameters from the source series.
+    MprResult   — sequence of 2-D float32 planes (held compactly as int16 /
+                  float16, see ``core.mpr_compact_stack``), output
+                  SliceStack, and rescale parameters from the source series.
+    On-demand mode (``MprBuilder.create_on_demand_result``) returns the
+    MprResult at once with lazily resliced planes; ``MprPlaneFillWorker``
+    completes it in the background (``core.mpr_on_demand``).
 
 Requirements:
     SimpleITK (pip install SimpleITK)
@@ -29,13 +33,15 @@ Requirements:
     pydicom
 
 Output grid math and standard LPS planes: ``core.mpr_geometry`` (Phase 5C).
+Chunked whole-grid resampling: ``core.mpr_reslice``.
 """
 
 from __future__ import annotations
 
 import traceback
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any, ClassVar
+from typing import Any
 
 import numpy as np
 from PySide6.QtCore import QThread, Signal
@@ -50,11 +56,10 @@ try:
 except ImportError:
     pass
 
-from core.mpr_geometry import (
-    compute_mpr_output_grid,
-    stack_positions_along_normal,
-    standard_slice_planes_lps,
-)
+from core.mpr_compact_stack import compact_mpr_stack, source_is_integer
+from core.mpr_geometry import standard_slice_planes_lps
+from core.mpr_on_demand import OnDemandMprStack
+from core.mpr_reslice import MprResliceEngine, reslice_parallel, resolve_build_workers
 from core.mpr_volume import MprVolume, MprVolumeError
 from core.slice_geometry import SlicePlane, SliceStack
 from utils.debug_flags import DEBUG_MPR
@@ -76,8 +81,11 @@ class MprResult:
     Output of a successful MprBuilder run.
 
     Attributes:
-        slices (List[np.ndarray]):
-            Ordered list of 2-D float32 NumPy arrays (one per output slice).
+        slices (Sequence[np.ndarray]):
+            Ordered 2-D float32 planes (one per output slice) — a
+            ``CompactMprStack`` for fully built stacks (int16/float16 storage,
+            float32 on read), an ``OnDemandMprStack`` that reslices planes
+            when first read, or a plain list.
         slice_stack (SliceStack):
             Phase-1 geometry for the MPR output — allows slice-sync and
             bounding-box queries.
@@ -94,7 +102,7 @@ class MprResult:
         rescale_intercept (Optional[float]):
             RescaleIntercept from the source series first dataset (if present).
     """
-    slices: list[np.ndarray]
+    slices: Sequence[np.ndarray]
     slice_stack: SliceStack
     output_spacing_mm: tuple[float, float]
     output_thickness_mm: float
@@ -110,6 +118,13 @@ class MprResult:
         """Number of output slices."""
         return len(self.slices)
 
+    @property
+    def is_complete(self) -> bool:
+        """False while an on-demand stack still has planes left to reslice."""
+        if isinstance(self.slices, OnDemandMprStack):
+            return self.slices.is_complete()
+        return True
+
     def apply_rescale(self, array: np.ndarray) -> np.ndarray:
         """
         Apply rescale slope/intercept to a pixel array if available.
@@ -143,13 +158,6 @@ class MprBuilderWorker(QThread):
     finished = Signal(object)   # MprResult (using object to avoid import cycle issues)
     error = Signal(str)
 
-    # SimpleITK interpolation method map
-    _INTERP_MAP: ClassVar[dict[str, str]] = {
-        "linear":  "sitkLinear",
-        "nearest": "sitkNearestNeighbor",
-        "cubic":   "sitkBSpline",
-    }
-
     def __init__(
         self,
         source_volume: MprVolume,
@@ -159,6 +167,7 @@ class MprBuilderWorker(QThread):
         interpolation: str = "linear",
         combine_mode: str = "none",
         slab_thickness_mm: float = 0.0,
+        build_workers: int = 1,
     ) -> None:
         """
         Args:
@@ -170,6 +179,8 @@ class MprBuilderWorker(QThread):
             interpolation:       "linear" | "nearest" | "cubic".
             combine_mode:       "none" | "mip" | "minip" | "aip".
             slab_thickness_mm: Slab thickness in mm used for combine modes.
+            build_workers:      Resample threads; 1 = serial, 0 = one per
+                                CPU core, N > 1 = N output slabs in parallel.
         """
         super().__init__()
         self._volume = source_volume
@@ -179,6 +190,7 @@ class MprBuilderWorker(QThread):
         self._interpolation = interpolation.lower()
         self._combine_mode = (combine_mode or "none").lower().strip()
         self._slab_thickness_mm = float(slab_thickness_mm or 0.0)
+        self._build_workers = resolve_build_workers(build_workers)
         self._cancelled = False
 
         source_spacing = self._volume.sitk_image.GetSpacing()
@@ -243,18 +255,18 @@ class MprBuilderWorker(QThread):
 
         # Determine output grid from the volume's bounding box projected onto
         # the output plane's coordinate system.
-        sitk_img = self._volume.sitk_image
-        grid = compute_mpr_output_grid(
-            np.array(sitk_img.GetOrigin()),
-            np.array(sitk_img.GetDirection()).reshape(3, 3),
-            sitk_img.GetSize(),
-            sitk_img.GetSpacing(),
-            self._output_plane.row_cosine,
-            self._output_plane.col_cosine,
-            self._output_plane.normal,
+        # Parallel mode pins ITK to one thread per call so the slab pool,
+        # not ITK's own thread pool, owns the cores.
+        parallel = self._build_workers > 1
+        engine = MprResliceEngine(
+            self._volume.sitk_image,
+            self._output_plane,
             self._output_spacing,
             self._output_thickness,
+            self._interpolation,
+            threads_per_call=1 if parallel else None,
         )
+        grid = engine.grid
         out_origin = grid.origin
         out_size = (grid.rows_px, grid.cols_px)
         n_slices = grid.n_slices
@@ -281,91 +293,67 @@ class MprBuilderWorker(QThread):
         # Collect rescale parameters from source.
         rescale_slope, rescale_intercept = self._get_rescale_params()
 
-        # Run per-slice resampling.
-        slices: list[np.ndarray] = []
-        mpr_planes: list[SlicePlane] = []
-
-        out_row_cosine = self._output_plane.row_cosine
-        out_col_cosine = self._output_plane.col_cosine
-        out_normal = self._output_plane.normal
-
-        # In-plane size in pixels.
-        out_rows_px, out_cols_px = out_size
-
-        for i in range(n_slices):
-            if self._cancelled:
-                raise MprVolumeError("Build cancelled.")
-
-            # Origin of this output slice along the output normal.
-            slice_origin = out_origin + out_normal * (i * self._output_thickness)
-
-            # Build a reference SimpleITK image representing one output slice.
-            ref_img = self._make_reference_image(
-                slice_origin, out_rows_px, out_cols_px
+        # Resample the whole output grid chunk by chunk into one stack array;
+        # each chunk is a single multi-plane SimpleITK resample.
+        stack = engine.allocate()
+        done = 0
+
+        def _on_chunk_done(count: int) -> None:
+            nonlocal done
+            done += count
+            self.progress.emit(15 + int(80 * done / max(n_slices, 1)))
+
+        if parallel:
+            _mpr_log(f"Parallel reslice: workers={self._build_workers}")
+            reslice_parallel(
+                engine,
+                stack,
+                self._build_workers,
+                is_cancelled=lambda: self._cancelled,
+                on_chunk_done=_on_chunk_done,
+            )
+        else:
+            engine.reslice_into(
+                stack,
+                is_cancelled=lambda: self._cancelled,
+                on_chunk_done=_on_chunk_done,
             )
 
-            # Resample the source volume onto this reference grid.
-            resampled = self._resample_to_reference(ref_img)
-            if resampled is None:
-                # Append a blank slice on failure — don't abort the whole build.
-                arr = np.zeros((out_rows_px, out_cols_px), dtype=np.float32)
-            else:
-                raw = sitk.GetArrayFromImage(resampled)
-                arr = raw.squeeze().astype(np.float32)
-                if arr.ndim == 3 and arr.shape[0] == 1:
-                    arr = arr[0]
-
-            if DEBUG_MPR and (
-                i < 3 or i == n_slices - 1 or (n_slices > 8 and i == n_slices // 2)
-            ):
-                non_zero = int(np.count_nonzero(arr))
+        # Keep the finished stack as int16/float16; planes are dequantised
+        # to float32 when read (core.mpr_compact_stack).
+        slices = compact_mpr_stack(
+            stack, integer_source=source_is_integer(self._volume.source_datasets)
+        )
+
+        if DEBUG_MPR:
+            sampled = {0, 1, 2, n_slices - 1}
+            if n_slices > 8:
+                sampled.add(n_slices // 2)
+            for i in sorted(j for j in sampled if 0 <= j < n_slices):
+                arr = slices[i]
                 _mpr_log(
                     f"Output slice {i + 1}/{n_slices}: "
                     f"shape={arr.shape} min={float(np.min(arr)):.4f} "
                     f"max={float(np.max(arr)):.4f} mean={float(np.mean(arr)):.4f} "
-                    f"nonzero={non_zero}/{arr.size}"
+                    f"nonzero={int(np.count_nonzero(arr))}/{arr.size}"
                 )
 
-            slices.append(arr)
-            mpr_planes.append(
-                SlicePlane(
-                    origin=slice_origin,
-                    row_cosine=out_row_cosine,
-                    col_cosine=out_col_cosine,
-                    row_spacing=self._output_spacing,
-                    col_spacing=self._output_spacing,
-                )
-            )
-
-            pct = 15 + int(80 * (i + 1) / max(n_slices, 1))
-            self.progress.emit(pct)
-
         # Slab combine (MIP / MinIP / AIP) is applied at display time from the
         # full uncombined stack, driven by subwindow_data and the right-pane
         # Combine Slices widget (see mpr_controller.display_mpr_slice).
 
         # Build output SliceStack from the MPR planes.
-        out_normal_arr = out_normal
-        positions = stack_positions_along_normal(mpr_planes, out_normal_arr)
-        out_stack = SliceStack(
-            planes=mpr_planes,
-            original_indices=list(range(len(mpr_planes))),
-            stack_normal=out_normal_arr,
-            positions=positions,
-            slice_thickness=self._output_thickness,
-        )
+        out_stack = engine.output_slice_stack()
 
         self.progress.emit(100)
 
         if DEBUG_MPR and slices:
-            mins = [float(np.min(arr)) for arr in slices]
-            maxs = [float(np.max(arr)) for arr in slices]
             non_zero_slices = sum(1 for arr in slices if np.count_nonzero(arr) > 0)
             _mpr_log(
                 "Build complete: "
                 f"slice_count={len(slices)} "
                 f"nonzero_slices={non_zero_slices}/{len(slices)} "
-                f"global_min={min(mins):.4f} global_max={max(maxs):.4f}"
+                f"global_min={float(stack.min()):.4f} global_max={float(stack.max()):.4f}"
             )
 
         return MprResult(
@@ -381,98 +369,96 @@ class MprBuilderWorker(QThread):
             slab_thickness_mm=0.0,
         )
 
-    def _make_reference_image(
+    def _get_rescale_params(
         self,
-        slice_origin: np.ndarray,
-        rows_px: int,
-        cols_px: int,
-    ) -> Any:
+    ) -> tuple[float | None, float | None]:
         """
-        Build a 2-D SimpleITK reference image for one output MPR slice.
-
-        The image has 1 pixel in the slice direction (z) so it acts as a
-        target grid for sitk.Resample.
-
-        Args:
-            slice_origin: Patient-space origin of this slice (mm).
-            rows_px:      Number of output rows.
-            cols_px:      Number of output columns.
+        Extract RescaleSlope and RescaleIntercept from the source series.
 
         Returns:
-            A sitk.Image with correct size / spacing / origin / direction.
+            (slope, intercept) as (float, float) or (None, None) if absent.
         """
-        ref = sitk.Image([cols_px, rows_px, 1], sitk.sitkFloat32)
+        return _source_rescale_params(self._volume)
+
+
+def _source_rescale_params(
+    volume: MprVolume,
+) -> tuple[float | None, float | None]:
+    """RescaleSlope / RescaleIntercept of the first source dataset (or Nones)."""
+    if not volume.source_datasets:
+        return None, None
+    ds = volume.source_datasets[0]
+    from core.dicom_rescale import get_rescale_parameters as _get_rp
+    slope, intercept, _ = _get_rp(ds)
+    if DEBUG_MPR and (slope is None) != (intercept is None):
+        _mpr_log(
+            "Unexpected partial rescale metadata on source dataset "
+            f"(RescaleSlope={slope!r}, RescaleIntercept={intercept!r}); "
+            "apply_rescale will be skipped unless both are present."
+        )
+    return slope, intercept
 
-        sp = self._output_spacing
-        ref.SetSpacing([sp, sp, self._output_thickness])
 
-        origin = [float(slice_origin[0]), float(slice_origin[1]), float(slice_origin[2])]
-        ref.SetOrigin(origin)
+# ---------------------------------------------------------------------------
+# On-demand plane filler (runs in background QThread)
+# ---------------------------------------------------------------------------
 
-        rc = self._output_plane.row_cosine
-        cc = self._output_plane.col_cosine
-        sn = self._output_plane.normal
-        direction = [
-            rc[0], cc[0], sn[0],
-            rc[1], cc[1], sn[1],
-            rc[2], cc[2], sn[2],
-        ]
-        ref.SetDirection(direction)
+class MprPlaneFillWorker(QThread):
+    """
+    Background thread that completes an on-demand MPR stack.
 
-        return ref
+    Reslices the missing planes of ``result.slices`` (an
+    ``OnDemandMprStack``) block by block, nearest the stack focus first.
+    Display reads stay responsive: each block is sized to the stack's
+    ``target_block_ms`` and the UI thread reslices any other plane it needs
+    immediately, without waiting for the block.
 
-    def _resample_to_reference(self, reference: Any) -> Any | None:
-        """
-        Resample the source volume onto a reference grid using identity transform.
+    Signals:
+        progress (int):  0–100 percent of planes resliced.
+        finished (MprResult):  Emitted once every plane exists.
+        error (str):     Emitted on failure with a human-readable message.
+    """
 
-        Args:
-            reference: Target grid (output slice definition).
+    progress = Signal(int)
+    finished = Signal(object)   # MprResult
+    error = Signal(str)
 
-        Returns:
-            Resampled sitk.Image, or None on failure.
+    def __init__(self, result: MprResult) -> None:
         """
-        interp_name = self._INTERP_MAP.get(self._interpolation, "sitkLinear")
-        try:
-            interp_method = getattr(sitk, interp_name)
-        except AttributeError:
-            interp_method = sitk.sitkLinear
+        Args:
+            result: MprResult whose ``slices`` is an ``OnDemandMprStack``.
+        """
+        super().__init__()
+        self._result = result
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Request cancellation; the thread stops after the current block."""
+        self._cancelled = True
 
+    def run(self) -> None:
+        """Entry point for the background thread."""
+        stack = self._result.slices
+        if not isinstance(stack, OnDemandMprStack):
+            if not self._cancelled:
+                self.finished.emit(self._result)
+            return
         try:
-            transform = sitk.Transform(3, sitk.sitkIdentity)
-            resampled = sitk.Resample(
-                self._volume.sitk_image,
-                reference,
-                transform,
-                interp_method,
-                0.0,
-                self._volume.sitk_image.GetPixelID(),
-            )
-            return resampled
+            total = max(len(stack), 1)
+            while not self._cancelled and stack.fill_next_block():
+                self.progress.emit(int(100 * stack.ready_count() / total))
+            if not self._cancelled and stack.is_complete():
+                _mpr_log(
+                    "On-demand fill complete: "
+                    f"slices={len(stack)} plane_ms={stack.plane_latency_ms}"
+                )
+                self.finished.emit(self._result)
         except Exception as exc:
-            _mpr_log(f"Resample failed: {exc}")
-            return None
-
-    def _get_rescale_params(
-        self,
-    ) -> tuple[float | None, float | None]:
-        """
-        Extract RescaleSlope and RescaleIntercept from the source series.
-
-        Returns:
-            (slope, intercept) as (float, float) or (None, None) if absent.
-        """
-        if not self._volume.source_datasets:
-            return None, None
-        ds = self._volume.source_datasets[0]
-        from core.dicom_rescale import get_rescale_parameters as _get_rp
-        slope, intercept, _ = _get_rp(ds)
-        if DEBUG_MPR and (slope is None) != (intercept is None):
-            _mpr_log(
-                "Unexpected partial rescale metadata on source dataset "
-                f"(RescaleSlope={slope!r}, RescaleIntercept={intercept!r}); "
-                "apply_rescale will be skipped unless both are present."
-            )
-        return slope, intercept
+            if not self._cancelled:
+                self.error.emit(
+                    f"Unexpected error while reslicing MPR planes: {exc}\n"
+                    + traceback.format_exc()
+                )
 
 
 # ---------------------------------------------------------------------------
@@ -507,6 +493,7 @@ class MprBuilder:
         interpolation: str = "linear",
         combine_mode: str = "none",
         slab_thickness_mm: float = 0.0,
+        build_workers: int = 1,
     ) -> MprBuilderWorker:
         """
         Create (but do not start) an MprBuilderWorker.
@@ -519,6 +506,7 @@ class MprBuilder:
             interpolation:       "linear" | "nearest" | "cubic".
             combine_mode:       "none" | "mip" | "minip" | "aip".
             slab_thickness_mm: Slab thickness in mm for combine modes.
+            build_workers:      Resample threads (1 = serial, 0 = per CPU core).
 
         Returns:
             MprBuilderWorker ready to be started.
@@ -531,6 +519,49 @@ class MprBuilder:
             interpolation=interpolation,
             combine_mode=combine_mode,
             slab_thickness_mm=slab_thickness_mm,
+            build_workers=build_workers,
+        )
+
+    @staticmethod
+    def create_on_demand_result(
+        source_volume: MprVolume,
+        output_plane: SlicePlane,
+        output_spacing_mm: float,
+        output_thickness_mm: float,
+        interpolation: str = "linear",
+    ) -> MprResult:
+        """
+        Build an MprResult immediately, without resampling any planes.
+
+        ``slices`` is an ``OnDemandMprStack``: planes are resliced from
+        *source_volume* when first read. Start an ``MprPlaneFillWorker`` to
+        complete the stack in the background.
+
+        Raises:
+            MprVolumeError: SimpleITK is not installed.
+        """
+        interpolation = interpolation.lower()
+        engine = MprResliceEngine(
+            source_volume.sitk_image,
+            output_plane,
+            output_spacing_mm,
+            output_thickness_mm,
+            interpolation,
+        )
+        slope, intercept = _source_rescale_params(source_volume)
+        _mpr_log(
+            "On-demand MPR: "
+            f"shape={engine.shape} plane_normal={np.round(output_plane.normal, 4).tolist()}"
+        )
+        return MprResult(
+            slices=OnDemandMprStack(engine),
+            slice_stack=engine.output_slice_stack(),
+            output_spacing_mm=(output_spacing_mm, output_spacing_mm),
+            output_thickness_mm=output_thickness_mm,
+            source_volume=source_volume,
+            interpolation=interpolation,
+            rescale_slope=slope,
+            rescale_intercept=intercept,
         )
 
     @staticmethod
@@ -4,9 +4,20 @@ MPR Cache
 Persistent disk-based LRU cache for MPR resampled stacks.
 
 Each cached entry stores:
-  - The NumPy pixel arrays for every MPR slice (.npz compressed).
+  - The whole MPR stack as one contiguous ``(n_slices, rows, cols)``
+    block in the compact int16 / float16 encoding of
+    ``core.mpr_compact_stack`` (float32 only for non-finite stacks): a raw
+    ``.npy`` file (default), opened with ``np.load(mmap_mode="r")`` so
+    slices page in lazily on a hit, or — when compression is opted into —
+    a zlib-compressed ``.npz``.
   - A JSON metadata sidecar with the cache key, creation time, size,
-    and all parameters used to build the MPR (for validation on re-load).
+    the stack encoding (dtype, scale, offset), and all parameters used to
+    build the MPR (for validation on re-load).
+
+Entries written by an older ``_MPR_CACHE_FORMAT_VERSION`` (per-slice
+compressed ``.npz`` up to version 4, float32 stacks in version 5) can never
+be hit again because the version is part of the key; they are removed when
+the cache is opened.
 
 The LRU eviction policy is applied on writes when the total cache size
 exceeds the configured maximum (default: 500 MB).  The oldest-accessed
@@ -16,9 +27,11 @@ Inputs:
     MprResult   — result of a completed MPR build.
     cache_dir   — Path (or str) of the directory used for storage.
     max_size_mb — Maximum total disk usage in MB; 0 = unlimited.
+    compress    — Store entries zlib-compressed (smaller, slower hits).
 
 Outputs:
-    Cached MprResult on a cache hit (pixel arrays loaded from disk).
+    Cached MprResult on a cache hit (a ``CompactMprStack`` over the stored
+    block, dequantised to float32 per plane on read).
     None on a cache miss.
 
 Requirements:
@@ -35,12 +48,15 @@ import os
 import tempfile
 import threading
 import time
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
 from core.mpr_builder import MprResult
+from core.mpr_compact_stack import CompactMprStack, compact_mpr_stack, source_is_integer
+from core.mpr_on_demand import OnDemandMprStack
 from core.slice_geometry import SlicePlane, SliceStack
 from utils.privacy.safe_storage import (
     assert_safe_internal_path,
@@ -59,7 +75,7 @@ def _is_windows() -> bool:
 # Cache key helpers
 # ---------------------------------------------------------------------------
 
-_MPR_CACHE_FORMAT_VERSION = "4"
+_MPR_CACHE_FORMAT_VERSION = "6"
 
 def _quantise_float(value: float, decimals: int = 4) -> str:
     """Round a float and return its string representation for stable keys."""
@@ -148,18 +164,18 @@ def make_result_key(result: MprResult) -> str:
 class _CacheEntry:
     """Lightweight descriptor for a single cache entry (metadata only)."""
 
-    __slots__ = ("key", "last_access", "path_meta", "path_npz", "size_bytes")
+    __slots__ = ("key", "last_access", "path_data", "path_meta", "size_bytes")
 
     def __init__(
         self,
         key: str,
-        path_npz: Path,
+        path_data: Path,
         path_meta: Path,
         size_bytes: int,
         last_access: float,
     ) -> None:
         self.key = key
-        self.path_npz = path_npz
+        self.path_data = path_data
         self.path_meta = path_meta
         self.size_bytes = size_bytes
         self.last_access = last_access
@@ -188,24 +204,29 @@ class MprCache:
     """
 
     # File name components.
-    _NPZ_SUFFIX = ".npz"
+    _NPY_SUFFIX = ".npy"   # raw, memory-mappable stack
+    _NPZ_SUFFIX = ".npz"   # zlib-compressed stack (opt-in) / legacy entries
     _META_SUFFIX = "_meta.json"
 
     def __init__(
         self,
         cache_dir: Path,
         max_size_mb: int = 500,
+        compress: bool = False,
     ) -> None:
         """
         Args:
             cache_dir:    Directory where cache files are stored.
                           Created if it does not exist.
             max_size_mb:  Maximum total cache size in MB (0 = unlimited).
+            compress:     Write new entries zlib-compressed instead of raw.
+                          Hits then decompress the whole stack up front.
         """
         self._cache_dir = Path(cache_dir)
         assert_safe_internal_path(self._cache_dir, source_root=_SOURCE_ROOT)
         ensure_private_directory(self._cache_dir)
         self._max_size_bytes = int(max_size_mb) * 1024 * 1024
+        self._compress = bool(compress)
         self._lock = threading.Lock()
         # In-memory index of all cache entries: key → _CacheEntry.
         self._index: dict[str, _CacheEntry] = {}
@@ -221,11 +242,11 @@ class MprCache:
             entry = self._index.get(key)
             if entry is None:
                 return False
-            return entry.path_npz.exists() and entry.path_meta.exists()
+            return entry.path_data.exists() and entry.path_meta.exists()
 
     def load(
         self, key: str
-    ) -> tuple[list[np.ndarray], SliceStack, dict[str, Any]] | None:
+    ) -> tuple[Sequence[np.ndarray], SliceStack, dict[str, Any]] | None:
         """
         Load cached MPR data for *key*.
 
@@ -234,7 +255,10 @@ class MprCache:
 
         Returns:
             ``(slices, slice_stack, metadata_dict)`` on a cache hit where:
-              - ``slices`` is a list of 2-D float32 NumPy arrays.
+              - ``slices`` is a sequence of 2-D float32 planes — a
+                ``CompactMprStack`` over the stored block (memory-mapped for
+                raw entries, so pixel data is paged in only for the slices
+                actually displayed), or a list for float32 entries.
               - ``slice_stack`` is a reconstructed SliceStack.
               - ``metadata_dict`` is the raw JSON metadata (contains
                 rescale slope/intercept, spacings, etc.).
@@ -244,21 +268,29 @@ class MprCache:
             entry = self._index.get(key)
             if entry is None:
                 return None
-            if not entry.path_npz.exists() or not entry.path_meta.exists():
+            if not entry.path_data.exists() or not entry.path_meta.exists():
                 # Entry is stale; remove from index.
                 self._index.pop(key, None)
                 return None
 
         try:
-            npz = np.load(str(entry.path_npz))
-            n_slices = int(npz["n_slices"])
-            slices: list[np.ndarray] = [
-                npz[f"slice_{i}"].astype(np.float32) for i in range(n_slices)
-            ]
-
             with open(entry.path_meta, encoding="utf-8") as f:
                 meta: dict[str, Any] = json.load(f)
 
+            stack = self._load_stack(entry.path_data)
+            if stack.ndim != 3 or stack.shape[0] != int(meta["n_slices"]):
+                raise ValueError("cached stack shape does not match metadata")
+            if str(stack.dtype) != meta.get("stack_dtype", "float32"):
+                raise ValueError("cached stack dtype does not match metadata")
+            slices: Sequence[np.ndarray]
+            if stack.dtype == np.float32:
+                slices = list(stack)
+            else:
+                slices = CompactMprStack(
+                    stack,
+                    float(meta.get("stack_scale", 1.0)),
+                    float(meta.get("stack_offset", 0.0)),
+                )
             slice_stack = self._reconstruct_stack(meta)
         except Exception as exc:
             _logger.warning(
@@ -289,6 +321,15 @@ class MprCache:
             True on success, False on failure.
         """
         key = make_result_key(result)
+        try:
+            stored = self._compact_stack(result)
+        except Exception as exc:
+            _logger.warning(
+                "MPR cache save failed",
+                extra={"operation": "mpr_cache.save", "error_class": type(exc).__name__},
+            )
+            return False
+        compact = stored if isinstance(stored, CompactMprStack) else None
 
         # Build metadata dict.
         ds_list = result.source_volume.source_datasets
@@ -329,50 +370,64 @@ class MprCache:
             ],
             "rescale_slope": result.rescale_slope,
             "rescale_intercept": result.rescale_intercept,
+            "storage": "zlib" if self._compress else "raw",
+            "stack_dtype": compact.stored.dtype.name if compact is not None else "float32",
+            "stack_scale": compact.scale if compact is not None else 1.0,
+            "stack_offset": compact.offset if compact is not None else 0.0,
         }
 
-        path_npz = self._cache_dir / (key + self._NPZ_SUFFIX)
+        suffix = self._NPZ_SUFFIX if self._compress else self._NPY_SUFFIX
+        path_data = self._cache_dir / (key + suffix)
         path_meta = self._cache_dir / (key + self._META_SUFFIX)
 
-        tmp_npz: Path | None = None
+        tmp_data: Path | None = None
         try:
-            npz_payload: dict[str, Any] = {"n_slices": np.array(result.n_slices)}
-            for i, arr in enumerate(result.slices):
-                npz_payload[f"slice_{i}"] = arr.astype(np.float32)
             descriptor, tmp_name = tempfile.mkstemp(
                 prefix=".mpr-cache-", suffix=".tmp", dir=self._cache_dir
             )
-            tmp_npz = Path(tmp_name)
+            tmp_data = Path(tmp_name)
             if not _is_windows():
-                tmp_npz.chmod(0o600)
+                tmp_data.chmod(0o600)
             with os.fdopen(descriptor, "wb") as stream:
-                np.savez_compressed(stream, **npz_payload)
+                if self._compress:
+                    np.savez_compressed(stream, stack=self._stack_array(stored))
+                elif compact is not None:
+                    np.lib.format.write_array(stream, compact.stored, allow_pickle=False)
+                else:
+                    self._write_raw_stack(stream, stored)
                 stream.flush()
                 os.fsync(stream.fileno())
-            os.replace(tmp_npz, path_npz)
-            tmp_npz = None
+            os.replace(tmp_data, path_data)
+            tmp_data = None
             if not _is_windows():
-                path_npz.chmod(0o600)
+                path_data.chmod(0o600)
             atomic_write_private_text(
                 path_meta,
                 json.dumps(meta, indent=2),
                 source_root=_SOURCE_ROOT,
             )
         except Exception as exc:
-            if tmp_npz is not None:
-                tmp_npz.unlink(missing_ok=True)
+            if tmp_data is not None:
+                tmp_data.unlink(missing_ok=True)
             _logger.warning(
                 "MPR cache save failed",
                 extra={"operation": "mpr_cache.save", "error_class": type(exc).__name__},
             )
             return False
 
-        size_bytes = self._file_size(path_npz) + self._file_size(path_meta)
+        size_bytes = self._file_size(path_data) + self._file_size(path_meta)
 
         with self._lock:
+            previous = self._index.get(key)
+            if previous is not None and previous.path_data != path_data:
+                # Same key re-saved in the other storage mode.
+                try:
+                    previous.path_data.unlink(missing_ok=True)
+                except OSError:
+                    pass
             self._index[key] = _CacheEntry(
                 key=key,
-                path_npz=path_npz,
+                path_data=path_data,
                 path_meta=path_meta,
                 size_bytes=size_bytes,
                 last_access=time.time(),
@@ -417,6 +472,12 @@ class MprCache:
         with self._lock:
             return len(self._index)
 
+    def set_compression(self, compress: bool) -> None:
+        """Choose raw (False) or zlib-compressed (True) storage for new entries."""
+
+        with self._lock:
+            self._compress = bool(compress)
+
     def set_max_size_mb(self, max_size_mb: int) -> None:
         """Apply a new bounded size limit and evict oldest entries if required."""
 
@@ -430,7 +491,12 @@ class MprCache:
     # ------------------------------------------------------------------
 
     def _scan_disk(self) -> None:
-        """Rebuild the in-memory index by scanning the cache directory."""
+        """
+        Rebuild the in-memory index by scanning the cache directory.
+
+        Entries from an older cache format are deleted: their keys embed the
+        old format version, so they could never be hit again.
+        """
         for meta_path in self._cache_dir.glob(f"*{self._META_SUFFIX}"):
             try:
                 with open(meta_path, encoding="utf-8") as f:
@@ -438,14 +504,24 @@ class MprCache:
                 key = meta.get("key", "")
                 if not key:
                     continue
-                path_npz = self._cache_dir / (key + self._NPZ_SUFFIX)
-                if not path_npz.exists():
+                if str(meta.get("cache_format_version", "")) != _MPR_CACHE_FORMAT_VERSION:
+                    self._delete_files(
+                        self._cache_dir / (key + self._NPZ_SUFFIX),
+                        self._cache_dir / (key + self._NPY_SUFFIX),
+                        meta_path,
+                    )
+                    continue
+                suffix = (
+                    self._NPZ_SUFFIX if meta.get("storage") == "zlib" else self._NPY_SUFFIX
+                )
+                path_data = self._cache_dir / (key + suffix)
+                if not path_data.exists():
                     continue
-                size_bytes = self._file_size(path_npz) + self._file_size(meta_path)
+                size_bytes = self._file_size(path_data) + self._file_size(meta_path)
                 last_access = float(meta.get("last_access", 0.0))
                 self._index[key] = _CacheEntry(
                     key=key,
-                    path_npz=path_npz,
+                    path_data=path_data,
                     path_meta=meta_path,
                     size_bytes=size_bytes,
                     last_access=last_access,
@@ -479,13 +555,76 @@ class MprCache:
         entry = self._index.pop(key, None)
         if entry is None:
             return
-        for p in (entry.path_npz, entry.path_meta):
+        self._delete_files(entry.path_data, entry.path_meta)
+
+    @staticmethod
+    def _delete_files(*paths: Path) -> None:
+        """Best-effort unlink (a still-mapped file may be locked on Windows)."""
+        for p in paths:
             try:
                 if p.exists():
                     p.unlink()
             except OSError:
                 pass
 
+    @staticmethod
+    def _compact_stack(result: MprResult) -> Sequence[np.ndarray]:
+        """
+        Stack to store for *result*: its ``CompactMprStack``, or the float32
+        planes compacted now (on-demand and pre-compact results).
+        """
+        slices = result.slices
+        if isinstance(slices, CompactMprStack):
+            return slices
+        if isinstance(slices, OnDemandMprStack):
+            array = slices.to_array()
+        else:
+            array = np.stack(list(slices)) if len(slices) else np.zeros((0, 0, 0))
+        return compact_mpr_stack(
+            array,
+            integer_source=source_is_integer(result.source_volume.source_datasets),
+        )
+
+    @staticmethod
+    def _stack_array(stored: Sequence[np.ndarray]) -> np.ndarray:
+        """Contiguous ``(n, rows, cols)`` block: compact dtype, or float32."""
+        if isinstance(stored, CompactMprStack):
+            return np.ascontiguousarray(stored.stored)
+        return np.ascontiguousarray(np.stack(list(stored)), dtype=np.float32)
+
+    @staticmethod
+    def _write_raw_stack(stream: Any, slices: Sequence[np.ndarray]) -> None:
+        """
+        Write float32 planes as one ``.npy`` block, slice by slice.
+
+        Streams each plane after the header so no second full-size copy of
+        the stack is made while saving.
+        """
+        n_slices = len(slices)
+        first = np.asarray(slices[0]) if n_slices else np.zeros((0, 0))
+        shape = (n_slices, int(first.shape[0]), int(first.shape[1]))
+        np.lib.format.write_array_header_1_0(
+            stream,
+            {
+                "descr": np.lib.format.dtype_to_descr(np.dtype(np.float32)),
+                "fortran_order": False,
+                "shape": shape,
+            },
+        )
+        for arr in slices:
+            plane = np.ascontiguousarray(arr, dtype=np.float32)
+            if plane.shape != shape[1:]:
+                raise ValueError("MPR slices do not share one shape")
+            stream.write(plane.tobytes())
+
+    @staticmethod
+    def _load_stack(path_data: Path) -> np.ndarray:
+        """Open a cached stack: memory-mapped for raw, decompressed for zlib."""
+        if path_data.suffix == MprCache._NPY_SUFFIX:
+            return np.load(str(path_data), mmap_mode="r", allow_pickle=False)
+        with np.load(str(path_data), allow_pickle=False) as npz:
+            return np.asarray(npz["stack"])
+
     @staticmethod
     def _file_size(path: Path) -> int:
         """Return file size in bytes, 0 if missing."""
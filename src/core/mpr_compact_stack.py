@@ -0,0 +1,214 @@
+"""
+Compact MPR Stack
+
+Half-size storage for finished MPR stacks. Resliced planes are float32, but
+the values usually carry far less information: nearest-neighbour reslices of
+integer CT/MR are integers that fit int16 exactly, and interpolated values of
+an integer source only need a fraction of one stored unit of precision.
+
+``CompactMprStack`` keeps the whole ``(n_slices, rows, cols)`` stack as int16
+(``value = stored * scale + offset``) or float16 and dequantises to float32
+only when a plane is read, so it can be used wherever ``MprResult.slices``
+is consumed (display, slab combine, export). ``scale`` / ``offset`` map
+stored values to the reslice values (raw source pixel values); the series
+RescaleSlope / RescaleIntercept are still applied on top by
+``MprResult.apply_rescale``.
+
+Dequantised planes are not kept: every read allocates a new float32 plane
+and pays one multiply-add per pixel (well under a millisecond for a
+512 x 512 plane), so re-reading a plane repeats that work. Caching planes
+would bring back the float32 memory the compact block saves; slab combines
+avoid the per-plane cost by reducing ``stored`` and dequantising only the
+result (``core.mpr_stack_combine``).
+
+Encoding (``compact_mpr_stack``):
+    - every value an integer within int16 → int16, scale 1, offset 0 (exact);
+    - integer source otherwise → int16 quantised over the stack range with a
+      per-stack scale (same mapping as the DICOM export's stored values);
+    - float source → float16 when every value is within float16 range,
+      otherwise quantised int16;
+    - non-finite values → left as float32.
+
+Inputs:
+    (n_slices, rows, cols) float32 stack.
+
+Outputs:
+    CompactMprStack — read-only ``Sequence[np.ndarray]`` of float32 planes.
+
+Requirements:
+    numpy
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
+
+import numpy as np
+
+ENCODING_INT16 = "int16"
+ENCODING_FLOAT16 = "float16"
+
+_INT16_MIN = float(np.iinfo(np.int16).min)
+_INT16_MAX = float(np.iinfo(np.int16).max)
+_FLOAT16_MAX = float(np.finfo(np.float16).max)
+
+
+def source_is_integer(datasets: Sequence[Any]) -> bool:
+    """
+    True unless the source series stores float pixels.
+
+    Float and double-float pixel data (parametric maps, some PET/RT series)
+    carry their values in ``FloatPixelData`` / ``DoubleFloatPixelData``;
+    everything else decodes to integers.
+    """
+    if not datasets:
+        return True
+    ds = datasets[0]
+    return not (hasattr(ds, "FloatPixelData") or hasattr(ds, "DoubleFloatPixelData"))
+
+
+class CompactMprStack(Sequence[np.ndarray]):
+    """
+    MPR stack stored as int16 or float16, read as float32 planes.
+
+    Reads (``stack[i]``, ``stack[a:b]``, iteration) return new float32
+    arrays; ``stored`` exposes the compact block for callers that can work
+    on stored values directly (slab combine, cache).
+    """
+
+    def __init__(self, stored: np.ndarray, scale: float = 1.0, offset: float = 0.0) -> None:
+        """
+        Args:
+            stored: ``(n_slices, rows, cols)`` int16 or float16 array (may be
+                    a read-only memory map).
+            scale:  Value per stored unit (positive).
+            offset: Value of stored zero.
+        """
+        if stored.ndim != 3 or stored.dtype not in (np.int16, np.float16):
+            raise ValueError("compact MPR stack must be a 3-D int16 or float16 array")
+        if not scale > 0:
+            raise ValueError("compact MPR stack scale must be positive")
+        self._stored = stored
+        self._scale = float(scale)
+        self._offset = float(offset)
+
+    # ------------------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return int(self._stored.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> np.ndarray: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[np.ndarray]: ...
+
+    def __getitem__(self, index: int | slice) -> np.ndarray | list[np.ndarray]:
+        if isinstance(index, slice):
+            return list(self.dequantize(self._stored[index]))
+        return self.dequantize(self._stored[index])
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for plane in self._stored:
+            yield self.dequantize(plane)
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    @property
+    def stored(self) -> np.ndarray:
+        """Compact ``(n_slices, rows, cols)`` block."""
+        return self._stored
+
+    @property
+    def encoding(self) -> str:
+        """``int16`` or ``float16``."""
+        return ENCODING_FLOAT16 if self._stored.dtype == np.float16 else ENCODING_INT16
+
+    @property
+    def scale(self) -> float:
+        """Value per stored unit."""
+        return self._scale
+
+    @property
+    def offset(self) -> float:
+        """Value of stored zero."""
+        return self._offset
+
+    @property
+    def is_exact(self) -> bool:
+        """True for identity-mapped int16 (no quantisation error)."""
+        return self.encoding == ENCODING_INT16 and self._scale == 1.0 and self._offset == 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the compact block."""
+        return int(self._stored.nbytes)
+
+    def dequantize(self, stored: np.ndarray) -> np.ndarray:
+        """Float32 values for stored values (or reductions of them) from this stack."""
+        out = np.asarray(stored).astype(np.float32)
+        if self._scale != 1.0:
+            out *= np.float32(self._scale)
+        if self._offset != 0.0:
+            out += np.float32(self._offset)
+        return out
+
+    def to_array(self) -> np.ndarray:
+        """Full float32 ``(n_slices, rows, cols)`` stack."""
+        return self.dequantize(self._stored)
+
+
+def _stack_is_integral(stack: np.ndarray) -> bool:
+    return all(np.array_equal(np.rint(plane), plane) for plane in stack)
+
+
+def _quantise_int16(stack: np.ndarray, v_min: float, v_max: float) -> CompactMprStack:
+    """int16 over ``[v_min, v_max]`` with ``scale = range / 65535`` (per plane, no float64 stack)."""
+    if v_max <= v_min:
+        return CompactMprStack(np.zeros(stack.shape, dtype=np.int16), 1.0, v_min)
+    scale = (v_max - v_min) / 65535.0
+    offset = v_min + 32768.0 * scale
+    stored = np.empty(stack.shape, dtype=np.int16)
+    for i, plane in enumerate(stack):
+        stored[i] = np.clip(
+            np.rint((plane.astype(np.float64) - offset) / scale), _INT16_MIN, _INT16_MAX
+        )
+    return CompactMprStack(stored, scale, offset)
+
+
+def compact_mpr_stack(
+    stack: np.ndarray | Sequence[np.ndarray], *, integer_source: bool = True
+) -> Sequence[np.ndarray]:
+    """
+    Half-size representation of a float32 MPR stack.
+
+    Args:
+        stack:          ``(n_slices, rows, cols)`` array or sequence of planes.
+        integer_source: The source series stores integer pixels (see
+                        ``source_is_integer``); decides between quantised
+                        int16 and float16 for non-integer values.
+
+    Returns:
+        A ``CompactMprStack``, the input unchanged when it is already
+        compact, or a list of float32 planes when the values are not all
+        finite.
+    """
+    if isinstance(stack, CompactMprStack):
+        return stack
+    array = np.asarray(stack, dtype=np.float32)
+    if array.ndim != 3 or array.shape[0] == 0:
+        return list(array)
+    v_min = float(np.min(array))
+    v_max = float(np.max(array))
+    if not (np.isfinite(v_min) and np.isfinite(v_max)):
+        return list(array)
+    if v_min >= _INT16_MIN and v_max <= _INT16_MAX and _stack_is_integral(array):
+        return CompactMprStack(array.astype(np.int16))
+    if not integer_source and max(abs(v_min), abs(v_max)) <= _FLOAT16_MAX:
+        return CompactMprStack(array.astype(np.float16))
+    return _quantise_int16(array, v_min, v_max)
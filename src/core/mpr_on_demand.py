@@ -0,0 +1,272 @@
+"""
+On-Demand MPR Stack
+
+Lazily resliced MPR output stack for interactive viewing. Instead of
+resampling every output plane before the first frame is shown, planes are
+resliced from the cached source volume the first time they are requested
+(display, slab combine, export) and a background filler completes the rest
+of the stack nearest-first around the plane the user is looking at.
+
+Background fill blocks are sized from the measured per-plane reslice cost so
+one block takes about ``target_block_ms``: a display read of a plane the
+filler is working on waits at most that long, and reads of other planes do
+not wait at all because resampling runs outside the stack lock.
+
+``OnDemandMprStack`` is a read-only ``Sequence[np.ndarray]``, so it can be
+used wherever ``MprResult.slices`` is consumed: indexing or slicing it
+reslices any missing planes first and returns views into one preallocated
+float32 stack buffer.
+
+Inputs:
+    MprResliceEngine — output grid + source volume (``core.mpr_reslice``).
+
+Outputs:
+    2-D float32 planes.
+
+Requirements:
+    numpy
+    SimpleITK (through ``MprResliceEngine``)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from typing import overload
+
+import numpy as np
+
+from core.mpr_reslice import MprResliceEngine, chunk_slices_for_grid
+
+# Latency target for one background fill block (ms).
+DEFAULT_BLOCK_TARGET_MS = 50.0
+
+
+class OnDemandMprStack(Sequence[np.ndarray]):
+    """
+    MPR output stack whose planes are resliced the first time they are read.
+
+    Reads (``stack[i]``, ``stack[a:b]``, iteration) block until the requested
+    planes exist. Each missing run is claimed under a lock and resampled
+    outside it, so a plane is never resliced twice or read half-written and
+    readers only wait for planes another thread is currently producing.
+    """
+
+    def __init__(
+        self,
+        engine: MprResliceEngine,
+        fill_block: int | None = None,
+        target_block_ms: float = DEFAULT_BLOCK_TARGET_MS,
+    ) -> None:
+        """
+        Args:
+            engine:           Reslice engine for the output grid.
+            fill_block:       Fixed planes per background fill step; by
+                              default the size follows *target_block_ms*.
+            target_block_ms:  Latency target for one background fill block.
+        """
+        self._engine = engine
+        self._stack = engine.allocate()
+        n_slices, rows_px, cols_px = engine.shape
+        self._ready = np.zeros(n_slices, dtype=bool)
+        self._claimed = np.zeros(n_slices, dtype=bool)
+        self._cond = threading.Condition()
+        self._max_block = chunk_slices_for_grid(rows_px, cols_px)
+        self._fixed_block = None if fill_block is None else max(1, int(fill_block))
+        self._target_ms = max(1.0, float(target_block_ms))
+        self._focus = n_slices // 2
+        self._plane_ms: float | None = None
+
+    # ------------------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return int(self._stack.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> np.ndarray: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[np.ndarray]: ...
+
+    def __getitem__(self, index: int | slice) -> np.ndarray | list[np.ndarray]:
+        n = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step == 1:
+                self.ensure(start, stop)
+                return list(self._stack[start:stop])
+            return [self[i] for i in range(start, stop, step)]
+        i = int(index)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("MPR slice index out of range")
+        self.ensure(i, i + 1)
+        return self._stack[i]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        step = self._max_block
+        for start in range(0, len(self), step):
+            yield from self[start:start + step]
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def engine(self) -> MprResliceEngine:
+        """Reslice engine backing this stack."""
+        return self._engine
+
+    @property
+    def focus(self) -> int:
+        """Plane the background filler works outwards from."""
+        return self._focus
+
+    @focus.setter
+    def focus(self, index: int) -> None:
+        self._focus = max(0, min(int(index), max(len(self) - 1, 0)))
+
+    @property
+    def plane_latency_ms(self) -> float | None:
+        """Smoothed full-resolution reslice cost per plane (ms), once measured."""
+        return self._plane_ms
+
+    @property
+    def target_block_ms(self) -> float:
+        """Latency target for one background fill block (ms)."""
+        return self._target_ms
+
+    def fill_block_size(self) -> int:
+        """
+        Planes in the next background fill block.
+
+        A fixed ``fill_block`` wins; otherwise the block holds as many planes
+        as fit in ``target_block_ms`` at the measured per-plane cost (one
+        plane until a cost is known), capped by the chunk voxel budget.
+        """
+        if self._fixed_block is not None:
+            return self._fixed_block
+        if not self._plane_ms:
+            return 1
+        return max(1, min(self._max_block, int(self._target_ms / self._plane_ms)))
+
+    def is_ready(self, index: int) -> bool:
+        """True once plane *index* has been resliced."""
+        return bool(self._ready[int(index)])
+
+    def ready_count(self) -> int:
+        """Number of planes resliced so far."""
+        return int(np.count_nonzero(self._ready))
+
+    def is_complete(self) -> bool:
+        """True once every plane has been resliced."""
+        return bool(self._ready.all())
+
+    # ------------------------------------------------------------------
+    # Reslicing
+    # ------------------------------------------------------------------
+
+    def ensure(self, start: int, stop: int) -> int:
+        """
+        Reslice every missing plane in ``[start, stop)``.
+
+        Missing planes are resampled as contiguous runs, one SimpleITK call
+        per run. Planes another thread is resampling are waited for, not
+        resliced again.
+
+        Returns:
+            Number of planes resliced by this call.
+        """
+        n = len(self)
+        start = max(0, min(int(start), n))
+        stop = max(start, min(int(stop), n))
+        if self._ready[start:stop].all():
+            return 0
+        written = 0
+        while True:
+            with self._cond:
+                run = self._claim_run(start, stop)
+                while run is None and not self._ready[start:stop].all():
+                    self._cond.wait()
+                    run = self._claim_run(start, stop)
+            if run is None:
+                return written
+            i, j = run
+            try:
+                t0 = time.perf_counter()
+                planes = self._engine.resample_range(i, j)
+                elapsed_ms = (time.perf_counter() - t0) * 1000.0
+                self._stack[i:j] = planes
+            except BaseException:
+                with self._cond:
+                    self._claimed[i:j] = False
+                    self._cond.notify_all()
+                raise
+            with self._cond:
+                self._ready[i:j] = True
+                self._claimed[i:j] = False
+                self._record_latency(elapsed_ms, j - i)
+                self._cond.notify_all()
+            written += j - i
+
+    def next_fill_block(self) -> tuple[int, int] | None:
+        """
+        Next ``[start, stop)`` block for the background filler, or ``None``.
+
+        Blocks are aligned to ``fill_block_size()`` and chosen nearest to
+        ``focus`` first, so the planes a user is about to scroll to are
+        resliced before distant ones. Planes a reader is already resampling
+        are skipped while any others are missing.
+        """
+        with self._cond:
+            missing = ~self._ready
+            free = np.flatnonzero(missing & ~self._claimed)
+            candidates = free if free.size else np.flatnonzero(missing)
+        if candidates.size == 0:
+            return None
+        nearest = int(candidates[np.argmin(np.abs(candidates - self._focus))])
+        size = self.fill_block_size()
+        start = (nearest // size) * size
+        return start, min(start + size, len(self))
+
+    def fill_next_block(self) -> bool:
+        """
+        Reslice the next background block.
+
+        Returns:
+            False when the stack was already complete.
+        """
+        block = self.next_fill_block()
+        if block is None:
+            return False
+        self.ensure(*block)
+        return True
+
+    def to_array(self) -> np.ndarray:
+        """Full ``(n_slices, rows, cols)`` stack, reslicing any missing planes."""
+        self.ensure(0, len(self))
+        return self._stack
+
+    def _claim_run(self, start: int, stop: int) -> tuple[int, int] | None:
+        """Claim the first run in ``[start, stop)`` nobody has resliced or claimed."""
+        free = np.flatnonzero(~(self._ready[start:stop] | self._claimed[start:stop]))
+        if free.size == 0:
+            return None
+        i = start + int(free[0])
+        j = i + 1
+        while j < stop and not (self._ready[j] or self._claimed[j]):
+            j += 1
+        self._claimed[i:j] = True
+        return i, j
+
+    def _record_latency(self, elapsed_ms: float, planes: int) -> None:
+        """Fold one reslice timing into the per-plane moving average."""
+        per_plane = elapsed_ms / max(planes, 1)
+        if self._plane_ms is None:
+            self._plane_ms = per_plane
+        else:
+            self._plane_ms = 0.7 * self._plane_ms + 0.3 * per_plane
@@ -0,0 +1,334 @@
+"""
+MPR Pre-build
+
+Opt-in idle-time precompute of the standard MPR planes (axial, coronal,
+sagittal) for loaded series, so the first MPR request on a series is a disk
+cache hit instead of a cold ``MprBuilderWorker`` build.
+
+``plan_standard_plane_prebuild`` picks the jobs: series that pass
+``MprVolume.available`` and resolve to one orientation group, newest loaded
+series first, using the same default spacing / thickness / interpolation the
+MPR dialog proposes so the cache keys match a default request. Planes already
+cached are skipped, and so are series whose planes do not fit in what is left
+of the memory budget.
+
+The budget covers the whole pre-build pass rather than one job: each series'
+source volume is counted once and every output stack is counted, first from
+header estimates when planning and then from the exact grids as the worker
+builds.
+
+``MprPrebuildWorker`` runs the jobs in one low-priority thread, with ITK
+pinned to one thread per resample, one source volume at a time, and stops
+between chunks as soon as it is cancelled (the controller cancels it when the
+user starts MPR work or a series load begins).
+
+Inputs:
+    loaded_series — ``series_key → info`` mapping built by the MPR controller
+                    (``datasets`` list per series, in load order).
+    MprCache      — destination of the built stacks.
+
+Outputs:
+    Cache entries keyed exactly like the dialog's default MPR requests.
+
+Requirements:
+    numpy
+    PySide6 (for QThread, Signal)
+    SimpleITK (through ``MprVolume`` / ``MprResliceEngine``)
+"""
+
+from __future__ import annotations
+
+import traceback
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+
+from core.mpr_builder import MprBuilder, MprResult, _source_rescale_params
+from core.mpr_compact_stack import compact_mpr_stack, source_is_integer
+from core.mpr_reslice import MprResliceEngine
+from core.mpr_volume import MprVolume, MprVolumeError, get_orientation_groups
+from core.slice_geometry import SlicePlane
+from utils.dicom_utils import get_pixel_spacing, get_slice_thickness
+
+if TYPE_CHECKING:
+    from core.mpr_cache import MprCache
+
+# Default memory budget for one pre-build pass (source volumes + output stacks).
+DEFAULT_PREBUILD_MAX_MB = 1024
+
+# Standard planes built per series, in build order.
+PREBUILD_PLANE_NAMES = ("axial", "coronal", "sagittal")
+
+# Interpolation proposed by the MPR dialog.
+PREBUILD_INTERPOLATION = "linear"
+
+_BYTES_PER_VOXEL = np.dtype(np.float32).itemsize
+
+
+def default_output_params(ds: Any) -> tuple[float, float]:
+    """
+    Default ``(spacing_mm, thickness_mm)`` the MPR dialog proposes for a series.
+
+    Pixel spacing falls back to 1 mm and slice thickness to the pixel
+    spacing; both are rounded to the dialog's two decimals so pre-built
+    cache keys match a default request.
+
+    Args:
+        ds: First dataset of the series.
+    """
+    ps_tuple = get_pixel_spacing(ds)
+    spacing = ps_tuple[0] if ps_tuple is not None else 1.0
+    thickness = get_slice_thickness(ds)
+    if thickness is None:
+        thickness = spacing
+    return round(float(spacing), 2), round(float(thickness), 2)
+
+
+def estimate_prebuild_bytes(
+    datasets: list[Any], spacing_mm: float, thickness_mm: float, n_planes: int = 1
+) -> int:
+    """
+    Rough memory of building *n_planes* standard planes from header fields only.
+
+    Counts the float32 source volume once plus one float32 output stack per
+    plane, each covering the same physical box at the output spacing.
+    Oblique acquisitions get a larger output grid; the worker re-checks the
+    exact grid before allocating it.
+    """
+    try:
+        ds0 = datasets[0]
+        rows, cols = int(ds0.Rows), int(ds0.Columns)
+    except (AttributeError, IndexError, TypeError, ValueError):
+        return 0
+    n = len(datasets)
+    ps_tuple = get_pixel_spacing(ds0)
+    row_sp, col_sp = ps_tuple if ps_tuple is not None else (1.0, 1.0)
+    slice_sp = get_slice_thickness(ds0) or row_sp
+    box_mm3 = rows * float(row_sp) * cols * float(col_sp) * n * float(slice_sp)
+    out_voxels = box_mm3 / max(spacing_mm * spacing_mm * thickness_mm, 1e-6)
+    return int((rows * cols * n + out_voxels * max(n_planes, 0)) * _BYTES_PER_VOXEL)
+
+
+def _series_uid(datasets: list[Any]) -> str:
+    try:
+        return str(datasets[0].SeriesInstanceUID)
+    except (AttributeError, IndexError):
+        return "__unknown__"
+
+
+@dataclass
+class MprPrebuildJob:
+    """One standard plane of one series to build into the cache."""
+
+    series_key: str
+    plane_name: str
+    output_plane: SlicePlane
+    output_spacing_mm: float
+    output_thickness_mm: float
+    cache_key: str
+    estimated_bytes: int
+    interpolation: str = PREBUILD_INTERPOLATION
+    datasets: list[Any] = field(default_factory=list, repr=False)
+
+
+def plan_standard_plane_prebuild(
+    loaded_series: Mapping[str, Mapping[str, Any]],
+    max_bytes: int,
+    is_cached: Callable[[str], bool],
+) -> list[MprPrebuildJob]:
+    """
+    Standard-plane jobs for the loaded series, newest loaded series first.
+
+    Series are skipped when ``MprVolume.available`` rejects them, when they
+    split into several orientation groups or need the SliceLocation
+    fallback (both ask the user in the dialog), or when their uncached
+    planes do not fit in what is left of *max_bytes*. Planes for which
+    *is_cached* returns True are skipped.
+
+    Args:
+        loaded_series: ``series_key → {"datasets": [...], ...}`` in load order.
+        max_bytes:     Memory budget for the whole pass (bytes).
+        is_cached:     Predicate on the cache key.
+    """
+    from core.mpr_cache import _make_cache_key
+
+    planes = MprBuilder.standard_planes()
+    jobs: list[MprPrebuildJob] = []
+    remaining = int(max_bytes)
+    for series_key, info in reversed(list(loaded_series.items())):
+        datasets = list(info.get("datasets") or [])
+        if not datasets or not MprVolume.available(datasets):
+            continue
+        groups = get_orientation_groups(datasets)
+        if len(groups) != 1:
+            continue
+        group = groups[0][1]
+        spacing, thickness = default_output_params(datasets[0])
+        estimated = estimate_prebuild_bytes(group, spacing, thickness)
+        if estimated <= 0:
+            continue
+        series_uid = _series_uid(group)
+        series_jobs: list[MprPrebuildJob] = []
+        for name in PREBUILD_PLANE_NAMES:
+            plane = planes[name]
+            key = _make_cache_key(
+                series_uid=series_uid,
+                normal=plane.normal,
+                output_spacing_mm=spacing,
+                output_thickness_mm=thickness,
+                interpolation=PREBUILD_INTERPOLATION,
+                source_dataset_count=len(group),
+            )
+            if is_cached(key):
+                continue
+            series_jobs.append(
+                MprPrebuildJob(
+                    series_key=series_key,
+                    plane_name=name,
+                    output_plane=plane,
+                    output_spacing_mm=spacing,
+                    output_thickness_mm=thickness,
+                    cache_key=key,
+                    estimated_bytes=estimated,
+                    datasets=group,
+                )
+            )
+        if not series_jobs:
+            continue
+        needed = estimate_prebuild_bytes(group, spacing, thickness, len(series_jobs))
+        if needed > remaining:
+            continue
+        remaining -= needed
+        jobs.extend(series_jobs)
+    return jobs
+
+
+class MprPrebuildWorker(QThread):
+    """
+    Background thread that builds planned pre-build jobs into an ``MprCache``.
+
+    Consecutive jobs of one series share its source volume; the volume is
+    released before the next series is decoded. The memory budget covers the
+    whole run: each source volume is charged once, on its first built plane,
+    and every output stack is charged; a plane that does not fit in what is
+    left is skipped.
+
+    Signals:
+        progress (int):  Number of jobs saved so far.
+        finished (list): Cache keys saved, emitted unless cancelled.
+        error (str):     Emitted on an unexpected failure.
+    """
+
+    progress = Signal(int)
+    finished = Signal(object)   # list[str]
+    error = Signal(str)
+
+    def __init__(
+        self,
+        jobs: list[MprPrebuildJob],
+        cache: MprCache,
+        max_bytes: int,
+    ) -> None:
+        """
+        Args:
+            jobs:      Jobs from ``plan_standard_plane_prebuild``.
+            cache:     Cache the stacks are saved to.
+            max_bytes: Memory budget for the whole run (bytes), charged
+                       from the exact source and output grids.
+        """
+        super().__init__()
+        self._jobs = list(jobs)
+        self._cache = cache
+        self._remaining_bytes = int(max_bytes)
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Request cancellation; the thread stops at the next chunk boundary."""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """True once ``cancel`` was called."""
+        return self._cancelled
+
+    def run(self) -> None:
+        """Entry point for the background thread."""
+        saved: list[str] = []
+        volume: MprVolume | None = None
+        volume_key: str | None = None
+        source_charged = False
+        try:
+            for job in self._jobs:
+                if self._cancelled:
+                    return
+                if self._cache.has(job.cache_key):
+                    continue
+                if volume is None or job.series_key != volume_key:
+                    volume = None  # release the previous series before decoding
+                    volume = MprVolume.from_datasets(job.datasets)
+                    volume_key = job.series_key
+                    source_charged = False
+                if len(volume.source_datasets) != len(job.datasets):
+                    # Duplicate positions were dropped: the saved entry would
+                    # be keyed on a different slice count than any request.
+                    continue
+                result = self._build_job(job, volume, source_charged)
+                if result is None:
+                    continue
+                source_charged = True
+                if self._cancelled:
+                    return
+                if self._cache.save(result):
+                    saved.append(job.cache_key)
+                    self.progress.emit(len(saved))
+            self.finished.emit(saved)
+        except MprVolumeError as exc:
+            if not self._cancelled:
+                self.error.emit(str(exc))
+        except Exception as exc:
+            if not self._cancelled:
+                self.error.emit(
+                    f"Unexpected error during MPR pre-build: {exc}\n"
+                    + traceback.format_exc()
+                )
+
+    def _build_job(
+        self, job: MprPrebuildJob, volume: MprVolume, source_charged: bool
+    ) -> MprResult | None:
+        """
+        Resample one plane, or ``None`` when it does not fit the remaining budget.
+
+        The exact output grid is charged, plus the source volume unless an
+        earlier plane of the same series already paid for it.
+        """
+        engine = MprResliceEngine(
+            volume.sitk_image,
+            job.output_plane,
+            job.output_spacing_mm,
+            job.output_thickness_mm,
+            job.interpolation,
+            threads_per_call=1,
+        )
+        needed = int(np.prod(engine.shape)) * _BYTES_PER_VOXEL
+        if not source_charged:
+            needed += int(volume.sitk_image.GetNumberOfPixels()) * _BYTES_PER_VOXEL
+        if needed > self._remaining_bytes:
+            return None
+        self._remaining_bytes -= needed
+        stack = engine.allocate()
+        engine.reslice_into(stack, is_cancelled=self.is_cancelled)
+        slope, intercept = _source_rescale_params(volume)
+        return MprResult(
+            slices=compact_mpr_stack(
+                stack, integer_source=source_is_integer(volume.source_datasets)
+            ),
+            slice_stack=engine.output_slice_stack(),
+            output_spacing_mm=(job.output_spacing_mm, job.output_spacing_mm),
+            output_thickness_mm=job.output_thickness_mm,
+            source_volume=volume,
+            interpolation=job.interpolation,
+            rescale_slope=slope,
+            rescale_intercept=intercept,
+        )
@@ -3,54 +3,203 @@ Runtime slab combine for MPR views — pure numpy, no GUI dependency.
 
 Extracted from ``mpr_controller`` so core modules can import this
 without pulling in GUI dialog imports.
+
+``MprSlabCombiner`` accelerates repeated combines on one stack with a fixed
+mode and plane count (the scrolling case): it keeps block-wise prefix and
+suffix reductions (van Herk / Gil-Werman) so every slab, whatever its
+position, is one plane operation on two precomputed planes instead of a
+``np.stack`` of the whole window. Blocks are built lazily and only a few are
+kept, so memory stays at a handful of slab widths.
+
+For a ``CompactMprStack`` both paths reduce the stored int16/float16 values
+and dequantise only the combined plane (the mapping is affine with a
+positive scale, so max, min and mean commute with it).
 """
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Sequence
+
 import numpy as np
 
+from core.mpr_compact_stack import CompactMprStack
+
+# Blocks of prefix/suffix planes kept per combiner (each is 2 * n_planes planes).
+DEFAULT_MAX_CACHED_BLOCKS = 4
+
+
+def mpr_combine_window(n_slices: int, slice_index: int, n_planes: int) -> tuple[int, int]:
+    """
+    Inclusive ``(start, end)`` plane range of the slab centred on *slice_index*.
+
+    The window is shifted (not shrunk) at the stack edges, and clipped to the
+    stack when it has fewer than *n_planes* planes.
+    """
+    n_planes = max(1, int(n_planes))
+    start = slice_index - (n_planes // 2)
+    end = start + n_planes - 1
+    if start < 0:
+        start = 0
+        end = min(n_slices - 1, n_planes - 1)
+    if end >= n_slices:
+        end = n_slices - 1
+        start = max(0, end - (n_planes - 1))
+    return start, end
+
+
+def _normalize_mode(mode: str) -> str:
+    mode_l = (mode or "aip").lower()
+    return mode_l if mode_l in ("mip", "minip") else "aip"
+
 
 def apply_mpr_stack_combine(
-    stack: list[np.ndarray],
+    stack: Sequence[np.ndarray],
     slice_index: int,
     *,
     enabled: bool,
     mode: str,
     n_planes: int,
+    combiner: MprSlabCombiner | None = None,
 ) -> np.ndarray:
     """
     Return one 2-D slice array, optionally averaged/max/min over *n_planes*
     neighboring planes in *stack* (same algorithm as legacy builder slab).
 
     Args:
-        stack:        Uncombined MPR planes (float32 2-D arrays).
+        stack:        Uncombined MPR planes (float32 2-D arrays, or a
+                      ``CompactMprStack``).
         slice_index:  Center plane index.
         enabled:      If False, return stack[slice_index] unchanged.
         mode:         ``aip`` | ``mip`` | ``minip``.
         n_planes:     Number of planes in the slab window.
+        combiner:     Optional ``MprSlabCombiner``; used when it was built for
+                      this stack, mode and plane count.
     """
     n_slices = len(stack)
     if not enabled or n_slices == 0:
         return stack[slice_index]
-    n_planes = max(1, int(n_planes))
-    mode_l = (mode or "aip").lower()
-    i = slice_index
-    start = i - (n_planes // 2)
-    end = start + n_planes - 1
-    if start < 0:
-        start = 0
-        end = min(n_slices - 1, n_planes - 1)
-    if end >= n_slices:
-        end = n_slices - 1
-        start = max(0, end - (n_planes - 1))
-    window = stack[start : end + 1]
-    if len(window) == 1:
-        return window[0]
-    arr = np.stack(window, axis=0)
+    if combiner is not None and combiner.matches(stack, mode, n_planes):
+        return combiner.combine(slice_index)
+    start, end = mpr_combine_window(n_slices, slice_index, n_planes)
+    if start == end:
+        return stack[start]
+    compact = stack if isinstance(stack, CompactMprStack) else None
+    if compact is not None:
+        arr = compact.stored[start : end + 1]
+    else:
+        arr = np.stack(stack[start : end + 1], axis=0)
+    mode_l = _normalize_mode(mode)
     if mode_l == "mip":
         out = np.max(arr, axis=0)
     elif mode_l == "minip":
         out = np.min(arr, axis=0)
     else:
-        out = np.mean(arr, axis=0)
-    return out.astype(np.float32)
+        out = np.mean(arr, axis=0, dtype=np.float32)
+    if compact is not None:
+        return compact.dequantize(np.asarray(out))
+    return np.asarray(out, dtype=np.float32)
+
+
+class MprSlabCombiner:
+    """
+    O(1)-per-slab combine for one stack, mode and plane count.
+
+    The stack is split into blocks of ``n_planes`` planes. For each block the
+    combiner keeps, per plane, the running reduction from the block start
+    (prefix) and to the block end (suffix). A slab of ``n_planes`` planes
+    spans at most two blocks, so it equals ``op(suffix[start], prefix[end])``
+    (sum for AIP, then divided by the plane count). Per-block sums cover at
+    most ``n_planes`` values, so AIP keeps float32 accuracy without a
+    whole-stack float64 cumulative sum.
+    """
+
+    def __init__(
+        self,
+        stack: Sequence[np.ndarray],
+        mode: str,
+        n_planes: int,
+        max_cached_blocks: int = DEFAULT_MAX_CACHED_BLOCKS,
+    ) -> None:
+        """
+        Args:
+            stack:             Uncombined MPR planes.
+            mode:              ``aip`` | ``mip`` | ``minip``.
+            n_planes:          Slab plane count.
+            max_cached_blocks: Prefix/suffix blocks kept in memory.
+        """
+        self._stack = stack
+        self._compact = stack if isinstance(stack, CompactMprStack) else None
+        self._mode_key = (mode or "aip").lower()
+        self._mode = _normalize_mode(mode)
+        self._n_planes = max(1, int(n_planes))
+        self._max_blocks = max(2, int(max_cached_blocks))
+        self._blocks: OrderedDict[int, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        if self._mode == "mip":
+            self._op = np.maximum
+        elif self._mode == "minip":
+            self._op = np.minimum
+        else:
+            self._op = np.add
+
+    def matches(self, stack: Sequence[np.ndarray], mode: str, n_planes: int) -> bool:
+        """True if this combiner was built for *stack*, *mode* and *n_planes*."""
+        return (
+            stack is self._stack
+            and (mode or "aip").lower() == self._mode_key
+            and max(1, int(n_planes)) == self._n_planes
+        )
+
+    def combine(self, slice_index: int) -> np.ndarray:
+        """Combined float32 slab centred on *slice_index* (same clamping as today)."""
+        n_slices = len(self._stack)
+        start, end = mpr_combine_window(n_slices, slice_index, self._n_planes)
+        count = end - start + 1
+        if count == 1:
+            return self._stack[start]
+        k = self._n_planes
+        first_block, last_block = start // k, end // k
+        if first_block != last_block:
+            _prefix_a, suffix_a = self._block(first_block)
+            prefix_b, _suffix_b = self._block(last_block)
+            out = self._op(suffix_a[start - first_block * k], prefix_b[end - last_block * k])
+        elif start == first_block * k:
+            out = self._block(first_block)[0][end - start].copy()
+        else:
+            # A window inside one block that does not start on its boundary
+            # is never produced by the clamping rules; reduce it directly.
+            return apply_mpr_stack_combine(
+                self._stack, slice_index, enabled=True, mode=self._mode, n_planes=k
+            )
+        if self._mode == "aip":
+            out = out / np.float32(count)
+        if self._compact is not None:
+            return self._compact.dequantize(out)
+        return out.astype(np.float32, copy=False)
+
+    def _block(self, block: int) -> tuple[np.ndarray, np.ndarray]:
+        """Prefix and suffix reductions for *block*, built on first use."""
+        cached = self._blocks.get(block)
+        if cached is not None:
+            self._blocks.move_to_end(block)
+            return cached
+        k = self._n_planes
+        start = block * k
+        stop = min(start + k, len(self._stack))
+        if self._compact is not None:
+            # Blocks hold stored units; combine() dequantises the result.
+            planes = self._compact.stored[start:stop].astype(np.float32)
+        else:
+            planes = np.asarray(self._stack[start:stop], dtype=np.float32)
+        prefix = np.empty_like(planes)
+        suffix = np.empty_like(planes)
+        prefix[0] = planes[0]
+        for i in range(1, len(planes)):
+            self._op(prefix[i - 1], planes[i], out=prefix[i])
+        suffix[-1] = planes[-1]
+        for i in range(len(planes) - 2, -1, -1):
+            self._op(suffix[i + 1], planes[i], out=suffix[i])
+        self._blocks[block] = (prefix, suffix)
+        while len(self._blocks) > self._max_blocks:
+            self._blocks.popitem(last=False)
+        return prefix, suffix
@@ -11,6 +11,8 @@ Outputs:
     MprVolume instance containing a sitk.Image with correct origin, spacing,
     and direction cosines.  All public geometry is also available as NumPy
     arrays for downstream use by MprBuilder.
+    LazyMprVolume — same interface, but pixel decoding and the SimpleITK
+    image are deferred until first use (MPR cache hits never need them).
 
 Raises:
     MprVolumeError — if the volume cannot be built (missing geometry,
@@ -25,6 +27,7 @@ Requirements:
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import numpy as np
@@ -585,3 +588,93 @@ class MprVolume:
             f"spacing=({self.pixel_spacing_mm[0]:.2f},{self.pixel_spacing_mm[1]:.2f})mm, "
             f"thickness={self.slice_thickness_mm:.2f}mm)"
         )
+
+
+class LazyMprVolume(MprVolume):
+    """
+    ``MprVolume`` whose SimpleITK image is built on first use.
+
+    ``source_datasets`` (sorted, position-deduplicated) only needs slice
+    geometry, so a cached MPR stack can be shown without decoding any pixel
+    data. Any other attribute (``sitk_image``, ``slice_stack``, ``rows``,
+    …) builds the real volume via ``MprVolume.from_datasets`` once and
+    delegates to it; that first access may raise ``MprVolumeError``.
+    """
+
+    # MprVolume.__init__ is deliberately not called: it needs the built
+    # SimpleITK image, and its attributes come from the volume resolved on
+    # first access (``source_datasets`` is a read-only property here).
+    def __init__(  # pyright: ignore[reportMissingSuperCall]
+        self,
+        datasets: list[Dataset],
+        use_slice_location_if_no_position: bool = False,
+    ) -> None:
+        """
+        Args:
+            datasets: Pydicom Datasets for one DICOM series (any order).
+            use_slice_location_if_no_position: Passed to ``from_datasets``.
+        """
+        self._datasets = list(datasets)
+        self._use_slice_location = use_slice_location_if_no_position
+        self._ordered: list[Dataset] | None = None
+        self._volume: MprVolume | None = None
+        self._resolve_lock = threading.Lock()
+
+    @property
+    def is_resolved(self) -> bool:
+        """True once the SimpleITK volume has been built."""
+        return self._volume is not None
+
+    @property  # type: ignore[override]
+    def source_datasets(self) -> list[Dataset]:
+        """Sorted, deduplicated source slices (no pixel decoding)."""
+        if self._volume is not None:
+            return self._volume.source_datasets
+        if self._ordered is None:
+            self._ordered = self._order_datasets()
+        return self._ordered
+
+    def resolve(self) -> MprVolume:
+        """
+        Build (once) and return the full ``MprVolume``.
+
+        Raises:
+            MprVolumeError: if the volume cannot be built.
+        """
+        if self._volume is None:
+            with self._resolve_lock:
+                if self._volume is None:
+                    _mpr_log("LazyMprVolume: building source volume on first use")
+                    self._volume = MprVolume.from_datasets(
+                        self._datasets,
+                        use_slice_location_if_no_position=self._use_slice_location,
+                    )
+        return self._volume
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not set on the proxy itself.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def _order_datasets(self) -> list[Dataset]:
+        """Mirror ``from_datasets`` ordering and deduplication on geometry only."""
+        stack = SliceStack.from_datasets(
+            self._datasets,
+            use_slice_location_if_no_position=self._use_slice_location,
+        )
+        if stack is None:
+            return list(self._datasets)
+        ordered: list[Dataset] = []
+        last_pos: float | None = None
+        for orig_idx, pos in zip(stack.original_indices, stack.positions, strict=False):
+            if last_pos is not None and abs(pos - last_pos) < 0.01:
+                continue
+            ordered.append(self._datasets[orig_idx])
+            last_pos = pos
+        return ordered
+
+    def __repr__(self) -> str:
+        if self._volume is not None:
+            return f"LazyMprVolume({self._volume!r})"
+        return f"LazyMprVolume(unresolved, slices={len(self._datasets)})"
@@ -70,6 +70,10 @@ def _find_keyword_value(container: Any, keyword: str, max_depth: int = 4) -> Any
         return direct_value
 
     if isinstance(container, Dataset):
+        if not getattr(container, "nested_elements_available", True):
+            # Rebuilt from the study index (core.study_index.indexed_open): only the
+            # indexed top-level elements are known until the file itself is read.
+            return None
         for element in container:
             value = element.value
             if isinstance(value, (Dataset, Sequence)):
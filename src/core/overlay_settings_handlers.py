@@ -149,6 +149,25 @@ def on_annotation_options_applied(app: Any) -> None:
             sdm.display_measurements_for_slice(current_ds)
 
 
+def apply_fusion_cache_settings(app: Any) -> None:
+    """Open, resize or drop the persistent fusion cache and hand it to every FusionHandler."""
+    from core.fusion_cache import open_fusion_cache
+
+    cache = getattr(app, "fusion_volume_cache", None)
+    if not app.config_manager.get_fusion_cache_enabled():
+        cache = None
+    elif cache is None:
+        cache = open_fusion_cache(app.config_manager)
+    else:
+        cache.set_max_size_mb(app.config_manager.get_fusion_cache_max_mb())
+    app.fusion_volume_cache = cache
+    for managers in getattr(app, "subwindow_managers", {}).values():
+        fusion_handler = managers.get("fusion_handler")
+        resampler = getattr(fusion_handler, "image_resampler", None)
+        if resampler is not None:
+            resampler.set_disk_cache(cache)
+
+
 def on_settings_applied(app: Any) -> None:
     """Handle settings being applied."""
     from utils.debug_log import configure_debug_logging
@@ -159,6 +178,7 @@ def on_settings_applied(app: Any) -> None:
     )
     if hasattr(app, "_mpr_controller"):
         app._mpr_controller.apply_cache_settings()
+    apply_fusion_cache_settings(app)
     app.main_window._apply_theme()
     if app.main_window.apply_toolbar_label_style is not None:
         app.main_window.apply_toolbar_label_style(
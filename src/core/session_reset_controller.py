@@ -194,6 +194,10 @@ def finalize_for_application_quit(app: DICOMViewerApp) -> None:
         app._volume_render_facade.close_all_dialogs()
 
     app._drain_tag_export_union_worker(timeout_sec=30.0)
+    # Commit study-index rows still queued by recent loads (bounded, so a slow disk
+    # cannot hold up quitting; anything left is logged as not indexed).
+    if getattr(app, "study_index_service", None) is not None:
+        app.study_index_service.shutdown(timeout_s=10.0)
     app.multi_window_layout.reset_slot_to_view_default()
     app.config_manager.set_slice_sync_groups([])
     app._slice_sync_coordinator.set_groups([])
@@ -112,8 +112,12 @@ def estimate_study_size_mb(
             # so it must not be used here.
             cached = getattr(ds, "_cached_pixel_array", None)
             nbytes = getattr(cached, "nbytes", None) if cached is not None else None
+            stored = getattr(ds, "stored_pixel_data_bytes", None)
             if isinstance(nbytes, int) and nbytes > 0:
                 total_bytes += nbytes
+            elif isinstance(stored, int):
+                # Opened from the study index and not read yet: size from the index.
+                total_bytes += stored
             else:
                 # No cached array yet (or it lacks .nbytes) — fall back to
                 # the raw (possibly compressed) PixelData element length.
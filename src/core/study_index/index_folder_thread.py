@@ -1,29 +1,92 @@
 """
 Background thread: crawl a folder tree and index DICOM headers into the study index.
+
+The crawl is a pipeline: a walker thread feeds file paths into a bounded queue, a
+small pool of parser threads reads only the indexed header tags, and this thread
+(the single writer) commits rows in batches of ``batch_rows`` per transaction.
+Memory stays bounded by the queue sizes and one batch, and a cancel or crash keeps
+every committed batch.
+
+Each row also records where the Pixel Data element starts, so a study can later be
+opened from the index without re-parsing its headers.
+
+Re-indexing is incremental: every file is ``stat``-ed first and only parsed when it is
+new or its ``(size, mtime_ns)`` differs from the stored row. Because committed rows
+carry those stats, an interrupted crawl resumes where it stopped. Rows for files under
+the root that no longer exist are deleted only after a complete walk.
 """
 
 from __future__ import annotations
 
 import logging
 import os
+import queue
+import threading
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 import pydicom
 from PySide6.QtCore import QThread, Signal
 
-from core.study_index.metadata_extract import dataset_to_index_row
+from core.study_index.metadata_extract import INDEX_ROW_TAGS, dataset_to_index_row
 from core.study_index.sqlcipher_store import StudyIndexStore
 from utils.log_sanitizer import sanitized_format_exc
 
 _logger = logging.getLogger(__name__)
 
+# (kind, path, row) from one parser: kind is "row", "skipped" or "unreadable".
+_ParseResult = tuple[str, str, dict[str, Any] | None]
+
+# Rows committed per transaction by the writer.
+INDEX_BATCH_ROWS = 500
+# Paths / parse results buffered between pipeline stages.
+_QUEUE_SIZE = 1024
+# Queue wait between cancellation checks (seconds).
+_POLL_S = 0.1
+
+
+def default_parser_workers() -> int:
+    """Header parser threads; reads are mostly I/O bound, so use a few more than CPUs."""
+    return max(2, min(8, (os.cpu_count() or 1) + 1))
+
+
+def _file_stat_key(path: str) -> tuple[int, int] | None:
+    """Return ``(size, mtime_ns)`` for ``path``, or None when it cannot be stat-ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _put(q: queue.Queue[Any], item: Any, stop: threading.Event) -> bool:
+    """Block until ``item`` is queued; return False when the pipeline is stopping."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_POLL_S)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+@dataclass(frozen=True)
+class FolderIndexReport:
+    """Outcome of one folder crawl."""
+
+    updated: int  # new or changed files parsed and written
+    skipped: int  # unchanged since the last crawl (same size and mtime)
+    removed: int  # rows deleted because the file no longer exists
+    unreadable: int  # files that could not be stat-ed or parsed as DICOM
+
 
 class StudyIndexFolderThread(QThread):
     """Index ``root_dir`` recursively using metadata-only reads."""
 
-    progress = Signal(int, int, str)  # current, total (estimate), path snippet
+    progress = Signal(int, int, str)  # current, total (grows while walking), path snippet
     finished_ok = Signal(int)  # rows written
+    report = Signal(object)  # FolderIndexReport, emitted just before finished_ok
     failed = Signal(str)
 
     def __init__(
@@ -33,44 +96,170 @@ class StudyIndexFolderThread(QThread):
         passphrase: str,
         should_cancel: Callable[[], bool],
         parent=None,
+        *,
+        workers: int | None = None,
+        batch_rows: int = INDEX_BATCH_ROWS,
     ) -> None:
         super().__init__(parent)
         self._root_dir = os.path.abspath(root_dir)
         self._db_path = db_path
         self._passphrase = passphrase
         self._should_cancel = should_cancel
+        self._workers = max(1, workers or default_parser_workers())
+        self._batch_rows = max(1, batch_rows)
 
     def run(self) -> None:
         try:
-            paths: list[str] = []
-            for dirpath, _dirnames, filenames in os.walk(self._root_dir):
-                if self._should_cancel():
-                    self.failed.emit("Cancelled")
-                    return
-                for name in filenames:
-                    paths.append(os.path.join(dirpath, name))
-            total = max(len(paths), 1)
-            rows: list[dict[str, Any]] = []
-            for i, path in enumerate(paths):
-                if self._should_cancel():
-                    self.failed.emit("Cancelled")
-                    return
-                if i % 20 == 0:
-                    self.progress.emit(i + 1, total, os.path.basename(path) or path)
-                try:
-                    ds = pydicom.dcmread(
-                        path, stop_before_pixels=True, force=True, defer_size="all"
-                    )
-                except Exception:
-                    continue
-                fp = getattr(ds, "filename", None) or path
-                rows.append(
-                    dataset_to_index_row(ds, file_path=fp, study_root_path=self._root_dir)
-                )
+            if self._should_cancel():
+                self.failed.emit("Cancelled")
+                return
             store = StudyIndexStore(self._db_path, self._passphrase)
             store.init_schema()
-            store.upsert_rows(rows)
-            self.finished_ok.emit(len(rows))
+            self._crawl(store, store.file_stats_under_root(self._root_dir))
         except Exception as e:
             _logger.debug("%s", sanitized_format_exc())
             self.failed.emit(f"{type(e).__name__}: {e}")
+
+    def _crawl(self, store: StudyIndexStore, known: dict[str, tuple[Any, Any]]) -> None:
+        """Run walker and parser threads and commit their rows from this thread."""
+        paths: queue.Queue[str | None] = queue.Queue(maxsize=_QUEUE_SIZE)
+        results: queue.Queue[_ParseResult | None] = queue.Queue(maxsize=_QUEUE_SIZE)
+        stop = threading.Event()
+        cancelled = threading.Event()
+        errors: list[BaseException] = []
+        walk = {"count": 0, "complete": False}
+        seen: set[str] = set()
+
+        def cancel_requested() -> bool:
+            if self._should_cancel():
+                cancelled.set()
+                stop.set()
+            return stop.is_set()
+
+        def walker() -> None:
+            try:
+                for dirpath, _dirnames, filenames in os.walk(self._root_dir):
+                    if cancel_requested():
+                        return
+                    for name in filenames:
+                        path = os.path.normpath(os.path.join(dirpath, name))
+                        seen.add(path)
+                        walk["count"] += 1
+                        if not _put(paths, path, stop):
+                            return
+                walk["complete"] = True
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                for _ in range(self._workers):
+                    _put(paths, None, stop)
+
+        def parser() -> None:
+            try:
+                while not stop.is_set():
+                    try:
+                        path = paths.get(timeout=_POLL_S)
+                    except queue.Empty:
+                        continue
+                    if path is None:
+                        break
+                    if cancel_requested():
+                        return
+                    if not _put(results, self._parse(path, known), stop):
+                        return
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+                return
+            _put(results, None, stop)
+
+        threads = [threading.Thread(target=walker, name="study-index-walk", daemon=True)]
+        threads += [
+            threading.Thread(target=parser, name=f"study-index-parse-{i}", daemon=True)
+            for i in range(self._workers)
+        ]
+        for t in threads:
+            t.start()
+
+        rows: list[dict[str, Any]] = []
+        written = done = skipped = unreadable = finished_parsers = 0
+        try:
+            while finished_parsers < self._workers and not cancel_requested():
+                try:
+                    item = results.get(timeout=_POLL_S)
+                except queue.Empty:
+                    continue
+                if item is None:
+                    finished_parsers += 1
+                    continue
+                kind, path, row = item
+                if done % 20 == 0:
+                    total = max(walk["count"], done + 1)
+                    self.progress.emit(done + 1, total, os.path.basename(path) or path)
+                done += 1
+                if kind == "skipped":
+                    skipped += 1
+                elif kind == "unreadable":
+                    unreadable += 1
+                elif row is not None:
+                    rows.append(row)
+                    if len(rows) >= self._batch_rows:
+                        store.upsert_rows(rows)
+                        written += len(rows)
+                        rows = []
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
+
+        if errors:
+            raise errors[0]
+        if rows:
+            # On cancel too: committed rows let the next crawl resume from here.
+            store.upsert_rows(rows)
+            written += len(rows)
+        if cancelled.is_set():
+            self.failed.emit("Cancelled")
+            return
+        removed = 0
+        if walk["complete"]:
+            # Only a complete walk can tell which indexed files have vanished.
+            removed = store.delete_file_paths([fp for fp in known if fp not in seen])
+        self.report.emit(
+            FolderIndexReport(
+                updated=written,
+                skipped=skipped,
+                removed=removed,
+                unreadable=unreadable,
+            )
+        )
+        self.finished_ok.emit(written)
+
+    def _parse(
+        self, path: str, known: dict[str, tuple[Any, Any]]
+    ) -> _ParseResult:
+        """Stat and, when new or changed, header-parse one file (parser thread)."""
+        stat_key = _file_stat_key(path)
+        if stat_key is None:
+            return "unreadable", path, None
+        if known.get(path) == stat_key:
+            return "skipped", path, None
+        try:
+            with open(path, "rb") as fh:
+                ds = pydicom.dcmread(
+                    fh,
+                    stop_before_pixels=True,
+                    force=True,
+                    defer_size="1 KB",
+                    specific_tags=list(INDEX_ROW_TAGS),
+                )
+                # The header read stops at the Pixel Data tag (or reads to the end).
+                header_end = fh.tell()
+        except Exception:
+            return "unreadable", path, None
+        fp = getattr(ds, "filename", None) or path
+        row = dataset_to_index_row(ds, file_path=fp, study_root_path=self._root_dir)
+        row["file_size"], row["file_mtime_ns"] = stat_key
+        row["pixel_data_offset"] = header_end if header_end < stat_key[0] else None
+        return "row", path, row
@@ -7,8 +7,13 @@ from __future__ import annotations
 import logging
 import os
 import shutil
-from collections.abc import Callable
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
 from dataclasses import dataclass
+from itertools import groupby
 from pathlib import Path
 from typing import Any
 
@@ -17,14 +22,19 @@ _logger = logging.getLogger(__name__)
 from pydicom.dataset import Dataset
 
 from core.dicom_organizer import MergeResult
+from core.study_index.file_presence import SCAN_WORKERS, FilePresenceChecker
 from core.study_index.index_folder_thread import StudyIndexFolderThread
 from core.study_index.index_write_thread import StudyIndexWriteThread
+from core.study_index.indexed_open import IndexedInstanceDataset
 from core.study_index.keyring_storage import get_or_create_study_index_passphrase
 from core.study_index.metadata_extract import dataset_to_index_row
-from core.study_index.sqlcipher_store import StudyIndexStore
+from core.study_index.sqlcipher_store import StudyIndexStore, close_pooled_connections
 from utils.config_manager import ConfigManager
 from utils.privacy.safe_storage import DeletionResult, secure_unlink
 
+# Studies whose directory listings may be in flight during an integrity scan.
+_SCAN_WINDOW_STUDIES = 4 * SCAN_WORKERS
+
 
 def _safe_remove(path: str) -> None:
     """Best-effort delete; ignore a missing file or a transient OS error."""
@@ -58,11 +68,25 @@ class LocalStudyIndexService:
     def __init__(self, config_manager: ConfigManager, parent_widget=None) -> None:
         self._config = config_manager
         self._parent = parent_widget
-        self._write_thread: StudyIndexWriteThread | None = None
+        self._writer: StudyIndexWriteThread | None = None
         self._folder_thread: StudyIndexFolderThread | None = None
         self._folder_cancel = False
         self._schema_initialized = False
         self._cached_db_path: str = ""
+        # Searches and integrity scans in progress; clear_all_data refuses while > 0.
+        self._reads_lock = threading.Lock()
+        self._active_reads = 0
+
+    @contextmanager
+    def _reading(self) -> Iterator[None]:
+        """Mark a search or scan in progress (blocks while ``clear_all_data`` runs)."""
+        with self._reads_lock:
+            self._active_reads += 1
+        try:
+            yield
+        finally:
+            with self._reads_lock:
+                self._active_reads -= 1
 
     @staticmethod
     def is_backend_available() -> bool:
@@ -108,18 +132,19 @@ class LocalStudyIndexService:
         limit: int = 500,
         privacy_mode: bool = False,
     ) -> list[dict[str, Any]]:
-        store = self._get_ready_store()
-        rows = store.search(
-            patient_name_contains=patient_name_contains,
-            patient_id_contains=patient_id_contains,
-            modality=modality,
-            accession_contains=accession_contains,
-            study_description_contains=study_description_contains,
-            study_date_from=study_date_from,
-            study_date_to=study_date_to,
-            global_fts_query=global_fts_query,
-            limit=limit,
-        )
+        with self._reading():
+            store = self._get_ready_store()
+            rows = store.search(
+                patient_name_contains=patient_name_contains,
+                patient_id_contains=patient_id_contains,
+                modality=modality,
+                accession_contains=accession_contains,
+                study_description_contains=study_description_contains,
+                study_date_from=study_date_from,
+                study_date_to=study_date_to,
+                global_fts_query=global_fts_query,
+                limit=limit,
+            )
         if not privacy_mode:
             return rows
         out = []
@@ -146,23 +171,26 @@ class LocalStudyIndexService:
         offset: int = 0,
         order_by: str = "study_date",
         descending: bool = True,
+        after_id: int | None = None,
         privacy_mode: bool = False,
     ) -> list[dict[str, Any]]:
-        store = self._get_ready_store()
-        rows = store.search_grouped_studies(
-            patient_name_contains=patient_name_contains,
-            patient_id_contains=patient_id_contains,
-            modality=modality,
-            accession_contains=accession_contains,
-            study_description_contains=study_description_contains,
-            study_date_from=study_date_from,
-            study_date_to=study_date_to,
-            global_fts_query=global_fts_query,
-            limit=limit,
-            offset=offset,
-            order_by=order_by,
-            descending=descending,
-        )
+        with self._reading():
+            store = self._get_ready_store()
+            rows = store.search_grouped_studies(
+                patient_name_contains=patient_name_contains,
+                patient_id_contains=patient_id_contains,
+                modality=modality,
+                accession_contains=accession_contains,
+                study_description_contains=study_description_contains,
+                study_date_from=study_date_from,
+                study_date_to=study_date_to,
+                global_fts_query=global_fts_query,
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+                descending=descending,
+                after_id=after_id,
+            )
         if not privacy_mode:
             return rows
         out = []
@@ -199,46 +227,88 @@ class LocalStudyIndexService:
         store = self._get_ready_store()
         return store.get_file_paths_for_study(study_uid, study_root_path)
 
+    def get_study_instances(
+        self, study_uid: str, study_root_path: str
+    ) -> list[dict[str, Any]]:
+        """
+        Return the indexed instance rows of one (study UID, study folder) pair, with
+        the per-instance fields used to open the study from the index.
+
+        Returns an empty list when the backend is unavailable or inputs are blank.
+        """
+        if not self.is_backend_available():
+            return []
+        store = self._get_ready_store()
+        return store.get_study_instances(study_uid, study_root_path)
+
     def integrity_scan(
         self, progress: Callable[[int, int], None] | None = None
     ) -> list[MissingStudyRecord]:
         """
         Find indexed studies whose files are missing on disk.
 
-        Walks every unique ``(study_uid, study_root_path)`` group, gathers its indexed
-        file paths, and counts how many no longer exist (``os.path.isfile``). A study is
-        reported when its root folder is gone **or** at least one member file is missing.
+        Streams every indexed ``(study, file_path)`` in one ordered query and checks the
+        files with :class:`FilePresenceChecker` (directories listed in parallel, one
+        ``os.scandir`` per folder). Up to ``_SCAN_WINDOW_STUDIES`` studies are checked
+        ahead; results are still resolved in study order. A study is reported when its
+        root folder is gone **or** at least one member file is missing.
 
         ``progress(done, total)`` is called after each study when supplied. Returns an
         empty list when the backend is unavailable.
         """
         if not self.is_backend_available():
             return []
+        with self._reading():
+            return self._integrity_scan(progress)
+
+    def _integrity_scan(
+        self, progress: Callable[[int, int], None] | None
+    ) -> list[MissingStudyRecord]:
         store = self._get_ready_store()
-        groups = store.iter_study_groups()
-        total = len(groups)
+        total = store.study_count()
         records: list[MissingStudyRecord] = []
-        for i, g in enumerate(groups):
-            study_uid = (g.get("study_uid") or "").strip()
+        root_present: dict[str, bool] = {}
+        pending: deque[
+            tuple[dict[str, Any], list[tuple[str, Future[frozenset[str] | None]]]]
+        ] = deque()
+        done = 0
+
+        def resolve_oldest() -> None:
+            nonlocal done
+            g, prefetched = pending.popleft()
+            missing_count = FilePresenceChecker.count_missing(prefetched)
             root = (g.get("study_root_path") or "").strip()
-            paths = store.get_file_paths_for_study(study_uid, root)
-            total_count = len(paths)
-            missing_count = sum(1 for p in paths if not os.path.isfile(p))
-            root_gone = bool(root) and not os.path.isdir(root)
+            if root and root not in root_present:
+                root_present[root] = os.path.isdir(root)
+            root_gone = bool(root) and not root_present[root]
             if root_gone or missing_count > 0:
                 records.append(
                     MissingStudyRecord(
-                        study_uid=study_uid,
+                        study_uid=(g.get("study_uid") or "").strip(),
                         study_root_path=root,
                         patient_name=str(g.get("patient_name") or ""),
                         study_date=str(g.get("study_date") or ""),
                         modalities=str(g.get("modalities") or ""),
                         missing_count=missing_count,
-                        total_count=total_count,
+                        total_count=len(prefetched),
                     )
                 )
+            done += 1
             if progress is not None:
-                progress(i + 1, total)
+                progress(done, total)
+
+        with FilePresenceChecker() as checker:
+            studies = groupby(
+                store.iter_study_files(),
+                key=lambda item: (item[0]["study_uid"], item[0]["study_root_path"]),
+            )
+            for _key, files in studies:
+                members = list(files)
+                pending.append((members[0][0], checker.prefetch(fp for _g, fp in members)))
+                if len(pending) >= _SCAN_WINDOW_STUDIES:
+                    resolve_oldest()
+            while pending:
+                resolve_oldest()
         return records
 
     def relocate_study(self, study_uid: str, old_root: str, new_root: str) -> int:
@@ -306,6 +376,8 @@ class LocalStudyIndexService:
             raise FileExistsError("A file already exists at the destination.")
 
         passphrase = self._passphrase()
+        # Commit queued rows to the old location so the copy includes them.
+        self._stop_writer()
         # Make sure the source exists and fold the WAL into the main file before copying.
         self.ensure_store_ready()
         StudyIndexStore(old_path, passphrase).checkpoint()
@@ -320,14 +392,18 @@ class LocalStudyIndexService:
         except Exception:
             verified = False
         if not verified:
+            close_pooled_connections(new_path)
             _safe_remove(new_path)
             raise RuntimeError("The copied database failed verification; move aborted.")
 
         if not self._config.set_study_index_db_path(new_path):
+            close_pooled_connections(new_path)
             _safe_remove(new_path)
             raise RuntimeError("Could not save the new index location; move aborted.")
 
-        # Old location is now stale — remove it and its WAL sidecars securely.
+        # Old location is now stale — close its pooled connections, then remove it and
+        # its WAL sidecars securely.
+        close_pooled_connections(old_path)
         try:
             secure_unlink(Path(old_path))
         except OSError:
@@ -383,6 +459,9 @@ class LocalStudyIndexService:
         """
         Queue a background upsert for datasets opened in this load batch.
 
+        Rows go to the single persistent writer, which coalesces loads that arrive
+        while it is busy, so back-to-back loads are all indexed.
+
         ``merge_paths`` must align positionally with ``datasets`` (as in
         ``merge_batch``).
 
@@ -403,6 +482,8 @@ class LocalStudyIndexService:
             return
         rows: list[dict[str, Any]] = []
         for i, ds in enumerate(datasets):
+            if isinstance(ds, IndexedInstanceDataset):
+                continue  # opened from its index row, which is already current
             mp = merge_paths[i] if i < len(merge_paths) else ""
             if not mp or not os.path.isfile(mp):
                 fn = getattr(ds, "filename", None)
@@ -412,16 +493,35 @@ class LocalStudyIndexService:
             rows.append(dataset_to_index_row(ds, file_path=mp, study_root_path=source_dir))
         if not rows:
             return
-        if self._write_thread and self._write_thread.isRunning():
-            # Avoid overlapping writes — drop duplicate schedule (MVP)
-            return
-        self._write_thread = StudyIndexWriteThread(
-            self._db_path(),
-            self._passphrase(),
-            rows,
-            parent=self._parent,
-        )
-        self._write_thread.start()
+        if not self._index_writer().enqueue(rows):
+            # The writer stopped between the check and the enqueue; use a fresh one.
+            self._stop_writer()
+            self._index_writer().enqueue(rows)
+
+    def _index_writer(self) -> StudyIndexWriteThread:
+        """Return the running writer for the current DB path, starting one if needed."""
+        db_path = self._db_path()
+        writer = self._writer
+        if writer is not None and writer.isRunning() and writer.db_path == db_path:
+            return writer
+        self._stop_writer()
+        writer = StudyIndexWriteThread(db_path, self._passphrase(), parent=self._parent)
+        writer.start()
+        self._writer = writer
+        return writer
+
+    def _stop_writer(self, *, discard: bool = False, timeout_s: float | None = None) -> None:
+        """Drain (or drop) queued rows and end the writer thread."""
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.stop(discard=discard, timeout_s=timeout_s)
+
+    def shutdown(self, timeout_s: float | None = None) -> None:
+        """Commit queued rows and stop the writer (application exit).
+
+        With ``timeout_s``, rows not committed by then are dropped and logged.
+        """
+        self._stop_writer(timeout_s=timeout_s)
 
     def start_index_folder(
         self,
@@ -430,8 +530,13 @@ class LocalStudyIndexService:
         on_progress=None,
         on_finished=None,
         on_failed=None,
+        on_report=None,
     ) -> None:
-        """Start background folder crawl (single active job)."""
+        """Start background folder crawl (single active job).
+
+        Re-crawls are incremental; ``on_report`` receives a ``FolderIndexReport``
+        with updated / skipped / removed / unreadable counts before ``on_finished``.
+        """
         self._folder_cancel = False
         if self._folder_thread and self._folder_thread.isRunning():
             return
@@ -454,6 +559,8 @@ class LocalStudyIndexService:
                 on_finished(n)
 
             self._folder_thread.finished_ok.connect(_ok)
+        if on_report:
+            self._folder_thread.report.connect(on_report)
         if on_failed:
             self._folder_thread.failed.connect(on_failed)
         self._folder_thread.start()
@@ -462,13 +569,23 @@ class LocalStudyIndexService:
         self._folder_cancel = True
 
     def clear_all_data(self) -> DeletionResult:
-        """Clear the encrypted index when no background index operation is active."""
+        """Clear the encrypted index when no folder crawl, integrity scan or search is active.
+
+        Rows still queued by recent loads are discarded rather than written. Searches
+        and scans that start meanwhile wait until the files are gone.
+        """
 
-        if self._write_thread and self._write_thread.isRunning():
-            return DeletionResult(failed=1)
         if self._folder_thread and self._folder_thread.isRunning():
             return DeletionResult(failed=1)
+        with self._reads_lock:
+            if self._active_reads:
+                return DeletionResult(failed=1)
+            return self._clear_all_data()
+
+    def _clear_all_data(self) -> DeletionResult:
+        self._stop_writer(discard=True)
         db_path = Path(self._db_path())
+        close_pooled_connections(str(db_path))
         removed = 0
         failed = 0
         for candidate in (
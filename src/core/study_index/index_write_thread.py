@@ -1,11 +1,20 @@
 """
-Background thread: upsert study index rows without blocking the UI thread.
+Background thread: the single persistent writer for study index rows.
+
+Loads enqueue their rows instead of starting a thread each; overlapping loads no
+longer drop batches. Pending rows are coalesced by ``file_path`` (the newest row
+wins) and committed in transactions of up to ``max_batch_rows`` rows, so a burst of
+loads becomes a few large commits. :meth:`StudyIndexWriteThread.stop` drains the
+queue before the thread exits (or discards it, when the index is being cleared).
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from collections.abc import Sequence
+from itertools import islice
 from typing import Any
 
 from PySide6.QtCore import QThread, Signal
@@ -15,31 +24,134 @@ from utils.log_sanitizer import sanitized_format_exc
 
 _logger = logging.getLogger(__name__)
 
+# Most rows committed in one transaction.
+INDEX_WRITE_BATCH_ROWS = 5000
+# Wait between liveness checks while a caller waits for the queue to drain (seconds).
+_POLL_S = 0.1
+
 
 class StudyIndexWriteThread(QThread):
-    """Runs :meth:`StudyIndexStore.upsert_rows` off the GUI thread."""
+    """Commits queued rows with :meth:`StudyIndexStore.upsert_rows` off the GUI thread."""
 
-    finished_ok = Signal()
+    batch_written = Signal(int)  # rows committed in one transaction
     failed = Signal(str)
 
     def __init__(
         self,
         db_path: str,
         passphrase: str,
-        rows: Sequence[dict[str, Any]],
         parent=None,
+        *,
+        max_batch_rows: int = INDEX_WRITE_BATCH_ROWS,
     ) -> None:
         super().__init__(parent)
         self._db_path = db_path
         self._passphrase = passphrase
-        self._rows = list(rows)
+        self._max_batch_rows = max(1, max_batch_rows)
+        self._cond = threading.Condition()
+        self._pending: dict[str, dict[str, Any]] = {}  # file_path -> newest row, FIFO
+        self._in_flight = 0
+        self._stopping = False
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    def enqueue(self, rows: Sequence[dict[str, Any]]) -> bool:
+        """Queue ``rows`` (a queued row for the same ``file_path`` is replaced).
+
+        Returns False, queueing nothing, once the writer is stopping.
+        """
+        with self._cond:
+            if self._stopping:
+                return False
+            for row in rows:
+                path = row["file_path"]
+                self._pending.pop(path, None)
+                self._pending[path] = row
+            self._cond.notify_all()
+        return True
+
+    def pending_count(self) -> int:
+        """Rows queued or being committed."""
+        with self._cond:
+            return len(self._pending) + self._in_flight
+
+    def flush(self, timeout_s: float | None = None) -> bool:
+        """Block until every queued row is committed; False on timeout or if the thread died."""
+        deadline = None if timeout_s is None else time.monotonic() + timeout_s
+        with self._cond:
+            while self._pending or self._in_flight:
+                if not self.isRunning():
+                    return False
+                remaining = _POLL_S if deadline is None else deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(min(_POLL_S, remaining))
+        return True
+
+    def stop(self, *, discard: bool = False, timeout_s: float | None = None) -> bool:
+        """Commit (or with ``discard``, drop) queued rows, then end the thread.
+
+        Rows still queued after ``timeout_s`` are dropped (and counted in a warning) so
+        the thread ends after the batch in flight. Returns False when the thread is
+        still running after ``timeout_s``.
+        """
+        with self._cond:
+            self._stopping = True
+            if discard:
+                self._pending.clear()
+            self._cond.notify_all()
+        if timeout_s is None:
+            return self.wait()
+        if self.wait(max(0, int(timeout_s * 1000))):
+            return True
+        with self._cond:
+            dropped = len(self._pending)
+            self._pending.clear()
+        if dropped:
+            _logger.warning(
+                "Study index writer did not finish within %.0f s; %d rows not indexed",
+                timeout_s,
+                dropped,
+            )
+        return False
 
     def run(self) -> None:
         try:
             store = StudyIndexStore(self._db_path, self._passphrase)
             store.init_schema()
-            store.upsert_rows(self._rows)
-            self.finished_ok.emit()
         except Exception as e:
             _logger.debug("%s", sanitized_format_exc())
+            with self._cond:
+                dropped = len(self._pending)
+                self._pending.clear()
+                self._stopping = True
+                self._cond.notify_all()
+            if dropped:
+                _logger.warning(
+                    "Study index writer could not open the index; %d rows not indexed", dropped
+                )
             self.failed.emit(f"{type(e).__name__}: {e}")
+            return
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                paths = list(islice(self._pending, self._max_batch_rows))
+                batch = [self._pending.pop(path) for path in paths]
+                self._in_flight = len(batch)
+            try:
+                store.upsert_rows(batch)
+            except Exception as e:
+                # Keep serving later batches; a bad batch must not wedge the queue.
+                _logger.debug("%s", sanitized_format_exc())
+                self.failed.emit(f"{type(e).__name__}: {e}")
+            else:
+                self.batch_written.emit(len(batch))
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
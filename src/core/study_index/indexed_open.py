@@ -0,0 +1,295 @@
+"""
+Open a study from the study index without re-parsing every header.
+
+Opening a study from the Study Index dialog used to hand its folder to the normal
+load pipeline, which walks the folder and reads every file in full before the first
+slice appears. When the index holds the per-instance fields recorded by the folder
+crawler (schema v7), the study is built from its rows instead: each unchanged classic
+single-frame image (no Number of Frames element) becomes an
+:class:`IndexedInstanceDataset` that answers the indexed elements (UIDs, sort keys,
+geometry) from the row and reads its file only when something needs any other
+element or the pixels.
+
+Instances the index cannot describe safely are read with
+:meth:`core.dicom_loader.DICOMLoader.load_file` like any other open: rows without
+per-instance fields, multi-frame and enhanced objects, objects without Pixel Data
+(SR, PR, KO, ...) and files whose size or modification time no longer match the index.
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import os
+import threading
+import warnings
+from collections.abc import Callable
+from typing import Any
+
+import pydicom
+from pydicom.datadict import tag_for_keyword
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.tag import Tag
+
+from core.dicom_loader import DEFAULT_DEFER_SIZE, DICOMLoader
+from core.study_index.index_folder_thread import _file_stat_key
+from core.study_index.metadata_extract import INDEX_ROW_TAGS
+
+_logger = logging.getLogger(__name__)
+
+# Elements an index row answers, present or absent, without reading the file. A
+# single-frame object has no per-frame functional groups, so that lookup is free too.
+_INDEXED_TAGS = frozenset(
+    Tag(tag)
+    for tag in (
+        tag_for_keyword(keyword)
+        for keyword in (*INDEX_ROW_TAGS, "PerFrameFunctionalGroupsSequence")
+    )
+    if tag is not None
+)
+# One file read at a time: the GUI thread and the tag-export worker may both touch
+# the same dataset, and a read swaps its whole element dictionary.
+_READ_LOCK = threading.RLock()
+# Rows between progress callbacks (building a lazy dataset is cheap).
+_PROGRESS_EVERY = 50
+
+
+class IndexedInstanceDataset(Dataset):
+    """
+    Single-frame instance answered from its study-index row until more is needed.
+
+    Reading any element outside ``INDEX_ROW_TAGS``, iterating, comparing, writing or
+    asking for pixels first reads the whole file (once); the file's elements then
+    replace the row's. A file that can no longer be read leaves only the indexed
+    elements, like a load that lost its pixel data.
+    """
+
+    # Class default so ``__init__`` can populate the dataset like a plain one.
+    _index_loaded = True
+
+    def __init__(self, row: dict[str, Any]) -> None:
+        super().__init__()
+        self.update(Dataset.from_json(row["instance_header"]))
+        meta = FileMetaDataset()
+        if row.get("transfer_syntax_uid"):
+            meta.TransferSyntaxUID = row["transfer_syntax_uid"]
+        self.file_meta = meta
+        self.filename = row["file_path"]
+        # Pixel Data runs from its element header (12 bytes) to the end of the file.
+        self._stored_pixel_bytes = max(
+            0, int(row.get("file_size") or 0) - int(row.get("pixel_data_offset") or 0) - 12
+        )
+        # Same markers DICOMLoader.load_file sets on single-frame datasets.
+        self._num_frames = 1
+        self._is_multiframe = False
+        self._index_loaded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once the file has been read (or found unreadable)."""
+        return self._index_loaded
+
+    @property
+    def nested_elements_available(self) -> bool:
+        """False until the file is read: the index keeps no sequence contents.
+
+        Nested keyword searches (frame classification) consult this instead of
+        iterating, which would read the file.
+        """
+        return self._index_loaded
+
+    @property
+    def stored_pixel_data_bytes(self) -> int | None:
+        """Approximate Pixel Data length on disk while the file is unread, else None.
+
+        Lets memory estimates size an opened study without reading every file.
+        """
+        return None if self._index_loaded else self._stored_pixel_bytes
+
+    def load(self) -> None:
+        """Read the file now; a no-op once it has been read."""
+        if self._index_loaded:
+            return
+        with _READ_LOCK:
+            if self._index_loaded:
+                return
+            try:
+                with warnings.catch_warnings():
+                    warnings.filterwarnings(
+                        "ignore", message=".*excess padding.*", category=UserWarning
+                    )
+                    full = pydicom.dcmread(
+                        self.filename, force=True, defer_size=DEFAULT_DEFER_SIZE
+                    )
+            except Exception as e:
+                _logger.warning(
+                    "Indexed instance could not be read; only indexed elements remain (%s)",
+                    type(e).__name__,
+                )
+                self.__dict__["_index_loaded"] = True
+                return
+            elements = dict(full._dict)
+            for tag, elem in self._dict.items():
+                elements.setdefault(tag, elem)
+            self.__dict__.update({k: v for k, v in vars(full).items() if k != "_dict"})
+            self.__dict__["_dict"] = elements
+            self.__dict__["_index_loaded"] = True
+
+    def _needs_file(self, key: Any) -> bool:
+        if self._index_loaded:
+            return False
+        try:
+            tag = Tag(key)
+        except Exception:
+            return False  # not an element key; Dataset answers as usual
+        return tag not in self._dict and tag not in _INDEXED_TAGS
+
+    def __getattr__(self, name: str) -> Any:
+        if not name.startswith("_") and tag_for_keyword(name) is not None and self._needs_file(name):
+            self.load()
+        return super().__getattr__(name)
+
+    def __contains__(self, name: Any) -> bool:
+        if self._needs_file(name):
+            self.load()
+        return super().__contains__(name)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, slice) or self._needs_file(key):
+            self.load()
+        return super().__getitem__(key)
+
+    def get_item(self, key: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(key, slice) or self._needs_file(key):
+            self.load()
+        return super().get_item(key, *args, **kwargs)
+
+    # Writes read the file first, so a later read never overwrites an edit.
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not self._index_loaded and tag_for_keyword(name) is not None:
+            self.load()
+        super().__setattr__(name, value)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.load()
+        super().__setitem__(key, value)
+
+    def __delattr__(self, name: str) -> None:
+        if tag_for_keyword(name) is not None:
+            self.load()
+        super().__delattr__(name)
+
+    def __delitem__(self, key: Any) -> None:
+        self.load()
+        super().__delitem__(key)
+
+    def __iter__(self):
+        self.load()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self.load()
+        return super().__len__()
+
+    def __eq__(self, other: Any) -> bool:
+        self.load()
+        if isinstance(other, IndexedInstanceDataset):
+            other.load()
+        return super().__eq__(other)
+
+    def keys(self):
+        self.load()
+        return super().keys()
+
+    def values(self):
+        self.load()
+        return super().values()
+
+    def items(self):
+        self.load()
+        return super().items()
+
+    def elements(self):
+        self.load()
+        return super().elements()
+
+    @property
+    def pixel_array(self) -> Any:
+        self.load()
+        return super().pixel_array
+
+    def convert_pixel_data(self, *args: Any, **kwargs: Any) -> None:
+        self.load()
+        super().convert_pixel_data(*args, **kwargs)
+
+    def decompress(self, *args: Any, **kwargs: Any) -> None:
+        self.load()
+        super().decompress(*args, **kwargs)
+
+    def save_as(self, *args: Any, **kwargs: Any) -> None:
+        self.load()
+        super().save_as(*args, **kwargs)
+
+
+def opens_from_index(row: dict[str, Any], stat_key: tuple[int, int] | None) -> bool:
+    """
+    True when ``row`` describes its file well enough to skip reading it up front.
+
+    ``stat_key`` is the file's current ``(size, mtime_ns)`` (None when it cannot be
+    stat-ed); it must match the values stored by the crawl that wrote the row.
+    """
+    return (
+        bool(row.get("instance_header"))
+        and row.get("pixel_data_offset") is not None
+        and row.get("number_of_frames") is None
+        and stat_key is not None
+        and stat_key == (row.get("file_size"), row.get("file_mtime_ns"))
+    )
+
+
+def load_indexed_instances(
+    loader: DICOMLoader,
+    instances: list[dict[str, Any]],
+    progress_callback: Callable[[int, int, str], None] | None = None,
+) -> list[Dataset]:
+    """
+    Build the datasets of one indexed study (see the module docstring).
+
+    The load-pipeline counterpart of :meth:`DICOMLoader.load_files` for rows from
+    :meth:`core.study_index.sqlcipher_store.StudyIndexStore.get_study_instances`:
+    same progress callback, cancellation and ``loaded_files`` / ``failed_files``
+    bookkeeping, so the pipeline reports failures and counts as for any load.
+    """
+    loader.reset_cancellation()
+    loader.loaded_files = []
+    loader.failed_files = []
+    total = len(instances)
+    loader.attempted_file_count = total
+
+    # As in load_files: no cyclic GC while datasets are created on the worker thread.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for idx, row in enumerate(instances):
+            if loader.is_cancelled():
+                break
+            path = row["file_path"]
+            if progress_callback and idx % _PROGRESS_EVERY == 0:
+                progress_callback(idx + 1, total, os.path.basename(path))
+            dataset: Dataset | None = None
+            if opens_from_index(row, _file_stat_key(path)):
+                try:
+                    dataset = IndexedInstanceDataset(row)
+                except Exception:
+                    dataset = None  # malformed header JSON: read the file instead
+            if dataset is None:
+                dataset = loader.load_file(path, defer_size=DEFAULT_DEFER_SIZE)
+            if dataset is not None:
+                loader.loaded_files.append(dataset)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    if progress_callback and total > 0:
+        progress_callback(len(loader.loaded_files), total, "")
+    return loader.loaded_files
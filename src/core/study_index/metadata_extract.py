@@ -2,15 +2,24 @@
 Extract denormalised study/series/instance fields from in-memory pydicom datasets.
 
 Used after a successful load so we do not re-read pixel data from disk.
+
+Besides the searchable study fields, each row carries what is needed to open the
+instance again without parsing its header (see :mod:`core.study_index.indexed_open`):
+instance number, frame count, transfer syntax, the offset of the Pixel Data element,
+and the indexed header elements (including those the viewer sorts and groups slices
+by) as DICOM JSON.
 """
 
 from __future__ import annotations
 
 import ast
+import json
 import os
 from typing import Any
 
+from pydicom.datadict import tag_for_keyword
 from pydicom.dataset import Dataset
+from pydicom.tag import Tag
 
 
 def repair_str_bytes_repr_artifact(s: str) -> str:
@@ -66,6 +75,103 @@ def _elem_to_str(val: Any) -> str:
         return ""
 
 
+_STUDY_ROW_TAGS: tuple[str, ...] = (
+    "StudyInstanceUID",
+    "SeriesInstanceUID",
+    "SOPInstanceUID",
+    "PatientName",
+    "PatientID",
+    "AccessionNumber",
+    "StudyDate",
+    "StudyDescription",
+    "SeriesDescription",
+    "Modality",
+)
+
+# Per-instance elements kept in ``instance_header``: everything the organizer and the
+# first slice display read before any pixel data (sort keys, series grouping, frame
+# classification and geometry).
+INSTANCE_HEADER_TAGS: tuple[str, ...] = (
+    "SOPClassUID",
+    "SeriesNumber",
+    "InstanceNumber",
+    "SliceLocation",
+    "ImagePositionPatient",
+    "ImageOrientationPatient",
+    "FrameOfReferenceUID",
+    "PixelSpacing",
+    "SliceThickness",
+    "SpacingBetweenSlices",
+    "Rows",
+    "Columns",
+    "NumberOfFrames",
+    "ContentTime",
+    "TemporalPositionIdentifier",
+    "FrameTime",
+    "ActualFrameDuration",
+    "TriggerTime",
+    "CardiacNumberOfImages",
+    "DiffusionBValue",
+)
+
+# Header keywords read by ``dataset_to_index_row``; the folder crawler passes them as
+# ``specific_tags`` so pydicom skips every other element.
+INDEX_ROW_TAGS: tuple[str, ...] = _STUDY_ROW_TAGS + INSTANCE_HEADER_TAGS
+
+_PIXEL_DATA_TAG = Tag(0x7FE00010)
+_IMPLICIT_VR_LITTLE_ENDIAN = "1.2.840.10008.1.2"
+_DEFLATED_EXPLICIT_VR_LITTLE_ENDIAN = "1.2.840.10008.1.2.1.99"
+
+
+def _int_or_none(val: Any) -> int | None:
+    try:
+        return int(val) if val is not None and str(val).strip() != "" else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _transfer_syntax_uid(ds: Dataset) -> str:
+    meta = getattr(ds, "file_meta", None)
+    return _elem_to_str(getattr(meta, "TransferSyntaxUID", None)) if meta is not None else ""
+
+
+def pixel_data_offset(ds: Dataset, transfer_syntax_uid: str) -> int | None:
+    """
+    File offset of the Pixel Data element's tag, from a dataset read from disk.
+
+    None when the dataset has no Pixel Data, was not read from a file, or uses the
+    deflated transfer syntax (offsets there are into the inflated stream).
+    """
+    if transfer_syntax_uid == _DEFLATED_EXPLICIT_VR_LITTLE_ENDIAN:
+        return None
+    # Not ``get_item``: it would read a deferred Pixel Data value just to find its offset.
+    elem = ds._dict.get(_PIXEL_DATA_TAG)
+    if elem is None:
+        return None
+    # RawDataElement (not yet converted) or DataElement; both point at the value.
+    value_tell = getattr(elem, "value_tell", None) or getattr(elem, "file_tell", None)
+    if not isinstance(value_tell, int):
+        return None
+    # Tag + length is 8 bytes; explicit VR OB/OW adds VR and 2 reserved bytes.
+    header = 8 if transfer_syntax_uid == _IMPLICIT_VR_LITTLE_ENDIAN else 12
+    return int(value_tell) - header if value_tell >= header else None
+
+
+def instance_header_json(ds: Dataset) -> str:
+    """
+    ``INDEX_ROW_TAGS`` present in ``ds``, as compact DICOM JSON (may be ``{}``).
+
+    The study fields are repeated here (their columns are normalised for search) so
+    an instance rebuilt from the row keeps the exact decoded values.
+    """
+    header = Dataset()
+    for keyword in INDEX_ROW_TAGS:
+        tag = tag_for_keyword(keyword)
+        if tag is not None and tag in ds:
+            header.add(ds[tag])
+    return json.dumps(header.to_json_dict(), separators=(",", ":"))
+
+
 def dataset_to_index_row(
     ds: Dataset,
     *,
@@ -79,12 +185,16 @@ def dataset_to_index_row(
         ds: Loaded dataset (may include pixel data).
         file_path: Absolute filesystem path to the file.
         study_root_path: ``source_dir`` from the load pipeline (disambiguates duplicate UIDs).
+
+    ``pixel_data_offset`` is only known when ``ds`` still holds the Pixel Data element
+    as read from the file; the folder crawler fills it from the read position instead.
     """
     fp = os.path.normpath(os.path.abspath(file_path))
     root = os.path.normpath(os.path.abspath(study_root_path))
     study_uid = _elem_to_str(getattr(ds, "StudyInstanceUID", None))
     series_uid = _elem_to_str(getattr(ds, "SeriesInstanceUID", None))
     sop_uid = _elem_to_str(getattr(ds, "SOPInstanceUID", None))
+    transfer_syntax_uid = _transfer_syntax_uid(ds)
     return {
         "file_path": fp,
         "study_root_path": root,
@@ -98,4 +208,9 @@ def dataset_to_index_row(
         "study_description": _elem_to_str(getattr(ds, "StudyDescription", None)),
         "series_description": _elem_to_str(getattr(ds, "SeriesDescription", None)),
         "modality": _elem_to_str(getattr(ds, "Modality", None)),
+        "instance_number": _int_or_none(getattr(ds, "InstanceNumber", None)),
+        "number_of_frames": _int_or_none(getattr(ds, "NumberOfFrames", None)),
+        "transfer_syntax_uid": transfer_syntax_uid,
+        "pixel_data_offset": pixel_data_offset(ds, transfer_syntax_uid),
+        "instance_header": instance_header_json(ds),
     }
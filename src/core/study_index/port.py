@@ -43,9 +43,13 @@ class StudyIndexPort(Protocol):
         global_fts_query: str = "",
         limit: int = 100,
         offset: int = 0,
+        after_id: int | None = None,
         privacy_mode: bool = False,
     ) -> list[dict[str, Any]]:
-        """Grouped browse/search rows; same privacy masking as :meth:`search`."""
+        """Grouped browse/search rows; same privacy masking as :meth:`search`.
+
+        ``after_id`` (the previous page's last ``summary_id``) pages by keyset.
+        """
         ...
 
     def delete_grouped_study(self, study_uid: str, study_root_path: str) -> int:
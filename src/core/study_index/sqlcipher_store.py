@@ -1,20 +1,41 @@
 """
 SQLCipher-backed persistence for the local study index (MVP schema).
 
-Opens a short-lived connection per operation with ``PRAGMA key`` and WAL mode.
+Each thread keeps one long-lived connection per database (``PRAGMA key`` and WAL mode
+are applied once when it opens); see ``_ConnectionPool``.
 
 Schema v2 adds ``series_description``, a denormalised ``doc`` column for FTS5, and
 virtual table ``study_index_entry_fts`` (external content) with sync triggers.
 
 Schema v3 adds a composite covering index for the grouped-study search query.
+
+Schema v4 adds ``file_size`` / ``file_mtime_ns`` per row so folder re-indexing can
+skip files that have not changed since they were last parsed.
+
+Schema v5 adds ``study_index_entry_tri``, an external-content FTS5 ``trigram`` table
+over the substring-filter columns, so "contains" filters resolve through an index
+instead of a ``LIKE '%…%'`` table scan.
+
+Schema v6 adds ``study_summary``, one row per (``study_uid``, ``study_root_path``) with
+the grouped-search aggregates. The store refreshes the affected summaries in the same
+transaction as every instance-row write, so grouped search and ``iter_study_groups``
+read it directly instead of re-aggregating the instance table per page.
+
+Schema v7 adds per-instance columns (instance number, frame count, transfer syntax,
+Pixel Data offset and a DICOM JSON ``instance_header``) so a study can be opened from
+the index without re-parsing every header.
 """
 
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
 import sqlite3
+import threading
 import time
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
 from typing import Any, cast
 
@@ -31,6 +52,11 @@ _FTS_QUERY_ERRS: tuple[type[BaseException], ...] = tuple(
 
 
 
+_logger = logging.getLogger(__name__)
+
+# How long ``close_pooled_connections`` waits for queries on other threads (seconds).
+_CLOSE_WAIT_S = 30.0
+
 _SQL_WHERE = " WHERE "
 _SQL_AND = " AND "
 
@@ -66,6 +92,172 @@ def _pragma_key_sql(passphrase: str) -> str:
     return f"PRAGMA key = '{escaped}'"
 
 
+def _file_identity(path: str) -> tuple[int, int] | None:
+    """``(st_dev, st_ino)`` of ``path``, or None when it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+class _PooledConnection:
+    """One pooled connection plus the identity of the file it was opened on."""
+
+    __slots__ = ("conn", "db_path", "file_id", "in_use", "owner")
+
+    def __init__(self, conn: sqlite3.Connection, db_path: str) -> None:
+        self.conn: sqlite3.Connection | None = conn
+        self.db_path = db_path
+        self.file_id = _file_identity(db_path)
+        self.owner = threading.current_thread()
+        self.in_use = 0  # open ``_ConnectionPool.session`` blocks on the owner thread
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+class _ConnectionPool:
+    """
+    Keyed SQLCipher connections reused per thread.
+
+    ``PRAGMA key`` runs SQLCipher's deliberately slow KDF, so opening a connection for
+    every query dominated search latency. Each thread keeps one open connection per
+    (database path, passphrase), which also keeps sqlite3's per-connection prepared
+    statement cache warm. A connection is reopened when its file was deleted or
+    replaced; connections of threads that have exited are closed on the next ``get``.
+
+    Every holder is tracked in one set under ``_lock``. ``session`` marks a holder in
+    use for the length of a transaction so ``close`` never closes a connection that
+    another thread is still querying.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._holders: set[_PooledConnection] = set()
+
+    def _holder(
+        self,
+        db_path: str,
+        passphrase: str,
+        open_fn: Callable[[], sqlite3.Connection],
+    ) -> _PooledConnection:
+        key = (db_path, hashlib.sha256(passphrase.encode("utf-8")).hexdigest())
+        holders: dict[tuple[str, str], _PooledConnection] = self._local.__dict__.setdefault(
+            "holders", {}
+        )
+        holder = holders.get(key)
+        if holder is not None:
+            file_id = _file_identity(db_path)
+            with self._lock:
+                if holder.conn is not None and holder.file_id == file_id:
+                    return holder
+                stale, holder.conn = holder.conn, None
+                self._holders.discard(holder)
+            if stale is not None:
+                _close_quietly(stale)
+        holder = _PooledConnection(open_fn(), db_path)
+        holders[key] = holder
+        with self._lock:
+            dead = [h for h in self._holders if not h.owner.is_alive()]
+            for h in dead:
+                self._holders.discard(h)
+            self._holders.add(holder)
+        for h in dead:
+            if h.conn is not None:
+                _close_quietly(h.conn)
+                h.conn = None
+        return holder
+
+    def get(
+        self,
+        db_path: str,
+        passphrase: str,
+        open_fn: Callable[[], sqlite3.Connection],
+    ) -> sqlite3.Connection:
+        conn = self._holder(db_path, passphrase, open_fn).conn
+        assert conn is not None
+        return conn
+
+    @contextmanager
+    def session(
+        self,
+        db_path: str,
+        passphrase: str,
+        open_fn: Callable[[], sqlite3.Connection],
+    ) -> Iterator[sqlite3.Connection]:
+        """This thread's connection inside a transaction, guarded against ``close``."""
+        while True:
+            holder = self._holder(db_path, passphrase, open_fn)
+            with self._lock:
+                # ``close`` may have taken the connection since ``_holder`` checked it.
+                conn = holder.conn
+                if conn is not None:
+                    holder.in_use += 1
+                    break
+        try:
+            with conn:
+                yield conn
+        finally:
+            with self._idle:
+                holder.in_use -= 1
+                if not holder.in_use:
+                    self._idle.notify_all()
+
+    def close(self, db_path: str | None = None, timeout_s: float = _CLOSE_WAIT_S) -> int:
+        """
+        Close pooled connections (every thread's) for ``db_path``, or all of them.
+
+        Waits up to ``timeout_s`` for sessions in progress on other threads; a
+        connection still busy after that is left open (the next ``get`` on its
+        thread reopens it if the file was replaced). Returns the number closed.
+        """
+        me = threading.current_thread()
+        with self._idle:
+            matched = [h for h in self._holders if db_path is None or h.db_path == db_path]
+            self._idle.wait_for(
+                lambda: not any(h.in_use and h.owner is not me for h in matched),
+                timeout_s,
+            )
+            closing = [h for h in matched if not h.in_use]
+            conns = []
+            for holder in closing:
+                self._holders.discard(holder)
+                if holder.conn is not None:
+                    conns.append(holder.conn)
+                    holder.conn = None
+        if len(closing) < len(matched):
+            _logger.warning(
+                "Left %d study index connection(s) open: still in use after %.0f s",
+                len(matched) - len(closing),
+                timeout_s,
+            )
+        for conn in conns:
+            _close_quietly(conn)
+        return len(conns)
+
+
+_POOL = _ConnectionPool()
+
+
+def close_pooled_connections(db_path: str | None = None) -> int:
+    """
+    Close the pooled connections to ``db_path`` (or to every database).
+
+    Call before moving, replacing, or deleting the database file so no thread keeps a
+    handle on it; the next store operation reopens. Waits for queries in progress on
+    other threads to finish (see ``_ConnectionPool.close``). Returns the number of
+    connections closed.
+    """
+    return _POOL.close(None if db_path is None else os.path.abspath(db_path))
+
+
 _FTS_TRIGGERS_DDL = """
 CREATE TRIGGER IF NOT EXISTS study_index_entry_ai AFTER INSERT ON study_index_entry BEGIN
   INSERT INTO study_index_entry_fts(rowid, doc) VALUES (new.id, new.doc);
@@ -93,23 +285,202 @@ def _create_fts_and_triggers(cur: sqlite3.Cursor) -> None:
     cur.executescript(_FTS_TRIGGERS_DDL)
 
 
+# Columns the search "contains" filters match as substrings; ``study_index_entry_tri``
+# indexes their trigrams. Needles shorter than a trigram cannot use it.
+_TRIGRAM_COLUMNS: tuple[str, ...] = (
+    "patient_name",
+    "patient_id",
+    "accession_number",
+    "study_description",
+)
+_TRIGRAM_MIN_CHARS = 3
+
+_TRIGRAM_NEW = ", ".join(f"new.{c}" for c in _TRIGRAM_COLUMNS)
+_TRIGRAM_OLD = ", ".join(f"old.{c}" for c in _TRIGRAM_COLUMNS)
+_TRIGRAM_COLS = ", ".join(_TRIGRAM_COLUMNS)
+_TRIGRAM_TRIGGERS_DDL = f"""
+CREATE TRIGGER IF NOT EXISTS study_index_entry_tri_ai AFTER INSERT ON study_index_entry BEGIN
+  INSERT INTO study_index_entry_tri(rowid, {_TRIGRAM_COLS}) VALUES (new.id, {_TRIGRAM_NEW});
+END;
+CREATE TRIGGER IF NOT EXISTS study_index_entry_tri_ad AFTER DELETE ON study_index_entry BEGIN
+  INSERT INTO study_index_entry_tri(study_index_entry_tri, rowid, {_TRIGRAM_COLS})
+    VALUES('delete', old.id, {_TRIGRAM_OLD});
+END;
+CREATE TRIGGER IF NOT EXISTS study_index_entry_tri_au AFTER UPDATE ON study_index_entry BEGIN
+  INSERT INTO study_index_entry_tri(study_index_entry_tri, rowid, {_TRIGRAM_COLS})
+    VALUES('delete', old.id, {_TRIGRAM_OLD});
+  INSERT INTO study_index_entry_tri(rowid, {_TRIGRAM_COLS}) VALUES (new.id, {_TRIGRAM_NEW});
+END;
+"""
+
+
+_STUDY_SUMMARY_DDL = """
+CREATE TABLE IF NOT EXISTS study_summary (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    study_uid TEXT NOT NULL,
+    study_root_path TEXT NOT NULL,
+    study_date TEXT NOT NULL DEFAULT '',
+    patient_name TEXT NOT NULL DEFAULT '',
+    patient_id TEXT NOT NULL DEFAULT '',
+    accession_number TEXT NOT NULL DEFAULT '',
+    study_description TEXT NOT NULL DEFAULT '',
+    series_description TEXT NOT NULL DEFAULT '',
+    indexed_at REAL NOT NULL DEFAULT 0,
+    open_file_path TEXT NOT NULL DEFAULT '',
+    instance_count INTEGER NOT NULL DEFAULT 0,
+    series_count INTEGER NOT NULL DEFAULT 0,
+    modalities TEXT NOT NULL DEFAULT '',
+    UNIQUE (study_uid, study_root_path)
+);
+""" + "".join(
+    f"CREATE INDEX IF NOT EXISTS idx_summary_{col} ON study_summary({col}, patient_name, id);\n"
+    for col in sorted(_GROUPED_SORT_COLUMNS)
+)
+
+# Aggregates for ``study_summary``; COUNT(DISTINCT …) ignores blank series UIDs so
+# they do not inflate ``series_count``.
+_SUMMARY_AGGREGATE_SQL = (
+    "SELECT e.study_uid, e.study_root_path, "
+    "COALESCE(MAX(e.study_date), ''), "
+    "COALESCE(MAX(e.patient_name), ''), "
+    "COALESCE(MAX(e.patient_id), ''), "
+    "COALESCE(MAX(e.accession_number), ''), "
+    "COALESCE(MAX(e.study_description), ''), "
+    "COALESCE(MAX(e.series_description), ''), "
+    "COALESCE(MAX(e.indexed_at), 0), "
+    "MIN(e.file_path), "
+    "COUNT(*), "
+    "COUNT(DISTINCT NULLIF(TRIM(e.series_uid), '')), "
+    "GROUP_CONCAT(DISTINCT NULLIF(TRIM(e.modality), '')) "
+    "FROM study_index_entry AS e"
+)
+_SUMMARY_UPSERT_SQL = """
+INSERT INTO study_summary (
+    study_uid, study_root_path, study_date, patient_name, patient_id, accession_number,
+    study_description, series_description, indexed_at, open_file_path, instance_count,
+    series_count, modalities
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(study_uid, study_root_path) DO UPDATE SET
+    study_date = excluded.study_date,
+    patient_name = excluded.patient_name,
+    patient_id = excluded.patient_id,
+    accession_number = excluded.accession_number,
+    study_description = excluded.study_description,
+    series_description = excluded.series_description,
+    indexed_at = excluded.indexed_at,
+    open_file_path = excluded.open_file_path,
+    instance_count = excluded.instance_count,
+    series_count = excluded.series_count,
+    modalities = excluded.modalities
+"""
+
+# Bound parameters per ``IN (…)`` lookup (well under SQLite's variable limit).
+_IN_CHUNK = 500
+
+StudyKey = tuple[str, str]
+
+
+def _summary_values(row: Sequence[Any]) -> tuple[Any, ...]:
+    return (*row[:-1], _normalize_modalities_group_concat(row[-1]))
+
+
+def _study_keys_for_paths(cur: sqlite3.Cursor, file_paths: Sequence[str]) -> set[StudyKey]:
+    """(study_uid, study_root_path) of the stored rows for ``file_paths``."""
+    keys: set[StudyKey] = set()
+    for i in range(0, len(file_paths), _IN_CHUNK):
+        chunk = list(file_paths[i:i + _IN_CHUNK])
+        marks = ", ".join("?" * len(chunk))
+        cur.execute(
+            "SELECT DISTINCT study_uid, study_root_path FROM study_index_entry "
+            f"WHERE file_path IN ({marks})",
+            chunk,
+        )
+        keys.update((row[0], row[1]) for row in cur.fetchall())
+    return keys
+
+
+def _refresh_study_summaries(cur: sqlite3.Cursor, keys: set[StudyKey]) -> None:
+    """Recompute ``study_summary`` for ``keys``; drop studies with no rows left."""
+    upserts: list[tuple[Any, ...]] = []
+    gone: list[StudyKey] = []
+    for key in keys:
+        cur.execute(
+            _SUMMARY_AGGREGATE_SQL
+            + " WHERE e.study_uid = ? AND e.study_root_path = ?"
+            + " GROUP BY e.study_uid, e.study_root_path",
+            key,
+        )
+        row = cur.fetchone()
+        if row is None:
+            gone.append(key)
+        else:
+            upserts.append(_summary_values(row))
+    if upserts:
+        cur.executemany(_SUMMARY_UPSERT_SQL, upserts)
+    if gone:
+        cur.executemany(
+            "DELETE FROM study_summary WHERE study_uid = ? AND study_root_path = ?", gone
+        )
+
+
+def _rebuild_study_summaries(cur: sqlite3.Cursor) -> None:
+    """Repopulate ``study_summary`` from every instance row."""
+    cur.execute("DELETE FROM study_summary;")
+    cur.execute(_SUMMARY_AGGREGATE_SQL + " GROUP BY e.study_uid, e.study_root_path")
+    cur.executemany(_SUMMARY_UPSERT_SQL, [_summary_values(row) for row in cur.fetchall()])
+
+
+def _create_trigram_index_and_triggers(cur: sqlite3.Cursor) -> None:
+    cur.execute(
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS study_index_entry_tri USING fts5(
+            {_TRIGRAM_COLS},
+            content='study_index_entry',
+            content_rowid='id',
+            tokenize='trigram case_sensitive 0'
+        );
+        """
+    )
+    cur.executescript(_TRIGRAM_TRIGGERS_DDL)
+
+
+def _trigram_phrase(column: str, needle: str) -> str:
+    """FTS5 column-filtered phrase matching ``needle`` as a literal substring."""
+    return f'{column} : "{needle.replace(chr(34), chr(34) * 2)}"'
+
+
 class StudyIndexStore:
     """Create, migrate, upsert, and query study index rows."""
 
-    SCHEMA_VERSION = 3
+    SCHEMA_VERSION = 7
 
     def __init__(self, db_path: str, passphrase: str) -> None:
         self._db_path = db_path
         self._passphrase = passphrase
 
     def _connect(self) -> sqlite3.Connection:
+        """This thread's pooled, keyed connection (opened on first use)."""
+        return _POOL.get(os.path.abspath(self._db_path), self._passphrase, self._open)
+
+    def _session(self) -> AbstractContextManager[sqlite3.Connection]:
+        """``with self._session() as conn``: a transaction on the pooled connection."""
+        return _POOL.session(os.path.abspath(self._db_path), self._passphrase, self._open)
+
+    def _open(self) -> sqlite3.Connection:
         parent = os.path.dirname(os.path.abspath(self._db_path))
         if parent:
             parent_path = Path(parent)
             if not parent_path.exists():
                 parent_path.mkdir(parents=True, mode=0o700)
         _connect_fn = cast(Any, sqlcipher_sqlite).connect
-        conn = cast(sqlite3.Connection, _connect_fn(self._db_path, timeout=30.0))
+        # ``check_same_thread=False`` only so ``close_pooled_connections`` can close a
+        # connection from another thread; each connection is used by one thread.
+        conn = cast(
+            sqlite3.Connection,
+            _connect_fn(
+                self._db_path, timeout=30.0, check_same_thread=False, cached_statements=256
+            ),
+        )
         if not _is_windows():
             Path(self._db_path).chmod(0o600)
         conn.execute(_pragma_key_sql(self._passphrase))
@@ -144,12 +515,12 @@ class StudyIndexStore:
             cur.execute("UPDATE study_index_entry SET doc = ? WHERE id = ?", (doc, rid))
         _create_fts_and_triggers(cur)
         cur.execute("INSERT INTO study_index_entry_fts(rowid, doc) SELECT id, doc FROM study_index_entry;")
-        # Also create covering index added in v3 (migration jumps to SCHEMA_VERSION).
+        # Also create covering index added in v3 (migration continues from v3).
         cur.execute(
             "CREATE INDEX IF NOT EXISTS idx_grouped_study_cover "
             "ON study_index_entry(study_uid, study_root_path, study_date, patient_name, modality);"
         )
-        cur.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION};")
+        cur.execute("PRAGMA user_version = 3;")
 
     def _migrate_v2_to_v3(self, conn: sqlite3.Connection) -> None:
         """Add composite covering index for grouped-study search."""
@@ -158,11 +529,59 @@ class StudyIndexStore:
             "CREATE INDEX IF NOT EXISTS idx_grouped_study_cover "
             "ON study_index_entry(study_uid, study_root_path, study_date, patient_name, modality);"
         )
-        cur.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION};")
+        cur.execute("PRAGMA user_version = 3;")
+        conn.commit()
+
+    def _migrate_v3_to_v4(self, conn: sqlite3.Connection) -> None:
+        """Add per-file ``(size, mtime_ns)`` columns for incremental folder indexing.
+
+        Existing rows get NULL stats, so the next crawl re-parses them once.
+        """
+        cur = conn.cursor()
+        cur.execute("ALTER TABLE study_index_entry ADD COLUMN file_size INTEGER;")
+        cur.execute("ALTER TABLE study_index_entry ADD COLUMN file_mtime_ns INTEGER;")
+        cur.execute("PRAGMA user_version = 4;")
+        conn.commit()
+
+    def _migrate_v4_to_v5(self, conn: sqlite3.Connection) -> None:
+        """Add the trigram substring index and build it from the existing rows."""
+        cur = conn.cursor()
+        _create_trigram_index_and_triggers(cur)
+        cur.execute("INSERT INTO study_index_entry_tri(study_index_entry_tri) VALUES('rebuild');")
+        cur.execute("PRAGMA user_version = 5;")
+        conn.commit()
+
+    def _migrate_v5_to_v6(self, conn: sqlite3.Connection) -> None:
+        """Add ``study_summary`` and fill it from the existing instance rows."""
+        cur = conn.cursor()
+        cur.executescript(_STUDY_SUMMARY_DDL)
+        _rebuild_study_summaries(cur)
+        cur.execute("PRAGMA user_version = 6;")
+        conn.commit()
+
+    def _migrate_v6_to_v7(self, conn: sqlite3.Connection) -> None:
+        """Add the per-instance columns used to open a study from the index.
+
+        Existing rows lose their file stats, so the next crawl re-parses them once
+        and fills the new columns.
+        """
+        cur = conn.cursor()
+        existing = {row[1] for row in cur.execute("PRAGMA table_info(study_index_entry);")}
+        for column, sql_type in (
+            ("instance_number", "INTEGER"),
+            ("number_of_frames", "INTEGER"),
+            ("transfer_syntax_uid", "TEXT"),
+            ("pixel_data_offset", "INTEGER"),
+            ("instance_header", "TEXT"),
+        ):
+            if column not in existing:
+                cur.execute(f"ALTER TABLE study_index_entry ADD COLUMN {column} {sql_type};")
+        cur.execute("UPDATE study_index_entry SET file_size = NULL, file_mtime_ns = NULL;")
+        cur.execute("PRAGMA user_version = 7;")
         conn.commit()
 
     def init_schema(self) -> None:
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             cur.execute("PRAGMA user_version;")
             row = cur.fetchone()
@@ -185,7 +604,14 @@ class StudyIndexStore:
                         series_description TEXT,
                         modality TEXT,
                         doc TEXT NOT NULL DEFAULT ' ',
-                        indexed_at REAL NOT NULL
+                        indexed_at REAL NOT NULL,
+                        file_size INTEGER,
+                        file_mtime_ns INTEGER,
+                        instance_number INTEGER,
+                        number_of_frames INTEGER,
+                        transfer_syntax_uid TEXT,
+                        pixel_data_offset INTEGER,
+                        instance_header TEXT
                     );
                     CREATE INDEX IF NOT EXISTS idx_study_uid_root
                         ON study_index_entry(study_uid, study_root_path);
@@ -200,31 +626,53 @@ class StudyIndexStore:
                     """
                 )
                 _create_fts_and_triggers(cur)
+                _create_trigram_index_and_triggers(cur)
+                cur.executescript(_STUDY_SUMMARY_DDL)
                 cur.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION};")
-            elif version == 1:
-                self._migrate_v1_to_v2(conn)
-            elif version == 2:
-                self._migrate_v2_to_v3(conn)
             elif version > self.SCHEMA_VERSION:
                 raise sqlite3.OperationalError(
                     f"study_index unsupported user_version={version}; "
-                    f"expected 0, 1, 2, or {self.SCHEMA_VERSION}"
+                    f"expected 0 to {self.SCHEMA_VERSION}"
                 )
+            else:
+                # Step through each migration so older files reach SCHEMA_VERSION.
+                if version == 1:
+                    self._migrate_v1_to_v2(conn)  # also adds the v3 index
+                    version = 3
+                if version == 2:
+                    self._migrate_v2_to_v3(conn)
+                    version = 3
+                if version == 3:
+                    self._migrate_v3_to_v4(conn)
+                    version = 4
+                if version == 4:
+                    self._migrate_v4_to_v5(conn)
+                    version = 5
+                if version == 5:
+                    self._migrate_v5_to_v6(conn)
+                    version = 6
+                if version == 6:
+                    self._migrate_v6_to_v7(conn)
             conn.commit()
 
     def upsert_rows(self, rows: Sequence[dict[str, Any]]) -> None:
         if not rows:
             return
         now = time.time()
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
+            # Rows that move to another study must refresh the study they leave too.
+            keys = _study_keys_for_paths(cur, [r["file_path"] for r in rows])
+            keys.update((r["study_uid"], r["study_root_path"]) for r in rows)
             cur.executemany(
                 """
                 INSERT INTO study_index_entry (
                     file_path, study_root_path, study_uid, series_uid, sop_instance_uid,
                     patient_name, patient_id, accession_number, study_date,
-                    study_description, series_description, modality, doc, indexed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    study_description, series_description, modality, doc, indexed_at,
+                    file_size, file_mtime_ns, instance_number, number_of_frames,
+                    transfer_syntax_uid, pixel_data_offset, instance_header
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(file_path) DO UPDATE SET
                     study_root_path = excluded.study_root_path,
                     study_uid = excluded.study_uid,
@@ -238,7 +686,16 @@ class StudyIndexStore:
                     series_description = excluded.series_description,
                     modality = excluded.modality,
                     doc = excluded.doc,
-                    indexed_at = excluded.indexed_at
+                    indexed_at = excluded.indexed_at,
+                    -- Load-pipeline rows carry no stats; keep the crawl's. A changed
+                    -- file then no longer matches them and is re-verified.
+                    file_size = COALESCE(excluded.file_size, study_index_entry.file_size),
+                    file_mtime_ns = COALESCE(excluded.file_mtime_ns, study_index_entry.file_mtime_ns),
+                    instance_number = excluded.instance_number,
+                    number_of_frames = excluded.number_of_frames,
+                    transfer_syntax_uid = excluded.transfer_syntax_uid,
+                    pixel_data_offset = excluded.pixel_data_offset,
+                    instance_header = excluded.instance_header
                 """,
                 [
                     (
@@ -256,10 +713,18 @@ class StudyIndexStore:
                         r.get("modality") or "",
                         index_row_to_search_doc(r),
                         now,
+                        r.get("file_size"),
+                        r.get("file_mtime_ns"),
+                        r.get("instance_number"),
+                        r.get("number_of_frames"),
+                        r.get("transfer_syntax_uid") or None,
+                        r.get("pixel_data_offset"),
+                        r.get("instance_header") or None,
                     )
                     for r in rows
                 ],
             )
+            _refresh_study_summaries(cur, keys)
             conn.commit()
 
     def delete_study_group(self, study_uid: str, study_root_path: str) -> int:
@@ -272,7 +737,7 @@ class StudyIndexStore:
         sr = os.path.normpath(os.path.abspath((study_root_path or "").strip()))
         if not su or not sr:
             return 0
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             cur.execute(
                 "DELETE FROM study_index_entry WHERE study_uid = ? AND study_root_path = ?",
@@ -281,9 +746,49 @@ class StudyIndexStore:
             cur.execute("SELECT changes()")
             row = cur.fetchone()
             n = int(row[0]) if row and row[0] is not None else 0
+            _refresh_study_summaries(cur, {(su, sr)})
             conn.commit()
         return n
 
+    def file_stats_under_root(self, root: str) -> dict[str, tuple[int | None, int | None]]:
+        """
+        Return ``{file_path: (file_size, file_mtime_ns)}`` for rows stored under ``root``.
+
+        Matches on the ``file_path`` prefix (a range scan on its UNIQUE index), so
+        rows indexed from a parent or child folder are included too. Stats are
+        ``None`` for rows written before schema v4 or only ever by the load pipeline.
+        """
+        if not (root or "").strip():
+            return {}
+        base = os.path.normpath(os.path.abspath(root.strip()))
+        prefix = base if base.endswith(os.sep) else base + os.sep
+        # Every path under ``prefix`` sorts in [prefix, prefix-with-next-separator).
+        upper = prefix[:-1] + chr(ord(os.sep) + 1)
+        with self._session() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT file_path, file_size, file_mtime_ns FROM study_index_entry "
+                "WHERE file_path >= ? AND file_path < ?",
+                (prefix, upper),
+            )
+            return {row[0]: (row[1], row[2]) for row in cur.fetchall()}
+
+    def delete_file_paths(self, file_paths: Sequence[str]) -> int:
+        """Delete the rows for ``file_paths`` (exact, already-normalised paths); return count."""
+        if not file_paths:
+            return 0
+        with self._session() as conn:
+            cur = conn.cursor()
+            keys = _study_keys_for_paths(cur, file_paths)
+            cur.executemany(
+                "DELETE FROM study_index_entry WHERE file_path = ?",
+                [(fp,) for fp in file_paths],
+            )
+            n = cur.rowcount if cur.rowcount is not None and cur.rowcount >= 0 else 0
+            _refresh_study_summaries(cur, keys)
+            conn.commit()
+        return int(n)
+
     def get_file_paths_for_study(
         self, study_uid: str, study_root_path: str
     ) -> list[str]:
@@ -298,7 +803,7 @@ class StudyIndexStore:
         sr = os.path.normpath(os.path.abspath((study_root_path or "").strip()))
         if not su or not sr:
             return []
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             cur.execute(
                 "SELECT file_path FROM study_index_entry "
@@ -307,9 +812,97 @@ class StudyIndexStore:
             )
             return [row[0] for row in cur.fetchall()]
 
+    # Columns returned per instance by ``get_study_instances``.
+    _INSTANCE_COLUMNS: tuple[str, ...] = (
+        "file_path",
+        "study_uid",
+        "series_uid",
+        "sop_instance_uid",
+        "patient_name",
+        "patient_id",
+        "accession_number",
+        "study_date",
+        "study_description",
+        "series_description",
+        "modality",
+        "file_size",
+        "file_mtime_ns",
+        "instance_number",
+        "number_of_frames",
+        "transfer_syntax_uid",
+        "pixel_data_offset",
+        "instance_header",
+    )
+
+    def get_study_instances(
+        self, study_uid: str, study_root_path: str
+    ) -> list[dict[str, Any]]:
+        """
+        Return the indexed instance rows of one logical study, in series and
+        instance-number order, with the per-instance fields needed to open it
+        without re-parsing headers (see :mod:`core.study_index.indexed_open`).
+        """
+        su = (study_uid or "").strip()
+        sr = os.path.normpath(os.path.abspath((study_root_path or "").strip()))
+        if not su or not sr:
+            return []
+        cols = ", ".join(self._INSTANCE_COLUMNS)  # fixed constant identifiers, not user input
+        with self._session() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                f"SELECT {cols} FROM study_index_entry "
+                "WHERE study_uid = ? AND study_root_path = ? "
+                "ORDER BY series_uid, instance_number, file_path",
+                (su, sr),
+            )
+            return [dict(zip(self._INSTANCE_COLUMNS, row, strict=True)) for row in cur.fetchall()]
+
+    def study_count(self) -> int:
+        """Number of logical studies (``study_summary`` rows)."""
+        with self._session() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM study_summary").fetchone()
+            return int(row[0]) if row and row[0] is not None else 0
+
+    def iter_study_files(self, batch_size: int = 2000) -> Iterator[tuple[dict[str, Any], str]]:
+        """
+        Stream ``(study, file_path)`` for every indexed file, one study after another.
+
+        One ordered query replaces a ``get_file_paths_for_study`` call per study; rows
+        are fetched ``batch_size`` at a time. ``study`` carries the same keys as
+        :meth:`iter_study_groups` and is the same dict for every file of one study.
+        """
+        with self._session() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT s.id, s.study_uid, s.study_root_path, s.patient_name, s.study_date, "
+                "s.instance_count, s.modalities, e.file_path "
+                "FROM study_summary AS s JOIN study_index_entry AS e "
+                "ON e.study_uid = s.study_uid AND e.study_root_path = s.study_root_path "
+                "ORDER BY s.study_uid, s.study_root_path"
+            )
+            study: dict[str, Any] = {}
+            current_id = None
+            try:
+                while batch := cur.fetchmany(batch_size):
+                    for sid, uid, root, name, date, count, modalities, file_path in batch:
+                        if sid != current_id:
+                            current_id = sid
+                            study = {
+                                "study_uid": uid,
+                                "study_root_path": root,
+                                "patient_name": name,
+                                "study_date": date,
+                                "instance_count": count,
+                                "modalities": modalities,
+                            }
+                        yield study, file_path
+            finally:
+                # Release the read snapshot even when the caller stops early.
+                cur.close()
+
     def row_count(self) -> int:
         """Total number of indexed instance rows (0 for an empty database)."""
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             cur.execute("SELECT COUNT(*) FROM study_index_entry")
             row = cur.fetchone()
@@ -317,7 +910,7 @@ class StudyIndexStore:
 
     def checkpoint(self) -> None:
         """Fold any WAL contents back into the main DB file so it is safe to copy."""
-        with self._connect() as conn:
+        with self._session() as conn:
             conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
             conn.commit()
 
@@ -327,7 +920,7 @@ class StudyIndexStore:
         Raises the underlying decrypt/IO error if the file cannot be opened with the
         current passphrase (callers treat any exception as a failed verification).
         """
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             cur.execute("PRAGMA integrity_check;")
             rows = cur.fetchall()
@@ -354,7 +947,7 @@ class StudyIndexStore:
     def iter_all_entries(self) -> list[dict[str, Any]]:
         """Return every indexed instance row (metadata + file paths only, no FTS doc)."""
         cols = ", ".join(self._PORTABLE_COLUMNS)  # fixed constant identifiers, not user input
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             cur.execute(
                 f"SELECT {cols} FROM study_index_entry ORDER BY study_uid, file_path"
@@ -364,7 +957,7 @@ class StudyIndexStore:
 
     def existing_study_file_keys(self) -> set[tuple[str, str]]:
         """Return the set of ``(study_uid, file_path)`` keys already in the database."""
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             cur.execute("SELECT study_uid, file_path FROM study_index_entry")
             return {((r[0] or ""), (r[1] or "")) for r in cur.fetchall()}
@@ -377,24 +970,14 @@ class StudyIndexStore:
         ``study_uid``, ``study_root_path``, ``patient_name``, ``study_date``,
         ``instance_count``, and a normalised ``modalities`` string.
         """
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             cur.execute(
-                "SELECT e.study_uid, e.study_root_path, "
-                "MAX(e.patient_name) AS patient_name, "
-                "MAX(e.study_date) AS study_date, "
-                "COUNT(*) AS instance_count, "
-                "GROUP_CONCAT(DISTINCT NULLIF(TRIM(e.modality), '')) AS _modalities_raw "
-                "FROM study_index_entry AS e "
-                "GROUP BY e.study_uid, e.study_root_path"
+                "SELECT study_uid, study_root_path, patient_name, study_date, "
+                "instance_count, modalities FROM study_summary"
             )
             cols = [d[0] for d in cur.description]
-            rows = [dict(zip(cols, row, strict=False)) for row in cur.fetchall()]
-        for r in rows:
-            raw = r.pop("_modalities_raw", None)
-            r["modalities"] = _normalize_modalities_group_concat(raw)
-            r["instance_count"] = int(r.get("instance_count") or 0)
-        return rows
+            return [dict(zip(cols, row, strict=False)) for row in cur.fetchall()]
 
     def relocate_study_paths(
         self, study_uid: str, old_root: str, new_root: str
@@ -414,7 +997,7 @@ class StudyIndexStore:
             return 0
         old = os.path.normpath(os.path.abspath(old_root.strip()))
         new = os.path.normpath(os.path.abspath(new_root.strip()))
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             cur.execute(
                 "SELECT id, file_path FROM study_index_entry "
@@ -446,6 +1029,7 @@ class StudyIndexStore:
                 "UPDATE study_index_entry SET file_path = ?, study_root_path = ? WHERE id = ?",
                 updates,
             )
+            _refresh_study_summaries(cur, {(su, old), (su, new)})
             conn.commit()
         return len(updates)
 
@@ -467,6 +1051,7 @@ class StudyIndexStore:
     ) -> tuple[str, list[Any]]:
         clauses: list[str] = []
         params: list[Any] = []
+        phrases: list[str] = []
 
         def add_like(column: str, needle: str) -> None:
             n = needle.strip()
@@ -474,11 +1059,22 @@ class StudyIndexStore:
                 clauses.append(f"{self._col(table_alias, column)} LIKE ? ESCAPE '\\'")
                 escaped = n.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
                 params.append(f"%{escaped}%")
+                if len(n) >= _TRIGRAM_MIN_CHARS:
+                    phrases.append(_trigram_phrase(column, n))
 
         add_like("patient_name", patient_name_contains)
         add_like("patient_id", patient_id_contains)
         add_like("accession_number", accession_contains)
         add_like("study_description", study_description_contains)
+        if phrases:
+            # Trigram lookup narrows to candidate rows through the index; it folds case
+            # for all of Unicode, so it matches a superset of LIKE's ASCII-only folding
+            # and the LIKE clauses above keep the exact matching semantics.
+            clauses.append(
+                f"{self._col(table_alias, 'id')} IN (SELECT rowid FROM study_index_entry_tri "
+                "WHERE study_index_entry_tri MATCH ?)"
+            )
+            params.append(" AND ".join(phrases))
         m = modality.strip()
         if m:
             clauses.append(f"{self._col(table_alias, 'modality')} LIKE ? ESCAPE '\\'")
@@ -497,18 +1093,18 @@ class StudyIndexStore:
         return where, params
 
     @staticmethod
-    def _fts_exists_sql(table_alias: str) -> str:
+    def _fts_filter_sql(table_alias: str) -> str:
         """
-        Return ``EXISTS (...)`` SQL (no leading ``AND``) for ``MATCH`` binding.
+        Return ``id IN (...)`` SQL (no leading ``AND``) for ``MATCH`` binding.
 
         ``MATCH`` requires the FTS **virtual table name** as the left operand
         (aliases are not accepted in all SQLite builds); rowid ties the hit to
-        ``study_index_entry`` via ``content_rowid='id'``.
+        ``study_index_entry`` via ``content_rowid='id'``. The match runs once as
+        an uncorrelated subquery; a correlated ``EXISTS`` re-ran it for every row.
         """
         return (
-            "EXISTS (SELECT 1 FROM study_index_entry_fts "
-            f"WHERE study_index_entry_fts.rowid = {table_alias}.id "
-            "AND study_index_entry_fts MATCH ?)"
+            f"{table_alias}.id IN (SELECT rowid FROM study_index_entry_fts "
+            "WHERE study_index_entry_fts MATCH ?)"
         )
 
     def search(
@@ -536,7 +1132,7 @@ class StudyIndexStore:
         )
         fts_q = normalize_user_fts_query(global_fts_query)
         if fts_q:
-            fts_sql = self._fts_exists_sql("study_index_entry")
+            fts_sql = self._fts_filter_sql("study_index_entry")
             if where:
                 where = where + _SQL_AND + fts_sql
             else:
@@ -552,7 +1148,7 @@ class StudyIndexStore:
         params = list(params)
         params.append(limit)
 
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             try:
                 cur.execute(sql, params)
@@ -581,16 +1177,23 @@ class StudyIndexStore:
         offset: int = 0,
         order_by: str = "study_date",
         descending: bool = True,
+        after_id: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         One row per (study_uid, study_root_path) with instance/series counts and modalities.
 
-        Study-level text fields use SQLite aggregates (deterministic MAX). ``open_file_path``
-        is MIN(file_path) for a stable default when opening from a grouped row.
+        Rows come from ``study_summary``: study-level text fields are deterministic MAX
+        aggregates and ``open_file_path`` is MIN(file_path) for a stable default when
+        opening from a grouped row. Filters select the studies with at least one
+        matching instance; counts and modalities always describe the whole study.
 
         ``order_by`` is validated against a whitelist of grouped output columns; any
-        other value falls back to ``study_date``. ``patient_name ASC`` is always the
-        secondary tiebreak so paging stays deterministic.
+        other value falls back to ``study_date``. ``patient_name ASC`` then the
+        summary id are the tiebreaks so paging stays deterministic.
+
+        Pass the last row's ``summary_id`` as ``after_id`` to fetch the next page by
+        keyset (``offset`` is then ignored), so deep pages cost the same as the first.
+        If that study has since been removed, the page is empty.
         """
         where, params = self._search_filter_clauses(
             patient_name_contains=patient_name_contains,
@@ -604,7 +1207,7 @@ class StudyIndexStore:
         )
         fts_q = normalize_user_fts_query(global_fts_query)
         if fts_q:
-            fts_sql = self._fts_exists_sql("e")
+            fts_sql = self._fts_filter_sql("e")
             if where:
                 where = where + _SQL_AND + fts_sql
             else:
@@ -614,30 +1217,45 @@ class StudyIndexStore:
         # interpolate raw user input into SQL — only a known column name reaches the query.
         order_col = order_by if order_by in _GROUPED_SORT_COLUMNS else "study_date"
         order_dir = "DESC" if descending else "ASC"
-        # COUNT(DISTINCT …): ignore empty series_uid so blank rows do not inflate series_count.
+
+        qparams: list[Any] = []
+        source = "study_summary AS s"
+        clauses: list[str] = []
+        if after_id is not None:
+            # One-row anchor: the sort key of the last row already shown.
+            source += (
+                f", (SELECT {order_col} AS k, patient_name AS p, id "
+                "FROM study_summary WHERE id = ?) AS a"
+            )
+            qparams.append(int(after_id))
+            beyond = "<" if descending else ">"
+            clauses.append(
+                f"(s.{order_col} {beyond} a.k OR (s.{order_col} = a.k AND "
+                "(s.patient_name > a.p OR (s.patient_name = a.p AND s.id > a.id))))"
+            )
+        if where:
+            clauses.append(
+                "(s.study_uid, s.study_root_path) IN "
+                "(SELECT e.study_uid, e.study_root_path FROM study_index_entry AS e"
+                + where
+                + ")"
+            )
+            qparams.extend(params)
         sql = (
-            "SELECT e.study_uid, e.study_root_path, "
-            "MAX(e.study_date) AS study_date, "
-            "MAX(e.patient_name) AS patient_name, "
-            "MAX(e.patient_id) AS patient_id, "
-            "MAX(e.accession_number) AS accession_number, "
-            "MAX(e.study_description) AS study_description, "
-            "MAX(e.series_description) AS series_description, "
-            "MAX(e.indexed_at) AS indexed_at, "
-            "MIN(e.file_path) AS open_file_path, "
-            "COUNT(*) AS instance_count, "
-            "COUNT(DISTINCT NULLIF(TRIM(e.series_uid), '')) AS series_count, "
-            "GROUP_CONCAT(DISTINCT NULLIF(TRIM(e.modality), '')) AS _modalities_raw "
-            "FROM study_index_entry AS e"
-            + where
-            + " GROUP BY e.study_uid, e.study_root_path "
-            + f"ORDER BY {order_col} {order_dir}, patient_name ASC "
-            + "LIMIT ? OFFSET ?"
+            "SELECT s.id AS summary_id, s.study_uid, s.study_root_path, s.study_date, "
+            "s.patient_name, s.patient_id, s.accession_number, s.study_description, "
+            "s.series_description, s.indexed_at, s.open_file_path, s.instance_count, "
+            "s.series_count, s.modalities FROM "
+            + source
+            + ((_SQL_WHERE + _SQL_AND.join(clauses)) if clauses else "")
+            + f" ORDER BY s.{order_col} {order_dir}, s.patient_name ASC, s.id ASC LIMIT ?"
         )
-        qparams = list(params)
-        qparams.extend([limit, max(0, offset)])
+        qparams.append(limit)
+        if after_id is None:
+            sql += " OFFSET ?"
+            qparams.append(max(0, offset))
 
-        with self._connect() as conn:
+        with self._session() as conn:
             cur = conn.cursor()
             try:
                 cur.execute(sql, qparams)
@@ -649,14 +1267,7 @@ class StudyIndexStore:
                     ) from e
                 raise
             cols = [d[0] for d in cur.description]
-            rows = [dict(zip(cols, row, strict=False)) for row in cur.fetchall()]
-
-        for r in rows:
-            raw = r.pop("_modalities_raw", None)
-            r["modalities"] = _normalize_modalities_group_concat(raw)
-            r["instance_count"] = int(r.get("instance_count") or 0)
-            r["series_count"] = int(r.get("series_count") or 0)
-        return rows
+            return [dict(zip(cols, row, strict=False)) for row in cur.fetchall()]
 
 
 def is_plain_sqlite_readable(path: str) -> bool:
@@ -0,0 +1,113 @@
+"""
+Volume Crop Sub-volume
+
+Index-space extraction of a crop-box region for 3D rendering.
+
+``VolumeRenderer.set_cropping`` only adds clipping planes: the mapper still
+uploads and samples the whole volume, so a small vessel or joint box costs as
+much per frame as the full scan. ``crop_index_extent`` maps the crop box
+(world/LPS bounds from the box widget) back onto voxel indices, and
+``extract_subvolume`` copies just that block at full resolution so the
+renderer can hand the mapper a volume the size of the region. The clipping
+planes stay on, so oblique boxes (whose index-space bounding block is a
+superset) still clip exactly.
+
+Inputs:
+    World bounds (xmin, xmax, ymin, ymax, zmin, zmax), volume shape
+    (depth, height, width), (sx, sy, sz) spacing, origin, 9-float direction.
+
+Outputs:
+    CropExtent (voxel index ranges) and contiguous float32 sub-arrays.
+
+Requirements:
+    numpy
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+
+# Voxels kept on each side of the box so linear interpolation and gradient
+# estimation at the clipping planes see real neighbours.
+CROP_MARGIN_VOXELS = 1
+
+
+class CropExtent(NamedTuple):
+    """Half-open voxel index ranges of a sub-volume."""
+
+    x0: int
+    x1: int
+    y0: int
+    y1: int
+    z0: int
+    z1: int
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """(depth, height, width) of the sub-volume."""
+        return (self.z1 - self.z0, self.y1 - self.y0, self.x1 - self.x0)
+
+
+def crop_index_extent(
+    bounds: Sequence[float],
+    shape: tuple[int, int, int],
+    spacing: Sequence[float],
+    origin: Sequence[float],
+    direction: Sequence[float] | None = None,
+    *,
+    margin: int = CROP_MARGIN_VOXELS,
+) -> CropExtent | None:
+    """
+    Voxel block covering a world-space crop box.
+
+    World points map to image space as ``D^T (p - origin)`` (the renderer's
+    user transform is ``[D | origin]``), then to indices by spacing. Every
+    corner of the box is mapped, so rotated directions give the enclosing
+    block.
+
+    Returns:
+        The extent, or ``None`` when the box covers the whole volume or
+        misses it entirely (no sub-volume worth extracting).
+    """
+    depth, height, width = (int(n) for n in shape)
+    if depth <= 0 or height <= 0 or width <= 0:
+        return None
+    rotation = np.eye(3)
+    if direction is not None and len(direction) == 9:
+        rotation = np.asarray(direction, dtype=np.float64).reshape(3, 3)
+    corners = np.array(
+        [
+            (bounds[ix], bounds[2 + iy], bounds[4 + iz])
+            for ix in (0, 1)
+            for iy in (0, 1)
+            for iz in (0, 1)
+        ],
+        dtype=np.float64,
+    )
+    image = (corners - np.asarray(origin[:3], dtype=np.float64)) @ rotation
+    index = image / np.asarray(spacing[:3], dtype=np.float64)
+
+    ranges = []
+    for axis, size in enumerate((width, height, depth)):
+        lo = math.floor(float(index[:, axis].min())) - margin
+        hi = math.ceil(float(index[:, axis].max())) + 1 + margin
+        lo, hi = max(lo, 0), min(hi, size)
+        if lo >= hi:
+            return None
+        ranges.extend((lo, hi))
+    extent = CropExtent(*ranges)
+    if extent.shape == (depth, height, width):
+        return None
+    return extent
+
+
+def extract_subvolume(array: np.ndarray, extent: CropExtent) -> np.ndarray:
+    """Copy the ``extent`` block of a (depth, height, width) array as float32."""
+    return np.ascontiguousarray(
+        array[extent.z0:extent.z1, extent.y0:extent.y1, extent.x0:extent.x1],
+        dtype=np.float32,
+    )
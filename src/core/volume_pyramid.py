@@ -0,0 +1,180 @@
+"""
+Volume Pyramid
+
+Block-averaged, reduced-resolution copies of a 3D render volume for
+interactive camera movement.
+
+``VolumeRenderer`` renders one full-resolution ``vtkImageData``; lowering the
+sample distance while rotating helps the GPU mapper but not much the CPU ray
+caster, which still walks a 512x512x1500 float volume per frame.
+``VolumePyramid`` builds 2x and/or 4x downsampled levels of
+``VolumeData.array`` on a background thread so the renderer can swap a
+coarse level in while the user drags and restore full resolution when the
+interaction ends.
+
+Levels are built coarse-from-fine (4x from 2x) in bounded z-chunks, so peak
+extra memory is the levels themselves (1/8 and 1/64 of the input) plus one
+chunk. Axes thinner than a factor are left at full resolution.
+Each level records its voxel spacing and the image-space shift of its first
+voxel centre so it lines up with the full-resolution image.
+
+Inputs:
+    float32 (depth, height, width) array, (sx, sy, sz) spacing, factors.
+
+Outputs:
+    VolumePyramidLevel objects (numpy only; VTK wrapping is the renderer's job).
+
+Requirements:
+    numpy
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+_log = logging.getLogger(__name__)
+
+# Source voxels reduced per chunk (~64 MiB of float32).
+_CHUNK_VOXELS = 16 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class VolumePyramidLevel:
+    """One reduced-resolution level of a render volume."""
+
+    factor: int  # nominal downsampling factor (2, 4, ...)
+    array: np.ndarray  # contiguous float32, shape (depth, height, width)
+    spacing: tuple[float, float, float]  # (sx, sy, sz)
+    offset: tuple[float, float, float]  # image-space shift of voxel (0, 0, 0)
+
+
+def downsample_volume(array: np.ndarray, factors: tuple[int, int, int]) -> np.ndarray:
+    """
+    Block-average ``array`` by per-axis ``(fz, fy, fx)`` factors.
+
+    Trailing voxels that do not fill a whole block are dropped. Works in
+    z-chunks so a non-contiguous crop never copies the whole input.
+    """
+    fz, fy, fx = factors
+    depth, height, width = (n // f for n, f in zip(array.shape, factors, strict=True))
+    out = np.empty((depth, height, width), dtype=np.float32)
+    if out.size == 0:
+        return out
+    per_slice = height * width * fz * fy * fx
+    step = max(1, _CHUNK_VOXELS // per_slice)
+    for z0 in range(0, depth, step):
+        z1 = min(depth, z0 + step)
+        block = np.ascontiguousarray(
+            array[z0 * fz:z1 * fz, :height * fy, :width * fx], dtype=np.float32
+        )
+        block = block.reshape(z1 - z0, fz, height, fy, width, fx)
+        np.mean(block, axis=(1, 3, 5), dtype=np.float32, out=out[z0:z1])
+    return out
+
+
+class VolumePyramid:
+    """
+    Background-built reduced-resolution levels of one render volume.
+
+    ``start`` launches a daemon thread; ``level`` returns only finished
+    levels, so callers on the GUI thread never wait. ``cancel`` stops the
+    build before the next level.
+    """
+
+    def __init__(
+        self,
+        array: np.ndarray,
+        spacing: tuple[float, ...],
+        factors: tuple[int, ...],
+    ) -> None:
+        self._array: np.ndarray | None = array
+        self._spacing = (float(spacing[0]), float(spacing[1]), float(spacing[2]))
+        self.factors: tuple[int, ...] = tuple(sorted(f for f in set(factors) if f > 1))
+        self._levels: dict[int, VolumePyramidLevel] = {}
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Build the levels on a daemon thread (no-op when already started)."""
+        if self._thread is not None or not self.factors:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="volume-pyramid", daemon=True
+        )
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Stop building; finished levels stay available."""
+        self._cancelled.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the background build; return True when it has finished."""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def level(self, factor: int) -> VolumePyramidLevel | None:
+        """Return the finished level for ``factor``, or None."""
+        with self._lock:
+            return self._levels.get(factor)
+
+    def best_ready(self, factor: int) -> VolumePyramidLevel | None:
+        """Return the coarsest finished level no coarser than ``factor``."""
+        with self._lock:
+            ready = [f for f in self._levels if f <= factor]
+            return self._levels[max(ready)] if ready else None
+
+    def build(self) -> None:
+        """Build every level synchronously on the calling thread."""
+        if self._array is not None:
+            self._build_levels(self._array)
+
+    def _build_levels(self, array: np.ndarray) -> None:
+        source = array
+        source_factors: tuple[int, int, int] = (1, 1, 1)  # (z, y, x) relative to the input
+        sx, sy, sz = self._spacing
+        for factor in self.factors:
+            if self._cancelled.is_set():
+                return
+            nz, ny, nx = array.shape
+            target = (
+                factor if nz >= factor else 1,
+                factor if ny >= factor else 1,
+                factor if nx >= factor else 1,
+            )
+            # Reduce from the previous level when its factors divide evenly.
+            if any(t % s for t, s in zip(target, source_factors, strict=True)):
+                source, source_factors = array, (1, 1, 1)
+            relative = (
+                target[0] // source_factors[0],
+                target[1] // source_factors[1],
+                target[2] // source_factors[2],
+            )
+            reduced = downsample_volume(source, relative)
+            fz, fy, fx = target
+            level = VolumePyramidLevel(
+                factor=factor,
+                array=reduced,
+                spacing=(sx * fx, sy * fy, sz * fz),
+                offset=((fx - 1) * sx / 2.0, (fy - 1) * sy / 2.0, (fz - 1) * sz / 2.0),
+            )
+            with self._lock:
+                self._levels[factor] = level
+            source, source_factors = reduced, target
+
+    def _run(self) -> None:
+        # The renderer's vtkImageData keeps the full-resolution voxels alive;
+        # hold them only in this frame so they are released once it returns.
+        array, self._array = self._array, None
+        if array is None:
+            return
+        try:
+            self._build_levels(array)
+        except Exception:
+            _log.warning("Volume pyramid build failed; interaction stays at full resolution")
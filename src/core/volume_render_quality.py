@@ -6,6 +6,8 @@ MEBIBYTE = 1024 * 1024
 LARGE_VOLUME_BYTES = 64 * MEBIBYTE
 HUGE_VOLUME_BYTES = 512 * MEBIBYTE
 AUTO_REFINE_BUDGET_MS = 200.0
+# Cropped sub-volumes up to this size keep the target detail while rotating.
+SMALL_REGION_BYTES = 16 * MEBIBYTE
 
 
 def estimate_volume_megabytes(dims: tuple[int, int, int], *, bytes_per_voxel: int = 4) -> float:
@@ -29,3 +31,41 @@ def auto_detail_cap_index(volume_bytes: int | None, *, mode_count: int) -> int:
 def should_auto_refine(*, preview_elapsed_ms: float, gpu_fallback_used: bool) -> bool:
     """Allow an automatic fine render only when the preview was responsive."""
     return not gpu_fallback_used and preview_elapsed_ms <= AUTO_REFINE_BUDGET_MS
+
+
+def pyramid_factors(volume_bytes: int | None) -> tuple[int, ...]:
+    """Return the reduced levels worth building for interactive rotation.
+
+    Uses the same size bands as ``auto_detail_cap_index``: volumes whose Auto
+    Detail is capped get a 2x level, and the Fast-only band also gets 4x.
+    """
+    if volume_bytes is None or volume_bytes < LARGE_VOLUME_BYTES:
+        return ()
+    if volume_bytes >= HUGE_VOLUME_BYTES:
+        return (2, 4)
+    return (2,)
+
+
+def interactive_pyramid_factor(
+    volume_bytes: int | None, *, cpu_rendering: bool, preview_slow: bool = False
+) -> int:
+    """Return the pyramid level to render while the camera moves (1 = full).
+
+    The CPU ray caster, and previews that failed ``should_auto_refine``, use
+    the coarsest level; otherwise the finest reduced level is enough.
+    """
+    factors = pyramid_factors(volume_bytes)
+    if not factors:
+        return 1
+    if cpu_rendering or preview_slow:
+        return factors[-1]
+    return factors[0]
+
+
+def subvolume_keeps_target_detail(region_bytes: int | None) -> bool:
+    """Return True when a cropped region is small enough to rotate at full detail.
+
+    The CPU ray caster's cost scales with the voxels a ray crosses, so a
+    region under ``SMALL_REGION_BYTES`` stays interactive even at "Ultra".
+    """
+    return region_bytes is not None and region_bytes <= SMALL_REGION_BYTES
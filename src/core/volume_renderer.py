@@ -21,6 +21,7 @@ Requirements:
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -71,6 +72,8 @@ except ImportError:
 # here for backward compatibility with existing callers.
 # ---------------------------------------------------------------------------
 
+from core.volume_crop import CropExtent, crop_index_extent, extract_subvolume
+from core.volume_pyramid import VolumePyramid
 from core.volume_render_presets import (
     BUILTIN_PRESETS,
     PRESET_CT_ANATOMY_COLORS,
@@ -96,6 +99,11 @@ from core.volume_render_presets import (
     is_steep_preset,
     preset_steepness,
 )
+from core.volume_render_quality import (
+    interactive_pyramid_factor,
+    pyramid_factors,
+    subvolume_keeps_target_detail,
+)
 from core.volume_renderer_quality import VolumeRendererQualityMixin
 
 # Mark re-exports as referenced for basedpyright without narrowing ``__all__``.
@@ -133,32 +141,39 @@ class VolumeData:
     scalar_units: str | None = None  # e.g. "HU" for calibrated CT
 
 
-def _calibrate_volume_array(
-    arr: np.ndarray,
+def _volume_rescale(
     source_datasets: list[Any] | None,
-) -> tuple[np.ndarray, bool, str | None]:
-    """Apply per-slice DICOM rescale only when every slice has sane metadata."""
-    if not source_datasets or len(source_datasets) != arr.shape[0]:
-        return arr, False, None
+    depth: int,
+) -> tuple[np.ndarray, np.ndarray, str | None] | None:
+    """
+    Per-slice ``(slopes, intercepts, units)`` when every slice has sane metadata.
+
+    Returns ``None`` (keep raw values) when metadata is missing, non-finite,
+    has a zero slope, or reports conflicting units.
+    """
+    if not source_datasets or len(source_datasets) != depth:
+        return None
 
     from core.dicom_rescale import get_rescale_parameters, infer_rescale_type
 
-    params: list[tuple[float, float, str | None]] = []
+    slopes = np.empty(depth, dtype=np.float64)
+    intercepts = np.empty(depth, dtype=np.float64)
     units: set[str] = set()
-    for dataset in source_datasets:
+    for z_index, dataset in enumerate(source_datasets):
         slope, intercept, rescale_type = get_rescale_parameters(dataset)
         if slope is None or intercept is None:
-            return arr, False, None
+            return None
         if not np.isfinite(slope) or not np.isfinite(intercept):
-            return arr, False, None
+            return None
         # RescaleSlope is DICOM DS-VR; exact 0.0 is well-defined
         if slope == 0.0:  # NOSONAR(S1244)
-            return arr, False, None
+            return None
 
         scalar_units = infer_rescale_type(dataset, slope, intercept, rescale_type)
         if scalar_units:
             units.add(str(scalar_units))
-        params.append((float(slope), float(intercept), scalar_units))
+        slopes[z_index] = slope
+        intercepts[z_index] = intercept
 
     # If slices report conflicting rescale-unit semantics (e.g. one "HU",
     # another "US"), the calibrated values are numerically valid but the
@@ -169,25 +184,81 @@ def _calibrate_volume_array(
             "Mixed rescale units across slices (%s); falling back to raw values.",
             units,
         )
-        return arr, False, None
+        return None
+
+    resolved_units = next(iter(units)) if len(units) == 1 else None
+    return slopes, intercepts, resolved_units
+
+
+def _rescale_stays_finite(
+    dtype: np.dtype,
+    slopes: np.ndarray,
+    intercepts: np.ndarray,
+) -> bool:
+    """
+    True when rescaling any value of integer ``dtype`` cannot overflow float32.
+
+    Bounds ``max|stored| * max|slope| + max|intercept|`` over the dtype's
+    whole range, so integer volumes skip the full ``np.isfinite`` scan.
+    """
+    if dtype.kind not in "iu":
+        return False
+    info = np.iinfo(dtype)
+    stored = float(max(abs(int(info.min)), int(info.max)))
+    bound = stored * float(np.max(np.abs(slopes))) + float(np.max(np.abs(intercepts)))
+    # Headroom for float32 rounding of the product and sum.
+    return bound < float(np.finfo(np.float32).max) / 2.0
+
 
-    calibrated = arr.copy()
-    for z_index, (slope, intercept, _scalar_units) in enumerate(params):
-        calibrated[z_index] = calibrated[z_index] * slope + intercept
+def _calibrate_volume_array(
+    stored: np.ndarray,
+    source_datasets: list[Any] | None,
+    out: np.ndarray | None = None,
+) -> tuple[np.ndarray, bool, str | None]:
+    """
+    Apply per-slice DICOM rescale only when every slice has sane metadata.
+
+    ``stored`` may be any numeric dtype (typically the SimpleITK array view);
+    the float32 result is written into ``out`` (allocated when ``None``), so
+    calibration costs no allocation beyond the output volume.  Slopes and
+    intercepts are broadcast over whole slices.  When the rescale is
+    rejected, ``out`` holds the raw stored values instead.
+    """
+    if out is None:
+        out = np.empty(stored.shape, dtype=np.float32)
+    rescale = _volume_rescale(source_datasets, stored.shape[0])
+    if rescale is None:
+        np.copyto(out, stored, casting="unsafe")
+        return out, False, None
+
+    slopes, intercepts, units = rescale
+    per_slice = (-1, 1, 1)
+    with np.errstate(over="ignore", invalid="ignore"):  # checked below
+        np.multiply(
+            stored,
+            slopes.astype(np.float32).reshape(per_slice),
+            out=out,
+            dtype=np.float32,
+            casting="unsafe",
+        )
+        np.add(out, intercepts.astype(np.float32).reshape(per_slice), out=out)
 
     # Guard against NaN/Inf that can arise from corrupted pixel data or
     # extreme slope/intercept values.  VTK volume rendering produces
     # unpredictable blank or garbage frames when the input contains
-    # non-finite values.
-    if not np.all(np.isfinite(calibrated)):
+    # non-finite values.  Integer inputs with a bounded rescale cannot
+    # produce them, so only float inputs and extreme slopes pay for the scan.
+    if not _rescale_stays_finite(stored.dtype, slopes, intercepts) and not np.all(
+        np.isfinite(out)
+    ):
         _log.warning(
             "Calibrated volume contains NaN or Inf values; "
             "falling back to raw stored values."
         )
-        return arr, False, None
+        np.copyto(out, stored, casting="unsafe")
+        return out, False, None
 
-    resolved_units = next(iter(units)) if len(units) == 1 else None
-    return np.ascontiguousarray(calibrated, dtype=np.float32), True, resolved_units
+    return out, True, units
 
 
 # ---------------------------------------------------------------------------
@@ -368,6 +439,15 @@ class VolumeRenderer(VolumeRendererQualityMixin):
         self._window: float = 1.0
         self._center: float = 0.0
         self._threshold_shift: float = 0.0  # shifts where opacity begins
+        # Reduced-resolution levels swapped in while the camera moves.
+        self._pyramid: VolumePyramid | None = None
+        self._pyramid_images: dict[int, Any] = {}  # factor -> vtkImageData
+        self._volume_bytes: int | None = None
+        self._interactive_factor: int = 1  # level on the mapper (1 = full)
+        # Crop-to-subvolume: the attached volume and the extent now rendered.
+        self._volume_data: VolumeData | None = None
+        self._full_image: Any = None  # full-resolution image of the volume
+        self._crop_extent: CropExtent | None = None
 
         # Configure volume property defaults.
         self._volume_property.SetInterpolationTypeToLinear()
@@ -419,15 +499,20 @@ class VolumeRenderer(VolumeRendererQualityMixin):
         """
         if not sitk_available:
             raise RuntimeError("SimpleITK is required to convert volumes.")
-        arr = sitk.GetArrayFromImage(sitk_image)  # shape: (z, y, x)
-        arr = np.ascontiguousarray(arr, dtype=np.float32)
+        # View onto the image's own buffer (valid while ``sitk_image`` lives);
+        # the float32 render array below is the only full-volume allocation.
+        stored = sitk.GetArrayViewFromImage(sitk_image)  # shape: (z, y, x)
+        arr = np.empty(stored.shape, dtype=np.float32)
         rescale_applied = False
         scalar_units: str | None = None
         if apply_rescale:
             arr, rescale_applied, scalar_units = _calibrate_volume_array(
-                arr,
+                stored,
                 source_datasets,
+                out=arr,
             )
+        else:
+            np.copyto(arr, stored, casting="unsafe")
         spacing = sitk_image.GetSpacing()
         origin = sitk_image.GetOrigin()
         direction = sitk_image.GetDirection()
@@ -456,10 +541,13 @@ class VolumeRenderer(VolumeRendererQualityMixin):
                 f"  dtype={arr.dtype}  range=[{float(arr.min()):.1f}, {float(arr.max()):.1f}]"
             )
 
-        flat = arr.ravel()
+        # Zero-copy: VTK reads the prepared float32 buffer directly.
+        # ``numpy_to_vtk`` keeps a reference to ``flat`` on the VTK array, so
+        # the voxels live as long as the image does.
+        flat = np.ascontiguousarray(arr, dtype=np.float32).ravel()
         vtk_data_array = numpy_support.numpy_to_vtk(
             num_array=flat,
-            deep=True,
+            deep=False,
             array_type=vtk_mod.VTK_FLOAT,
         )
         vtk_data_array.SetNumberOfComponents(1)
@@ -483,7 +571,11 @@ class VolumeRenderer(VolumeRendererQualityMixin):
         vtk_image.GetPointData().SetScalars(vtk_data_array)
         self._vtk_image = vtk_image
         self._vtk_image_original = vtk_image  # keep raw for re-smoothing
+        self._full_image = vtk_image
+        self._volume_data = volume_data
+        self._crop_extent = None
         self._mapper.SetInputData(vtk_image)
+        self._start_pyramid(arr, volume_data.spacing)
 
         if DEBUG_VOLUME_3D:
             print(
@@ -791,6 +883,7 @@ class VolumeRenderer(VolumeRendererQualityMixin):
             return
         sigma = max(0.0, float(sigma))
         self._display_smoothing_sigma = sigma
+        self._interactive_factor = 1
         if sigma <= 0.0:
             self._vtk_image = self._vtk_image_original
         else:
@@ -913,14 +1006,107 @@ class VolumeRenderer(VolumeRendererQualityMixin):
         """Remove all clipping planes (show the full volume)."""
         self.set_cropping(None)
 
+    def set_crop_subvolume(self, bounds: Sequence[float] | None) -> bool:
+        """
+        Feed the mapper only the voxels inside a world-space crop box.
+
+        The enclosing voxel block is extracted at full resolution and the
+        rest of the volume is dropped from the mapper; clipping planes from
+        ``set_cropping`` still apply on top.  Display smoothing and the
+        interactive pyramid follow the sub-volume.
+
+        Args:
+            bounds: ``(xmin, xmax, ymin, ymax, zmin, zmax)`` in world (LPS)
+                coordinates, or ``None`` to render the whole volume again.
+
+        Returns:
+            ``True`` when the mapper input changed.
+        """
+        data = self._volume_data
+        if data is None or self._full_image is None:
+            return False
+        extent = None
+        if bounds is not None:
+            extent = crop_index_extent(
+                bounds, data.array.shape, data.spacing, data.origin, data.direction
+            )
+        if extent == self._crop_extent:
+            return False
+        self._crop_extent = extent
+        if extent is None:
+            array = data.array
+            image = self._full_image
+        else:
+            array = extract_subvolume(data.array, extent)
+            base_origin = self._full_image.GetOrigin()
+            start = (extent.x0, extent.y0, extent.z0)
+            image = self._wrap_image(
+                array,
+                data.spacing,
+                tuple(o + i * d for o, i, d in zip(base_origin, start, data.spacing, strict=True)),
+            )
+        self._vtk_image_original = image
+        self._start_pyramid(array, data.spacing)
+        # Re-applies smoothing (if any) and sets the mapper input.
+        self.set_display_smoothing(self._display_smoothing_sigma)
+        return True
+
+    def crop_extent(self) -> CropExtent | None:
+        """Return the voxel extent rendered in crop-to-subvolume mode, or None."""
+        return self._crop_extent
+
     def set_interactive_quality(self, low: bool) -> None:
-        """Switch sample distance for interactive (coarse) vs static (fine) rendering."""
-        if low:
-            self._mapper.SetSampleDistance(max(self._quality_sample_distance * 2.0, 2.0))
+        """Switch sample distance for interactive (coarse) vs static (fine) rendering.
+
+        Large volumes also swap to a reduced pyramid level while ``low``; the
+        sample distance is then at least the target distance scaled by the
+        level factor, so rays take proportionally fewer steps.  A small
+        cropped sub-volume keeps the target distance (e.g. "Ultra").
+        """
+        factor = self.set_interactive_level(low)
+        if low and self._crop_extent is not None and subvolume_keeps_target_detail(
+            self._volume_bytes
+        ):
+            self._mapper.SetSampleDistance(self._quality_sample_distance)
+        elif low:
+            self._mapper.SetSampleDistance(max(
+                self._quality_sample_distance * 2.0,
+                2.0,
+                self._quality_sample_distance * factor,
+            ))
         else:
             self._mapper.SetSampleDistance(self._quality_sample_distance)
         self._mapper.Modified()
 
+    def set_interactive_level(self, low: bool, *, preview_slow: bool = False) -> int:
+        """Swap a reduced pyramid level onto the mapper while interacting.
+
+        Args:
+            low: True while the camera moves; False restores full resolution.
+            preview_slow: The first preview failed ``should_auto_refine``;
+                use the coarsest level.
+
+        Returns:
+            The factor of the level now on the mapper (1 = full resolution).
+            Levels still being built are skipped, never waited for.
+        """
+        factor = 1
+        image = self._vtk_image
+        if low and self._pyramid is not None and self._vtk_image is not None:
+            wanted = interactive_pyramid_factor(
+                self._volume_bytes,
+                cpu_rendering=self._is_cpu_rendering(),
+                preview_slow=preview_slow,
+            )
+            level_image = self._pyramid_image(wanted)
+            if level_image is not None:
+                factor, image = level_image
+        if factor != self._interactive_factor and image is not None:
+            self._mapper.SetInputData(image)
+            self._mapper.Modified()
+            self._interactive_factor = factor
+        return factor
+
     def check_gpu_fallback(
         self, render_window: Any, *, probe_quality: str | None = None
     ) -> bool:
@@ -1002,11 +1188,15 @@ class VolumeRenderer(VolumeRendererQualityMixin):
 
     def cleanup(self) -> None:
         """Release VTK objects to free GPU / CPU memory."""
+        self._stop_pyramid()
         if self._volume is not None:
             self._renderer.RemoveVolume(self._volume)
         self._mapper.RemoveAllInputs()
         self._vtk_image = None
         self._vtk_image_original = None
+        self._full_image = None
+        self._volume_data = None
+        self._crop_extent = None
         self._volume = None
         if DEBUG_VOLUME_3D:
             print("[DEBUG-VOLUME-3D] VolumeRenderer cleanup complete.")
@@ -1015,6 +1205,70 @@ class VolumeRenderer(VolumeRendererQualityMixin):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _start_pyramid(self, array: np.ndarray, spacing: tuple[float, ...]) -> None:
+        """Start building reduced levels of the volume (or sub-volume) on the mapper."""
+        self._stop_pyramid()
+        self._volume_bytes = int(array.nbytes)
+        factors = pyramid_factors(self._volume_bytes)
+        if not factors:
+            return
+        self._pyramid = VolumePyramid(array, spacing, factors)
+        self._pyramid.start()
+
+    def _stop_pyramid(self) -> None:
+        if self._pyramid is not None:
+            self._pyramid.cancel()
+        self._pyramid = None
+        self._pyramid_images = {}
+        self._interactive_factor = 1
+
+    def _pyramid_image(self, factor: int) -> tuple[int, Any] | None:
+        """Return ``(factor, vtkImageData)`` for the best finished level."""
+        assert self._pyramid is not None
+        level = self._pyramid.best_ready(factor)
+        if level is None:
+            return None
+        image = self._pyramid_images.get(level.factor)
+        if image is None:
+            base_origin = self._vtk_image_original.GetOrigin()
+            image = self._wrap_image(
+                level.array,
+                level.spacing,
+                tuple(o + d for o, d in zip(base_origin, level.offset, strict=True)),
+            )
+            self._pyramid_images[level.factor] = image
+        return level.factor, image
+
+    @staticmethod
+    def _wrap_image(
+        array: np.ndarray,
+        spacing: tuple[float, ...],
+        origin: tuple[float, ...],
+    ) -> Any:
+        """Shallow-wrap a contiguous float32 (depth, height, width) array as vtkImageData."""
+        from vtkmodules.util import numpy_support
+
+        depth, height, width = array.shape
+        # numpy_to_vtk keeps a reference to the array on the VTK array.
+        data = numpy_support.numpy_to_vtk(
+            num_array=array.ravel(), deep=False, array_type=vtk_mod.VTK_FLOAT
+        )
+        data.SetNumberOfComponents(1)
+        image = vtk_mod.vtkImageData()
+        image.SetDimensions(width, height, depth)
+        image.SetSpacing(*spacing)
+        image.SetOrigin(*origin)
+        image.GetPointData().SetScalars(data)
+        return image
+
+    def _is_cpu_rendering(self) -> bool:
+        """Return True when the mapper ray-casts on the CPU."""
+        if "Smart" not in self._mapper.GetClassName():
+            return True
+        if hasattr(self._mapper, "GetRequestedRenderMode"):
+            return self._mapper.GetRequestedRenderMode() == 1
+        return False
+
     def _set_camera_direction(
         self,
         direction: tuple[float, float, float],
@@ -270,6 +270,9 @@ def open_study_index_search(app: DICOMViewerApp) -> None:
             paths
         ),
         parent=app.main_window,
+        open_indexed_study_callback=lambda instances, root: (
+            app.file_operations_handler.open_indexed_study(instances, root)
+        ),
     )
     dlg.exec()
 
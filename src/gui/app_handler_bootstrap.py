@@ -96,6 +96,7 @@ def initialize_handlers(app: DICOMViewerApp) -> None:
         update_status_callback=app.main_window.update_status,
         on_load_success_callback=app._on_study_index_after_load,
         pipeline_complete_callback=app._file_series_coordinator._on_load_complete,
+        load_started_callback=app._file_series_coordinator._on_load_started,
     )
 
     # Initialize DialogCoordinator
@@ -30,6 +30,7 @@ import numpy as np
 from pydicom.dataset import Dataset
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QDialog,
     QDialogButtonBox,
@@ -47,9 +48,9 @@ from PySide6.QtWidgets import (
 )
 
 from core.mpr_combine_slice_count import normalize_mpr_combine_slice_count
+from core.mpr_prebuild import default_output_params
 from core.mpr_volume import MprVolume
 from core.slice_geometry import SlicePlane
-from utils.dicom_utils import get_pixel_spacing, get_slice_thickness
 
 _STYLE_SERIES_INFO = "color: gray; font-size: 10px;"
 
@@ -76,6 +77,9 @@ class MprRequest:
         combine_slice_count: Planes in the slab (2, 3, 4, 6, or 8), same as the
                              right-pane Combine Slices control.
         orientation_label:   Human-readable label ("Axial", "Coronal", etc.)
+        on_demand:           Show the view at once and reslice planes when
+                             first viewed, completing the stack in the
+                             background (interactive oblique MPR).
     """
     series_key: str
     datasets: list[Dataset]
@@ -87,6 +91,7 @@ class MprRequest:
     slab_thickness_mm: float
     orientation_label: str
     combine_slice_count: int = 4
+    on_demand: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -234,6 +239,14 @@ class MprDialog(QDialog):
         params_layout.addRow("Slice Thickness:", self._thickness_spin)
         params_layout.addRow("Interpolation:", self._interp_combo)
 
+        self._on_demand_check = QCheckBox("Reslice planes on demand (interactive)")
+        self._on_demand_check.setObjectName("mprOnDemand")
+        self._on_demand_check.setToolTip(
+            "Open the view immediately and reslice each plane the first time "
+            "it is shown; the rest of the stack is filled in the background."
+        )
+        params_layout.addRow("", self._on_demand_check)
+
         # --- Combine slices (same model as the right-pane "Combine Slices" widget) ---
         combine_group = QGroupBox("Combine Slices")
         combine_group.setToolTip(
@@ -326,17 +339,11 @@ class MprDialog(QDialog):
         if not datasets:
             return
 
-        ds0 = datasets[0]
-        # Default pixel spacing.
-        ps_tuple = get_pixel_spacing(ds0)
-        default_sp = ps_tuple[0] if ps_tuple is not None else 1.0
-
-        # Default slice thickness.
-        st = get_slice_thickness(ds0)
-        default_th = st if st is not None else default_sp
-
-        self._spacing_spin.setValue(round(default_sp, 2))
-        self._thickness_spin.setValue(round(default_th, 2))
+        # Pixel spacing, and slice thickness falling back to it (shared with
+        # the idle pre-build so its cache keys match a default request).
+        default_sp, default_th = default_output_params(datasets[0])
+        self._spacing_spin.setValue(default_sp)
+        self._thickness_spin.setValue(default_th)
 
         idx4 = self._combine_slice_combo.findData(4)
         if idx4 >= 0:
@@ -484,6 +491,7 @@ class MprDialog(QDialog):
             slab_thickness_mm=slab_thickness,
             orientation_label=label,
             combine_slice_count=combine_n,
+            on_demand=self._on_demand_check.isChecked(),
         )
         # Close the dialog first so the orientation-choice or error dialogs
         # opened by the handler are visible on top and the user is not stuck.
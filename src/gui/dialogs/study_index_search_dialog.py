@@ -159,6 +159,15 @@ _COLUMN_LABELS: dict[str, str] = {
     "study_uid": "Study UID",
 }
 
+# Header tooltips: grouped rows come from ``study_summary``, so these columns
+# describe the whole study even when a filter matched only some of its instances.
+_WHOLE_STUDY_TOOLTIP = "Whole study; filters choose which studies are listed, not what is counted"
+_COLUMN_TOOLTIPS: dict[str, str] = {
+    "instance_count": _WHOLE_STUDY_TOOLTIP,
+    "series_count": _WHOLE_STUDY_TOOLTIP,
+    "modalities": _WHOLE_STUDY_TOOLTIP,
+}
+
 
 class _StudyIndexGroupedModel(QAbstractTableModel):
     """Table model for grouped study rows (dicts from ``search_grouped_studies``)."""
@@ -219,6 +228,8 @@ class _StudyIndexGroupedModel(QAbstractTableModel):
         if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
             cid = self._column_ids[section]
             return _COLUMN_LABELS.get(cid, cid)
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.ToolTipRole:
+            return _COLUMN_TOOLTIPS.get(self._column_ids[section])
         return super().headerData(section, orientation, role)
 
     def set_rows(self, rows: list[dict[str, Any]]) -> None:
@@ -256,12 +267,16 @@ class StudyIndexSearchDialog(QDialog):
         config_manager: ConfigManager,
         open_paths_callback: Callable[[list[str]], None],
         parent=None,
+        *,
+        open_indexed_study_callback: Callable[[list[dict[str, Any]], str], None] | None = None,
     ) -> None:
         super().__init__(parent)
         self._service = service
         self._config = config_manager
         self._open_paths = open_paths_callback
+        self._open_indexed_study = open_indexed_study_callback
         self._offset = 0
+        self._after_id: int | None = None  # keyset cursor: last loaded row's summary_id
         self._sort_column_id = "study_date"
         self._sort_descending = True
         self._integrity_thread: StudyIndexIntegrityThread | None = None
@@ -482,11 +497,13 @@ class StudyIndexSearchDialog(QDialog):
             return
         if reset:
             self._offset = 0
+            self._after_id = None
         try:
             batch = self._service.search_grouped_studies(
                 **self._service_query_kwargs(df, dt),
                 limit=_PAGE_SIZE,
                 offset=self._offset,
+                after_id=self._after_id,
                 order_by=self._sort_column_id,
                 descending=self._sort_descending,
                 privacy_mode=self._privacy(),
@@ -513,6 +530,8 @@ class StudyIndexSearchDialog(QDialog):
         else:
             self._model.append_rows(batch)
         self._offset += len(batch)
+        if batch:
+            self._after_id = batch[-1].get("summary_id", self._after_id)
         self._load_more_btn.setEnabled(len(batch) >= _PAGE_SIZE)
 
     def _on_search_clicked(self) -> None:
@@ -617,10 +636,15 @@ class StudyIndexSearchDialog(QDialog):
             QMessageBox.warning(self, _TITLE_STUDY_INDEX, "Row is missing study UID or folder path.")
             return
 
-        # Full folder rescan (same as Open Folder / recent folder) when the indexed
-        # study root still exists — avoids opening only a partial path list from the DB.
         if os.path.isdir(study_root):
-            self._open_paths([study_root])
+            # A study the folder crawler indexed opens from its rows (no header
+            # re-parse); otherwise rescan the folder (same as Open Folder / recent
+            # folder), which avoids opening only a partial path list from the DB.
+            instances = self._crawled_study_instances(study_uid, study_root)
+            if instances and self._open_indexed_study is not None:
+                self._open_indexed_study(instances, study_root)
+            else:
+                self._open_paths([study_root])
             self.accept()
             return
 
@@ -693,6 +717,18 @@ class StudyIndexSearchDialog(QDialog):
         self._open_paths(existing)
         self.accept()
 
+    def _crawled_study_instances(self, study_uid: str, study_root: str) -> list[dict[str, Any]]:
+        """Index rows of the study when every one was written by a folder crawl, else []."""
+        if self._open_indexed_study is None:
+            return []
+        try:
+            instances = self._service.get_study_instances(study_uid, study_root)
+        except Exception:
+            return []  # the folder rescan still opens the study
+        if all(r.get("file_size") is not None and r.get("instance_header") for r in instances):
+            return instances
+        return []
+
     def _relocate_and_reopen(self, study_uid: str, study_root: str) -> bool:
         """Prompt for the study's new folder, relocate index paths, then retry opening.
 
@@ -881,9 +917,23 @@ class StudyIndexSearchDialog(QDialog):
             if msg != "Cancelled":
                 QMessageBox.warning(self, _TITLE_STUDY_INDEX, f"Indexing failed:\n{msg}")
 
+        summary: dict[str, str] = {}
+
+        def on_report(report: object) -> None:
+            updated = getattr(report, "updated", 0)
+            skipped = getattr(report, "skipped", 0)
+            removed = getattr(report, "removed", 0)
+            summary["text"] = (
+                f"Indexed {updated} new or changed DICOM file(s) into the local database.\n"
+                f"Skipped {skipped} unchanged file(s); removed {removed} missing file(s)."
+            )
+
         def on_ok(n: int) -> None:
             QMessageBox.information(
-                self, _TITLE_STUDY_INDEX, f"Indexed {n} DICOM file(s) into the local database."
+                self,
+                _TITLE_STUDY_INDEX,
+                summary.get("text")
+                or f"Indexed {n} DICOM file(s) into the local database.",
             )
             self._run_browse(reset=True)
 
@@ -891,6 +941,7 @@ class StudyIndexSearchDialog(QDialog):
             folder,
             on_finished=lambda n: on_ok(n),
             on_failed=on_fail,
+            on_report=on_report,
         )
 
     def _check_indexed_studies(self) -> None:
@@ -36,6 +36,7 @@ from core.loading_pipeline import (
     run_load_pipeline_async,
 )
 from core.loading_progress_manager import LoadingProgressManager
+from core.study_index.indexed_open import load_indexed_instances
 from gui.dialogs.file_dialog import FileDialog
 from gui.main_window import MainWindow
 from utils.config_manager import ConfigManager
@@ -70,6 +71,7 @@ class FileOperationsHandler:
         update_status_callback: Callable[..., None],
         on_load_success_callback: Callable[..., None] | None = None,
         pipeline_complete_callback: Callable[..., None] | None = None,
+        load_started_callback: Callable[[], None] | None = None,
     ):
         """
         Initialize the file operations handler.
@@ -88,6 +90,8 @@ class FileOperationsHandler:
             pipeline_complete_callback: Optional callback ``(datasets, studies)``
                 invoked when the async load pipeline finishes (or ``(None, None)``
                 on error/cancel).
+            load_started_callback: Optional callback invoked just before an
+                async load pipeline starts.
         """
         self.dicom_loader = dicom_loader
         self.dicom_organizer = dicom_organizer
@@ -99,6 +103,7 @@ class FileOperationsHandler:
         self.update_status_callback = update_status_callback
         self._on_load_success_callback = on_load_success_callback
         self._pipeline_complete_callback = pipeline_complete_callback
+        self._load_started_callback = load_started_callback
         self._active_worker = None  # prevent GC of worker thread
 
         # Centralised loading progress infrastructure (animated dots, progress dialog, cancellation).
@@ -185,6 +190,11 @@ class FileOperationsHandler:
         return proceed
 
 
+    def _on_pipeline_start(self) -> None:
+        """Called just before an async load starts (lets idle background work yield)."""
+        if self._load_started_callback:
+            self._load_started_callback()
+
     def _on_pipeline_complete(self, datasets, studies):
         """Called when async loading finishes. Updates app state."""
         if self._pipeline_complete_callback:
@@ -219,6 +229,7 @@ class FileOperationsHandler:
         def load_selected_files(cb):
             return self.dicom_loader.load_files(captured, progress_callback=cb)
 
+        self._on_pipeline_start()
         self._active_worker = run_load_pipeline_async(
             LoadPipelineRequest(
                 loader_fn=load_selected_files,
@@ -267,6 +278,7 @@ class FileOperationsHandler:
                 folder_path, recursive=True, progress_callback=cb
             )
 
+        self._on_pipeline_start()
         self._active_worker = run_load_pipeline_async(
             LoadPipelineRequest(
                 loader_fn=load_selected_folder,
@@ -326,6 +338,7 @@ class FileOperationsHandler:
             def load_recent_file(cb):
                 return self.dicom_loader.load_files([file_path], progress_callback=cb)
 
+            self._on_pipeline_start()
             self._active_worker = run_load_pipeline_async(
                 LoadPipelineRequest(
                     loader_fn=load_recent_file,
@@ -368,6 +381,7 @@ class FileOperationsHandler:
                 file_path, recursive=True, progress_callback=cb
             )
 
+        self._on_pipeline_start()
         self._active_worker = run_load_pipeline_async(
             LoadPipelineRequest(
                 loader_fn=load_recent_folder,
@@ -433,6 +447,7 @@ class FileOperationsHandler:
                     folder_path, recursive=True, progress_callback=cb
                 )
 
+            self._on_pipeline_start()
             self._active_worker = run_load_pipeline_async(
                 LoadPipelineRequest(
                     loader_fn=load_dropped_folder,
@@ -478,6 +493,7 @@ class FileOperationsHandler:
             def load_dropped_files(cb):
                 return self.dicom_loader.load_files(captured, progress_callback=cb)
 
+            self._on_pipeline_start()
             self._active_worker = run_load_pipeline_async(
                 LoadPipelineRequest(
                     loader_fn=load_dropped_files,
@@ -498,6 +514,51 @@ class FileOperationsHandler:
                 on_pipeline_complete=self._on_pipeline_complete,
             )
 
+    def open_indexed_study(self, instances: list[dict[str, Any]], study_root: str) -> None:
+        """
+        Open one study from its study-index rows instead of rescanning its folder.
+
+        Unchanged single-frame images are built from the index and read on first use
+        (see :mod:`core.study_index.indexed_open`); the rest load as usual. Results
+        delivered via pipeline_complete_callback.
+
+        Args:
+            instances: Rows from ``LocalStudyIndexService.get_study_instances``.
+            study_root: The study folder the rows were indexed under.
+        """
+        if not instances:
+            return
+        self.config_manager.add_recent_file(study_root)
+        self.main_window.update_recent_menu()
+        if not self._check_large_files([row["file_path"] for row in instances]):
+            return
+
+        captured = list(instances)
+
+        def load_indexed_study(cb):
+            return load_indexed_instances(self.dicom_loader, captured, progress_callback=cb)
+
+        self._on_pipeline_start()
+        self._active_worker = run_load_pipeline_async(
+            LoadPipelineRequest(
+                loader_fn=load_indexed_study,
+                source_dir=study_root,
+                source_name=os.path.basename(study_root),
+                file_paths_for_merge=None,
+                loader=self.dicom_loader,
+                organizer=self.dicom_organizer,
+                loading_manager=self._loading_manager,
+                progress_max=len(captured),
+                main_window=self.main_window,
+                file_dialog=self.file_dialog,
+                load_first_slice_callback=self.load_first_slice_callback,
+                update_status_callback=self.update_status_callback,
+                check_compression_errors=False,
+                on_load_success=self._on_load_success_callback,
+            ),
+            on_pipeline_complete=self._on_pipeline_complete,
+        )
+
     def _get_first_study_series_by_dicom(
         self, studies: dict[str, Any]
     ) -> tuple[str, str] | None:
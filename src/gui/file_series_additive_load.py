@@ -168,7 +168,8 @@ def invalidate_fusion_resampler_caches_for_series(
 
     Additive loads grow series in-place; cached resampled volumes and sorted
     reference grids are keyed by series UID and become stale when slice count
-    changes without invalidation.
+    changes without invalidation. Persisted fusion volumes of the old slice
+    count can never be hit again, so they are removed as well.
     """
     if not series_uids:
         return
@@ -182,6 +183,8 @@ def invalidate_fusion_resampler_caches_for_series(
                 fusion_handler._slice_location_cache.pop(series_uid, None)
             if resampler:
                 resampler.clear_cache(series_uid=series_uid)
+            if hasattr(fusion_handler, "clear_alignment_cache"):
+                fusion_handler.clear_alignment_cache(series_uid, persistent=True)
 
 
 def refresh_appended_series_subwindows(app: Any, appended_series: list[tuple[str, str]]) -> None:
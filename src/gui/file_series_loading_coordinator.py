@@ -259,6 +259,12 @@ class FileSeriesLoadingCoordinator:
         show_additive_load_status(app, merge_result)
         finish_additive_load_side_effects(app)
 
+    def _on_load_started(self) -> None:
+        """Callback just before an async load starts: idle MPR pre-build yields to it."""
+        mpr_controller = getattr(self.app, "_mpr_controller", None)
+        if mpr_controller is not None:
+            mpr_controller.cancel_standard_plane_prebuild()
+
     def _on_load_complete(self, datasets, studies) -> None:
         """Callback for async pipeline completion. Updates app state."""
         if datasets is not None and studies is not None:
@@ -270,6 +276,10 @@ class FileSeriesLoadingCoordinator:
                 for study_uid in studies:
                     study_cache.mark_accessed(study_uid)
             self.app._schedule_tag_export_union_rebuild()
+        # Also after a failed or cancelled load: the pre-build was cancelled when it began.
+        mpr_controller = getattr(self.app, "_mpr_controller", None)
+        if mpr_controller is not None:
+            mpr_controller.schedule_standard_plane_prebuild()
 
     def open_files(self) -> None:
         """Body in ``file_path_actions``."""
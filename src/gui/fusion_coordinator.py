@@ -27,7 +27,9 @@ from pydicom.dataset import Dataset
 from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QMessageBox
 
+from core.fusion_compositor import FusionLutCompositor
 from core.fusion_handler import FusionHandler, OverlayMatchResult
+from core.fusion_overlay_map import OverlayAlignmentMap
 from core.fusion_processor import FusionProcessor
 from gui.fusion_controls_widget import FusionControlsWidget
 from utils.debug_flags import DEBUG_OFFSET, DEBUG_SPATIAL_ALIGNMENT
@@ -101,6 +103,13 @@ class FusionCoordinator:
         # T3/T4).  None means no coverage hint is currently active.
         self._last_fusion_hint: str | None = None
 
+        # LUT blender with a reusable output buffer for this subwindow's fused
+        # slices; the fused PIL image copies out of it (RGB is never shared).
+        self._fusion_compositor = FusionLutCompositor()
+        # 2D-mode overlay resize + offset taps, rebuilt only when the
+        # alignment (shapes, spacing ratio, rounded offset) changes.
+        self._overlay_alignment_map = OverlayAlignmentMap()
+
         # Note: Signals are connected externally when subwindow gains focus
         # Do not auto-connect here to allow per-subwindow signal routing
 
@@ -920,6 +929,8 @@ class FusionCoordinator:
                 overlay_pixel_spacing=overlay_pixel_spacing,
                 translation_offset=translation_offset,
                 skip_2d_resize=actual_use_3d,
+                compositor=self._fusion_compositor,
+                overlay_map=self._overlay_alignment_map,
             )
             return self.fusion_processor.convert_array_to_pil_image(fused_array)
         except Exception as e:
@@ -11,6 +11,12 @@ Responsibilities:
     the normal DICOM display path for MPR slices).
   - Draws the "MPR – <Orientation>" banner using the overlay manager.
   - Disables ROI/measurement/annotation tools while a subwindow is in MPR mode.
+  - Interactive (on-demand) MPR: shows the view before the stack is built,
+    reslices planes when first displayed and fills the rest in the background.
+  - Opt-in idle pre-build: after a load completes, builds the standard
+    planes of loaded series into the cache at lowest priority
+    (``schedule_standard_plane_prebuild``); any user MPR work or series
+    load cancels it.
   - Provides ``is_mpr(idx)`` and ``clear_mpr(idx)`` for callers.
 
 Inputs:
@@ -36,7 +42,7 @@ from typing import Any
 
 import numpy as np
 from PIL import Image
-from PySide6.QtCore import QObject, Qt, QTimer, Signal
+from PySide6.QtCore import QObject, Qt, QThread, QTimer, Signal
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,
@@ -46,15 +52,23 @@ from PySide6.QtWidgets import (
 )
 
 from core.dicom_parser import DICOMParser
-from core.mpr_builder import MprBuilder, MprBuilderWorker, MprResult
+from core.mpr_builder import (
+    MprBuilder,
+    MprBuilderWorker,
+    MprPlaneFillWorker,
+    MprResult,
+)
 from core.mpr_cache import MprCache
 from core.mpr_combine_slice_count import normalize_mpr_combine_slice_count
+from core.mpr_compact_stack import compact_mpr_stack, source_is_integer
 from core.mpr_dicom_export import (
     MprDicomExportError,
     MprDicomExportOptions,
     write_mpr_series,
 )
-from core.mpr_stack_combine import apply_mpr_stack_combine
+from core.mpr_on_demand import OnDemandMprStack
+from core.mpr_prebuild import MprPrebuildWorker, plan_standard_plane_prebuild
+from core.mpr_stack_combine import MprSlabCombiner, apply_mpr_stack_combine
 from core.mpr_view_math import (
     array_to_pil,
     auto_window_level,
@@ -62,7 +76,7 @@ from core.mpr_view_math import (
     compute_mpr_combine_range,
 )
 from core.mpr_volume import (
-    MprVolume,
+    LazyMprVolume,
     MprVolumeError,
     get_orientation_groups,
     has_slice_location_fallback_available,
@@ -80,6 +94,9 @@ _logger = logging.getLogger(__name__)
 _TITLE_SAVE_MPR_DICOM = "Save MPR as DICOM"
 _TITLE_MPR_ERROR = "MPR Error"
 
+# Quiet period after a load completes before the idle pre-build starts (ms).
+_PREBUILD_IDLE_DELAY_MS = 2000
+
 def seed_mpr_combine_state(
     data: dict[str, Any], request: Any | None, output_thickness_mm: float
 ) -> None:
@@ -163,10 +180,19 @@ class MprController(QObject):
         """
         super().__init__()
         self._app = app
-        self._workers: dict[int, MprBuilderWorker] = {}  # idx → active worker
+        # idx → active build or on-demand plane fill worker
+        self._workers: dict[int, MprBuilderWorker | MprPlaneFillWorker] = {}
         self._cache: MprCache | None = None
         # MPR session detached from all panes (Clear Window); reassigned via drag-drop.
         self._detached_mpr_payload: dict[str, Any] | None = None
+        # Idle standard-plane pre-build (opt-in); cancelled workers are kept
+        # referenced until their thread has returned.
+        self._prebuild_worker: MprPrebuildWorker | None = None
+        self._retired_prebuild_workers: list[MprPrebuildWorker] = []
+        self._prebuild_timer = QTimer(self)
+        self._prebuild_timer.setSingleShot(True)
+        self._prebuild_timer.setInterval(_PREBUILD_IDLE_DELAY_MS)
+        self._prebuild_timer.timeout.connect(self._start_standard_plane_prebuild)
         self._init_cache()
 
     # ------------------------------------------------------------------
@@ -187,7 +213,11 @@ class MprController(QObject):
                 return
             cache_dir = self._app.config_manager.get_mpr_cache_path()
             max_mb = self._app.config_manager.get_mpr_cache_max_mb()
-            self._cache = MprCache(cache_dir=cache_dir, max_size_mb=max_mb)
+            self._cache = MprCache(
+                cache_dir=cache_dir,
+                max_size_mb=max_mb,
+                compress=self._cache_compression(),
+            )
             _mpr_log(f"Cache initialised: enabled=True max_mb={max_mb}")
         except Exception as exc:
             _logger.warning(
@@ -199,6 +229,7 @@ class MprController(QObject):
     def clear_persistent_cache(self) -> DeletionResult:
         """Clear active and legacy derived-pixel files with truthful counts."""
 
+        self.cancel_standard_plane_prebuild()
         self._cache = None
         result = self._app.config_manager.clear_mpr_cache_storage()
         if result.success and self._app.config_manager.get_mpr_cache_enabled():
@@ -206,6 +237,7 @@ class MprController(QObject):
                 self._cache = MprCache(
                     cache_dir=self._app.config_manager.get_mpr_cache_path(),
                     max_size_mb=self._app.config_manager.get_mpr_cache_max_mb(),
+                    compress=self._cache_compression(),
                 )
             except Exception as exc:
                 _logger.warning(
@@ -228,9 +260,90 @@ class MprController(QObject):
         if self._cache is None:
             self._init_cache()
             return
+        if not self._prebuild_enabled():
+            self.cancel_standard_plane_prebuild()
         self._cache.set_max_size_mb(
             self._app.config_manager.get_mpr_cache_max_mb()
         )
+        self._cache.set_compression(self._cache_compression())
+
+    def _cache_compression(self) -> bool:
+        """Configured opt-in for compressed (non-memory-mapped) cache entries."""
+        try:
+            return self._app.config_manager.get_mpr_cache_compression() is True
+        except Exception:
+            return False
+
+    # ------------------------------------------------------------------
+    # Idle pre-build of standard planes
+    # ------------------------------------------------------------------
+
+    def _prebuild_enabled(self) -> bool:
+        """True when the idle pre-build is opted into and the cache exists."""
+        if self._cache is None:
+            return False
+        try:
+            return self._app.config_manager.get_mpr_prebuild_enabled() is True
+        except Exception:
+            return False
+
+    def schedule_standard_plane_prebuild(self) -> None:
+        """
+        (Re)start the idle countdown for pre-building standard planes.
+
+        Called when a load completes and when user MPR work finishes. Any
+        running pre-build is cancelled; the next one re-plans from the cache,
+        so finished planes are not built again.
+        """
+        self.cancel_standard_plane_prebuild()
+        if self._prebuild_enabled():
+            self._prebuild_timer.start()
+
+    def cancel_standard_plane_prebuild(self) -> None:
+        """Stop the pending or running pre-build without waiting for its thread."""
+        self._prebuild_timer.stop()
+        worker = self._prebuild_worker
+        self._prebuild_worker = None
+        if worker is not None:
+            worker.cancel()
+            self._retired_prebuild_workers.append(worker)
+        self._retired_prebuild_workers = [
+            w for w in self._retired_prebuild_workers if not w.isFinished()
+        ]
+
+    def _start_standard_plane_prebuild(self) -> None:
+        """Plan and start the pre-build unless user MPR work is in flight."""
+        if not self._prebuild_enabled() or self._prebuild_worker is not None:
+            return
+        if self._workers:
+            # Yield to user builds; their completion reschedules the pre-build.
+            return
+        cache = self._cache
+        if cache is None:
+            return
+        max_bytes = int(self._app.config_manager.get_mpr_prebuild_max_mb()) * 1024 * 1024
+        jobs = plan_standard_plane_prebuild(
+            self._collect_loaded_series(), max_bytes, cache.has
+        )
+        if not jobs:
+            return
+        _mpr_log(f"Idle pre-build: jobs={len(jobs)} budget_mb={max_bytes >> 20}")
+        worker = MprPrebuildWorker(jobs, cache, max_bytes)
+
+        def on_finished(saved: list[str]) -> None:
+            if self._prebuild_worker is worker:
+                self._prebuild_worker = None
+            _mpr_log(f"Idle pre-build finished: saved={len(saved)}")
+
+        def on_error(msg: str) -> None:
+            if self._prebuild_worker is worker:
+                self._prebuild_worker = None
+            print_redacted(f"[MprController] MPR pre-build error: {msg}")
+
+        worker.finished.connect(on_finished)
+        worker.error.connect(on_error)
+        self._prebuild_worker = worker
+        worker.start(QThread.Priority.LowestPriority)
 
     # ------------------------------------------------------------------
     # Public API
@@ -492,6 +605,7 @@ class MprController(QObject):
         for key in (
             "is_mpr",
             "mpr_result",
+            "mpr_slab_combiner",
             "mpr_orientation",
             "mpr_slice_index",
             "mpr_source_dataset",
@@ -1024,12 +1138,24 @@ class MprController(QObject):
         managers: dict[str, Any],
     ) -> np.ndarray:
         """Combine raw planes then optionally rescale (order must be preserved)."""
+        stack = result.slices
+        if isinstance(stack, OnDemandMprStack):
+            # Background fill works outwards from the plane being viewed.
+            stack.focus = slice_index
+        enabled = bool(data.get("mpr_combine_enabled", False))
+        mode = str(data.get("mpr_combine_mode", "aip") or "aip")
+        n_planes = int(data.get("mpr_combine_slice_count", 4) or 4)
         raw_array = apply_mpr_stack_combine(
-            result.slices,
+            stack,
             slice_index,
-            enabled=bool(data.get("mpr_combine_enabled", False)),
-            mode=str(data.get("mpr_combine_mode", "aip") or "aip"),
-            n_planes=int(data.get("mpr_combine_slice_count", 4) or 4),
+            enabled=enabled,
+            mode=mode,
+            n_planes=n_planes,
+            combiner=(
+                self._mpr_slab_combiner(data, stack, mode, n_planes)
+                if enabled
+                else None
+            ),
         )
         view_state_manager = managers.get("view_state_manager")
         use_rescaled_values = bool(
@@ -1041,6 +1167,19 @@ class MprController(QObject):
             return raw_array
         return raw_array.astype(np.float32)
 
+    @staticmethod
+    def _mpr_slab_combiner(
+        data: dict[str, Any], stack: Any, mode: str, n_planes: int
+    ) -> MprSlabCombiner:
+        """Reuse (or rebuild) the slab accelerator for this stack and setting."""
+        combiner = data.get("mpr_slab_combiner")
+        if not isinstance(combiner, MprSlabCombiner) or not combiner.matches(
+            stack, mode, n_planes
+        ):
+            combiner = MprSlabCombiner(stack, mode, n_planes)
+            data["mpr_slab_combiner"] = combiner
+        return combiner
+
     def _display_mpr_apply_image_and_context(
         self,
         idx: int,
@@ -1208,6 +1347,7 @@ class MprController(QObject):
             target_idx: Subwindow to host the MPR view.
             request:    MprRequest from the dialog.
         """
+        self.cancel_standard_plane_prebuild()
         self._mpr_request_cancel_prior_worker(target_idx)
 
         resolved = self._mpr_request_resolve_datasets(request)
@@ -1215,12 +1355,12 @@ class MprController(QObject):
             return
         datasets_to_use, use_slice_location_fallback = resolved
 
-        volume = self._mpr_request_build_volume(
-            datasets_to_use, use_slice_location_fallback
+        # Cache hits only need the key inputs and the cached stack; the
+        # source volume (pixel decode + SimpleITK image) is built on first use.
+        volume = LazyMprVolume(
+            datasets_to_use,
+            use_slice_location_if_no_position=use_slice_location_fallback,
         )
-        if volume is None:
-            return
-
         _mpr_log(
             "MPR request: "
             f"target_window={target_idx} "
@@ -1236,6 +1376,14 @@ class MprController(QObject):
         if self._mpr_request_try_cache(target_idx, request, volume, datasets_to_use):
             return
 
+        volume = self._mpr_request_build_volume(volume)
+        if volume is None:
+            return
+
+        if getattr(request, "on_demand", False):
+            self._mpr_request_start_on_demand(target_idx, request, volume)
+            return
+
         self._mpr_request_start_worker(target_idx, request, volume)
 
     def _mpr_request_cancel_prior_worker(self, target_idx: int) -> None:
@@ -1294,15 +1442,10 @@ class MprController(QObject):
             datasets_to_use = groups[0][1]
         return datasets_to_use, use_slice_location_fallback
 
-    def _mpr_request_build_volume(
-        self, datasets_to_use: list[Any], use_slice_location_fallback: bool
-    ):
-        """Build ``MprVolume`` or show an error and return ``None``."""
+    def _mpr_request_build_volume(self, volume: LazyMprVolume):
+        """Build the deferred ``MprVolume`` or show an error and return ``None``."""
         try:
-            return MprVolume.from_datasets(
-                datasets_to_use,
-                use_slice_location_if_no_position=use_slice_location_fallback,
-            )
+            return volume.resolve()
         except MprVolumeError:
             QMessageBox.critical(
                 self._app.main_window,
@@ -1380,6 +1523,7 @@ class MprController(QObject):
             interpolation=request.interpolation,
             combine_mode=getattr(request, "combine_mode", "none"),
             slab_thickness_mm=float(getattr(request, "slab_thickness_mm", 0.0)),
+            build_workers=self._mpr_build_workers(),
         )
 
         progress_dlg = QProgressDialog(
@@ -1404,6 +1548,7 @@ class MprController(QObject):
         def on_finished(result: MprResult) -> None:
             progress_dlg.close()
             self._workers.pop(target_idx, None)
+            self.schedule_standard_plane_prebuild()
             _mpr_log(
                 f"Build finished for window {target_idx}: "
                 f"slices={result.n_slices} interpolation={result.interpolation}"
@@ -1430,6 +1575,7 @@ class MprController(QObject):
         def on_error(msg: str) -> None:
             progress_dlg.close()
             self._workers.pop(target_idx, None)
+            self.schedule_standard_plane_prebuild()
             if "cancelled" in msg.lower() or "canceled" in msg.lower():
                 return
             QMessageBox.critical(
@@ -1444,6 +1590,95 @@ class MprController(QObject):
         self._workers[target_idx] = worker
         worker.start()
 
+    def _mpr_request_start_on_demand(self, target_idx: int, request, volume) -> None:
+        """Activate an on-demand MPR at once and fill its planes in the background."""
+        try:
+            result = MprBuilder.create_on_demand_result(
+                source_volume=volume,
+                output_plane=request.output_plane,
+                output_spacing_mm=request.output_spacing_mm,
+                output_thickness_mm=request.output_thickness_mm,
+                interpolation=request.interpolation,
+            )
+        except MprVolumeError as exc:
+            QMessageBox.critical(
+                self._app.main_window,
+                _TITLE_MPR_ERROR,
+                f"MPR build failed:\n{exc}",
+            )
+            return
+        if self._get_image_viewer(target_idx) is None:
+            QMessageBox.critical(
+                self._app.main_window,
+                _TITLE_MPR_ERROR,
+                "Cannot activate MPR: image viewer not ready. Please try again.",
+            )
+            return
+        self._activate_mpr(
+            target_idx, result, request.orientation_label, request=request
+        )
+        self._start_mpr_plane_fill(target_idx, result)
+
+    def _start_mpr_plane_fill(self, idx: int, result: MprResult) -> None:
+        """
+        Complete an on-demand stack in a low-priority background thread.
+
+        The finished stack is written to the disk cache like a normal build,
+        fill progress is shown in the status bar, and the idle pre-build is
+        rescheduled once the fill ends.
+        """
+        if result.is_complete:
+            return
+        worker = MprPlaneFillWorker(result)
+
+        def on_progress(percent: int) -> None:
+            # Short timeout: a cancelled fill stops refreshing and the text clears.
+            self._show_status_message(f"Reslicing MPR planes… {percent}%", 2000)
+
+        def on_finished(done: MprResult) -> None:
+            if self._workers.get(idx) is worker:
+                self._workers.pop(idx, None)
+            self._show_status_message("MPR planes ready", 3000)
+            self.schedule_standard_plane_prebuild()
+            _mpr_log(f"On-demand fill finished for window {idx}: slices={done.n_slices}")
+            if isinstance(done.slices, OnDemandMprStack):
+                # Release the float32 fill buffer for the compact stack.
+                done.slices = compact_mpr_stack(
+                    done.slices.to_array(),
+                    integer_source=source_is_integer(done.source_volume.source_datasets),
+                )
+            if self._cache is not None:
+                try:
+                    self._cache.save(done)
+                except Exception as exc:
+                    print_redacted(f"[MprController] Cache save error: {exc}")
+
+        def on_error(msg: str) -> None:
+            if self._workers.get(idx) is worker:
+                self._workers.pop(idx, None)
+            self.schedule_standard_plane_prebuild()
+            print_redacted(f"[MprController] On-demand MPR fill error: {msg}")
+
+        worker.progress.connect(on_progress)
+        worker.finished.connect(on_finished)
+        worker.error.connect(on_error)
+        self._workers[idx] = worker
+        worker.start(QThread.Priority.LowPriority)
+
+    def _show_status_message(self, text: str, timeout_ms: int = 0) -> None:
+        """Show *text* in the main window status bar, if there is one."""
+        try:
+            self._app.main_window.statusBar().showMessage(text, timeout_ms)
+        except Exception:
+            pass
+
+    def _mpr_build_workers(self) -> int:
+        """Configured MPR build thread count (0 = one per CPU core)."""
+        try:
+            return int(self._app.config_manager.get_mpr_build_workers())
+        except Exception:
+            return 1
+
     # ------------------------------------------------------------------
     # Internal: activate MPR in a subwindow
     # ------------------------------------------------------------------
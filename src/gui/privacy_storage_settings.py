@@ -45,6 +45,12 @@ class PrivacyStorageSettingsPanel(QWidget):
         self.study_index_path = QLineEdit()
         self.mpr_cache_enabled = QCheckBox()
         self.mpr_cache_max_mb = QSpinBox()
+        self.mpr_cache_compression = QCheckBox()
+        self.mpr_build_workers = QSpinBox()
+        self.mpr_prebuild_enabled = QCheckBox()
+        self.mpr_prebuild_max_mb = QSpinBox()
+        self.fusion_cache_enabled = QCheckBox()
+        self.fusion_cache_max_mb = QSpinBox()
         self.recent_path_count = QLabel()
         self.diagnostics_enabled = QCheckBox()
         self._build_ui()
@@ -61,6 +67,7 @@ class PrivacyStorageSettingsPanel(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self._build_study_index_group())
         layout.addWidget(self._build_mpr_cache_group())
+        layout.addWidget(self._build_fusion_cache_group())
         layout.addWidget(self._build_recent_paths_group())
         layout.addWidget(self._build_diagnostics_group())
 
@@ -127,6 +134,41 @@ class PrivacyStorageSettingsPanel(QWidget):
         self.mpr_cache_max_mb.setSuffix(" MiB")
         self.mpr_cache_max_mb.setValue(self._config.get_mpr_cache_max_mb())
         form.addRow("Maximum retained:", self.mpr_cache_max_mb)
+        self.mpr_cache_compression.setText("Compress cached stacks")
+        self.mpr_cache_compression.setObjectName("mprCacheCompression")
+        self.mpr_cache_compression.setToolTip(
+            "Store new cache entries losslessly compressed. They use less disk "
+            "but take longer to reopen than uncompressed, memory-mapped entries."
+        )
+        self.mpr_cache_compression.setChecked(self._config.get_mpr_cache_compression())
+        form.addRow(self.mpr_cache_compression)
+        self.mpr_build_workers.setRange(0, 64)
+        self.mpr_build_workers.setSpecialValueText("Auto (one per CPU core)")
+        self.mpr_build_workers.setObjectName("mprBuildWorkers")
+        self.mpr_build_workers.setToolTip(
+            "Threads used to resample an MPR stack. 1 builds serially; higher "
+            "values split the output into slabs built in parallel."
+        )
+        self.mpr_build_workers.setValue(self._config.get_mpr_build_workers())
+        form.addRow("Build threads:", self.mpr_build_workers)
+        self.mpr_prebuild_enabled.setText("Pre-build standard planes when idle")
+        self.mpr_prebuild_enabled.setObjectName("mprPrebuildEnabled")
+        self.mpr_prebuild_enabled.setToolTip(
+            "After a series loads, build its axial, coronal and sagittal MPR "
+            "into the cache in the background so opening them is instant. "
+            "Stops as soon as you start MPR work or load a series."
+        )
+        self.mpr_prebuild_enabled.setChecked(self._config.get_mpr_prebuild_enabled())
+        form.addRow(self.mpr_prebuild_enabled)
+        self.mpr_prebuild_max_mb.setRange(64, 16384)
+        self.mpr_prebuild_max_mb.setSuffix(" MiB")
+        self.mpr_prebuild_max_mb.setObjectName("mprPrebuildMaxMb")
+        self.mpr_prebuild_max_mb.setToolTip(
+            "Memory one idle pre-build may use across all the planes it builds; "
+            "series that do not fit in what is left are skipped."
+        )
+        self.mpr_prebuild_max_mb.setValue(self._config.get_mpr_prebuild_max_mb())
+        form.addRow("Pre-build memory limit:", self.mpr_prebuild_max_mb)
         form.addRow(
             "Location:", self._location_label(str(self._config.get_mpr_cache_path()))
         )
@@ -136,6 +178,34 @@ class PrivacyStorageSettingsPanel(QWidget):
         form.addRow(clear_button)
         return group
 
+    def _build_fusion_cache_group(self) -> QGroupBox:
+        group = QGroupBox("Fusion resampled-volume disk cache")
+        form = QFormLayout(group)
+        disclosure = QLabel(
+            "When enabled, overlay volumes resampled onto the base series for 3D "
+            "fusion are retained locally to speed reopening the same pair. It is "
+            "off until you opt in. Disabling clears it."
+        )
+        disclosure.setWordWrap(True)
+        form.addRow(disclosure)
+        self.fusion_cache_enabled.setText("Enable persistent fusion cache")
+        self.fusion_cache_enabled.setObjectName("fusionCacheEnabled")
+        self.fusion_cache_enabled.setChecked(self._config.get_fusion_cache_enabled())
+        form.addRow(self.fusion_cache_enabled)
+        self.fusion_cache_max_mb.setRange(16, 4096)
+        self.fusion_cache_max_mb.setSuffix(" MiB")
+        self.fusion_cache_max_mb.setObjectName("fusionCacheMaxMb")
+        self.fusion_cache_max_mb.setValue(self._config.get_fusion_cache_max_mb())
+        form.addRow("Maximum retained:", self.fusion_cache_max_mb)
+        form.addRow(
+            "Location:", self._location_label(str(self._config.get_fusion_cache_path()))
+        )
+        clear_button = QPushButton("Clear fusion cache now")
+        clear_button.setObjectName("clearFusionCacheButton")
+        clear_button.clicked.connect(self._clear_fusion_cache)
+        form.addRow(clear_button)
+        return group
+
     def _build_recent_paths_group(self) -> QGroupBox:
         group = QGroupBox("Remembered file locations")
         form = QFormLayout(group)
@@ -190,6 +260,18 @@ class PrivacyStorageSettingsPanel(QWidget):
         mpr_enabled = self.mpr_cache_enabled.isChecked()
         if not self._config.set_mpr_cache_max_mb(self.mpr_cache_max_mb.value()):
             return self._settings_not_saved()
+        if not self._config.set_mpr_cache_compression(
+            self.mpr_cache_compression.isChecked()
+        ):
+            return self._settings_not_saved()
+        if not self._config.set_mpr_build_workers(self.mpr_build_workers.value()):
+            return self._settings_not_saved()
+        if not self._config.set_mpr_prebuild_enabled(
+            self.mpr_prebuild_enabled.isChecked()
+        ):
+            return self._settings_not_saved()
+        if not self._config.set_mpr_prebuild_max_mb(self.mpr_prebuild_max_mb.value()):
+            return self._settings_not_saved()
         if not self._config.set_mpr_cache_enabled(mpr_enabled):
             return self._settings_not_saved()
         if was_mpr_enabled and not mpr_enabled:
@@ -197,6 +279,17 @@ class PrivacyStorageSettingsPanel(QWidget):
             if not result.success:
                 self._show_deletion_result("MPR Cache Not Fully Cleared", result)
                 return False
+        was_fusion_enabled = self._config.get_fusion_cache_enabled()
+        fusion_enabled = self.fusion_cache_enabled.isChecked()
+        if not self._config.set_fusion_cache_max_mb(self.fusion_cache_max_mb.value()):
+            return self._settings_not_saved()
+        if not self._config.set_fusion_cache_enabled(fusion_enabled):
+            return self._settings_not_saved()
+        if was_fusion_enabled and not fusion_enabled:
+            result = self._config.clear_fusion_cache_storage()
+            if not result.success:
+                self._show_deletion_result("Fusion Cache Not Fully Cleared", result)
+                return False
         diagnostics_enabled = self.diagnostics_enabled.isChecked()
         if not self._config.set_diagnostics_enabled(diagnostics_enabled):
             return self._settings_not_saved()
@@ -272,6 +365,12 @@ class PrivacyStorageSettingsPanel(QWidget):
             self._clear_mpr_cache_without_notice(),
         )
 
+    def _clear_fusion_cache(self) -> None:
+        self._show_deletion_result(
+            "Fusion Cache Not Fully Cleared",
+            self._config.clear_fusion_cache_storage(),
+        )
+
     def _clear_recent_paths(self) -> None:
         if self._config.clear_recent_path_history():
             self.recent_path_count.setText("0")
@@ -218,7 +218,9 @@ def build_managers_for_subwindow(
         ),
         hide_roi_statistics_overlays=managers["roi_coordinator"].hide_roi_statistics_overlays,
     )
-    managers["fusion_handler"] = FusionHandler()
+    managers["fusion_handler"] = FusionHandler(
+        disk_cache=getattr(app, "fusion_volume_cache", None)
+    )
     managers["fusion_coordinator"] = FusionCoordinator(
         managers["fusion_handler"],
         app.fusion_processor,
@@ -146,9 +146,13 @@ def auto_detail_target(renderer: Any, *, steep: bool, mode_count: int) -> tuple[
 
 
 def apply_interaction_detail(widget: Any, *, low: bool) -> None:
-    """Keep slow automatic previews at Fast through interaction events."""
+    """Keep slow automatic previews at Fast through interaction events.
+
+    Slow previews also rotate on the coarsest pyramid level of large volumes.
+    """
     if widget._auto_refine_suppressed or (low and widget._first_paint_pending):
         widget._renderer.set_temporary_quality("Fast")
+        widget._renderer.set_interactive_level(low, preview_slow=True)
     else:
         widget._renderer.set_interactive_quality(low)
 
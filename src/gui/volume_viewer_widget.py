@@ -143,6 +143,11 @@ class VolumeViewerWidget(QWidget):
         self._render_timer.setSingleShot(True)
         self._render_timer.setInterval(80)
         self._render_timer.timeout.connect(self._render)
+        # Debounce sub-volume extraction while the crop box is dragged.
+        self._crop_timer = QTimer(self)
+        self._crop_timer.setSingleShot(True)
+        self._crop_timer.setInterval(250)
+        self._crop_timer.timeout.connect(self._apply_crop_subvolume)
         setup_first_paint_state(self)
         self._setup_ui()
 
@@ -715,6 +720,15 @@ class VolumeViewerWidget(QWidget):
         self._reset_crop_btn.setEnabled(False)
         crop_row.addWidget(self._reset_crop_btn)
         advanced_layout.addLayout(crop_row)
+        self._crop_subvolume_cb = QCheckBox("Render crop only", self._advanced_group)
+        self._crop_subvolume_cb.setToolTip(
+            "Send only the voxels inside the crop box to the renderer, at full "
+            "resolution.  Small regions stay at the selected Detail while "
+            "rotating, even on CPU rendering."
+        )
+        self._crop_subvolume_cb.setEnabled(False)
+        self._crop_subvolume_cb.stateChanged.connect(self._on_crop_subvolume_toggled)
+        advanced_layout.addWidget(self._crop_subvolume_cb)
 
         # Render status readout (T7).
         self._render_status_label = QLabel("", self._advanced_group)
@@ -1440,6 +1454,7 @@ class VolumeViewerWidget(QWidget):
     def _on_crop_toggled(self, state: int) -> None:
         enabled = state == Qt.CheckState.Checked.value
         self._reset_crop_btn.setEnabled(enabled)
+        self._crop_subvolume_cb.setEnabled(enabled)
         if enabled:
             self._enable_crop_box()
         else:
@@ -1479,6 +1494,8 @@ class VolumeViewerWidget(QWidget):
         """Hide the box widget and remove clipping planes."""
         if hasattr(self, "_box_widget") and self._box_widget is not None:
             self._box_widget.Off()
+        self._crop_timer.stop()
+        self._renderer.set_crop_subvolume(None)
         self._renderer.clear_cropping()
         self._render()
 
@@ -1496,6 +1513,28 @@ class VolumeViewerWidget(QWidget):
             self._renderer.set_cropping(plane_list)
         except Exception:
             pass
+        if self._crop_subvolume_cb.isChecked():
+            self._crop_timer.start()
+
+    def _on_crop_subvolume_toggled(self, _state: int) -> None:
+        self._crop_timer.stop()
+        self._apply_crop_subvolume()
+
+    def _apply_crop_subvolume(self) -> None:
+        """Extract the crop-box region for the mapper (or restore the full volume)."""
+        bounds = None
+        box_widget = getattr(self, "_box_widget", None)
+        if (
+            self._crop_cb.isChecked()
+            and self._crop_subvolume_cb.isChecked()
+            and box_widget is not None
+        ):
+            try:
+                bounds = tuple(box_widget.GetRepresentation().GetBounds())
+            except Exception:
+                bounds = None
+        if self._renderer.set_crop_subvolume(bounds):
+            self._render_timer.start()
 
     def _current_preset_object(self) -> TransferFunctionPreset | None:
         """Return the built-in preset backing the current selection, or None."""
@@ -1655,6 +1694,7 @@ class VolumeViewerWidget(QWidget):
             return
         self._cleaned_up = True
         stop_first_paint_timers(self)
+        self._crop_timer.stop()
         self._initialized = False
         if DEBUG_VOLUME_3D:
             print("[DEBUG-VOLUME-3D] VolumeViewerWidget.cleanup() called from:")
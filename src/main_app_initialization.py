@@ -192,6 +192,10 @@ class InitializationMixin:
         # Lazy import: defers heavy matplotlib/fusion import chain until first use
         from core.fusion_processor import FusionProcessor
         self.fusion_processor = FusionProcessor()
+        # Opt-in persistent cache of resampled overlay volumes, shared by the
+        # per-subwindow FusionHandlers (None when disabled).
+        from core.fusion_cache import open_fusion_cache
+        self.fusion_volume_cache = open_fusion_cache(self.config_manager)
         self.fusion_controls_widget = FusionControlsWidget(config_manager=self.config_manager)
 
         # Shared overlay manager (each subwindow also has its own copy)
@@ -55,6 +55,50 @@ class PrivacyStorageConfigMixin:
             "mpr_cache_max_mb", max(16, min(4096, int(max_mb)))
         )
 
+    def get_mpr_cache_compression(self) -> bool:
+        """Return whether new MPR cache entries are stored zlib-compressed."""
+
+        return self._config().get("mpr_cache_compression", False) is True
+
+    def set_mpr_cache_compression(self, enabled: bool) -> bool:
+        return self._persist_privacy_value("mpr_cache_compression", enabled is True)
+
+    def get_mpr_build_workers(self) -> int:
+        """Return the MPR build thread count (0 = one per CPU core)."""
+
+        raw = self._config().get("mpr_build_workers", 1)
+        try:
+            return max(0, min(64, int(raw)))
+        except (TypeError, ValueError):
+            return 1
+
+    def set_mpr_build_workers(self, workers: int) -> bool:
+        return self._persist_privacy_value(
+            "mpr_build_workers", max(0, min(64, int(workers)))
+        )
+
+    def get_mpr_prebuild_enabled(self) -> bool:
+        """Return whether standard MPR planes are pre-built into the cache when idle."""
+
+        return self._config().get("mpr_prebuild_enabled", False) is True
+
+    def set_mpr_prebuild_enabled(self, enabled: bool) -> bool:
+        return self._persist_privacy_value("mpr_prebuild_enabled", enabled is True)
+
+    def get_mpr_prebuild_max_mb(self) -> int:
+        """Return the peak-memory budget (MiB) of one idle MPR pre-build job."""
+
+        raw = self._config().get("mpr_prebuild_max_mb", 1024)
+        try:
+            return max(64, min(16384, int(raw)))
+        except (TypeError, ValueError):
+            return 1024
+
+    def set_mpr_prebuild_max_mb(self, max_mb: int) -> bool:
+        return self._persist_privacy_value(
+            "mpr_prebuild_max_mb", max(64, min(16384, int(max_mb)))
+        )
+
     def get_mpr_cache_path(self) -> Path:
         """Return the private internal location for derived MPR pixels."""
 
@@ -69,7 +113,48 @@ class PrivacyStorageConfigMixin:
         for directory in (self.get_mpr_cache_path(), legacy):
             if not directory.exists():
                 continue
-            for pattern in ("*.npz", "*_meta.json", ".mpr-cache-*.tmp"):
+            for pattern in ("*.npy", "*.npz", "*_meta.json", ".mpr-cache-*.tmp"):
+                for path in directory.glob(pattern):
+                    if path.is_file() and not path.is_symlink():
+                        try:
+                            removed += int(secure_unlink(path))
+                        except OSError:
+                            failed += 1
+        return DeletionResult(removed=removed, failed=failed)
+
+    def get_fusion_cache_enabled(self) -> bool:
+        """Return whether resampled fusion overlay volumes are kept on disk."""
+
+        return self._config().get("fusion_cache_enabled", False) is True
+
+    def set_fusion_cache_enabled(self, enabled: bool) -> bool:
+        return self._persist_privacy_value("fusion_cache_enabled", enabled is True)
+
+    def get_fusion_cache_max_mb(self) -> int:
+        raw = self._config().get("fusion_cache_max_mb", 500)
+        try:
+            return max(16, min(4096, int(raw)))
+        except (TypeError, ValueError):
+            return 500
+
+    def set_fusion_cache_max_mb(self, max_mb: int) -> bool:
+        return self._persist_privacy_value(
+            "fusion_cache_max_mb", max(16, min(4096, int(max_mb)))
+        )
+
+    def get_fusion_cache_path(self) -> Path:
+        """Return the private internal location for resampled fusion volumes."""
+
+        return self._privacy_storage_root() / "fusion-cache"
+
+    def clear_fusion_cache_storage(self) -> DeletionResult:
+        """Delete owned fusion cache files and report the removal counts."""
+
+        removed = 0
+        failed = 0
+        directory = self.get_fusion_cache_path()
+        if directory.exists():
+            for pattern in ("*.npy", "*_meta.json", ".fusion-cache-*.tmp"):
                 for path in directory.glob(pattern):
                     if path.is_file() and not path.is_symlink():
                         try:
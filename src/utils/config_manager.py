@@ -250,6 +250,13 @@ class ConfigManager(
             # MPR cache
             "mpr_cache_enabled": False,
             "mpr_cache_max_mb": 500,
+            "mpr_cache_compression": False,
+            "mpr_build_workers": 1,
+            "mpr_prebuild_enabled": False,
+            "mpr_prebuild_max_mb": 1024,
+            # Fusion resampled-volume cache
+            "fusion_cache_enabled": False,
+            "fusion_cache_max_mb": 500,
             # Optional redacted diagnostics
             "diagnostics_enabled": False,
             # Local study index (SQLCipher; see core/study_index)
@@ -0,0 +1,143 @@
+"""
+Tests for ``core.fusion_cache`` — persistent resampled fusion overlay volumes.
+
+Entries must round-trip as float32 memory maps with their grid geometry,
+respect the LRU size limit, be invalidated per series, and be reused by
+``ImageResampler`` only while the base grid still matches.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+from core.fusion_cache import FusionCache, make_fusion_cache_key
+
+
+def _geometry(shape: tuple[int, int, int]) -> dict:
+    n, rows, cols = shape
+    return {
+        "size": [cols, rows, n],
+        "origin": [0.0, 0.0, 0.0],
+        "spacing": [1.0, 1.0, 1.0],
+        "direction": [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+    }
+
+
+def _volume(shape=(3, 4, 5), value: float = 1.5) -> np.ndarray:
+    return np.full(shape, value, dtype=np.float32)
+
+
+def test_key_depends_on_pair_counts_and_interpolator() -> None:
+    key = make_fusion_cache_key("pet", "ct", 10, 20, "linear")
+    assert key == make_fusion_cache_key("pet", "ct", 10, 20, "LINEAR")
+    assert key != make_fusion_cache_key("ct", "pet", 10, 20, "linear")
+    assert key != make_fusion_cache_key("pet", "ct", 11, 20, "linear")
+    assert key != make_fusion_cache_key("pet", "ct", 10, 20, "nearest")
+
+
+def test_save_and_load_round_trip_as_memmap(tmp_path: Path) -> None:
+    cache = FusionCache(tmp_path, max_size_mb=10)
+    volume = np.arange(60, dtype=np.float32).reshape(3, 4, 5)
+    key = make_fusion_cache_key("pet", "ct", 3, 3, "linear")
+
+    assert cache.save(key, volume, _geometry(volume.shape), ("pet", "ct"))
+    assert cache.has(key)
+    loaded, meta = cache.load(key)
+    assert isinstance(loaded, np.memmap) and loaded.dtype == np.float32
+    np.testing.assert_array_equal(loaded, volume)
+    assert meta["size"] == [5, 4, 3]
+    assert "pet" not in str(meta["series_keys"])
+
+    reopened = FusionCache(tmp_path, max_size_mb=10)
+    assert reopened.entry_count() == 1 and reopened.has(key)
+
+
+def test_lru_eviction_and_series_invalidation(tmp_path: Path) -> None:
+    cache = FusionCache(tmp_path, max_size_mb=2)
+    shape = (48, 64, 64)  # 0.75 MiB per entry: two fit
+    keys = [make_fusion_cache_key(f"pet{i}", "ct", 48, 48, "linear") for i in range(3)]
+    assert cache.save(keys[0], _volume(shape), _geometry(shape), ("pet0", "ct"))
+    assert cache.save(keys[1], _volume(shape), _geometry(shape), ("pet1", "ct"))
+    cache.load(keys[0])  # keys[1] becomes the least recently used entry
+    assert cache.save(keys[2], _volume(shape), _geometry(shape), ("pet2", "ct"))
+    assert not cache.has(keys[1])
+    assert cache.has(keys[0]) and cache.has(keys[2])
+
+    assert cache.invalidate("pet2") == 1
+    assert cache.invalidate("ct") == 1
+    assert cache.entry_count() == 0
+
+
+def test_rejects_volume_not_matching_geometry(tmp_path: Path) -> None:
+    cache = FusionCache(tmp_path, max_size_mb=10)
+    key = make_fusion_cache_key("pet", "ct", 3, 3, "linear")
+    assert not cache.save(key, _volume((2, 4, 5)), _geometry((3, 4, 5)), ("pet", "ct"))
+    assert not cache.has(key)
+    assert list(tmp_path.glob(".fusion-cache-*.tmp")) == []
+
+
+def _series(values, z_step: float = 1.0) -> list[Dataset]:
+    datasets = []
+    for i, value in enumerate(values):
+        ds = Dataset()
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        ds.SOPInstanceUID = generate_uid()
+        ds.Rows, ds.Columns = 4, 4
+        ds.SamplesPerPixel = 1
+        ds.PhotometricInterpretation = "MONOCHROME2"
+        ds.PixelRepresentation = 0
+        ds.BitsAllocated = ds.BitsStored = 16
+        ds.HighBit = 15
+        ds.PixelData = np.full((4, 4), value, dtype=np.uint16).tobytes()
+        ds.ImagePositionPatient = [0.0, 0.0, z_step * i]
+        ds.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+        ds.PixelSpacing = [1.0, 1.0]
+        ds.SliceThickness = z_step
+        datasets.append(ds)
+    return datasets
+
+
+@pytest.mark.parametrize("background_fill", [False, True])
+def test_resampler_reuses_persisted_volume(tmp_path: Path, background_fill: bool, monkeypatch) -> None:
+    pytest.importorskip("SimpleITK")
+    from core.image_resampler import ImageResampler
+
+    cache = FusionCache(tmp_path, max_size_mb=10)
+    reference = _series([1, 2, 3])
+    overlay = _series([10, 20, 30])
+    kwargs = {"overlay_series_uid": "pet", "reference_series_uid": "ct"}
+
+    first = ImageResampler(background_fill=background_fill, disk_cache=cache)
+    want = first.get_resampled_slice(overlay, reference, 1, **kwargs)
+    assert first.wait_for_background_fill(timeout=30)
+    assert cache.entry_count() == 1
+
+    second = ImageResampler(background_fill=background_fill, disk_cache=cache)
+    monkeypatch.setattr(
+        second, "dicom_series_to_sitk", lambda *_a, **_k: pytest.fail("resampled again")
+    )
+    got = second.get_resampled_slice(overlay, reference, 1, **kwargs)
+    np.testing.assert_allclose(got, want, atol=1e-4)
+    assert isinstance(second._numpy_cache[("pet", "ct", "linear")], np.memmap)
+
+
+def test_resampler_ignores_entry_for_different_base_grid(tmp_path: Path) -> None:
+    pytest.importorskip("SimpleITK")
+    from core.image_resampler import ImageResampler
+
+    cache = FusionCache(tmp_path, max_size_mb=10)
+    overlay = _series([10, 20, 30])
+    kwargs = {"overlay_series_uid": "pet", "reference_series_uid": "ct"}
+    ImageResampler(disk_cache=cache).get_resampled_slice(overlay, _series([1, 2, 3]), 0, **kwargs)
+
+    # Same keys and counts, but the base slices moved: the entry must not be used.
+    shifted = _series([1, 2, 3], z_step=0.5)
+    resampler = ImageResampler(disk_cache=cache)
+    result = resampler.get_resampled_slice(overlay, shifted, 2, **kwargs)
+    np.testing.assert_allclose(result, np.full((4, 4), 20.0), atol=1e-4)
@@ -85,14 +85,14 @@ def test_get_file_paths_available(monkeypatch) -> None:
 def test_schedule_skips_when_cancelled() -> None:
     svc = _service()
     svc.schedule_index_after_load([], [], "/src", MagicMock(), was_cancelled=True)
-    assert svc._write_thread is None
+    assert svc._writer is None
 
 
 def test_schedule_skips_when_auto_add_off() -> None:
     svc = _service()
     svc._config.get_study_index_auto_add_on_open.return_value = False
     svc.schedule_index_after_load([MagicMock()], ["/x.dcm"], "/src", MagicMock())
-    assert svc._write_thread is None
+    assert svc._writer is None
 
 
 def test_schedule_force_indexes_when_auto_add_off(monkeypatch) -> None:
@@ -105,15 +105,20 @@ def test_schedule_force_indexes_when_auto_add_off(monkeypatch) -> None:
     started = {}
 
     class _FakeThread:
-        def __init__(self, *a, **k) -> None:
+        def __init__(self, db_path, *a, **k) -> None:
+            self.db_path = db_path
             started["created"] = True
 
         def isRunning(self):
-            return False
+            return started.get("started", False)
 
         def start(self):
             started["started"] = True
 
+        def enqueue(self, rows):
+            started.setdefault("rows", []).extend(rows)
+            return True
+
     monkeypatch.setattr(isvc, "StudyIndexWriteThread", _FakeThread)
     # "Add this one time" path: force=True indexes despite auto-add being off.
     svc.schedule_index_after_load(
@@ -132,18 +137,71 @@ def test_schedule_builds_rows_and_starts_thread(monkeypatch) -> None:
     started = {}
 
     class _FakeThread:
-        def __init__(self, *a, **k) -> None:
+        def __init__(self, db_path, *a, **k) -> None:
+            self.db_path = db_path
             started["created"] = True
 
         def isRunning(self):
-            return False
+            return started.get("started", False)
 
         def start(self):
             started["started"] = True
 
+        def enqueue(self, rows):
+            started.setdefault("rows", []).extend(rows)
+            return True
+
     monkeypatch.setattr(isvc, "StudyIndexWriteThread", _FakeThread)
     svc.schedule_index_after_load([MagicMock()], ["/x.dcm"], "/src", MagicMock())
     assert started.get("started") is True
+    assert started["rows"] == [{"row": 1}]
+
+
+def test_schedule_queues_overlapping_loads_on_one_writer(monkeypatch) -> None:
+    svc = _service()
+    svc._config.get_study_index_auto_add_on_open.return_value = True
+    svc._config.get_study_index_db_path.return_value = "/tmp/idx.db"
+    monkeypatch.setattr(svc, "is_backend_available", lambda: True)
+    monkeypatch.setattr(svc, "_passphrase", lambda: "pw")
+    monkeypatch.setattr(isvc.os.path, "isfile", lambda p: True)
+    monkeypatch.setattr(
+        isvc, "dataset_to_index_row", lambda ds, *, file_path, **k: {"file_path": file_path}
+    )
+    writers = []
+
+    class _BusyWriter:
+        def __init__(self, db_path, *a, **k) -> None:
+            self.db_path = db_path
+            self.rows = []
+            writers.append(self)
+
+        def isRunning(self):
+            return True  # still committing the previous load
+
+        def start(self):
+            pass
+
+        def enqueue(self, rows):
+            self.rows.extend(rows)
+            return True
+
+        def stop(self, *, discard=False, timeout_s=None):
+            self.discarded = discard
+            self.timeout_s = timeout_s
+            return True
+
+    monkeypatch.setattr(isvc, "StudyIndexWriteThread", _BusyWriter)
+    svc.schedule_index_after_load([MagicMock()], ["/a.dcm"], "/src", MagicMock())
+    svc.schedule_index_after_load([MagicMock()], ["/b.dcm"], "/src2", MagicMock())
+
+    assert len(writers) == 1
+    assert [r["file_path"] for r in writers[0].rows] == ["/a.dcm", "/b.dcm"]
+
+    # Shutdown drains the queue; clearing the index would discard it instead.
+    svc.shutdown(timeout_s=5.0)
+    assert writers[0].discarded is False
+    assert writers[0].timeout_s == 5.0
+    assert svc._writer is None
 
 
 def test_start_index_folder_connects_and_starts(monkeypatch) -> None:
@@ -176,14 +234,46 @@ def test_cancel_folder_index_sets_flag() -> None:
     assert svc._folder_cancel is True
 
 
-def test_clear_all_data_blocked_by_write_thread() -> None:
+def test_clear_all_data_blocked_by_folder_thread() -> None:
     svc = _service()
-    svc._write_thread = MagicMock()
-    svc._write_thread.isRunning.return_value = True
+    svc._folder_thread = MagicMock()
+    svc._folder_thread.isRunning.return_value = True
     result = svc.clear_all_data()
     assert result.failed == 1
 
 
+def test_clear_all_data_blocked_by_search_or_scan(monkeypatch) -> None:
+    svc = _service()
+    svc._config.get_study_index_db_path.return_value = "/tmp/idx.db"
+    unlinked: list = []
+    monkeypatch.setattr(isvc, "secure_unlink", lambda p: unlinked.append(p) or True)
+    results = []
+
+    class _ClearingStore(_FakeStore):
+        def search(self, **kwargs):
+            results.append(svc.clear_all_data())
+            return super().search(**kwargs)
+
+        search_grouped_studies = search
+
+    svc._get_ready_store = lambda: _ClearingStore()
+    svc.search_grouped_studies()
+    assert results[0].failed == 1 and not unlinked
+    assert svc.clear_all_data().removed == 4
+
+
+def test_clear_all_data_discards_queued_writes(monkeypatch) -> None:
+    svc = _service()
+    svc._config.get_study_index_db_path.return_value = "/tmp/idx.db"
+    monkeypatch.setattr(isvc, "secure_unlink", lambda p: True)
+    writer = MagicMock()
+    svc._writer = writer
+    result = svc.clear_all_data()
+    writer.stop.assert_called_once_with(discard=True, timeout_s=None)
+    assert svc._writer is None
+    assert result.removed == 4
+
+
 def test_clear_all_data_removes_files(monkeypatch) -> None:
     svc = _service()
     svc._config.get_study_index_db_path.return_value = "/tmp/idx.db"
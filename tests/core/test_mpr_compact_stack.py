@@ -0,0 +1,94 @@
+"""
+Tests for ``core.mpr_compact_stack`` — int16 / float16 MPR stack storage.
+
+Integral stacks must round-trip exactly; quantised stacks must stay within
+half a quantisation step; slab combine on a compact stack must match the
+combine of its dequantised planes.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from pydicom.dataset import Dataset
+
+from core.mpr_compact_stack import (
+    ENCODING_FLOAT16,
+    ENCODING_INT16,
+    CompactMprStack,
+    compact_mpr_stack,
+    source_is_integer,
+)
+from core.mpr_stack_combine import MprSlabCombiner, apply_mpr_stack_combine
+
+
+def _ct_stack(integral: bool) -> np.ndarray:
+    rng = np.random.default_rng(5)
+    stack = rng.integers(-1024, 3071, size=(9, 6, 7)).astype(np.float32)
+    if not integral:
+        stack += rng.random(stack.shape, dtype=np.float32)
+    return stack
+
+
+def test_integral_stack_is_exact_int16() -> None:
+    stack = _ct_stack(integral=True)
+    compact = compact_mpr_stack(stack)
+
+    assert isinstance(compact, CompactMprStack)
+    assert compact.encoding == ENCODING_INT16 and compact.is_exact
+    assert compact.nbytes * 2 == stack.nbytes
+    assert compact[2].dtype == np.float32
+    np.testing.assert_array_equal(compact.to_array(), stack)
+    np.testing.assert_array_equal(np.stack(compact[1:4]), stack[1:4])
+    np.testing.assert_array_equal(np.stack(list(compact)), stack)
+
+
+def test_interpolated_integer_source_is_quantised_int16() -> None:
+    stack = _ct_stack(integral=False)
+    compact = compact_mpr_stack(stack, integer_source=True)
+
+    assert compact.encoding == ENCODING_INT16 and not compact.is_exact
+    step = (float(stack.max()) - float(stack.min())) / 65535.0
+    assert compact.scale == pytest.approx(step)
+    assert np.max(np.abs(compact.to_array() - stack)) <= step
+
+
+def test_float_source_uses_float16_within_range() -> None:
+    stack = _ct_stack(integral=False) / 100.0
+    compact = compact_mpr_stack(stack, integer_source=False)
+    assert compact.encoding == ENCODING_FLOAT16
+    np.testing.assert_allclose(compact.to_array(), stack, rtol=1e-3)
+
+    too_wide = stack * 1e4
+    assert compact_mpr_stack(too_wide, integer_source=False).encoding == ENCODING_INT16
+
+
+def test_non_finite_and_constant_stacks() -> None:
+    stack = _ct_stack(integral=True)
+    stack[0, 0, 0] = np.nan
+    kept = compact_mpr_stack(stack)
+    assert isinstance(kept, list) and kept[0].dtype == np.float32
+
+    flat = np.full((3, 2, 2), 12.5, dtype=np.float32)
+    np.testing.assert_array_equal(compact_mpr_stack(flat).to_array(), flat)
+
+
+@pytest.mark.parametrize("mode", ["aip", "mip", "minip"])
+@pytest.mark.parametrize("integral", [True, False])
+def test_combine_on_compact_matches_dequantised_planes(mode: str, integral: bool) -> None:
+    compact = compact_mpr_stack(_ct_stack(integral))
+    planes = list(compact)
+    combiner = MprSlabCombiner(compact, mode, 4)
+    for index in range(len(planes)):
+        want = apply_mpr_stack_combine(planes, index, enabled=True, mode=mode, n_planes=4)
+        direct = apply_mpr_stack_combine(compact, index, enabled=True, mode=mode, n_planes=4)
+        np.testing.assert_allclose(direct, want, rtol=1e-5, atol=1e-3)
+        np.testing.assert_allclose(combiner.combine(index), want, rtol=1e-5, atol=1e-3)
+
+
+def test_source_is_integer() -> None:
+    ds = Dataset()
+    ds.PixelData = b"\x00\x00"
+    assert source_is_integer([ds])
+    ds.FloatPixelData = b"\x00\x00\x00\x00"
+    assert not source_is_integer([ds])
@@ -0,0 +1,185 @@
+"""
+Tests for ``core.mpr_on_demand`` — lazily resliced MPR stacks.
+
+On-demand planes must be pixel-identical to a full build; only the
+reslice timing changes.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+sitk = pytest.importorskip("SimpleITK")
+
+from core.mpr_builder import MprBuilder, MprPlaneFillWorker
+from core.mpr_on_demand import OnDemandMprStack
+from core.mpr_reslice import MprResliceEngine
+from core.mpr_stack_combine import apply_mpr_stack_combine
+from core.mpr_volume import MprVolume
+
+
+def _volume(shape=(12, 10, 9), spacing=(0.8, 0.7, 1.5)) -> object:
+    rng = np.random.default_rng(11)
+    arr = rng.integers(0, 2000, size=shape).astype(np.float32)
+    img = sitk.GetImageFromArray(arr)
+    img.SetSpacing(spacing)
+    img.SetOrigin((-3.0, 4.0, 10.0))
+    return img
+
+
+def _engine(plane_name: str = "sagittal") -> MprResliceEngine:
+    return MprResliceEngine(_volume(), MprBuilder.standard_planes()[plane_name], 0.9, 1.1)
+
+
+def _full(engine: MprResliceEngine) -> np.ndarray:
+    out = engine.allocate()
+    engine.reslice_into(out)
+    return out
+
+
+def test_index_reslices_only_requested_plane() -> None:
+    engine = _engine()
+    stack = OnDemandMprStack(engine)
+    full = _full(engine)
+
+    np.testing.assert_array_equal(stack[3], full[3])
+    assert stack.is_ready(3)
+    assert stack.ready_count() == 1
+    assert stack.plane_latency_ms is not None
+    np.testing.assert_array_equal(stack[-1], full[-1])
+    with pytest.raises(IndexError):
+        stack[len(stack)]
+
+
+def test_slicing_and_iteration_match_full_build() -> None:
+    engine = _engine("coronal")
+    stack = OnDemandMprStack(engine, fill_block=3)
+    full = _full(engine)
+
+    window = stack[2:6]
+    assert len(window) == 4
+    assert stack.ready_count() == 4
+    for got, want in zip(window, full[2:6], strict=True):
+        np.testing.assert_array_equal(got, want)
+
+    planes = list(stack)
+    assert stack.is_complete()
+    np.testing.assert_array_equal(np.stack(planes), full)
+    np.testing.assert_array_equal(stack.to_array(), full)
+
+
+def test_ensure_skips_ready_planes() -> None:
+    stack = OnDemandMprStack(_engine())
+    assert stack.ensure(1, 4) == 3
+    assert stack.ensure(0, 6) == 3
+    assert stack.ensure(0, 6) == 0
+
+
+def test_background_fill_starts_at_focus() -> None:
+    stack = OnDemandMprStack(_engine(), fill_block=2)
+    stack.focus = len(stack) - 1
+    first = stack.next_fill_block()
+    assert first is not None and first[1] == len(stack)
+
+    blocks = 0
+    while stack.fill_next_block():
+        blocks += 1
+    assert stack.is_complete()
+    assert stack.next_fill_block() is None
+    assert blocks == -(-len(stack) // 2)
+
+
+def test_fill_block_size_follows_latency_target() -> None:
+    stack = OnDemandMprStack(_engine(), target_block_ms=40.0)
+    assert stack.fill_block_size() == 1
+    stack._plane_ms = 10.0
+    assert stack.fill_block_size() == 4
+    stack._plane_ms = 100.0
+    assert stack.fill_block_size() == 1
+    stack._plane_ms = 1e-6
+    assert stack.fill_block_size() == stack._max_block
+    assert OnDemandMprStack(_engine(), fill_block=3).fill_block_size() == 3
+
+
+class _GatedEngine:
+    """Engine wrapper whose resample of plane 0 waits for a release event."""
+
+    def __init__(self, engine: MprResliceEngine) -> None:
+        self._engine = engine
+        self.shape = engine.shape
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def allocate(self) -> np.ndarray:
+        return self._engine.allocate()
+
+    def resample_range(self, start: int, stop: int) -> np.ndarray:
+        if start == 0:
+            self.started.set()
+            assert self.release.wait(5.0)
+        return self._engine.resample_range(start, stop)
+
+
+def test_reads_do_not_wait_for_other_fill_blocks() -> None:
+    engine = _engine()
+    gated = _GatedEngine(engine)
+    stack = OnDemandMprStack(gated, fill_block=3)  # type: ignore[arg-type]
+    full = _full(engine)
+    stack.focus = 0
+    filler = threading.Thread(target=stack.fill_next_block)
+    filler.start()
+    assert gated.started.wait(5.0)
+
+    # Plane 5 is outside the in-flight block: no wait behind the filler.
+    np.testing.assert_array_equal(stack[5], full[5])
+    assert not stack.is_ready(1)
+    gated.release.set()
+    # Plane 1 is being resliced by the filler: the read waits for it.
+    np.testing.assert_array_equal(stack[1], full[1])
+    filler.join(5.0)
+    assert stack.ready_count() == 4
+
+
+def test_combine_reads_through_on_demand_stack() -> None:
+    engine = _engine()
+    stack = OnDemandMprStack(engine)
+    full = list(_full(engine))
+    got = apply_mpr_stack_combine(stack, 4, enabled=True, mode="mip", n_planes=3)
+    want = apply_mpr_stack_combine(full, 4, enabled=True, mode="mip", n_planes=3)
+    np.testing.assert_array_equal(got, want)
+    assert stack.ready_count() == 3
+
+
+def test_on_demand_result_and_fill_worker() -> None:
+    vol = MprVolume.__new__(MprVolume)
+    vol.sitk_image = _volume()
+    vol.source_datasets = []
+    plane = MprBuilder.standard_planes()["coronal"]
+    built = MprBuilder.create_worker(vol, plane, 1.0, 1.0)._build()
+
+    result = MprBuilder.create_on_demand_result(vol, plane, 1.0, 1.0)
+    assert result.n_slices == built.n_slices
+    assert not result.is_complete
+    assert len(result.slice_stack.planes) == built.n_slices
+    np.testing.assert_allclose(
+        result.slice_stack.positions, built.slice_stack.positions
+    )
+
+    worker = MprPlaneFillWorker(result)
+    finished: list[object] = []
+    progress: list[int] = []
+    worker.finished.connect(finished.append)
+    worker.progress.connect(progress.append)
+    worker.run()
+
+    assert finished == [result]
+    assert result.is_complete
+    assert progress[-1] == 100
+    # Full builds are stored compactly: interpolated values are within one
+    # quantisation step of the float32 on-demand planes.
+    step = getattr(built.slices, "scale", 0.0)
+    for a, b in zip(result.slices, built.slices, strict=True):
+        np.testing.assert_allclose(a, b, rtol=0, atol=step)
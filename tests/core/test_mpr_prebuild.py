@@ -0,0 +1,169 @@
+"""
+Tests for ``core.mpr_prebuild`` — idle pre-build of standard MPR planes.
+
+Pre-built entries must be keyed exactly like the dialog's default request
+(so the request is a cache hit) and the planner must respect the memory
+budget and skip planes already cached.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("SimpleITK")
+
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+from core.mpr_builder import MprBuilder
+from core.mpr_cache import MprCache, _make_cache_key
+from core.mpr_prebuild import (
+    PREBUILD_PLANE_NAMES,
+    MprPrebuildWorker,
+    default_output_params,
+    estimate_prebuild_bytes,
+    plan_standard_plane_prebuild,
+)
+from core.mpr_reslice import MprResliceEngine
+from core.mpr_volume import MprVolume
+
+
+def _series(n_slices: int = 4, rows: int = 6, cols: int = 5, spacing=(0.8, 0.8)) -> list:
+    series_uid = generate_uid()
+    datasets = []
+    for i in range(n_slices):
+        ds = Dataset()
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        ds.SOPInstanceUID = generate_uid()
+        ds.SeriesInstanceUID = series_uid
+        ds.Modality = "CT"
+        ds.Rows, ds.Columns = rows, cols
+        ds.SamplesPerPixel = 1
+        ds.PhotometricInterpretation = "MONOCHROME2"
+        ds.PixelRepresentation = 0
+        ds.BitsAllocated = ds.BitsStored = 16
+        ds.HighBit = 15
+        ds.ImagePositionPatient = [0.0, 0.0, 1.5 * i]
+        ds.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+        ds.PixelSpacing = list(spacing)
+        ds.SliceThickness = 1.5
+        ds.InstanceNumber = i + 1
+        ds.PixelData = np.full((rows, cols), 10 * i, dtype=np.uint16).tobytes()
+        datasets.append(ds)
+    return datasets
+
+
+def _loaded(*series: list) -> dict:
+    return {f"s{i}": {"datasets": ds} for i, ds in enumerate(series)}
+
+
+def test_default_output_params_match_dialog_rounding() -> None:
+    ds = _series(1, spacing=(0.6543, 0.6543))[0]
+    assert default_output_params(ds) == (0.65, 1.5)
+    del ds.SliceThickness
+    assert default_output_params(ds) == (0.65, 0.65)
+
+
+def test_plan_orders_newest_first_and_skips_cached() -> None:
+    old, new = _series(), _series()
+    jobs = plan_standard_plane_prebuild(_loaded(old, new), 1 << 30, lambda _k: False)
+    assert [j.series_key for j in jobs] == ["s1"] * 3 + ["s0"] * 3
+    assert [j.plane_name for j in jobs[:3]] == list(PREBUILD_PLANE_NAMES)
+
+    expected = _make_cache_key(
+        series_uid=str(new[0].SeriesInstanceUID),
+        normal=MprBuilder.standard_planes()["coronal"].normal,
+        output_spacing_mm=0.8,
+        output_thickness_mm=1.5,
+        interpolation="linear",
+        source_dataset_count=len(new),
+    )
+    assert jobs[1].cache_key == expected
+
+    cached = {jobs[0].cache_key}
+    again = plan_standard_plane_prebuild(_loaded(old, new), 1 << 30, cached.__contains__)
+    assert len(again) == 5
+    assert jobs[0].cache_key not in {j.cache_key for j in again}
+
+
+def test_plan_respects_budget_and_eligibility() -> None:
+    big, small = _series(rows=64, cols=64), _series()
+    n_planes = len(PREBUILD_PLANE_NAMES)
+    budget = estimate_prebuild_bytes(small, 0.8, 1.5, n_planes)
+    assert estimate_prebuild_bytes(big, 0.8, 1.5, n_planes) > budget
+    jobs = plan_standard_plane_prebuild(_loaded(small, big), budget, lambda _k: False)
+    assert {j.series_key for j in jobs} == {"s0"}
+
+    no_geometry = _series()
+    for ds in no_geometry:
+        del ds.ImagePositionPatient
+        del ds.ImageOrientationPatient
+    assert not MprVolume.available(no_geometry)
+    assert plan_standard_plane_prebuild(_loaded(no_geometry), 1 << 30, lambda _k: False) == []
+
+
+def test_plan_budget_covers_the_whole_pass() -> None:
+    old, new = _series(), _series()
+    n_planes = len(PREBUILD_PLANE_NAMES)
+    one_series = estimate_prebuild_bytes(new, 0.8, 1.5, n_planes)
+    assert estimate_prebuild_bytes(new, 0.8, 1.5) < one_series
+    jobs = plan_standard_plane_prebuild(
+        _loaded(old, new), one_series + one_series // 2, lambda _k: False
+    )
+    assert [j.series_key for j in jobs] == ["s1"] * n_planes
+
+
+def test_worker_fills_cache_with_default_request_keys(tmp_path: Path) -> None:
+    cache = MprCache(cache_dir=tmp_path, max_size_mb=50)
+    jobs = plan_standard_plane_prebuild(_loaded(_series()), 1 << 30, cache.has)
+    worker = MprPrebuildWorker(jobs, cache, 1 << 30)
+    finished: list[object] = []
+    worker.finished.connect(finished.append)
+    worker.run()
+
+    assert finished == [[j.cache_key for j in jobs]]
+    assert all(cache.has(j.cache_key) for j in jobs)
+    slices, _stack, meta = cache.load(jobs[0].cache_key)
+    assert meta["interpolation"] == "linear"
+    assert len(slices) > 0
+
+
+def test_worker_skips_over_budget_and_stops_when_cancelled(tmp_path: Path) -> None:
+    cache = MprCache(cache_dir=tmp_path, max_size_mb=50)
+    jobs = plan_standard_plane_prebuild(_loaded(_series()), 1 << 30, cache.has)
+
+    tiny = MprPrebuildWorker(jobs, cache, 1)
+    tiny.run()
+    assert cache.entry_count() == 0
+
+    cancelled = MprPrebuildWorker(jobs, cache, 1 << 30)
+    finished: list[object] = []
+    cancelled.finished.connect(finished.append)
+    cancelled.cancel()
+    cancelled.run()
+    assert finished == []
+    assert cache.entry_count() == 0
+
+
+def test_worker_charges_budget_across_jobs(tmp_path: Path) -> None:
+    cache = MprCache(cache_dir=tmp_path, max_size_mb=50)
+    jobs = plan_standard_plane_prebuild(_loaded(_series()), 1 << 30, cache.has)
+    volume = MprVolume.from_datasets(jobs[0].datasets)
+    first = MprResliceEngine(
+        volume.sitk_image,
+        jobs[0].output_plane,
+        jobs[0].output_spacing_mm,
+        jobs[0].output_thickness_mm,
+    )
+    source_bytes = int(volume.sitk_image.GetNumberOfPixels()) * 4
+    output_bytes = int(np.prod(first.shape)) * 4
+
+    # Room for the source volume and one output stack, not a second stack.
+    worker = MprPrebuildWorker(jobs, cache, source_bytes + output_bytes)
+    worker.run()
+    assert cache.entry_count() == 1
+    assert cache.has(jobs[0].cache_key)
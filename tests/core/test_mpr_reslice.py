@@ -0,0 +1,137 @@
+"""
+Tests for ``core.mpr_reslice`` — chunked whole-grid MPR resampling.
+
+Chunked output must match one-plane-at-a-time resampling exactly, so the
+chunk size only changes call count, never pixels.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+sitk = pytest.importorskip("SimpleITK")
+
+from core.mpr_builder import MprBuilder
+from core.mpr_reslice import (
+    MprResliceEngine,
+    chunk_slices_for_grid,
+    reslice_parallel,
+    resolve_build_workers,
+    resolve_sitk_interpolator,
+)
+from core.mpr_volume import MprVolumeError
+
+
+def _volume(shape=(12, 10, 9), spacing=(0.8, 0.7, 1.5)) -> object:
+    rng = np.random.default_rng(7)
+    arr = rng.integers(0, 2000, size=shape).astype(np.float32)
+    img = sitk.GetImageFromArray(arr)
+    img.SetSpacing(spacing)
+    img.SetOrigin((-3.0, 4.0, 10.0))
+    return img
+
+
+@pytest.mark.parametrize("plane_name", ["axial", "coronal", "sagittal"])
+@pytest.mark.parametrize("interpolation", ["linear", "nearest"])
+def test_chunked_matches_single_plane_resample(plane_name: str, interpolation: str) -> None:
+    plane = MprBuilder.standard_planes()[plane_name]
+    engine = MprResliceEngine(_volume(), plane, 0.9, 1.1, interpolation)
+    n = engine.shape[0]
+
+    per_plane = np.stack([engine.resample_range(i, i + 1)[0] for i in range(n)])
+    chunked = engine.allocate()
+    engine.reslice_into(chunked, chunk_slices=4)
+    whole = engine.allocate()
+    engine.reslice_into(whole)
+
+    assert chunked.dtype == np.float32
+    np.testing.assert_array_equal(chunked, per_plane)
+    np.testing.assert_array_equal(whole, per_plane)
+    assert np.count_nonzero(whole) > 0
+
+
+def test_reslice_into_partial_range_reports_chunks() -> None:
+    engine = MprResliceEngine(_volume(), MprBuilder.standard_planes()["sagittal"], 1.0, 1.0)
+    out = engine.allocate()
+    counts: list[int] = []
+    engine.reslice_into(out, start=2, stop=7, chunk_slices=2, on_chunk_done=counts.append)
+
+    assert counts == [2, 2, 1]
+    assert not out[:2].any()
+    assert not out[7:].any()
+    np.testing.assert_array_equal(out[2:7], engine.resample_range(2, 7))
+
+
+def test_reslice_into_stops_between_chunks_when_cancelled() -> None:
+    engine = MprResliceEngine(_volume(), MprBuilder.standard_planes()["coronal"], 1.0, 1.0)
+    out = engine.allocate()
+    calls: list[int] = []
+
+    def _cancel_after_first() -> bool:
+        return len(calls) >= 1
+
+    with pytest.raises(MprVolumeError, match="cancelled"):
+        engine.reslice_into(
+            out, chunk_slices=1, is_cancelled=_cancel_after_first, on_chunk_done=calls.append
+        )
+    assert calls == [1]
+
+
+@pytest.mark.parametrize("workers", [2, 3, 8])
+def test_reslice_parallel_matches_serial(workers: int) -> None:
+    plane = MprBuilder.standard_planes()["sagittal"]
+    serial_engine = MprResliceEngine(_volume(), plane, 0.9, 1.1)
+    serial = serial_engine.allocate()
+    serial_engine.reslice_into(serial)
+
+    engine = MprResliceEngine(_volume(), plane, 0.9, 1.1, threads_per_call=1)
+    out = engine.allocate()
+    counts: list[int] = []
+    reslice_parallel(engine, out, workers, chunk_slices=2, on_chunk_done=counts.append)
+
+    np.testing.assert_array_equal(out, serial)
+    assert sum(counts) == engine.shape[0]
+
+
+def test_reslice_parallel_cancel_raises() -> None:
+    engine = MprResliceEngine(_volume(), MprBuilder.standard_planes()["coronal"], 1.0, 1.0)
+    with pytest.raises(MprVolumeError, match="cancelled"):
+        reslice_parallel(engine, engine.allocate(), 4, chunk_slices=1, is_cancelled=lambda: True)
+
+
+def test_builder_parallel_mode_matches_serial() -> None:
+    from core.mpr_volume import MprVolume
+
+    vol = MprVolume.__new__(MprVolume)
+    vol.sitk_image = _volume()
+    vol.source_datasets = []
+    plane = MprBuilder.standard_planes()["coronal"]
+    serial = MprBuilder.create_worker(vol, plane, 1.0, 1.0)._build()
+    progress: list[int] = []
+    worker = MprBuilder.create_worker(vol, plane, 1.0, 1.0, build_workers=4)
+    worker.progress.connect(progress.append)
+    parallel = worker._build()
+
+    assert parallel.n_slices == serial.n_slices
+    for a, b in zip(parallel.slices, serial.slices, strict=True):
+        np.testing.assert_array_equal(a, b)
+    assert progress[-1] == 100
+
+
+def test_slice_origin_steps_along_normal() -> None:
+    plane = MprBuilder.standard_planes()["axial"]
+    engine = MprResliceEngine(_volume(), plane, 1.0, 2.5)
+    np.testing.assert_allclose(
+        engine.slice_origin(3) - engine.slice_origin(0), plane.normal * 7.5
+    )
+
+
+def test_chunk_slices_for_grid_and_interpolator_fallback() -> None:
+    assert chunk_slices_for_grid(100, 100, chunk_voxels=25_000) == 2
+    assert chunk_slices_for_grid(4096, 4096, chunk_voxels=1) == 1
+    assert resolve_sitk_interpolator("nearest") == sitk.sitkNearestNeighbor
+    assert resolve_sitk_interpolator("bogus") == sitk.sitkLinear
+    assert resolve_build_workers(3) == 3
+    assert resolve_build_workers(0) >= 1
+    assert resolve_build_workers("x") >= 1
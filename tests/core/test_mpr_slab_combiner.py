@@ -0,0 +1,59 @@
+"""
+Tests for ``MprSlabCombiner`` — block prefix/suffix slab combine.
+
+Every slab must match the direct ``np.stack`` reduction, including the
+edge-clamped windows at both ends of the stack.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from core.mpr_stack_combine import (
+    MprSlabCombiner,
+    apply_mpr_stack_combine,
+    mpr_combine_window,
+)
+
+
+def _stack(n_slices: int, shape=(5, 6)) -> list[np.ndarray]:
+    rng = np.random.default_rng(n_slices)
+    return list(rng.normal(0.0, 500.0, size=(n_slices, *shape)).astype(np.float32))
+
+
+@pytest.mark.parametrize("mode", ["aip", "mip", "minip"])
+@pytest.mark.parametrize("n_planes", [2, 3, 4, 6, 8, 30])
+@pytest.mark.parametrize("n_slices", [1, 5, 17, 64])
+def test_combiner_matches_direct_reduction(mode: str, n_planes: int, n_slices: int) -> None:
+    stack = _stack(n_slices)
+    combiner = MprSlabCombiner(stack, mode, n_planes, max_cached_blocks=2)
+    for i in range(n_slices):
+        want = apply_mpr_stack_combine(stack, i, enabled=True, mode=mode, n_planes=n_planes)
+        got = apply_mpr_stack_combine(
+            stack, i, enabled=True, mode=mode, n_planes=n_planes, combiner=combiner
+        )
+        assert got.dtype == np.float32
+        if mode == "aip":
+            np.testing.assert_allclose(got, want, rtol=1e-5, atol=1e-3)
+        else:
+            np.testing.assert_array_equal(got, want)
+    assert len(combiner._blocks) <= 2
+
+
+def test_combiner_ignored_for_other_settings() -> None:
+    stack = _stack(10)
+    combiner = MprSlabCombiner(stack, "mip", 4)
+    assert combiner.matches(stack, "MIP", 4)
+    assert not combiner.matches(stack, "aip", 4)
+    assert not combiner.matches(stack, "mip", 3)
+    assert not combiner.matches(list(stack), "mip", 4)
+    got = apply_mpr_stack_combine(stack, 3, enabled=True, mode="aip", n_planes=4, combiner=combiner)
+    np.testing.assert_allclose(got, np.mean(np.stack(stack[1:5]), axis=0), rtol=1e-6)
+
+
+def test_combine_window_clamps_at_edges() -> None:
+    assert mpr_combine_window(10, 0, 4) == (0, 3)
+    assert mpr_combine_window(10, 5, 4) == (3, 6)
+    assert mpr_combine_window(10, 9, 4) == (6, 9)
+    assert mpr_combine_window(3, 1, 8) == (0, 2)
@@ -58,6 +58,7 @@ def _make_app(**overrides) -> SimpleNamespace:
         current_slice_index=5,
         _volume_render_facade=SimpleNamespace(close_all_dialogs=MagicMock()),
         _drain_tag_export_union_worker=MagicMock(),
+        study_index_service=SimpleNamespace(shutdown=MagicMock()),
     )
     app._default_scene = roi_scene
     for key, value in overrides.items():
@@ -234,6 +235,7 @@ class TestFinalizeForApplicationQuit:
 
         app._volume_render_facade.close_all_dialogs.assert_called_once_with()
         app._drain_tag_export_union_worker.assert_called_once_with(timeout_sec=30.0)
+        app.study_index_service.shutdown.assert_called_once_with(timeout_s=10.0)
         app.multi_window_layout.reset_slot_to_view_default.assert_called_once_with()
         app.config_manager.set_slice_sync_groups.assert_called_once_with([])
         app._slice_sync_coordinator.set_groups.assert_called_once_with([])
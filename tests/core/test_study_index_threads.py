@@ -14,20 +14,88 @@ pytest.importorskip("keyring", reason="keyring not installed")
 from core.study_index.index_write_thread import StudyIndexWriteThread
 
 
-def test_study_index_write_thread(tmp_path):
-    db_path = str(tmp_path / "thread.sqlite")
-    thread = StudyIndexWriteThread(db_path, "pw-write", [])
+def _row(path: str, study_uid: str = "1.2.3", patient: str = "Doe^Jane") -> dict:
+    return {
+        "file_path": path,
+        "study_root_path": "/root",
+        "study_uid": study_uid,
+        "series_uid": f"{study_uid}.1",
+        "patient_name": patient,
+    }
 
-    finished_called = False
 
-    def on_finished():
-        nonlocal finished_called
-        finished_called = True
+def test_study_index_write_thread_coalesces_queued_rows(tmp_path):
+    from core.study_index.sqlcipher_store import StudyIndexStore
 
-    thread.finished_ok.connect(on_finished)
-    # Direct execution of run() to avoid thread timing/asynchrony issues in unit tests
+    db_path = str(tmp_path / "thread.sqlite")
+    thread = StudyIndexWriteThread(db_path, "pw-write", max_batch_rows=2)
+    # Two overlapping loads queued while the writer was busy: /b.dcm is deduplicated
+    # and its newest row wins.
+    assert thread.enqueue([_row("/a.dcm"), _row("/b.dcm", patient="Old^Name")])
+    assert thread.enqueue([_row("/b.dcm"), _row("/c.dcm")])
+    assert thread.pending_count() == 3
+    batches = []
+    thread.batch_written.connect(batches.append)
+
+    # Not started: stop() only marks the writer as stopping, run() then drains it.
+    thread.stop()
+    assert thread.enqueue([_row("/d.dcm")]) is False
     thread.run()
-    assert finished_called is True
+
+    assert batches == [2, 1]
+    assert thread.pending_count() == 0
+    rows = StudyIndexStore(db_path, "pw-write").iter_all_entries()
+    assert sorted(r["file_path"] for r in rows) == ["/a.dcm", "/b.dcm", "/c.dcm"]
+    assert {r["patient_name"] for r in rows} == {"Doe^Jane"}
+
+
+def test_study_index_write_thread_flushes_while_running(tmp_path):
+    from core.study_index.sqlcipher_store import StudyIndexStore
+
+    db_path = str(tmp_path / "thread.sqlite")
+    thread = StudyIndexWriteThread(db_path, "pw-write")
+    thread.start()
+    try:
+        for i in range(5):
+            thread.enqueue([_row(f"/s{i}/im.dcm", study_uid=f"1.2.{i}")])
+        assert thread.flush(timeout_s=30) is True
+        assert thread.pending_count() == 0
+        assert StudyIndexStore(db_path, "pw-write").row_count() == 5
+    finally:
+        assert thread.stop(timeout_s=30) is True
+
+
+def test_study_index_write_thread_stop_timeout_drops_queued_rows(monkeypatch, caplog):
+    import threading
+
+    from core.study_index import index_write_thread
+
+    started, release = threading.Event(), threading.Event()
+    written: list = []
+
+    class _SlowStore:
+        def __init__(self, *args):
+            pass
+
+        def init_schema(self):
+            pass
+
+        def upsert_rows(self, rows):
+            started.set()
+            release.wait(10)
+            written.extend(rows)
+
+    monkeypatch.setattr(index_write_thread, "StudyIndexStore", _SlowStore)
+    thread = index_write_thread.StudyIndexWriteThread("unused", "pw", max_batch_rows=1)
+    thread.enqueue([_row("/a.dcm"), _row("/b.dcm"), _row("/c.dcm")])
+    thread.start()
+    assert started.wait(10)
+    with caplog.at_level("WARNING"):
+        assert thread.stop(timeout_s=0.1) is False
+    assert "2 rows not indexed" in caplog.text
+    release.set()
+    assert thread.wait(10_000)
+    assert [r["file_path"] for r in written] == ["/a.dcm"]
 
 
 def test_study_index_write_thread_failure(tmp_path, monkeypatch):
@@ -39,8 +107,9 @@ def test_study_index_write_thread_failure(tmp_path, monkeypatch):
         MagicMock(side_effect=RuntimeError("store unavailable")),
     )
     thread = index_write_thread.StudyIndexWriteThread(
-        str(tmp_path / "thread.sqlite"), "pw-write", []
+        str(tmp_path / "thread.sqlite"), "pw-write"
     )
+    thread.enqueue([_row("/a.dcm")])
     failed_reason = None
 
     def on_failed(reason):
@@ -50,6 +119,9 @@ def test_study_index_write_thread_failure(tmp_path, monkeypatch):
     thread.failed.connect(on_failed)
     thread.run()
     assert failed_reason == "RuntimeError: store unavailable"
+    # A writer that could not open the index refuses work so the service replaces it.
+    assert thread.pending_count() == 0
+    assert thread.enqueue([_row("/b.dcm")]) is False
 
 
 def test_study_index_integrity_thread():
@@ -0,0 +1,56 @@
+"""
+Tests for ``core.volume_crop`` — crop-box to voxel sub-volume mapping.
+
+World bounds must map back through origin, spacing and direction cosines to
+the enclosing voxel block (plus the interpolation margin), and whole-volume
+or disjoint boxes must not produce a sub-volume.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from core.volume_crop import CropExtent, crop_index_extent, extract_subvolume
+
+_IDENTITY = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+
+
+def test_axis_aligned_box_maps_through_origin_and_spacing() -> None:
+    extent = crop_index_extent(
+        (10.0 + 4.0, 10.0 + 8.0, 2.0, 6.0, -5.0 + 9.0, -5.0 + 12.0),
+        (40, 30, 20),
+        (1.0, 0.5, 3.0),
+        (10.0, 0.0, -5.0),
+        _IDENTITY,
+    )
+    # x: 4..8 mm / 1.0; y: 2..6 mm / 0.5; z: 9..12 mm / 3.0; +1 voxel margin
+    assert extent == CropExtent(3, 10, 3, 14, 2, 6)
+    assert extent.shape == (4, 11, 7)
+
+
+def test_rotated_direction_maps_world_axes_to_index_axes() -> None:
+    # Image x runs along world -y; image y along world +x.
+    direction = (0.0, 1.0, 0.0, -1.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+    extent = crop_index_extent(
+        (2.0, 4.0, -7.0, -5.0, 0.0, 1.0),
+        (4, 16, 16),
+        (1.0, 1.0, 1.0),
+        (0.0, 0.0, 0.0),
+        direction,
+        margin=0,
+    )
+    assert extent == CropExtent(5, 8, 2, 5, 0, 2)
+
+
+def test_whole_or_disjoint_boxes_give_no_extent() -> None:
+    shape, spacing, origin = (8, 8, 8), (1.0, 1.0, 1.0), (0.0, 0.0, 0.0)
+    assert crop_index_extent((-5, 20, -5, 20, -5, 20), shape, spacing, origin) is None
+    assert crop_index_extent((50, 60, 0, 4, 0, 4), shape, spacing, origin) is None
+
+
+def test_extract_subvolume_is_contiguous_float32_copy() -> None:
+    array = np.arange(4 * 5 * 6, dtype=np.float32).reshape(4, 5, 6)
+    sub = extract_subvolume(array, CropExtent(1, 4, 2, 5, 0, 2))
+    assert sub.flags.c_contiguous and sub.dtype == np.float32
+    np.testing.assert_array_equal(sub, array[0:2, 2:5, 1:4])
+    assert not np.shares_memory(sub, array)
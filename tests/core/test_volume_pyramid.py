@@ -0,0 +1,75 @@
+"""
+Tests for ``core.volume_pyramid`` — reduced levels for interactive 3D rotation.
+
+Levels must be exact block means with matching spacing and voxel-centre
+offsets, be built coarse-from-fine, leave thin axes alone, and be published
+by the background build without blocking readers.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from core.volume_pyramid import VolumePyramid, downsample_volume
+
+
+def _volume(shape=(8, 12, 16)) -> np.ndarray:
+    return np.random.default_rng(4).random(shape, dtype=np.float32) * 1000.0
+
+
+def test_downsample_is_block_mean_and_drops_partial_blocks() -> None:
+    array = _volume((9, 13, 17))
+    got = downsample_volume(array, (2, 2, 2))
+    want = array[:8, :12, :16].reshape(4, 2, 6, 2, 8, 2).mean(axis=(1, 3, 5))
+    assert got.shape == (4, 6, 8) and got.dtype == np.float32
+    np.testing.assert_allclose(got, want, rtol=1e-5)
+
+
+def test_downsample_in_chunks_matches_single_pass(monkeypatch) -> None:
+    import core.volume_pyramid as volume_pyramid
+
+    array = _volume((16, 8, 8))
+    whole = downsample_volume(array, (2, 2, 2))
+    monkeypatch.setattr(volume_pyramid, "_CHUNK_VOXELS", 64)
+    np.testing.assert_array_equal(downsample_volume(array, (2, 2, 2)), whole)
+
+
+def test_levels_have_spacing_offset_and_coarse_from_fine_values() -> None:
+    array = _volume()
+    pyramid = VolumePyramid(array, (0.5, 0.75, 2.0), (4, 2))
+    assert pyramid.factors == (2, 4)
+    pyramid.build()
+
+    half, quarter = pyramid.level(2), pyramid.level(4)
+    assert half is not None and quarter is not None
+    assert half.array.shape == (4, 6, 8) and quarter.array.shape == (2, 3, 4)
+    assert half.spacing == (1.0, 1.5, 4.0)
+    assert quarter.offset == (0.75, 1.125, 3.0)
+    want = array.reshape(2, 4, 3, 4, 4, 4).mean(axis=(1, 3, 5))
+    np.testing.assert_allclose(quarter.array, want, rtol=1e-5)
+
+
+def test_thin_axes_are_not_reduced() -> None:
+    pyramid = VolumePyramid(_volume((3, 8, 8)), (1.0, 1.0, 1.0), (2, 4))
+    pyramid.build()
+    level = pyramid.level(4)
+    assert level is not None and level.array.shape == (3, 2, 2)
+    assert level.spacing == (4.0, 4.0, 1.0) and level.offset[2] == 0.0
+
+
+def test_background_build_publishes_levels_and_releases_input() -> None:
+    pyramid = VolumePyramid(_volume(), (1.0, 1.0, 1.0), (2, 4))
+    assert pyramid.best_ready(4) is None
+    pyramid.start()
+    assert pyramid.wait(timeout=30)
+    best = pyramid.best_ready(4)
+    assert best is not None and best.factor == 4
+    assert pyramid.best_ready(3) is pyramid.level(2)
+    assert pyramid._array is None
+
+
+def test_cancel_before_build_publishes_nothing() -> None:
+    pyramid = VolumePyramid(_volume(), (1.0, 1.0, 1.0), (2,))
+    pyramid.cancel()
+    pyramid.build()
+    assert pyramid.level(2) is None
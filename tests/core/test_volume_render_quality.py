@@ -4,9 +4,13 @@ from core.volume_render_quality import (
     AUTO_REFINE_BUDGET_MS,
     HUGE_VOLUME_BYTES,
     LARGE_VOLUME_BYTES,
+    SMALL_REGION_BYTES,
     auto_detail_cap_index,
     estimate_volume_megabytes,
+    interactive_pyramid_factor,
+    pyramid_factors,
     should_auto_refine,
+    subvolume_keeps_target_detail,
 )
 
 
@@ -29,3 +33,26 @@ def test_auto_refine_requires_a_responsive_non_fallback_preview() -> None:
         preview_elapsed_ms=AUTO_REFINE_BUDGET_MS + 0.1, gpu_fallback_used=False
     ) is False
     assert should_auto_refine(preview_elapsed_ms=1.0, gpu_fallback_used=True) is False
+
+
+def test_pyramid_levels_follow_auto_detail_size_bands() -> None:
+    assert pyramid_factors(None) == ()
+    assert pyramid_factors(LARGE_VOLUME_BYTES - 1) == ()
+    assert pyramid_factors(LARGE_VOLUME_BYTES) == (2,)
+    assert pyramid_factors(HUGE_VOLUME_BYTES) == (2, 4)
+
+
+def test_interactive_pyramid_factor_prefers_coarsest_for_cpu_or_slow_preview() -> None:
+    assert interactive_pyramid_factor(LARGE_VOLUME_BYTES - 1, cpu_rendering=True) == 1
+    assert interactive_pyramid_factor(HUGE_VOLUME_BYTES, cpu_rendering=False) == 2
+    assert interactive_pyramid_factor(HUGE_VOLUME_BYTES, cpu_rendering=True) == 4
+    assert interactive_pyramid_factor(
+        HUGE_VOLUME_BYTES, cpu_rendering=False, preview_slow=True
+    ) == 4
+    assert interactive_pyramid_factor(LARGE_VOLUME_BYTES, cpu_rendering=True) == 2
+
+
+def test_only_small_crop_regions_keep_target_detail() -> None:
+    assert subvolume_keeps_target_detail(None) is False
+    assert subvolume_keeps_target_detail(SMALL_REGION_BYTES) is True
+    assert subvolume_keeps_target_detail(SMALL_REGION_BYTES + 1) is False
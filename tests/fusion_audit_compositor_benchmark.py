@@ -0,0 +1,115 @@
+"""
+Fusion Audit: Benchmark the LUT fusion compositor against the float path.
+
+Builds synthetic 512x512 fused-slice inputs the way the viewer produces them
+(an 8-bit windowed CT-like base image and a float PET-like overlay with a
+fixed overlay window/level), then times:
+
+- FusionProcessor.create_fusion_image (float normalise / colormap / blend)
+- the same call with a FusionLutCompositor (LUT gather into a reused buffer)
+
+and reports the largest per-channel difference between the two outputs.
+
+This script does NOT modify any production code. It only prints diagnostic output.
+
+Usage: python tests/fusion_audit_compositor_benchmark.py [repeats]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.fusion_compositor import FusionLutCompositor
+from core.fusion_processor import FusionProcessor
+
+SIZE = 512
+OVERLAY_WL = (6000.0, 3000.0)
+TARGET_MS = 5.0
+
+
+def make_fixture(size=SIZE, seed=7):
+    """Return (uint8 windowed base, int16 stored base, float32 overlay)."""
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:size, 0:size].astype(np.float32)
+    r = np.hypot(yy - size / 2, xx - size / 2) / (size / 2)
+
+    # CT-like body: soft tissue ellipse with noise, air outside.
+    hu = np.where(r < 0.85, 40.0, -1000.0) + rng.normal(0, 15, (size, size))
+    stored = np.clip(hu, -1024, 3071).astype(np.int16)
+    window_min, window_max = -160.0, 240.0
+    displayed = np.clip((hu - window_min) / (window_max - window_min), 0, 1)
+    base_u8 = (displayed * 255).astype(np.uint8)
+
+    # PET-like overlay: low background uptake plus two hot lesions.
+    overlay = np.where(r < 0.85, 800.0, 0.0).astype(np.float32)
+    for cy, cx, peak in ((200, 220, 9000.0), (330, 300, 5000.0)):
+        d2 = (yy - cy) ** 2 + (xx - cx) ** 2
+        overlay += peak * np.exp(-d2 / (2 * 18.0**2))
+    overlay += rng.normal(0, 50, (size, size)).astype(np.float32)
+    return base_u8, stored, overlay
+
+
+def time_call(func, repeats):
+    func()  # warm-up: colormap / LUT construction
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1000.0
+
+
+def benchmark(repeats=50):
+    base_u8, stored, overlay = make_fixture()
+    compositor = FusionLutCompositor()
+    all_ok = True
+
+    for label, base in (("uint8 windowed base", base_u8), ("int16 stored base", stored)):
+        print("=" * 70)
+        print(f"{label}: {SIZE}x{SIZE}, overlay W/L {OVERLAY_WL}")
+        print("=" * 70)
+        for colormap in FusionProcessor.AVAILABLE_COLORMAPS:
+            kwargs = {
+                "alpha": 0.5,
+                "colormap": colormap,
+                "threshold": 0.1,
+                "base_wl": None,
+                "overlay_wl": OVERLAY_WL,
+            }
+            float_ms = time_call(
+                lambda b=base, kw=kwargs: FusionProcessor.create_fusion_image(b, overlay, **kw),
+                repeats,
+            )
+            lut_ms = time_call(
+                lambda b=base, kw=kwargs: FusionProcessor.create_fusion_image(
+                    b, overlay, compositor=compositor, **kw
+                ),
+                repeats,
+            )
+            expected = FusionProcessor.create_fusion_image(base, overlay, **kwargs)
+            got = FusionProcessor.create_fusion_image(base, overlay, compositor=compositor, **kwargs)
+            max_diff = int(np.max(np.abs(expected.astype(np.int16) - got)))
+            ok = max_diff <= 2
+            all_ok = all_ok and ok
+            print(
+                f"  {colormap:<8} float {float_ms:6.2f} ms  lut {lut_ms:6.2f} ms  "
+                f"speed-up {float_ms / lut_ms:4.1f}x  max diff {max_diff}"
+                f"{'' if lut_ms < TARGET_MS else '  (above target)'}"
+                f"{'' if ok else '  MISMATCH'}"
+            )
+        print()
+
+    print(f"Target: < {TARGET_MS:.0f} ms per {SIZE}x{SIZE} fused slice (LUT path)")
+    print("PASS: LUT output within 2 levels of the float path" if all_ok
+          else "FAIL: LUT output differs from the float path")
+    return all_ok
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    print("\n" + "=" * 70)
+    print("FUSION AUDIT: LUT Compositor Benchmark")
+    print("=" * 70 + "\n")
+    raise SystemExit(0 if benchmark(repeats) else 1)
@@ -164,6 +164,24 @@ class TestOnPipelineComplete:
         handler._on_pipeline_complete([1], {"a": 1})  # no error
 
 
+class TestOnPipelineStart:
+    @patch("gui.file_operations_handler.should_skip_path_for_dicom", return_value=False)
+    @patch("gui.file_operations_handler.run_load_pipeline_async")
+    def test_calls_callback_before_pipeline_starts(self, mock_pipeline, mock_skip, qapp):
+        order: list[str] = []
+        started = MagicMock(side_effect=lambda: order.append("started"))
+        mock_pipeline.side_effect = lambda *a, **k: order.append("pipeline")
+        handler, _, dialog, _, _ = _make_handler(load_started_callback=started)
+        dialog.open_files.return_value = ["/a.dcm"]
+        with patch.object(handler, "_check_large_files", return_value=True):
+            handler.open_files()
+        assert order == ["started", "pipeline"]
+
+    def test_noop_when_no_callback(self):
+        handler, *_ = _make_handler()
+        handler._on_pipeline_start()  # no error
+
+
 # ---------------------------------------------------------------------------
 # open_files
 # ---------------------------------------------------------------------------
@@ -601,6 +601,14 @@ class TestOnLoadComplete:
         coordinator._on_load_complete([Dataset()], None)
         assert mock_app.current_studies is sentinel
 
+    def test_reschedules_mpr_prebuild_even_after_failed_load(self, coordinator, mock_app):
+        coordinator._on_load_complete(None, None)
+        mock_app._mpr_controller.schedule_standard_plane_prebuild.assert_called_once()
+
+    def test_load_start_cancels_mpr_prebuild(self, coordinator, mock_app):
+        coordinator._on_load_started()
+        mock_app._mpr_controller.cancel_standard_plane_prebuild.assert_called_once()
+
     def test_handles_missing_study_cache(self, coordinator, mock_app):
         mock_app.study_cache = None
         datasets = [Dataset()]
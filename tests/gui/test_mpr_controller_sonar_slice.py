@@ -465,7 +465,6 @@ def test_on_mpr_requested_activates_from_cache_hit() -> None:
         output_plane=SimpleNamespace(normal=np.array([0.0, 1.0, 0.0])),
     )
     result = _make_result(n_slices=2)
-    volume = SimpleNamespace(source_datasets=[ds])
     cache = MagicMock()
     cache.load.return_value = (
         result.slices,
@@ -486,7 +485,7 @@ def test_on_mpr_requested_activates_from_cache_hit() -> None:
             "gui.mpr_controller.get_orientation_groups",
             return_value=[("Axial", [ds])],
         ),
-        patch("gui.mpr_controller.MprVolume.from_datasets", return_value=volume),
+        patch("core.mpr_volume.MprVolume.from_datasets") as from_datasets,
         patch.object(ctrl, "_activate_mpr") as activate,
         patch("gui.mpr_controller.MprBuilder.create_worker") as create_worker,
     ):
@@ -495,6 +494,47 @@ def test_on_mpr_requested_activates_from_cache_hit() -> None:
     assert activate.call_args[0][0] == 0
     assert activate.call_args[0][2] == "Coronal"
     create_worker.assert_not_called()
+    # A cache hit never decodes pixels or builds the SimpleITK volume.
+    from_datasets.assert_not_called()
+    cached = activate.call_args[0][1]
+    assert cached.source_volume.source_datasets == [ds]
+    assert not cached.source_volume.is_resolved
+
+
+def test_standard_plane_prebuild_is_opt_in_and_yields_to_requests() -> None:
+    ctrl, app = _make_controller()
+    app.main_window = MagicMock()
+    app.config_manager.get_mpr_prebuild_enabled.return_value = False
+    ctrl._cache = MagicMock()
+    ctrl.schedule_standard_plane_prebuild()
+    assert not ctrl._prebuild_timer.isActive()
+
+    app.config_manager.get_mpr_prebuild_enabled.return_value = True
+    ctrl.schedule_standard_plane_prebuild()
+    assert ctrl._prebuild_timer.isActive()
+
+    running = MagicMock()
+    running.isFinished.return_value = False
+    ctrl._prebuild_worker = running
+    request = SimpleNamespace(datasets=[_source_dataset()], orientation_label="Axial")
+    with (
+        patch("gui.mpr_controller.get_orientation_groups", return_value=[]),
+        patch(
+            "gui.mpr_controller.has_slice_location_fallback_available",
+            return_value=False,
+        ),
+        patch("gui.mpr_controller.QMessageBox.critical"),
+    ):
+        ctrl._on_mpr_requested(0, request)
+    running.cancel.assert_called_once()
+    assert ctrl._prebuild_worker is None
+    assert not ctrl._prebuild_timer.isActive()
+
+    # While a user build is in flight the idle timer does not start one.
+    ctrl._workers[0] = MagicMock()
+    with patch("gui.mpr_controller.plan_standard_plane_prebuild") as plan:
+        ctrl._start_standard_plane_prebuild()
+    plan.assert_not_called()
 
 
 def test_reset_window_level_updates_pane_even_when_unfocused() -> None:
@@ -549,3 +589,4 @@ def test_reset_window_level_syncs_toolbar_when_focused() -> None:
     args = app.window_level_controls.set_window_level.call_args
     assert args[0][:2] == (50.0, 350.0)
     app.main_window.set_rescale_toggle_state.assert_called_once_with(True)
+
@@ -183,6 +183,17 @@ class TestMprCacheGroup:
         config_value = panel._config.get_mpr_cache_max_mb()
         assert panel.mpr_cache_max_mb.value() == config_value
 
+    @pytest.mark.qt
+    def test_mpr_build_workers_defaults_to_serial(
+        self, panel: PrivacyStorageSettingsPanel
+    ) -> None:
+        """Verify MPR build threads default to the serial path; 0 shows Auto."""
+        assert panel.mpr_build_workers.minimum() == 0
+        assert panel.mpr_build_workers.maximum() == 64
+        assert panel.mpr_build_workers.value() == 1
+        panel.mpr_build_workers.setValue(0)
+        assert panel.mpr_build_workers.text().startswith("Auto")
+
     @pytest.mark.qt
     def test_mpr_cache_enabled_object_name(
         self, panel: PrivacyStorageSettingsPanel
@@ -262,6 +273,58 @@ class TestApply:
         assert panel.apply() is True
         assert panel._config.get_mpr_cache_max_mb() == 1024
 
+    @pytest.mark.qt
+    def test_apply_saves_mpr_build_workers(
+        self, panel: PrivacyStorageSettingsPanel
+    ) -> None:
+        """Verify apply() persists the MPR build thread count."""
+        panel.mpr_build_workers.setValue(8)
+        assert panel.apply() is True
+        assert panel._config.get_mpr_build_workers() == 8
+
+    @pytest.mark.qt
+    def test_apply_saves_mpr_cache_compression(
+        self, panel: PrivacyStorageSettingsPanel
+    ) -> None:
+        """Verify compression is off by default and apply() persists the opt-in."""
+        assert panel.mpr_cache_compression.isChecked() is False
+        panel.mpr_cache_compression.setChecked(True)
+        assert panel.apply() is True
+        assert panel._config.get_mpr_cache_compression() is True
+
+    @pytest.mark.qt
+    def test_apply_saves_mpr_prebuild_settings(
+        self, panel: PrivacyStorageSettingsPanel
+    ) -> None:
+        """Verify idle pre-build is off by default and apply() persists its settings."""
+        assert panel.mpr_prebuild_enabled.isChecked() is False
+        panel.mpr_prebuild_enabled.setChecked(True)
+        panel.mpr_prebuild_max_mb.setValue(2048)
+        assert panel.apply() is True
+        assert panel._config.get_mpr_prebuild_enabled() is True
+        assert panel._config.get_mpr_prebuild_max_mb() == 2048
+
+    @pytest.mark.qt
+    def test_apply_saves_fusion_cache_settings_and_disabling_clears(
+        self, panel: PrivacyStorageSettingsPanel
+    ) -> None:
+        """Verify the fusion cache is opt-in, persisted, and cleared when disabled."""
+        assert panel.fusion_cache_enabled.isChecked() is False
+        panel.fusion_cache_enabled.setChecked(True)
+        panel.fusion_cache_max_mb.setValue(256)
+        assert panel.apply() is True
+        assert panel._config.get_fusion_cache_enabled() is True
+        assert panel._config.get_fusion_cache_max_mb() == 256
+
+        cache_dir = panel._config.get_fusion_cache_path()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / "abc.npy").write_bytes(b"x")
+        (cache_dir / "abc_meta.json").write_text("{}")
+        panel.fusion_cache_enabled.setChecked(False)
+        assert panel.apply() is True
+        assert panel._config.get_fusion_cache_enabled() is False
+        assert list(cache_dir.iterdir()) == []
+
     @pytest.mark.qt
     def test_apply_saves_diagnostics_enabled(
         self, panel: PrivacyStorageSettingsPanel
@@ -339,6 +402,17 @@ class TestApply:
         ):
             assert panel.apply() is False
 
+    @pytest.mark.qt
+    def test_apply_mpr_build_workers_failure(
+        self, panel: PrivacyStorageSettingsPanel
+    ) -> None:
+        """Verify apply() returns False when the MPR build thread count save fails."""
+        with (
+            patch.object(panel._config, "set_mpr_build_workers", return_value=False),
+            patch("gui.privacy_storage_settings.QMessageBox.warning"),
+        ):
+            assert panel.apply() is False
+
     @pytest.mark.qt
     def test_apply_mpr_cache_enabled_failure(
         self, panel: PrivacyStorageSettingsPanel
@@ -14,7 +14,7 @@ import pytest
 
 pytest.importorskip("PySide6", reason="PySide6 not installed")
 
-from PySide6.QtCore import QModelIndex
+from PySide6.QtCore import QModelIndex, Qt
 from PySide6.QtWidgets import QDialog, QFileDialog, QMessageBox
 
 from core.study_index.index_service import MissingStudyRecord
@@ -55,6 +55,7 @@ class Service:
         self.calls: list[dict] = []
         self.error: Exception | None = None
         self.file_paths: list[str] = []
+        self.instances: list[dict] = []
         self.deleted: list[tuple[str, str]] = []
         self.relocated: list[tuple[str, str, str]] = []
         self.relocate_result = 2
@@ -71,6 +72,9 @@ class Service:
     def get_file_paths_for_study(self, uid: str, root: str) -> list[str]:
         return list(self.file_paths)
 
+    def get_study_instances(self, uid: str, root: str) -> list[dict]:
+        return list(self.instances)
+
     def delete_grouped_study(self, uid: str, root: str) -> int:
         self.deleted.append((uid, root))
         return 3
@@ -79,7 +83,7 @@ class Service:
         self.relocated.append((uid, old, new))
         return self.relocate_result
 
-    def start_index_folder(self, folder, on_finished, on_failed) -> None:
+    def start_index_folder(self, folder, on_finished, on_failed, on_report=None) -> None:
         on_finished(4)
 
     def row_count(self) -> int:
@@ -154,6 +158,9 @@ def test_model_guards_and_display_branches() -> None:
     model.append_rows([])
     assert model.open_path_for_row(9) == ""
     assert model.group_row_snapshot(9) == {}
+    tooltip = Qt.ItemDataRole.ToolTipRole
+    assert "Whole study" in model.headerData(1, Qt.Orientation.Horizontal, tooltip)
+    assert model.headerData(0, Qt.Orientation.Horizontal, tooltip) is None
 
 
 def test_date_filter_strictness_and_formatting(qapp) -> None:
@@ -235,6 +242,36 @@ def test_selection_and_open_row_guards(monkeypatch, qapp, tmp_path) -> None:
         dlg.deleteLater()
 
 
+def test_open_row_opens_crawled_study_from_index(qapp, tmp_path) -> None:
+    service = Service()
+    opened: list[list[str]] = []
+    indexed: list[tuple[list[dict], str]] = []
+    dlg = StudyIndexSearchDialog(
+        service,
+        Config(),
+        opened.append,
+        open_indexed_study_callback=lambda rows, root: indexed.append((rows, root)),
+    )
+    try:
+        root = tmp_path / "study"
+        root.mkdir()
+        crawled = {"file_path": str(root / "a.dcm"), "file_size": 10, "instance_header": "{}"}
+        service.instances = [crawled]
+        dlg._model.set_rows([row(study_root_path=str(root))])
+        dlg._open_row(0)
+        assert indexed == [([crawled], str(root))]
+        assert opened == []
+
+        # Any row the crawl did not write (e.g. added on open) means a folder rescan.
+        indexed.clear()
+        service.instances = [crawled, {"file_path": str(root / "b.dcm"), "file_size": None}]
+        dlg._open_row(0)
+        assert indexed == []
+        assert opened == [[str(root)]]
+    finally:
+        dlg.deleteLater()
+
+
 def test_open_row_file_errors_and_partial_missing(monkeypatch, qapp, tmp_path) -> None:
     service = Service()
     opened: list[list[str]] = []
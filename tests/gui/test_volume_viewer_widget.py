@@ -235,9 +235,11 @@ class _FakeRenderer:
         self.views: list[str] = []
         self.render_methods: list[str] = []
         self.interactive_quality: list[bool] = []
+        self.interactive_levels: list[tuple[bool, bool]] = []
         self.blend_modes: list[str] = []
         self.cropping_planes = None
         self.cleared_cropping = 0
+        self.crop_subvolumes: list = []
         self.custom_points = None
         self.cleanup_called = False
         self.reset_camera_calls = 0
@@ -301,6 +303,10 @@ class _FakeRenderer:
     def set_interactive_quality(self, enabled: bool) -> None:
         self.interactive_quality.append(enabled)
 
+    def set_interactive_level(self, low: bool, *, preview_slow: bool = False) -> int:
+        self.interactive_levels.append((low, preview_slow))
+        return 1
+
     def check_gpu_fallback(self, render_window, *, probe_quality=None) -> bool:
         self.check_gpu_fallback_calls += 1
         return False
@@ -335,6 +341,10 @@ class _FakeRenderer:
     def set_cropping(self, plane_list) -> None:
         self.cropping_planes = list(plane_list)
 
+    def set_crop_subvolume(self, bounds) -> bool:
+        self.crop_subvolumes.append(bounds)
+        return True
+
     def cleanup(self) -> None:
         self.cleanup_called = True
 
@@ -398,6 +408,9 @@ class _FakeBoxRepresentation:
     def GetPlanes(self, planes) -> None:
         planes._planes = ["a", "b", "c", "d"]
 
+    def GetBounds(self):
+        return self.bounds
+
 
 class _FakeBoxWidget2:
     def __init__(self) -> None:
@@ -605,6 +618,24 @@ def test_overlay_text_keypress_status_and_cleanup(monkeypatch, qapp) -> None:
     assert interactor.finalized is True
 
 
+@pytest.mark.qt
+def test_slow_preview_interaction_uses_coarsest_pyramid_level(monkeypatch, qapp) -> None:
+    _install_fake_tf_editor(monkeypatch)
+    renderer = _FakeRenderer()
+    widget = _make_widget(monkeypatch, qapp, renderer=renderer)
+    widget._build_controls()
+
+    widget._on_interaction_start()
+    widget._on_interaction_end()
+    assert renderer.interactive_levels == []
+
+    widget._auto_refine_suppressed = True
+    widget._on_interaction_start()
+    widget._on_interaction_end()
+    assert renderer.interactive_levels == [(True, True), (False, True)]
+    assert renderer.temporary_quality_modes[-2:] == ["Fast", "Fast"]
+
+
 @pytest.mark.qt
 def test_save_preset_flow_and_validation(monkeypatch, qapp) -> None:
     _install_fake_tf_editor(monkeypatch)
@@ -741,3 +772,41 @@ def test_misc_control_handlers_and_crop_box_paths(monkeypatch, qapp) -> None:
     assert renderer.quality_modes
     assert renderer.cropping_planes == ["a", "b", "c", "d"]
     assert renderer.cleared_cropping >= 1
+
+
+@pytest.mark.qt
+def test_crop_subvolume_follows_crop_box_with_debounce(monkeypatch, qapp) -> None:
+    _install_fake_tf_editor(monkeypatch)
+    _install_dialog_stubs(monkeypatch)
+    renderer = _FakeRenderer()
+    widget = _make_widget(monkeypatch, qapp, renderer=renderer)
+    widget._build_controls()
+    render_window = _FakeRenderWindow()
+    widget._interactor = _FakeInteractor(render_window)
+    widget._vtk_render_window = render_window
+    widget._initialized = True
+    fake_vtk = types.SimpleNamespace(
+        vtkBoxWidget2=_FakeBoxWidget2,
+        vtkBoxRepresentation=_FakeBoxRepresentation,
+        vtkPlanes=_FakePlanes,
+    )
+    monkeypatch.setattr("gui.volume_viewer_widget.vtk_mod", fake_vtk)
+
+    assert widget._crop_subvolume_cb.isEnabled() is False
+    widget._crop_cb.setChecked(True)
+    assert widget._crop_subvolume_cb.isEnabled() is True
+    widget._box_widget.rep.bounds = [0.0, 10.0, 0.0, 20.0, 0.0, 30.0]
+    widget._crop_subvolume_cb.setChecked(True)
+    assert renderer.crop_subvolumes[-1] == (0.0, 10.0, 0.0, 20.0, 0.0, 30.0)
+
+    calls = len(renderer.crop_subvolumes)
+    widget._box_widget.rep.bounds = [0.0, 5.0, 0.0, 5.0, 0.0, 5.0]
+    widget._on_crop_box_changed()
+    assert widget._crop_timer.isActive()
+    assert len(renderer.crop_subvolumes) == calls  # debounced
+    widget._crop_timer.stop()
+    widget._apply_crop_subvolume()
+    assert renderer.crop_subvolumes[-1] == (0.0, 5.0, 0.0, 5.0, 0.0, 5.0)
+
+    widget._crop_cb.setChecked(False)
+    assert renderer.crop_subvolumes[-1] is None
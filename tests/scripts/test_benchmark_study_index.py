@@ -0,0 +1,62 @@
+"""Tests for the study-index query benchmark harness."""
+
+from __future__ import annotations
+
+import csv
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[2]
+_SCRIPT = _ROOT / "scripts" / "benchmark_study_index.py"
+_SPEC = importlib.util.spec_from_file_location("benchmark_study_index", _SCRIPT)
+assert _SPEC and _SPEC.loader
+_MODULE = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)
+
+
+def test_iter_rows_builds_exact_count_across_studies_and_series() -> None:
+    rows = list(_MODULE.iter_rows(3000))
+    assert len(rows) == 3000
+    assert len({r["file_path"] for r in rows}) == 3000
+    studies = {r["study_uid"] for r in rows}
+    assert 1 < len(studies) < 3000
+    assert len({r["series_uid"] for r in rows}) > len(studies)
+    assert all(r["study_root_path"] in r["file_path"] for r in rows)
+    assert rows == list(_MODULE.iter_rows(3000))  # deterministic for a seed
+
+
+def test_run_appends_a_row_per_operation_and_query(tmp_path: Path) -> None:
+    pytest.importorskip("sqlcipher3")
+    csv_file = tmp_path / "study_index.csv"
+
+    assert _MODULE.main(
+        ["--rows", "600", "--queries", "1", "--relocations", "2", "--csv", str(csv_file)]
+    ) == 0
+
+    with open(csv_file, newline="") as f:
+        rows = list(csv.DictReader(f))
+    operations = [r["operation"] for r in rows]
+    assert operations.count("upsert") == 2
+    for grouped in ("search", "search_grouped", "search_grouped_reopen"):
+        assert operations.count(grouped) == len(_MODULE.QUERIES)
+    assert set(operations) == set(_MODULE.OPERATIONS)
+    assert {r["rows"] for r in rows} == {"600"}
+    by_op = {r["operation"]: r for r in rows}
+    assert by_op["csv_import"]["rows_per_s"] and by_op["csv_export"]["rows_per_s"]
+    assert all(float(r["median_ms"]) >= 0.0 for r in rows)
+
+
+def test_skip_omits_operations(tmp_path: Path) -> None:
+    pytest.importorskip("sqlcipher3")
+    csv_file = tmp_path / "study_index.csv"
+    skipped = ["search", "search_grouped_reopen", "csv_import", "integrity_scan"]
+
+    assert _MODULE.main(
+        ["--rows", "200", "--queries", "1", "--skip", *skipped, "--csv", str(csv_file)]
+    ) == 0
+
+    with open(csv_file, newline="") as f:
+        operations = {r["operation"] for r in csv.DictReader(f)}
+    assert operations == set(_MODULE.OPERATIONS) - set(skipped)
@@ -0,0 +1,50 @@
+"""Tests for the headless volume-render benchmark harness."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[2]
+_SCRIPT = _ROOT / "scripts" / "benchmark_volume_render.py"
+_SPEC = importlib.util.spec_from_file_location("benchmark_volume_render", _SCRIPT)
+assert _SPEC and _SPEC.loader
+_MODULE = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(_MODULE)
+
+
+def test_parse_sizes_accepts_depth_height_width_lists() -> None:
+    assert _MODULE.parse_sizes("8x16x32, 4X4X4") == [(8, 16, 32), (4, 4, 4)]
+    with pytest.raises(argparse.ArgumentTypeError):
+        _MODULE.parse_sizes("8x16")
+
+
+def test_synthetic_volume_spans_air_tissue_and_bone() -> None:
+    volume = _MODULE.make_ct_volume((4, 64, 64))
+    assert volume.dtype == np.float32 and volume.shape == (4, 64, 64)
+    assert volume.min() < -900.0
+    assert volume.max() > 800.0
+    assert np.any(np.abs(volume - 40.0) < 50.0)
+
+
+def test_quick_run_appends_one_row_per_configuration(tmp_path: Path) -> None:
+    pytest.importorskip("vtk")
+    pytest.importorskip("SimpleITK")
+    csv_file = tmp_path / "volume_render.csv"
+
+    args = ["--quick", "--sizes", "8x16x16", "--frames", "2", "--window", "32"]
+    assert _MODULE.main([*args, "--csv", str(csv_file)]) == 0
+    assert _MODULE.main([*args, "--csv", str(csv_file)]) == 0
+
+    with open(csv_file, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2
+    assert rows[0]["size"] == "8x16x16"
+    assert rows[0]["quality"] == "Normal" and rows[0]["blend_mode"] == "Composite"
+    assert float(rows[0]["time_to_first_frame_ms"]) > 0.0
+    assert float(rows[0]["orbit_median_ms"]) >= 0.0
@@ -7,6 +7,8 @@ import pytest
 from PIL import Image
 
 import core.fusion_processor as fusion_processor
+from core.fusion_compositor import FusionLutCompositor
+from core.fusion_overlay_map import OverlayAlignmentMap
 from core.fusion_processor import FusionProcessor
 
 
@@ -252,3 +254,130 @@ class TestCreateFusionImage:
         )
         expected_pixel = np.clip(overlay_rgb[0, 0] * 255.0, 0, 255).astype(np.uint8)
         np.testing.assert_array_equal(fused[0, 0], expected_pixel)
+
+
+class TestFusionLutCompositor:
+    def _inputs(self, shape=(32, 40), seed=3):
+        rng = np.random.default_rng(seed)
+        base = rng.integers(0, 256, size=shape).astype(np.uint8)
+        overlay = (rng.random(shape) * 5000.0).astype(np.float32)
+        return base, overlay
+
+    @pytest.mark.parametrize("colormap", ["hot", "jet", "viridis"])
+    @pytest.mark.parametrize("alpha,threshold", [(0.5, 0.0), (0.3, 0.2), (1.0, 0.0), (0.0, 0.5), (0.7, 1.0), (0.5, 1.5)])
+    def test_matches_float_path_within_two_levels(self, colormap, alpha, threshold):
+        base, overlay = self._inputs()
+        kwargs = {
+            "alpha": alpha,
+            "colormap": colormap,
+            "threshold": threshold,
+            "overlay_wl": (3000.0, 1500.0),
+        }
+        expected = FusionProcessor.create_fusion_image(base, overlay, **kwargs)
+        got = FusionProcessor.create_fusion_image(
+            base, overlay, compositor=FusionLutCompositor(), **kwargs
+        )
+        assert got.shape == expected.shape and got.dtype == np.uint8
+        assert np.max(np.abs(got.astype(np.int16) - expected)) <= 2
+
+    def test_signed_base_and_explicit_base_window(self):
+        base, overlay = self._inputs()
+        signed = base.astype(np.int16) * 8 - 1024
+        kwargs = {"alpha": 0.6, "overlay_wl": (3000.0, 1500.0), "base_wl": (1200.0, -400.0)}
+        expected = FusionProcessor.create_fusion_image(signed, overlay, **kwargs)
+        got = FusionLutCompositor().composite(
+            signed, overlay, 0.6, "hot", 0.0, (3000.0, 1500.0), base_wl=(1200.0, -400.0)
+        )
+        assert np.max(np.abs(got.astype(np.int16) - expected)) <= 2
+
+    def test_nan_overlay_pixels_show_the_base(self):
+        base, overlay = self._inputs()
+        overlay[0, 0] = np.nan
+        fused = FusionLutCompositor().composite(base, overlay, 1.0, "hot", 0.0, (3000.0, 1500.0))
+        grey = FusionLutCompositor().composite(base, overlay, 0.0, "hot", 0.0, (3000.0, 1500.0))
+        np.testing.assert_array_equal(fused[0, 0], grey[0, 0])
+
+    def test_output_buffer_is_reused_and_pil_copy_is_independent(self):
+        base, overlay = self._inputs()
+        compositor = FusionLutCompositor()
+        first = compositor.composite(base, overlay, 0.5, "hot", 0.0, (3000.0, 1500.0))
+        image = FusionProcessor.convert_array_to_pil_image(first)
+        snapshot = np.array(image)
+        second = compositor.composite(base, overlay, 0.9, "jet", 0.0, (3000.0, 1500.0))
+        assert second is first
+        np.testing.assert_array_equal(np.array(image), snapshot)
+
+    def test_unsupported_inputs_use_float_path(self):
+        base, overlay = self._inputs()
+        compositor = FusionLutCompositor()
+        assert not compositor.supports(base.astype(np.float32), overlay, (3000.0, 1500.0))
+        assert not compositor.supports(base, overlay, None)
+        assert not compositor.supports(base, overlay, (0.0, 1500.0))
+        assert not compositor.supports(base, overlay[:-1], (3000.0, 1500.0))
+
+        fused = FusionProcessor.create_fusion_image(
+            base.astype(np.float32), overlay, overlay_wl=(3000.0, 1500.0), compositor=compositor
+        )
+        assert fused.shape == (*base.shape, 3)
+        assert compositor._output is None
+
+
+class TestOverlayAlignmentMap:
+    @staticmethod
+    def _pil_path(overlay, resize_to, base_shape, offset):
+        if resize_to is not None:
+            overlay = FusionProcessor._resize_overlay(overlay, resize_to)
+        if offset is not None:
+            overlay = FusionProcessor._apply_translation_offset(overlay, *offset, base_shape)
+        return overlay
+
+    @pytest.mark.parametrize(
+        "overlay_shape,resize_to,base_shape,offset",
+        [
+            ((32, 32), (128, 128), (128, 128), (3.4, -7.6)),  # PET-like upscale
+            ((32, 25), (100, 130), (128, 128), (-20.0, 15.0)),
+            ((128, 128), (50, 45), (64, 64), (0.0, 0.0)),  # downscale (antialiased)
+            ((40, 40), (96, 96), None, None),  # resize only
+            ((16, 16), None, (16, 16), (2.0, 2.0)),  # translation only
+            ((10, 10), (33, 7), (40, 40), (500.0, 1.0)),  # entirely off canvas
+        ],
+    )
+    def test_matches_pil_resize_and_translation(self, overlay_shape, resize_to, base_shape, offset):
+        rng = np.random.default_rng(11)
+        overlay = (rng.random(overlay_shape) * 1000.0).astype(np.float32)
+        expected = self._pil_path(overlay, resize_to, base_shape, offset)
+        got = OverlayAlignmentMap().align(overlay, resize_to, base_shape, offset)
+        assert got.shape == expected.shape
+        np.testing.assert_allclose(got, expected, atol=1e-3)
+
+    def test_taps_are_rebuilt_only_when_alignment_changes(self):
+        overlay = np.ones((8, 8), dtype=np.float32)
+        alignment_map = OverlayAlignmentMap()
+        first = alignment_map.align(overlay, (16, 16), (16, 16), (1.2, 0.0))
+        cols = alignment_map._cols
+        # 0.8 rounds to the same whole-pixel offset: same taps, same buffer
+        second = alignment_map.align(overlay * 2, (16, 16), (16, 16), (0.8, 0.0))
+        assert second is first and alignment_map._cols is cols
+        alignment_map.align(overlay, (16, 16), (16, 16), (2.0, 0.0))
+        assert alignment_map._cols is not cols
+
+    def test_identity_alignment_returns_input(self):
+        overlay = np.ones((8, 8), dtype=np.float32)
+        assert OverlayAlignmentMap().align(overlay, None, None, None) is overlay
+        assert OverlayAlignmentMap().align(overlay, (8, 8), (8, 8), (0.0, 0.0)) is overlay
+
+    def test_create_fusion_image_with_map_matches_pil_path(self):
+        rng = np.random.default_rng(2)
+        base = rng.integers(0, 256, size=(64, 64)).astype(np.uint8)
+        overlay = (rng.random((16, 16)) * 100.0).astype(np.float32)
+        kwargs = {
+            "overlay_wl": (100.0, 50.0),
+            "base_pixel_spacing": (1.0, 1.0),
+            "overlay_pixel_spacing": (4.0, 4.0),
+            "translation_offset": (3.0, -2.0),
+        }
+        expected = FusionProcessor.create_fusion_image(base, overlay, **kwargs)
+        got = FusionProcessor.create_fusion_image(
+            base, overlay, overlay_map=OverlayAlignmentMap(), **kwargs
+        )
+        assert np.max(np.abs(got.astype(np.int16) - expected)) <= 1
@@ -9,6 +9,8 @@ conversion/resampling machinery runs end-to-end rather than being mocked out.
 
 from __future__ import annotations
 
+import threading
+
 import numpy as np
 import pytest
 from pydicom.dataset import Dataset, FileMetaDataset
@@ -532,3 +534,88 @@ class TestCacheEviction:
         evicted_key = ("ov0", "ref", "linear")
         assert evicted_key not in resampler._cache
         assert evicted_key not in resampler._numpy_cache
+
+
+class TestBackgroundFill:
+    def _overlay(self):
+        # Coarser overlay grid so linear interpolation actually blends slices.
+        return [
+            _make_ct_dataset(z=2.0 * i, pixel_value=10 * (i + 1), slice_thickness=2.0)
+            for i in range(3)
+        ]
+
+    def test_first_slice_matches_full_volume_then_cache_fills(self):
+        reference = _make_series([1, 2, 3, 4, 5])
+        overlay = self._overlay()
+        eager = ImageResampler()
+        on_demand = ImageResampler(background_fill=True)
+
+        first = on_demand.get_resampled_slice(
+            overlay, reference, 3, overlay_series_uid="ov", reference_series_uid="ref"
+        )
+        assert first is not None and first.dtype == np.float32
+        assert on_demand.wait_for_background_fill(timeout=30)
+        assert ("ov", "ref", "linear") in on_demand._cache
+        assert ("ov", "ref", "linear") in on_demand._numpy_cache
+        assert not on_demand._pending_fills
+
+        for idx in range(len(reference)):
+            want = eager.get_resampled_slice(
+                overlay, reference, idx, overlay_series_uid="ov", reference_series_uid="ref"
+            )
+            got = on_demand.get_resampled_slice(
+                overlay, reference, idx, overlay_series_uid="ov", reference_series_uid="ref"
+            )
+            np.testing.assert_allclose(got, want, atol=1e-4)
+        np.testing.assert_allclose(first, np.full((4, 4), 25.0), atol=1e-4)
+
+    def test_does_not_decode_reference_pixels(self, monkeypatch):
+        reference = _make_series([1, 2, 3])
+        overlay = _make_series([10, 20, 30])
+        resampler = ImageResampler(background_fill=True)
+        converted = []
+        original = resampler.dicom_series_to_sitk
+
+        def recording_wrapper(datasets, series_uid=None):
+            converted.append(series_uid)
+            return original(datasets, series_uid)
+
+        monkeypatch.setattr(resampler, "dicom_series_to_sitk", recording_wrapper)
+        for idx in (0, 2):
+            result = resampler.get_resampled_slice(
+                overlay, reference, idx, overlay_series_uid="ov", reference_series_uid="ref"
+            )
+            np.testing.assert_allclose(result, np.full((4, 4), 10.0 * (idx + 1)), atol=1e-4)
+        assert resampler.wait_for_background_fill(timeout=30)
+        assert converted == ["ov"]
+
+    def test_cleared_fill_is_not_published(self):
+        reference = _make_series([1, 2, 3])
+        overlay = _make_series([10, 20, 30])
+        resampler = ImageResampler(background_fill=True)
+        release = threading.Event()
+        original = resampler._run_background_fill
+
+        def delayed_fill(cache_key, fill):
+            release.wait(30)
+            original(cache_key, fill)
+
+        resampler._run_background_fill = delayed_fill
+        assert resampler.get_resampled_slice(
+            overlay, reference, 0, overlay_series_uid="ov", reference_series_uid="ref"
+        ) is not None
+        threads = [fill.thread for fill in resampler._pending_fills.values()]
+        resampler.clear_cache("ov")
+        release.set()
+        for thread in threads:
+            thread.join(30)
+        assert not resampler._cache
+        assert not resampler._pending_fills
+
+    def test_uncached_request_resamples_synchronously(self):
+        reference = _make_series([1, 2, 3])
+        overlay = _make_series([10, 20, 30])
+        resampler = ImageResampler(background_fill=True)
+        result = resampler.get_resampled_slice(overlay, reference, 1)
+        np.testing.assert_allclose(result, np.full((4, 4), 20.0), atol=1e-4)
+        assert not resampler._pending_fills
@@ -1,12 +1,14 @@
 """
 Unit tests for ``core.study_index.index_folder_thread.StudyIndexFolderThread``.
 
-Mocks ``pydicom.dcmread``, ``StudyIndexStore``, and ``os.walk`` to exercise the
-success, cancel, and failure signal paths without touching disk or SQLCipher.
+Mocks ``pydicom.dcmread``, ``StudyIndexStore``, ``os.walk`` and the per-file stat and open to
+exercise the success, cancel, and failure signal paths without touching disk or
+SQLCipher. The incremental re-index tests at the end use real files and a real store.
 """
 
 from __future__ import annotations
 
+import io
 import os
 from unittest.mock import MagicMock, patch
 
@@ -18,6 +20,22 @@ from core.study_index.index_folder_thread import StudyIndexFolderThread
 pytestmark = pytest.mark.qt
 
 
+def _empty_handle(path, mode="rb"):
+    fh = io.BytesIO()
+    fh.name = path
+    return fh
+
+
+@pytest.fixture
+def _fake_file_stats():
+    """Give the mocked walk's paths a stat and a file handle so they reach ``dcmread``."""
+    with patch(
+        "core.study_index.index_folder_thread._file_stat_key",
+        return_value=(128, 1),
+    ), patch("core.study_index.index_folder_thread.open", _empty_handle, create=True):
+        yield
+
+
 def _run(thread: StudyIndexFolderThread, qapp) -> str:
     """Run the thread and return which terminal signal fired ('ok'/'failed'/'')."""
     outcome: dict[str, str] = {"signal": ""}
@@ -51,6 +69,7 @@ def _make_thread(cancel_predicate=lambda: False):
     )
 
 
+@pytest.mark.usefixtures("_fake_file_stats")
 class TestStudyIndexFolderThread:
     def test_indexes_files_and_emits_finished(self, qapp):
         walk_paths = [("/data/studies", [], ["a.dcm", "b.dcm"])]
@@ -95,9 +114,10 @@ class TestStudyIndexFolderThread:
         store_cls.assert_not_called()
 
     def test_cancel_before_first_read_emits_failed(self, qapp):
-        # should_cancel is checked once before the path loop and again before each
-        # read, so cancellation always precedes reads; with 2 files the second
-        # check (call #2) cancels before any dcmread occurs.
+        # should_cancel is checked once before the store is opened and again by every
+        # pipeline stage (walker per directory, parsers before each read, writer per
+        # result), so the second check cancels before any dcmread occurs. The store
+        # is opened (to look up stored file stats) but nothing is written.
         walk_paths = [("/data/studies", [], ["a.dcm", "b.dcm"])]
         calls = {"n": 0}
 
@@ -114,7 +134,29 @@ class TestStudyIndexFolderThread:
             signal = _run(thread, qapp)
         assert signal == "failed"
         assert dcmread.call_count == 0
-        store_cls.assert_not_called()
+        store_cls.return_value.upsert_rows.assert_not_called()
+        store_cls.return_value.delete_file_paths.assert_not_called()
+
+    def test_commits_in_batches_with_header_only_reads(self, qapp):
+        walk_paths = [("/data/studies", [], [f"im{i}.dcm" for i in range(5)])]
+        thread = StudyIndexFolderThread(
+            root_dir="/data/studies",
+            db_path="/data/idx.sqlite",
+            passphrase="secret",
+            should_cancel=lambda: False,
+            workers=3,
+            batch_rows=2,
+        )
+        with patch("core.study_index.index_folder_thread.os.walk", return_value=walk_paths), patch(
+            "core.study_index.index_folder_thread.pydicom.dcmread",
+            side_effect=lambda fh, **kw: MagicMock(filename=fh.name),
+        ) as dcmread, patch("core.study_index.index_folder_thread.StudyIndexStore") as store_cls:
+            assert _run(thread, qapp) == "ok"
+        batches = [len(c.args[0]) for c in store_cls.return_value.upsert_rows.call_args_list]
+        assert batches == [2, 2, 1]
+        kwargs = dcmread.call_args.kwargs
+        assert kwargs["stop_before_pixels"] is True
+        assert "StudyInstanceUID" in kwargs["specific_tags"]
 
     def test_read_errors_skipped(self, qapp):
         walk_paths = [("/data/studies", [], ["good.dcm", "bad.dcm"])]
@@ -122,8 +164,8 @@ class TestStudyIndexFolderThread:
         good = MagicMock()
         good.filename = "/data/studies/good.dcm"
 
-        def _dcmread(path, **kwargs):
-            if "bad" in path:
+        def _dcmread(fh, **kwargs):
+            if "bad" in fh.name:
                 raise ValueError("unreadable")
             return good
 
@@ -161,3 +203,100 @@ class TestStudyIndexFolderThread:
             store_cls.return_value.upsert_rows.side_effect = RuntimeError("db down")
             signal = _run(thread, qapp)
         assert signal == "failed"
+
+
+def _write_ct(path, sop_uid: str, study_uid: str = "1.2.826.0.1.42") -> None:
+    from pydicom.dataset import FileDataset, FileMetaDataset
+    from pydicom.uid import ExplicitVRLittleEndian
+
+    meta = FileMetaDataset()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+    meta.MediaStorageSOPInstanceUID = sop_uid
+    ds = FileDataset(str(path), {}, file_meta=meta, preamble=b"\0" * 128)
+    ds.StudyInstanceUID = study_uid
+    ds.SeriesInstanceUID = study_uid + ".1"
+    ds.SOPInstanceUID = sop_uid
+    ds.PatientName = "Incremental^Test"
+    ds.Modality = "CT"
+    ds.is_little_endian = True
+    ds.is_implicit_VR = False
+    ds.save_as(str(path), write_like_original=False)
+
+
+class TestIncrementalReindex:
+    """Real files + real SQLCipher store: unchanged files are not re-parsed."""
+
+    @pytest.fixture(autouse=True)
+    def _backend(self):
+        pytest.importorskip("sqlcipher3", reason="sqlcipher3 not installed")
+
+    def _crawl(self, root, db):
+        thread = StudyIndexFolderThread(str(root), str(db), "pw-incr", lambda: False)
+        reports: list = []
+        thread.report.connect(reports.append)
+        thread.run()
+        assert len(reports) == 1
+        return reports[0]
+
+    def test_reindex_skips_unchanged_updates_changed_and_removes_vanished(self, tmp_path):
+        from core.study_index.sqlcipher_store import StudyIndexStore
+
+        root = tmp_path / "studies"
+        (root / "series").mkdir(parents=True)
+        for i in range(3):
+            _write_ct(root / "series" / f"im{i}.dcm", f"1.2.826.0.1.42.1.{i}")
+        db = tmp_path / "idx.sqlite"
+
+        first = self._crawl(root, db)
+        assert (first.updated, first.skipped, first.removed) == (3, 0, 0)
+
+        with patch(
+            "core.study_index.index_folder_thread.pydicom.dcmread",
+            wraps=__import__("pydicom").dcmread,
+        ) as dcmread:
+            second = self._crawl(root, db)
+        assert (second.updated, second.skipped, second.removed) == (0, 3, 0)
+        assert dcmread.call_count == 0
+
+        changed = root / "series" / "im0.dcm"
+        st = os.stat(changed)
+        os.utime(changed, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        (root / "series" / "im2.dcm").unlink()
+        third = self._crawl(root, db)
+        assert (third.updated, third.skipped, third.removed) == (1, 1, 1)
+
+        store = StudyIndexStore(str(db), "pw-incr")
+        stats = store.file_stats_under_root(str(root))
+        assert sorted(os.path.basename(p) for p in stats) == ["im0.dcm", "im1.dcm"]
+        assert store.row_count() == 2
+
+    def test_cancelled_crawl_keeps_committed_batches_and_resumes(self, tmp_path):
+        from core.study_index.sqlcipher_store import StudyIndexStore
+
+        root = tmp_path / "studies"
+        root.mkdir()
+        for i in range(5):
+            _write_ct(root / f"im{i}.dcm", f"1.2.826.0.1.43.1.{i}")
+        db = tmp_path / "idx.sqlite"
+        cancel = {"flag": False}
+        real_upsert = StudyIndexStore.upsert_rows
+
+        def upsert_then_cancel(store, rows):
+            real_upsert(store, rows)
+            cancel["flag"] = True
+
+        thread = StudyIndexFolderThread(
+            str(root), str(db), "pw-incr", lambda: cancel["flag"], workers=1, batch_rows=2
+        )
+        failures: list[str] = []
+        thread.failed.connect(failures.append)
+        with patch.object(StudyIndexStore, "upsert_rows", upsert_then_cancel):
+            thread.run()
+        assert failures == ["Cancelled"]
+        committed = StudyIndexStore(str(db), "pw-incr").row_count()
+        assert 2 <= committed < 5
+
+        resumed = self._crawl(root, db)
+        assert (resumed.updated, resumed.skipped) == (5 - committed, committed)
+        assert StudyIndexStore(str(db), "pw-incr").row_count() == 5
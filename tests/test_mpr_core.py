@@ -27,7 +27,8 @@ from pydicom.uid import ExplicitVRLittleEndian, generate_uid
 
 from core.mpr_builder import MprBuilder, MprResult
 from core.mpr_cache import MprCache, make_result_key
-from core.mpr_volume import MprVolume
+from core.mpr_compact_stack import CompactMprStack
+from core.mpr_volume import LazyMprVolume, MprVolume
 
 
 def _make_pixel_dataset(
@@ -131,6 +132,26 @@ class TestMprVolume(unittest.TestCase):
         arr = sitk.GetArrayFromImage(volume.sitk_image)  # shape (z, y, x)
         np.testing.assert_allclose(arr[0], 15.0, rtol=1e-5)
 
+    def test_lazy_volume_orders_without_building(self):
+        datasets = _make_axial_volume(n_slices=4)
+        shuffled = [datasets[2], datasets[0], datasets[3], datasets[1], datasets[0]]
+        lazy = LazyMprVolume(shuffled)
+
+        self.assertEqual(
+            [ds.SOPInstanceUID for ds in lazy.source_datasets],
+            [ds.SOPInstanceUID for ds in datasets],
+        )
+        self.assertFalse(lazy.is_resolved)
+
+        # First geometry/pixel attribute access builds the real volume.
+        self.assertEqual(lazy.sitk_image.GetSize(), (5, 4, 4))
+        self.assertTrue(lazy.is_resolved)
+        self.assertEqual(lazy.rows, 4)
+        self.assertEqual(
+            [ds.SOPInstanceUID for ds in lazy.source_datasets],
+            [ds.SOPInstanceUID for ds in datasets],
+        )
+
 
 class TestMprBuilderAndCache(unittest.TestCase):
     """Focused tests for MprBuilder output and MprCache round-trip."""
@@ -223,6 +244,72 @@ class TestMprBuilderAndCache(unittest.TestCase):
                 result.apply_rescale(raw),
             )
 
+    def _sagittal_result(self):
+        volume = MprVolume.from_datasets(_make_axial_volume())
+        worker = MprBuilder.create_worker(
+            source_volume=volume,
+            output_plane=MprBuilder.standard_planes()["sagittal"],
+            output_spacing_mm=1.0,
+            output_thickness_mm=1.0,
+            interpolation="linear",
+        )
+        return worker._build()
+
+    def test_cache_raw_entry_is_memory_mapped(self):
+        result = self._sagittal_result()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = MprCache(cache_dir=tmpdir, max_size_mb=50)
+            self.assertTrue(cache.save(result))
+            key = make_result_key(result)
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, key + ".npy")))
+
+            slices, _stack, meta = cache.load(key)
+            self.assertEqual(meta["storage"], "raw")
+            self.assertEqual(meta["stack_dtype"], "int16")
+            self.assertIsInstance(slices, CompactMprStack)
+            self.assertIsInstance(slices.stored, np.memmap)
+            self.assertFalse(slices.stored.flags.writeable)
+            self.assertEqual(slices[0].dtype, np.float32)
+            for got, want in zip(slices, result.slices, strict=True):
+                np.testing.assert_array_equal(got, want)
+            del slices
+
+            # Re-opening the cache indexes the raw entry.
+            self.assertTrue(MprCache(cache_dir=tmpdir, max_size_mb=50).has(key))
+
+    def test_cache_compressed_entry_round_trip(self):
+        result = self._sagittal_result()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = MprCache(cache_dir=tmpdir, max_size_mb=50, compress=True)
+            self.assertTrue(cache.save(result))
+            key = make_result_key(result)
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, key + ".npz")))
+
+            slices, _stack, meta = cache.load(key)
+            self.assertEqual(meta["storage"], "zlib")
+            for got, want in zip(slices, result.slices, strict=True):
+                np.testing.assert_array_equal(got, want)
+
+            # Switching back to raw replaces the compressed file for the key.
+            cache.set_compression(False)
+            self.assertTrue(cache.save(result))
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, key + ".npz")))
+            self.assertTrue(MprCache(cache_dir=tmpdir, max_size_mb=50).has(key))
+
+    def test_cache_drops_entries_from_older_format(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            legacy_npz = os.path.join(tmpdir, "old.npz")
+            legacy_meta = os.path.join(tmpdir, "old_meta.json")
+            np.savez_compressed(legacy_npz, n_slices=np.array(1), slice_0=np.zeros((2, 2)))
+            with open(legacy_meta, "w", encoding="utf-8") as f:
+                f.write('{"key": "old", "cache_format_version": "4"}')
+
+            cache = MprCache(cache_dir=tmpdir, max_size_mb=50)
+
+            self.assertEqual(cache.entry_count(), 0)
+            self.assertFalse(os.path.exists(legacy_npz))
+            self.assertFalse(os.path.exists(legacy_meta))
+
 
 if __name__ == "__main__":
     unittest.main()
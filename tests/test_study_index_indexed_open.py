@@ -0,0 +1,140 @@
+"""Tests for opening a study from its index rows (``core.study_index.indexed_open``)."""
+
+from __future__ import annotations
+
+import copy
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pydicom
+from pydicom.dataset import FileDataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian
+
+from core.dicom_loader import DICOMLoader
+from core.dicom_organizer import DICOMOrganizer
+from core.study_index import indexed_open
+from core.study_index.indexed_open import (
+    IndexedInstanceDataset,
+    load_indexed_instances,
+    opens_from_index,
+)
+from core.study_index.metadata_extract import dataset_to_index_row
+
+_STUDY = "1.2.826.0.1.77"
+
+
+def _write_ct(path, index: int) -> None:
+    meta = FileMetaDataset()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+    meta.MediaStorageSOPInstanceUID = f"{_STUDY}.1.{index}"
+    ds = FileDataset(str(path), {}, file_meta=meta, preamble=b"\0" * 128)
+    ds.SOPClassUID = meta.MediaStorageSOPClassUID
+    ds.StudyInstanceUID = _STUDY
+    ds.SeriesInstanceUID = _STUDY + ".1"
+    ds.SOPInstanceUID = meta.MediaStorageSOPInstanceUID
+    ds.PatientName = "Lazy^Open"
+    ds.Modality = "CT"
+    ds.SeriesNumber = 1
+    ds.InstanceNumber = 3 - index
+    ds.ImagePositionPatient = [0.0, 0.0, float(index)]
+    ds.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+    ds.WindowCenter = 40
+    ds.Rows = ds.Columns = 4
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated = ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 1
+    ds.PixelData = np.full((4, 4), index, dtype=np.int16).tobytes()
+    ds.is_little_endian = True
+    ds.is_implicit_VR = False
+    ds.save_as(str(path), write_like_original=False)
+
+
+def _crawled_rows(tmp_path, count: int = 3) -> list[dict]:
+    """Rows as the folder crawler writes them (per-instance fields and file stats)."""
+    rows = []
+    for i in range(count):
+        path = tmp_path / f"im{i}.dcm"
+        _write_ct(path, i)
+        row = dataset_to_index_row(
+            pydicom.dcmread(str(path)), file_path=str(path), study_root_path=str(tmp_path)
+        )
+        st = os.stat(path)
+        row["file_size"], row["file_mtime_ns"] = st.st_size, st.st_mtime_ns
+        rows.append(row)
+    return rows
+
+
+def test_indexed_dataset_reads_file_only_for_unindexed_elements(tmp_path) -> None:
+    (row,) = _crawled_rows(tmp_path, 1)
+    ds = IndexedInstanceDataset(row)
+    with patch.object(indexed_open.pydicom, "dcmread", side_effect=AssertionError("read")):
+        assert ds.PatientName == "Lazy^Open"
+        assert ds.ImagePositionPatient == [0.0, 0.0, 0.0]
+        assert "NumberOfFrames" not in ds
+        assert not hasattr(ds, "PerFrameFunctionalGroupsSequence")
+        assert ds.file_meta.TransferSyntaxUID == ExplicitVRLittleEndian
+        assert ds.stored_pixel_data_bytes == 32
+        assert ds.is_loaded is False
+    assert ds.WindowCenter == 40
+    assert ds.is_loaded is True
+    assert ds.stored_pixel_data_bytes is None
+    assert ds.pixel_array.shape == (4, 4)
+    assert len(ds) == len(pydicom.dcmread(row["file_path"]))
+
+
+def test_indexed_dataset_edits_survive_the_file_read(tmp_path) -> None:
+    (row,) = _crawled_rows(tmp_path, 1)
+    original = IndexedInstanceDataset(row)
+    anonymized = copy.deepcopy(original)
+    anonymized.PatientName = "Anon"
+    assert anonymized.is_loaded is True
+    assert anonymized.PatientName == "Anon"
+    assert anonymized.WindowCenter == 40
+    assert original.is_loaded is False
+    assert original.PatientName == "Lazy^Open"
+
+
+def test_indexed_dataset_keeps_indexed_elements_when_file_is_gone(tmp_path) -> None:
+    (row,) = _crawled_rows(tmp_path, 1)
+    ds = IndexedInstanceDataset(row)
+    os.remove(row["file_path"])
+    assert not hasattr(ds, "WindowCenter")
+    assert ds.is_loaded is True
+    assert ds.SOPInstanceUID == row["sop_instance_uid"]
+
+
+def test_opens_from_index_requires_current_stats_and_instance_fields(tmp_path) -> None:
+    (row,) = _crawled_rows(tmp_path, 1)
+    stats = (row["file_size"], row["file_mtime_ns"])
+    assert opens_from_index(row, stats)
+    assert not opens_from_index(row, None)
+    assert not opens_from_index(row, (row["file_size"] + 1, row["file_mtime_ns"]))
+    assert not opens_from_index({**row, "instance_header": None}, stats)
+    assert not opens_from_index({**row, "pixel_data_offset": None}, stats)
+    assert not opens_from_index({**row, "number_of_frames": 1}, stats)
+
+
+def test_load_indexed_instances_merges_without_reading_unchanged_files(tmp_path) -> None:
+    rows = _crawled_rows(tmp_path)
+    # A file changed since the crawl is read up front like any other load.
+    changed = rows[2]["file_path"]
+    st = os.stat(changed)
+    os.utime(changed, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    loader = DICOMLoader()
+    progress: list[tuple[int, int]] = []
+
+    datasets = load_indexed_instances(loader, rows, lambda cur, total, _name: progress.append((cur, total)))
+
+    assert [type(ds) is IndexedInstanceDataset for ds in datasets] == [True, True, False]
+    assert loader.attempted_file_count == 3 and loader.failed_files == []
+    assert progress[-1] == (3, 3)
+    organizer = DICOMOrganizer()
+    result = organizer.merge_batch(datasets, [ds.filename for ds in datasets], str(tmp_path))
+    assert result.added_file_count == 3
+    assert [ds.is_loaded for ds in datasets[:2]] == [False, False]
+    (series,) = organizer.studies[_STUDY].values()
+    assert [int(ds.InstanceNumber) for ds in series] == [1, 2, 3]
@@ -109,6 +109,58 @@ def test_scan_empty_when_backend_unavailable(tmp_path) -> None:
     assert svc.integrity_scan() == []
 
 
+def test_scan_streams_studies_and_lists_each_directory_once(tmp_path) -> None:
+    from unittest.mock import patch
+
+    root = tmp_path / "archive"
+    db = tmp_path / "many.sqlite"
+    store = StudyIndexStore(str(db), "pw-many")
+    store.init_schema()
+    rows = []
+    expected_missing: dict[str, int] = {}
+    for s in range(12):
+        series_dir = root / f"dir{s % 3}"  # four studies share each folder
+        series_dir.mkdir(parents=True, exist_ok=True)
+        uid = f"1.{s:02d}"
+        for i in range(3):
+            p = series_dir / f"s{s}_{i}.dcm"
+            p.write_bytes(b"DICM")
+            rows.append(_row(os.path.abspath(str(root)), os.path.abspath(str(p)), uid))
+        if s % 4 == 1:
+            os.remove(series_dir / f"s{s}_0.dcm")
+            expected_missing[uid] = 1
+    store.upsert_rows(rows)
+    svc = _service_for(store)
+    seen: list[tuple[int, int]] = []
+    with patch("core.study_index.file_presence.os.scandir", wraps=os.scandir) as scandir, patch.object(
+        StudyIndexStore, "get_file_paths_for_study"
+    ) as per_study:
+        records = svc.integrity_scan(progress=lambda d, t: seen.append((d, t)))
+    assert scandir.call_count == 3
+    per_study.assert_not_called()
+    assert {r.study_uid: r.missing_count for r in records} == expected_missing
+    assert [r.study_uid for r in records] == sorted(expected_missing)
+    assert all(r.total_count == 3 for r in records)
+    assert seen == [(i, 12) for i in range(1, 13)]
+
+
+def test_presence_checker_falls_back_to_isfile(tmp_path) -> None:
+    from unittest.mock import patch
+
+    from core.study_index.file_presence import FilePresenceChecker
+
+    present = tmp_path / "here.dcm"
+    present.write_bytes(b"DICM")
+    paths = [str(present), str(tmp_path / "gone.dcm"), str(tmp_path / "nodir" / "x.dcm")]
+    with FilePresenceChecker(workers=2) as checker:
+        assert checker.count_missing(checker.prefetch(paths)) == 2
+    # Unlistable directory (e.g. list permission denied): answer per file instead.
+    with patch(
+        "core.study_index.file_presence._list_regular_files", return_value=None
+    ), FilePresenceChecker(workers=2) as checker:
+        assert checker.count_missing(checker.prefetch(paths)) == 2
+
+
 def test_relocate_rewrites_paths_and_counts(tmp_path) -> None:
     store, root, files = _seed(tmp_path)
     # Move the folder to a new location on disk.
@@ -92,6 +92,11 @@ def test_dataset_to_index_row_all_fields_and_paths() -> None:
         "study_description",
         "series_description",
         "modality",
+        "instance_number",
+        "number_of_frames",
+        "transfer_syntax_uid",
+        "pixel_data_offset",
+        "instance_header",
     }
 
 
@@ -101,6 +106,30 @@ def test_dataset_to_index_row_missing_fields_empty() -> None:
     assert row["patient_name"] == ""
     assert row["modality"] == ""
     assert row["study_uid"] == ""
+    assert row["instance_number"] is None
+    assert row["pixel_data_offset"] is None
+    assert row["instance_header"] == "{}"
+
+
+def test_dataset_to_index_row_per_instance_fields(tmp_path) -> None:
+    """A dataset read from disk records its Pixel Data offset and header JSON."""
+    import pydicom
+    from pydicom.data import get_testdata_file
+
+    path = get_testdata_file("CT_small.dcm")
+    with open(path, "rb") as fh:
+        pydicom.dcmread(fh, stop_before_pixels=True, force=True)
+        header_end = fh.tell()
+    ds = pydicom.dcmread(path, force=True)
+    row = dataset_to_index_row(ds, file_path=path, study_root_path=str(tmp_path))
+    assert row["pixel_data_offset"] == header_end
+    assert row["transfer_syntax_uid"] == ds.file_meta.TransferSyntaxUID
+    assert row["instance_number"] == int(ds.InstanceNumber)
+    assert row["number_of_frames"] is None
+    header = Dataset.from_json(row["instance_header"])
+    assert header.ImagePositionPatient == ds.ImagePositionPatient
+    assert header.PatientName == ds.PatientName
+    assert "PixelData" not in header
 
 
 def test_repair_str_bytes_repr_artifact_single_quote() -> None:
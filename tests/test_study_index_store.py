@@ -354,6 +354,8 @@ def test_study_index_store_migrate_v1_schema_to_v2_fts(tmp_path) -> None:
     g = store.search_grouped_studies(global_fts_query="LegacyPat", limit=10, offset=0)
     assert len(g) == 1
     assert g[0]["study_uid"] == "1.legacy"
+    # v4 file-stat columns exist; legacy rows have no stats so they re-parse once.
+    assert store.file_stats_under_root(root) == {fp: (None, None)}
 
 
 def _seed_two_studies(store, tmp_path):
@@ -463,3 +465,431 @@ def test_study_index_store_iter_all_entries_and_keys(tmp_path) -> None:
     keys = store.existing_study_file_keys()
     assert (entries[0]["study_uid"], entries[0]["file_path"]) in keys
     assert len(keys) == 2
+
+
+def test_study_index_store_file_stats_and_delete_paths(tmp_path) -> None:
+    db = tmp_path / "stats.sqlite"
+    store = StudyIndexStore(str(db), "pw-stats")
+    store.init_schema()
+    root = os.path.abspath(str(tmp_path / "root"))
+    sibling = root + "2"  # shares the prefix string but is not under ``root``
+    store.upsert_rows(
+        [
+            {
+                "file_path": os.path.join(root, "a.dcm"),
+                "study_root_path": root,
+                "study_uid": "1.a",
+                "file_size": 100,
+                "file_mtime_ns": 7,
+            },
+            {
+                "file_path": os.path.join(root, "sub", "b.dcm"),
+                "study_root_path": root,
+                "study_uid": "1.a",
+                "file_size": 200,
+                "file_mtime_ns": 8,
+            },
+            {
+                "file_path": os.path.join(sibling, "c.dcm"),
+                "study_root_path": sibling,
+                "study_uid": "2.c",
+            },
+        ]
+    )
+    stats = store.file_stats_under_root(root)
+    assert stats == {
+        os.path.join(root, "a.dcm"): (100, 7),
+        os.path.join(root, "sub", "b.dcm"): (200, 8),
+    }
+    assert store.delete_file_paths([os.path.join(root, "a.dcm"), "/missing.dcm"]) == 1
+    assert store.delete_file_paths([]) == 0
+    assert store.row_count() == 2
+
+
+def test_study_index_store_reuses_keyed_connection_per_thread(tmp_path) -> None:
+    import threading
+
+    db = tmp_path / "pool.sqlite"
+    store = StudyIndexStore(str(db), "pw-pool")
+    store.init_schema()
+    conn = store._connect()
+    # A fresh store on the same file (how the service works) reuses the connection.
+    assert StudyIndexStore(str(db), "pw-pool")._connect() is conn
+    other: list = []
+    worker = threading.Thread(target=lambda: other.append(store._connect()))
+    worker.start()
+    worker.join()
+    assert other[0] is not conn
+
+
+def test_study_index_store_reopens_after_close_or_file_replaced(tmp_path) -> None:
+    from core.study_index.sqlcipher_store import close_pooled_connections
+
+    db = tmp_path / "reopen.sqlite"
+    store = StudyIndexStore(str(db), "pw-reopen")
+    store.init_schema()
+    _seed_two_studies(store, tmp_path)
+    conn = store._connect()
+    assert close_pooled_connections(str(db)) >= 1
+    assert store.row_count() == 2
+    assert store._connect() is not conn
+
+    # Deleting the file under a pooled connection must not keep serving the old inode.
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(f"{db}{suffix}"):
+            os.remove(f"{db}{suffix}")
+    store.init_schema()
+    assert store.row_count() == 0
+
+
+def test_close_pooled_connections_waits_for_a_query_on_another_thread(tmp_path) -> None:
+    import threading
+
+    from core.study_index.sqlcipher_store import close_pooled_connections
+
+    db = tmp_path / "busy.sqlite"
+    store = StudyIndexStore(str(db), "pw-busy")
+    store.init_schema()
+    _seed_two_studies(store, tmp_path)
+    started, release = threading.Event(), threading.Event()
+    seen: list = []
+
+    def reader() -> None:
+        with store._session() as conn:
+            started.set()
+            release.wait(5)
+            seen.append(conn.execute("SELECT COUNT(*) FROM study_index_entry").fetchone()[0])
+
+    worker = threading.Thread(target=reader)
+    worker.start()
+    started.wait(5)
+    threading.Timer(0.2, release.set).start()
+    assert close_pooled_connections(str(db)) >= 1
+    worker.join()
+    assert seen == [2]
+
+
+def test_connections_of_exited_threads_are_closed(tmp_path) -> None:
+    import threading
+
+    from core.study_index import sqlcipher_store
+
+    db = tmp_path / "exited.sqlite"
+    store = StudyIndexStore(str(db), "pw-exited")
+    store.init_schema()
+    other: list = []
+    worker = threading.Thread(target=lambda: other.append(store._connect()))
+    worker.start()
+    worker.join()
+    StudyIndexStore(str(tmp_path / "next.sqlite"), "pw-exited")._connect()
+    assert all(h.conn is not other[0] for h in sqlcipher_store._POOL._holders)
+    with pytest.raises(sqlcipher_store.sqlcipher_sqlite.ProgrammingError):
+        other[0].execute("SELECT 1")
+
+
+def _like_contains(value: str, needle: str) -> bool:
+    """Reference for SQLite ``LIKE '%needle%'``: case folding for ASCII letters only."""
+
+    def fold(text: str) -> str:
+        return "".join(ch.lower() if ch.isascii() else ch for ch in text)
+
+    return fold(needle.strip()) in fold(value)
+
+
+_SUBSTRING_NAMES = (
+    "Müller^Hans",
+    "MÜLLER^Anna",
+    "O'Brien^Pat",
+    'Quote"d^Name',
+    "Percent%Sign^X",
+    "Under_Score^Y",
+    "smith^john",
+    "SMITHSON^Jo",
+)
+
+
+@pytest.mark.parametrize(
+    "needle",
+    ["mül", "MÜL", "smith", "SMI", "ith^j", "'bri", '"d^n', "t%s", "r_s", "er", "zzz", "^"],
+)
+def test_study_index_store_trigram_filter_matches_like_semantics(tmp_path, needle) -> None:
+    db = tmp_path / "tri.sqlite"
+    store = StudyIndexStore(str(db), "pw-tri")
+    store.init_schema()
+    root = os.path.abspath(str(tmp_path))
+    store.upsert_rows(
+        [
+            {
+                "file_path": os.path.join(root, f"{i}.dcm"),
+                "study_root_path": root,
+                "study_uid": f"1.{i}",
+                "patient_name": name,
+                "study_description": name.upper(),
+            }
+            for i, name in enumerate(_SUBSTRING_NAMES)
+        ]
+    )
+    expected = sorted(n for n in _SUBSTRING_NAMES if _like_contains(n, needle))
+    found = sorted(r["patient_name"] for r in store.search(patient_name_contains=needle))
+    assert found == expected
+    grouped = store.search_grouped_studies(patient_name_contains=needle, limit=50)
+    assert sorted(r["patient_name"] for r in grouped) == expected
+
+
+def test_study_index_store_substring_filters_use_trigram_index(tmp_path) -> None:
+    db = tmp_path / "triplan.sqlite"
+    store = StudyIndexStore(str(db), "pw-triplan")
+    store.init_schema()
+    _seed_two_studies(store, tmp_path)
+    where, params = store._search_filter_clauses(
+        patient_name_contains="alpha", accession_contains="xy", table_alias="e"
+    )
+    assert "study_index_entry_tri MATCH ?" in where
+    # Only needles long enough for a trigram go through the index.
+    assert params[-1] == 'patient_name : "alpha"'
+    conn = store._connect()
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT e.id FROM study_index_entry e" + where, params
+    ).fetchall()
+    assert any("study_index_entry_tri" in str(row[-1]) for row in plan)
+    assert [r["study_uid"] for r in store.search(patient_name_contains="ALPHA")] == ["1.alpha"]
+
+
+def test_study_index_store_global_fts_filter_is_uncorrelated(tmp_path) -> None:
+    db = tmp_path / "ftsplan.sqlite"
+    store = StudyIndexStore(str(db), "pw-ftsplan")
+    store.init_schema()
+    _seed_two_studies(store, tmp_path)
+    conn = store._connect()
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT e.id FROM study_index_entry e WHERE "
+        + store._fts_filter_sql("e"),
+        ('"alpha"',),
+    ).fetchall()
+    details = [str(row[-1]) for row in plan]
+    assert any("study_index_entry_fts" in d for d in details)
+    # The MATCH must run once, not once per outer row.
+    assert not any("CORRELATED" in d for d in details)
+
+
+def test_study_index_store_migrate_v4_builds_trigram_index(tmp_path) -> None:
+    db = tmp_path / "v4.sqlite"
+    store = StudyIndexStore(str(db), "pw-v4")
+    store.init_schema()
+    _seed_two_studies(store, tmp_path)
+    conn = store._connect()
+    # Roll the file back to the v4 layout (no trigram table or triggers).
+    conn.executescript(
+        """
+        DROP TRIGGER study_index_entry_tri_ai;
+        DROP TRIGGER study_index_entry_tri_ad;
+        DROP TRIGGER study_index_entry_tri_au;
+        DROP TABLE study_index_entry_tri;
+        PRAGMA user_version = 4;
+        """
+    )
+    store.init_schema()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == StudyIndexStore.SCHEMA_VERSION
+    assert [r["study_uid"] for r in store.search(patient_name_contains="bravo")] == ["2.bravo"]
+
+
+def _summary_rows(store) -> dict[tuple[str, str], dict]:
+    return {(g["study_uid"], g["study_root_path"]): g for g in store.iter_study_groups()}
+
+
+def test_study_index_store_study_summary_follows_every_write(tmp_path) -> None:
+    db = tmp_path / "summary.sqlite"
+    store = StudyIndexStore(str(db), "pw-summary")
+    store.init_schema()
+    root = os.path.abspath(str(tmp_path))
+    new_root = os.path.abspath(str(tmp_path / "moved"))
+
+    def row(name: str, study: str, series: str, modality: str) -> dict:
+        return {
+            "file_path": os.path.join(root, name),
+            "study_root_path": root,
+            "study_uid": study,
+            "series_uid": series,
+            "patient_name": f"Pat^{study}",
+            "modality": modality,
+        }
+
+    store.upsert_rows(
+        [row("a1.dcm", "1.a", "1.a.1", "CT"), row("a2.dcm", "1.a", "1.a.2", "PT"),
+         row("b1.dcm", "2.b", "2.b.1", "MR")]
+    )
+    groups = _summary_rows(store)
+    assert groups[("1.a", root)]["instance_count"] == 2
+    assert groups[("1.a", root)]["modalities"] == "CT, PT"
+
+    # Re-indexing a file with a different study UID moves it between summaries.
+    store.upsert_rows([row("a2.dcm", "2.b", "2.b.2", "MR")])
+    groups = _summary_rows(store)
+    assert groups[("1.a", root)]["modalities"] == "CT"
+    b = store.search_grouped_studies(patient_name_contains="Pat^2.b", limit=10)
+    assert [(g["instance_count"], g["series_count"]) for g in b] == [(2, 2)]
+
+    store.delete_file_paths([os.path.join(root, "a1.dcm")])
+    assert set(_summary_rows(store)) == {("2.b", root)}
+
+    os.makedirs(new_root)
+    for name in ("b1.dcm", "a2.dcm"):
+        open(os.path.join(new_root, name), "wb").close()
+    assert store.relocate_study_paths("2.b", root, new_root) == 2
+    moved = _summary_rows(store)
+    assert set(moved) == {("2.b", new_root)}
+    assert moved[("2.b", new_root)]["instance_count"] == 2
+
+    assert store.delete_study_group("2.b", new_root) == 2
+    assert store.iter_study_groups() == []
+    assert store.search_grouped_studies(limit=10) == []
+
+
+def test_study_index_store_grouped_keyset_pages_match_offset_pages(tmp_path) -> None:
+    db = tmp_path / "keyset.sqlite"
+    store = StudyIndexStore(str(db), "pw-keyset")
+    store.init_schema()
+    root = os.path.abspath(str(tmp_path))
+    store.upsert_rows(
+        [
+            {
+                "file_path": os.path.join(root, f"s{i}_{j}.dcm"),
+                "study_root_path": root,
+                "study_uid": f"1.{i}",
+                "series_uid": f"1.{i}.{j}",
+                # Repeated dates and names exercise the tiebreaks.
+                "patient_name": f"Pat^{i % 3}",
+                "study_date": f"2020010{i % 4}",
+                "modality": "CT",
+            }
+            for i in range(11)
+            for j in range(1 + i % 2)
+        ]
+    )
+    for order_by in ("study_date", "patient_name", "instance_count"):
+        for descending in (True, False):
+            full = store.search_grouped_studies(
+                limit=100, order_by=order_by, descending=descending
+            )
+            by_keyset: list[dict] = []
+            after = None
+            while True:
+                page = store.search_grouped_studies(
+                    limit=4, order_by=order_by, descending=descending, after_id=after
+                )
+                if not page:
+                    break
+                by_keyset.extend(page)
+                after = page[-1]["summary_id"]
+            assert [r["study_uid"] for r in by_keyset] == [r["study_uid"] for r in full]
+            by_offset = [
+                r
+                for offset in range(0, 12, 4)
+                for r in store.search_grouped_studies(
+                    limit=4, offset=offset, order_by=order_by, descending=descending
+                )
+            ]
+            assert by_offset == full
+
+
+def test_study_index_store_grouped_filters_select_whole_studies(tmp_path) -> None:
+    db = tmp_path / "wholestudy.sqlite"
+    store = StudyIndexStore(str(db), "pw-whole")
+    store.init_schema()
+    root = os.path.abspath(str(tmp_path))
+    store.upsert_rows(
+        [
+            {
+                "file_path": os.path.join(root, f"{m}.dcm"),
+                "study_root_path": root,
+                "study_uid": "1.petct",
+                "series_uid": f"1.petct.{m}",
+                "modality": m,
+            }
+            for m in ("CT", "PT")
+        ]
+    )
+    (only,) = store.search_grouped_studies(modality="PT", limit=10)
+    assert (only["instance_count"], only["modalities"]) == (2, "CT, PT")
+    assert store.search_grouped_studies(modality="MR", limit=10) == []
+    after_only = store.search_grouped_studies(
+        modality="PT", limit=10, after_id=only["summary_id"]
+    )
+    assert after_only == []
+
+
+def test_study_index_store_migrate_v5_builds_study_summary(tmp_path) -> None:
+    db = tmp_path / "v5.sqlite"
+    store = StudyIndexStore(str(db), "pw-v5")
+    store.init_schema()
+    _seed_two_studies(store, tmp_path)
+    conn = store._connect()
+    conn.executescript("DROP TABLE study_summary; PRAGMA user_version = 5;")
+    store.init_schema()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == StudyIndexStore.SCHEMA_VERSION
+    assert sorted(g["study_uid"] for g in store.iter_study_groups()) == ["1.alpha", "2.bravo"]
+
+
+def test_study_index_store_study_instances_and_kept_crawl_stats(tmp_path) -> None:
+    db = tmp_path / "instances.sqlite"
+    store = StudyIndexStore(str(db), "pw-instances")
+    store.init_schema()
+    root = os.path.abspath(str(tmp_path))
+
+    def row(name: str, series: str, number: int | None, **extra) -> dict:
+        return {
+            "file_path": os.path.join(root, name),
+            "study_root_path": root,
+            "study_uid": "1.inst",
+            "series_uid": series,
+            "instance_number": number,
+            **extra,
+        }
+
+    store.upsert_rows(
+        [
+            row("b2.dcm", "1.inst.2", 1, file_size=10, file_mtime_ns=1, pixel_data_offset=300),
+            row("a2.dcm", "1.inst.1", 2, instance_header="{}"),
+            row("a1.dcm", "1.inst.1", 1, transfer_syntax_uid="1.2.840.10008.1.2.1"),
+        ]
+    )
+    instances = store.get_study_instances("1.inst", root)
+    assert [os.path.basename(r["file_path"]) for r in instances] == ["a1.dcm", "a2.dcm", "b2.dcm"]
+    assert instances[0]["transfer_syntax_uid"] == "1.2.840.10008.1.2.1"
+    assert instances[1]["instance_header"] == "{}"
+    assert instances[2]["pixel_data_offset"] == 300
+    assert store.get_study_instances("1.inst", "") == []
+
+    # A load-pipeline row (no stats) keeps the stats the folder crawl recorded.
+    store.upsert_rows([row("b2.dcm", "1.inst.2", 1)])
+    assert store.file_stats_under_root(root)[os.path.join(root, "b2.dcm")] == (10, 1)
+
+
+def test_study_index_store_migrate_v6_adds_instance_columns(tmp_path) -> None:
+    db = tmp_path / "v6.sqlite"
+    store = StudyIndexStore(str(db), "pw-v6")
+    store.init_schema()
+    conn = store._connect()
+    # Roll the file back to the v6 layout (no per-instance columns).
+    for column in (
+        "instance_number",
+        "number_of_frames",
+        "transfer_syntax_uid",
+        "pixel_data_offset",
+        "instance_header",
+    ):
+        conn.execute(f"ALTER TABLE study_index_entry DROP COLUMN {column}")
+    root = os.path.abspath(str(tmp_path))
+    conn.execute(
+        "INSERT INTO study_index_entry (file_path, study_root_path, study_uid, indexed_at, "
+        "file_size, file_mtime_ns) VALUES (?, ?, '1.v6', 0, 5, 6)",
+        (os.path.join(root, "a.dcm"), root),
+    )
+    conn.execute("PRAGMA user_version = 6")
+    conn.commit()
+    store.init_schema()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == StudyIndexStore.SCHEMA_VERSION
+    (only,) = store.get_study_instances("1.v6", root)
+    assert only["instance_header"] is None
+    # Stats are cleared so the next crawl fills the new columns.
+    assert (only["file_size"], only["file_mtime_ns"]) == (None, None)
@@ -219,3 +219,57 @@ def test_mpr_volume_remains_raw_and_mpr_rescale_still_applies_once() -> None:
     result = worker._build()
 
     np.testing.assert_allclose(result.apply_rescale(np.array([[1024.0]], dtype=np.float32)), [[0.0]])
+
+
+def test_prepare_volume_data_peak_memory_is_one_float_volume() -> None:
+    """Calibration writes into the one float32 render array (no extra copies)."""
+    import tracemalloc
+
+    depth, rows, cols = 32, 128, 128
+    stored = np.arange(depth * rows * cols, dtype=np.int64) % 4096
+    image = sitk.GetImageFromArray(stored.reshape(depth, rows, cols).astype(np.int16))
+    datasets = []
+    for z in range(depth):
+        ds = Dataset()
+        ds.Modality = "CT"
+        ds.RescaleSlope = 1.0 + z / depth
+        ds.RescaleIntercept = -1024.0
+        ds.RescaleType = "HU"
+        datasets.append(ds)
+
+    float_volume_bytes = depth * rows * cols * 4
+    tracemalloc.start()
+    try:
+        vd = VolumeRenderer.prepare_volume_data(
+            image, source_datasets=datasets, apply_rescale=True
+        )
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    print(f"prepare_volume_data peak: {peak / 2**20:.2f} MiB "
+          f"(float32 volume {float_volume_bytes / 2**20:.2f} MiB)")
+    assert vd.rescale_applied is True
+    assert peak < float_volume_bytes * 1.25
+    expected = stored.reshape(depth, rows, cols)[5] * np.float32(1.0 + 5 / depth) - 1024.0
+    np.testing.assert_allclose(vd.array[5], expected, rtol=1e-6)
+
+
+def test_attach_volume_shares_the_prepared_buffer() -> None:
+    """VTK wraps the prepared float32 array instead of deep-copying it."""
+    import pytest
+
+    pytest.importorskip("vtk")
+    from vtkmodules.util import numpy_support
+
+    image = sitk.GetImageFromArray(np.arange(24, dtype=np.int16).reshape(2, 3, 4))
+    vd = VolumeRenderer.prepare_volume_data(image)
+    renderer = VolumeRenderer()
+    try:
+        renderer.attach_volume(vd)
+        scalars = renderer._vtk_image.GetPointData().GetScalars()
+        wrapped = numpy_support.vtk_to_numpy(scalars)
+        assert np.shares_memory(wrapped, vd.array)
+        np.testing.assert_array_equal(wrapped, np.arange(24, dtype=np.float32))
+    finally:
+        renderer.cleanup()
@@ -535,3 +535,65 @@ def test_smooth_anatomy_has_gentler_ramp_than_bone() -> None:
     bone_max = max(o for _, o in PRESET_CT_BONE.scalar_opacity)
     smooth_max = max(o for _, o in PRESET_CT_SMOOTH_ANATOMY.scalar_opacity)
     assert smooth_max < bone_max
+
+
+def test_interactive_quality_swaps_pyramid_level(monkeypatch) -> None:
+    import numpy as np
+
+    import core.volume_renderer as volume_renderer
+    from core.volume_renderer import VolumeData
+
+    monkeypatch.setattr(volume_renderer, "pyramid_factors", lambda _bytes: (2,))
+    monkeypatch.setattr(volume_renderer, "interactive_pyramid_factor", lambda *_a, **_k: 2)
+    r = _make_renderer()
+    r.attach_volume(VolumeData(
+        array=np.ones((16, 16, 16), dtype=np.float32),
+        spacing=(1.0, 1.0, 2.0),
+        origin=(0.0, 0.0, 0.0),
+        direction=(1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0),
+    ))
+    assert r._pyramid is not None and r._pyramid.wait(timeout=30)
+
+    r.set_interactive_quality(True)
+    assert r._mapper.GetInput().GetDimensions() == (8, 8, 8)
+    assert r._mapper.GetInput().GetSpacing() == pytest.approx((2.0, 2.0, 4.0))
+    r.set_interactive_quality(False)
+    assert r._mapper.GetInput().GetDimensions() == (16, 16, 16)
+    r.cleanup()
+    assert r._pyramid is None
+
+
+def test_crop_subvolume_feeds_only_the_region() -> None:
+    import numpy as np
+
+    from core.volume_renderer import VolumeData
+
+    r = _make_renderer()
+    array = np.arange(20 * 24 * 28, dtype=np.float32).reshape(20, 24, 28)
+    r.attach_volume(VolumeData(
+        array=array,
+        spacing=(1.0, 1.0, 2.0),
+        origin=(5.0, 0.0, 0.0),
+        direction=(1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0),
+    ))
+    r.set_quality_mode("Ultra")
+
+    assert r.set_crop_subvolume((9.0, 13.0, 2.0, 6.0, 4.0, 10.0)) is True
+    image = r._mapper.GetInput()
+    # x 4..8, y 2..6, z 2..5 voxels, one voxel margin each side
+    assert image.GetDimensions() == (7, 7, 6)
+    assert image.GetOrigin() == pytest.approx((3.0, 1.0, 2.0))
+    assert image.GetScalarRange()[0] == float(array[1, 1, 3])
+    assert r.set_crop_subvolume((9.0, 13.0, 2.0, 6.0, 4.0, 10.0)) is False
+
+    # Small regions keep the selected detail while rotating.
+    r.set_interactive_quality(True)
+    assert r._mapper.GetSampleDistance() == pytest.approx(0.25)
+    r.set_interactive_quality(False)
+
+    assert r.set_crop_subvolume(None) is True
+    assert r._mapper.GetInput().GetDimensions() == (28, 24, 20)
+    r.set_interactive_quality(True)
+    assert r._mapper.GetSampleDistance() == pytest.approx(2.0)
+    r.cleanup()
+    assert r.crop_extent() is None